@@ -20,10 +20,13 @@ export class ArenaRoom implements DurableObject {
   async fetch(request: Request): Promise<Response> {
     const url = new URL(request.url);
 
-    // Internal broadcast endpoint
+    // Internal broadcast endpoint (one message, or { messages } sent in order)
     if (url.pathname === '/broadcast' && request.method === 'POST') {
-      const message = await request.json() as WebSocketMessage;
-      this.broadcast(JSON.stringify(message));
+      const body = await request.json() as WebSocketMessage | { messages: WebSocketMessage[] };
+      const messages = 'messages' in body ? body.messages : [body];
+      for (const message of messages) {
+        this.broadcast(JSON.stringify(message));
+      }
       return new Response('OK', { status: 200 });
     }
 
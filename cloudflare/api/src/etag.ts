@@ -0,0 +1,20 @@
+/**
+ * ETags for JSON responses - a content hash clients send back in If-None-Match
+ */
+
+export async function jsonETag(body: unknown): Promise<string> {
+  const digest = await crypto.subtle.digest('SHA-1', new TextEncoder().encode(JSON.stringify(body)));
+  const hex = [...new Uint8Array(digest)].map(b => b.toString(16).padStart(2, '0')).join('');
+  return `"${hex}"`;
+}
+
+// Cloudflare weakens ETags on responses it compresses, so W/"x" matches "x"
+export function etagMatches(ifNoneMatch: string | undefined, etag: string): boolean {
+  if (!ifNoneMatch) {
+    return false;
+  }
+  return ifNoneMatch.split(',').some(tag => {
+    const value = tag.trim();
+    return value === '*' || value.replace(/^W\//, '') === etag;
+  });
+}
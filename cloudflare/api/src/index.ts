@@ -5,13 +5,14 @@
 import { Hono } from 'hono';
 import { cors } from 'hono/cors';
 import { logger } from 'hono/logger';
-import type { Env } from './types';
-import state from './routes/state';
+import type { Env, RoundCommit, WebSocketMessage } from './types';
+import state, { patchStatements } from './routes/state';
 import leaderboard from './routes/leaderboard';
 import bot from './routes/bot';
 import trades from './routes/trades';
 import social from './routes/social';
 import memory from './routes/memory';
+import snapshots, { snapshotStatements } from './routes/snapshots';
 import { authMiddleware } from './middleware/auth';
 
 // Re-export Durable Object
@@ -23,7 +24,7 @@ const app = new Hono<{ Bindings: Env }>();
 app.use('*', logger());
 app.use('*', cors({
   origin: '*',
-  allowMethods: ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
+  allowMethods: ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'],
   allowHeaders: ['Content-Type', 'Authorization'],
 }));
 
@@ -43,6 +44,7 @@ app.route('/api/bot', bot);
 app.route('/api/trades', trades);
 app.route('/api/social', social);
 app.route('/api/memory', memory);
+app.route('/api/snapshots', snapshots);
 
 // POST /api/round/increment - Increment round counter (authenticated)
 app.post('/api/round/increment', authMiddleware, async (c) => {
@@ -86,6 +88,48 @@ app.post('/api/round/increment', authMiddleware, async (c) => {
   return c.json({ round: newRound });
 });
 
+// POST /api/round/commit - Apply a bot turn's or a round's writes at once (authenticated)
+// The state patch and the snapshots commit in one transaction; the
+// broadcasts go out, in order, only once it has.
+app.post('/api/round/commit', authMiddleware, async (c) => {
+  const db = c.env.DB;
+  const body = await c.req.json<RoundCommit>();
+
+  if ((body.state?.bots ?? []).some(bot => !bot.id)) {
+    return c.json({ error: 'Each bot patch needs an id' }, 400);
+  }
+  if (body.snapshots && body.round === undefined) {
+    return c.json({ error: 'round is required with snapshots' }, 400);
+  }
+
+  const statements = [
+    ...(body.state ? patchStatements(db, body.state) : []),
+    ...(body.snapshots
+      ? snapshotStatements(db, body.round as number, body.snapshots, body.benchmark_price ?? null)
+      : []),
+  ];
+  if (statements.length) {
+    await db.batch(statements);
+  }
+
+  const broadcasts = body.broadcasts ?? [];
+  if (broadcasts.length) {
+    const roomId = c.env.ARENA_ROOM.idFromName('main');
+    const room = c.env.ARENA_ROOM.get(roomId);
+
+    await room.fetch('http://internal/broadcast', {
+      method: 'POST',
+      body: JSON.stringify({ messages: broadcasts }),
+    });
+  }
+
+  return c.json({
+    success: true,
+    statements: statements.length,
+    broadcasts: broadcasts.length,
+  });
+});
+
 // POST /api/broadcast - Broadcast message to WebSocket clients (authenticated)
 app.post('/api/broadcast', authMiddleware, async (c) => {
   const body = await c.req.json();
@@ -101,6 +145,27 @@ app.post('/api/broadcast', authMiddleware, async (c) => {
   return c.json({ success: true });
 });
 
+// POST /api/broadcast/batch - Broadcast several messages, in order (authenticated)
+app.post('/api/broadcast/batch', authMiddleware, async (c) => {
+  const body = await c.req.json<{ messages: WebSocketMessage[] }>();
+
+  if (!Array.isArray(body.messages)) {
+    return c.json({ error: 'messages is required' }, 400);
+  }
+
+  if (body.messages.length) {
+    const roomId = c.env.ARENA_ROOM.idFromName('main');
+    const room = c.env.ARENA_ROOM.get(roomId);
+
+    await room.fetch('http://internal/broadcast', {
+      method: 'POST',
+      body: JSON.stringify({ messages: body.messages }),
+    });
+  }
+
+  return c.json({ success: true, count: body.messages.length });
+});
+
 // WebSocket endpoint
 app.get('/ws', async (c) => {
   const upgradeHeader = c.req.header('Upgrade');
@@ -622,4 +622,205 @@ bot.post('/:id/trade', authMiddleware, async (c) => {
   return c.json({ success: true, trade_id: tradeResult.meta.last_row_id });
 });
 
+// ==================== WRITE-BEHIND RECORDS ====================
+// MCP servers journal trades, rejections, messages and memories locally and
+// post them here in batches. Records apply in the order given; each carries
+// a client-generated id that applied_records remembers, so a batch retried
+// after a lost response doesn't insert twice.
+
+type RecordKind = 'trade' | 'rejected' | 'message' | 'memory';
+
+interface QueuedRecord {
+  id: string;
+  kind: RecordKind;
+  round?: number | null;  // Round the tool call ran in (default: current round)
+  at?: string | null;  // When the tool call ran (default: now)
+  data: Record<string, unknown>;
+}
+
+interface RecordResult {
+  id: string;
+  status: 'ok' | 'duplicate' | 'error';
+  row_id?: number | null;
+  error?: string;
+}
+
+const MEMORY_TYPES = ['trade', 'rival', 'strategy', 'reflection', 'note'];
+
+// Insert statement for one record, or a validation error
+function recordStatement(
+  db: D1Database,
+  botId: string,
+  record: QueuedRecord,
+  round: number,
+): D1PreparedStatement | string {
+  const d = record.data || {};
+  switch (record.kind) {
+    case 'trade':
+      if (!d.symbol || !d.side) return 'symbol and side are required';
+      return db.prepare(`
+        INSERT INTO trades (bot_id, symbol, side, shares, price, commentary, round, executed_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+      `).bind(
+        botId, String(d.symbol).toUpperCase(), String(d.side).toUpperCase(),
+        d.shares, d.price ?? null, d.commentary || null, round, record.at || null,
+      );
+    case 'rejected':
+      if (!d.symbol || !d.side || !d.reason) return 'symbol, side and reason are required';
+      return db.prepare(`
+        INSERT INTO rejected_trades (bot_id, symbol, side, shares, reason, round, attempted_at)
+        VALUES (?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+      `).bind(
+        botId, String(d.symbol).toUpperCase(), String(d.side).toUpperCase(),
+        d.shares, d.reason, round, record.at || null,
+      );
+    case 'message':
+      if (!d.content) return 'content is required';
+      return db.prepare(`
+        INSERT INTO messages (round, from_bot, to_bot, content, created_at)
+        VALUES (?, ?, ?, ?, COALESCE(?, datetime('now')))
+      `).bind(round, botId, d.to_bot || null, d.content, record.at || null);
+    case 'memory': {
+      if (!d.type || !d.content) return 'type and content are required';
+      if (!MEMORY_TYPES.includes(d.type as string)) {
+        return `Invalid type. Must be one of: ${MEMORY_TYPES.join(', ')}`;
+      }
+      const importance = (d.importance as number | undefined) ?? 5;
+      if (importance < 1 || importance > 10) return 'Importance must be between 1 and 10';
+      return db.prepare(`
+        INSERT INTO memories (bot_id, round, type, content, importance, created_at)
+        VALUES (?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+      `).bind(botId, round, d.type, d.content, importance, record.at || null);
+    }
+    default:
+      return `Unknown record kind: ${record.kind}`;
+  }
+}
+
+// POST /api/bot/:id/records - Apply a batch of queued records (authenticated)
+bot.post('/:id/records', authMiddleware, async (c) => {
+  const db = c.env.DB;
+  const botId = c.req.param('id');
+  const body = await c.req.json<{ records: QueuedRecord[] }>();
+  const records = body.records || [];
+
+  const botRow = await db.prepare('SELECT name FROM bots WHERE id = ?').bind(botId).first();
+  if (!botRow) {
+    return c.json({ error: 'Bot not found' }, 404);
+  }
+
+  // Records already applied by an earlier attempt of this batch
+  const applied = new Map<string, number | null>();
+  if (records.length) {
+    const placeholders = records.map(() => '?').join(', ');
+    const rows = await db.prepare(
+      `SELECT id, row_id FROM applied_records WHERE id IN (${placeholders})`
+    ).bind(...records.map(r => r.id)).all();
+    for (const row of rows.results) {
+      applied.set(row.id as string, row.row_id as number | null);
+    }
+  }
+
+  const game = await db.prepare('SELECT current_round FROM game WHERE id = 1').first();
+  const currentRound = (game?.current_round as number) || 0;
+
+  const results: RecordResult[] = [];
+  const statements: D1PreparedStatement[] = [];
+  const inserted: Array<{ result: RecordResult; record: QueuedRecord; round: number; index: number }> = [];
+
+  for (const record of records) {
+    if (applied.has(record.id)) {
+      results.push({ id: record.id, status: 'duplicate', row_id: applied.get(record.id) });
+      continue;
+    }
+    const round = record.round ?? currentRound;
+    const statement = recordStatement(db, botId, record, round);
+    if (typeof statement === 'string') {
+      results.push({ id: record.id, status: 'error', error: statement });
+      continue;
+    }
+    const result: RecordResult = { id: record.id, status: 'ok' };
+    inserted.push({ result, record, round, index: statements.length });
+    statements.push(
+      statement,
+      db.prepare(`
+        INSERT INTO applied_records (id, bot_id, kind, row_id)
+        VALUES (?, ?, ?, last_insert_rowid())
+      `).bind(record.id, botId, record.kind),
+    );
+    results.push(result);
+  }
+
+  // One transaction: every record and its applied_records row, or none
+  if (statements.length) {
+    const batchResults = await db.batch(statements);
+    for (const { result, index } of inserted) {
+      result.row_id = batchResults[index].meta.last_row_id;
+    }
+  }
+
+  // Broadcast to WebSocket clients, in order
+  try {
+    const roomId = c.env.ARENA_ROOM.idFromName('main');
+    const room = c.env.ARENA_ROOM.get(roomId);
+
+    for (const { result, record, round } of inserted) {
+      const d = record.data;
+      let message: { type: string; data: Record<string, unknown> } | null = null;
+      if (record.kind === 'trade') {
+        message = {
+          type: 'trade',
+          data: {
+            id: result.row_id,
+            bot_id: botId,
+            bot_name: botRow.name,
+            symbol: String(d.symbol).toUpperCase(),
+            side: String(d.side).toUpperCase(),
+            shares: d.shares,
+            price: d.price ?? null,
+            round,
+          },
+        };
+      } else if (record.kind === 'rejected') {
+        message = {
+          type: 'rejected_trade',
+          data: {
+            id: result.row_id,
+            bot_id: botId,
+            bot_name: botRow.name,
+            symbol: String(d.symbol).toUpperCase(),
+            side: String(d.side).toUpperCase(),
+            shares: d.shares,
+            reason: d.reason,
+            round,
+          },
+        };
+      } else if (record.kind === 'message') {
+        message = {
+          type: 'message',
+          data: {
+            id: result.row_id,
+            round,
+            from_bot: botId,
+            from_name: botRow.name,
+            to_bot: d.to_bot || null,
+            content: d.content,
+            is_dm: !!d.to_bot,
+          },
+        };
+      }
+      if (message) {
+        await room.fetch('http://internal/broadcast', {
+          method: 'POST',
+          body: JSON.stringify(message),
+        });
+      }
+    }
+  } catch {
+    // Don't fail if WebSocket broadcast fails
+  }
+
+  return c.json({ success: true, results });
+});
+
 export default bot;
@@ -83,6 +83,7 @@ memory.get('/:botId', async (c) => {
   const count = parseInt(c.req.query('count') || '20');
   const minImportance = parseInt(c.req.query('min_importance') || '1');
   const targetBot = c.req.query('target_bot');  // For filtering rival notes about a specific bot
+  const sinceId = c.req.query('since_id');  // For incremental sync of a local memory index
 
   // Build query
   let query = `
@@ -110,9 +111,15 @@ memory.get('/:botId', async (c) => {
     params.push(`%${targetBot}%`);
   }
 
-  // Order by round (most recent first), then importance
-  query += ' ORDER BY round DESC, importance DESC, created_at DESC LIMIT ?';
-  params.push(count);
+  if (sinceId) {
+    // Only memories newer than the caller's copy, oldest first so it can page
+    query += ' AND id > ? ORDER BY id ASC LIMIT ?';
+    params.push(parseInt(sinceId), count);
+  } else {
+    // Order by round (most recent first), then importance
+    query += ' ORDER BY round DESC, importance DESC, created_at DESC LIMIT ?';
+    params.push(count);
+  }
 
   const result = await db.prepare(query).bind(...params).all();
 
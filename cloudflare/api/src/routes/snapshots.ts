@@ -0,0 +1,211 @@
+/**
+ * Snapshot routes - per-round equity curves
+ */
+
+import { Hono } from 'hono';
+import type { Env, SnapshotBatchRequest } from '../types';
+import { authMiddleware } from '../middleware/auth';
+
+const snapshots = new Hono<{ Bindings: Env }>();
+
+interface EquityCurve {
+  rounds: number[];
+  values: number[];
+  traded: number[];  // Notional traded during each round
+}
+
+interface BenchmarkCurve {
+  rounds: number[];
+  values: number[];
+}
+
+/**
+ * Pick point indices with Largest-Triangle-Three-Buckets.
+ * Keeps the first and last points and the visually significant ones between.
+ */
+function downsampleIndices(xs: number[], ys: number[], maxPoints: number): number[] {
+  const n = xs.length;
+  if (maxPoints >= n || maxPoints < 3) {
+    return xs.map((_, i) => i);
+  }
+
+  const chosen = [0];
+  const bucketSize = (n - 2) / (maxPoints - 2);
+  let a = 0;
+
+  for (let i = 0; i < maxPoints - 2; i++) {
+    // Average of the next bucket
+    const nextStart = Math.floor((i + 1) * bucketSize) + 1;
+    const nextEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, n);
+    let avgX = 0;
+    let avgY = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgX += xs[j];
+      avgY += ys[j];
+    }
+    const nextLen = Math.max(nextEnd - nextStart, 1);
+    avgX /= nextLen;
+    avgY /= nextLen;
+
+    // Pick the point in this bucket forming the largest triangle
+    const start = Math.floor(i * bucketSize) + 1;
+    const end = Math.floor((i + 1) * bucketSize) + 1;
+    let maxArea = -1;
+    let best = start;
+    for (let j = start; j < end; j++) {
+      const area = Math.abs(
+        (xs[a] - avgX) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avgY - ys[a])
+      );
+      if (area > maxArea) {
+        maxArea = area;
+        best = j;
+      }
+    }
+
+    chosen.push(best);
+    a = best;
+  }
+
+  chosen.push(n - 1);
+  return chosen;
+}
+
+// GET /api/snapshots - Equity curves per bot (public)
+// Query: bot_id, since_round, max_points (downsamples each curve)
+snapshots.get('/', async (c) => {
+  const db = c.env.DB;
+  const botId = c.req.query('bot_id');
+  const sinceRound = parseInt(c.req.query('since_round') || '0');
+  const maxPoints = parseInt(c.req.query('max_points') || '0');
+
+  let query = `
+    SELECT bot_id, round, total_value, benchmark_price
+    FROM snapshots
+    WHERE round >= ?
+  `;
+  let tradedQuery = `
+    SELECT bot_id, round, SUM(ABS(shares * price)) as traded
+    FROM trades
+    WHERE round >= ?
+  `;
+  const params: (string | number)[] = [sinceRound];
+
+  if (botId) {
+    query += ' AND bot_id = ?';
+    tradedQuery += ' AND bot_id = ?';
+    params.push(botId);
+  }
+
+  query += ' ORDER BY bot_id, round, captured_at';
+  tradedQuery += ' GROUP BY bot_id, round';
+
+  const [result, tradedResult] = await Promise.all([
+    db.prepare(query).bind(...params).all(),
+    db.prepare(tradedQuery).bind(...params).all(),
+  ]);
+
+  const tradedByKey = new Map<string, number>();
+  for (const row of tradedResult.results) {
+    tradedByKey.set(`${row.bot_id}:${row.round}`, (row.traded as number) || 0);
+  }
+
+  // Columnar curves, one entry per round (latest capture wins)
+  const curves: Record<string, EquityCurve> = {};
+  const benchmarkByRound = new Map<number, number>();
+  for (const row of result.results) {
+    const bid = row.bot_id as string;
+    const round = row.round as number;
+    const value = row.total_value as number;
+    if (row.benchmark_price !== null && row.benchmark_price !== undefined) {
+      benchmarkByRound.set(round, row.benchmark_price as number);
+    }
+    if (!curves[bid]) {
+      curves[bid] = { rounds: [], values: [], traded: [] };
+    }
+    const curve = curves[bid];
+    const last = curve.rounds.length - 1;
+    if (last >= 0 && curve.rounds[last] === round) {
+      curve.values[last] = value;
+    } else {
+      curve.rounds.push(round);
+      curve.values.push(value);
+      curve.traded.push(tradedByKey.get(`${bid}:${round}`) || 0);
+    }
+  }
+
+  const benchmarkRounds = [...benchmarkByRound.keys()].sort((a, b) => a - b);
+  let benchmark: BenchmarkCurve = {
+    rounds: benchmarkRounds,
+    values: benchmarkRounds.map(r => benchmarkByRound.get(r) as number),
+  };
+
+  if (maxPoints > 0) {
+    for (const bid of Object.keys(curves)) {
+      const curve = curves[bid];
+      const keep = downsampleIndices(curve.rounds, curve.values, maxPoints);
+      curves[bid] = {
+        rounds: keep.map(i => curve.rounds[i]),
+        values: keep.map(i => curve.values[i]),
+        traded: keep.map(i => curve.traded[i]),
+      };
+    }
+    const keep = downsampleIndices(benchmark.rounds, benchmark.values, maxPoints);
+    benchmark = {
+      rounds: keep.map(i => benchmark.rounds[i]),
+      values: keep.map(i => benchmark.values[i]),
+    };
+  }
+
+  return c.json({
+    since_round: sinceRound,
+    curves,
+    benchmark,
+  });
+});
+
+// Statements writing one round of snapshots, replacing any already
+// captured for the same bot and round
+export function snapshotStatements(
+  db: D1Database,
+  round: number,
+  entries: SnapshotBatchRequest['snapshots'],
+  benchmarkPrice: number | null = null
+): D1PreparedStatement[] {
+  const remove = db.prepare(
+    'DELETE FROM snapshots WHERE bot_id = ? AND round = ?'
+  );
+  const insert = db.prepare(`
+    INSERT INTO snapshots (bot_id, total_value, round, benchmark_price, captured_at)
+    VALUES (?, ?, ?, ?, datetime('now'))
+  `);
+
+  return entries.flatMap(s => [
+    remove.bind(s.bot_id, round),
+    insert.bind(s.bot_id, s.total_value, round, benchmarkPrice),
+  ]);
+}
+
+// POST /api/snapshots/batch - Write one round of snapshots (authenticated)
+// Replaces any snapshot already captured for the same bot and round.
+snapshots.post('/batch', authMiddleware, async (c) => {
+  const db = c.env.DB;
+  const body = await c.req.json<SnapshotBatchRequest>();
+
+  if (body.round === undefined || !Array.isArray(body.snapshots)) {
+    return c.json({ error: 'round and snapshots are required' }, 400);
+  }
+
+  const batch = snapshotStatements(db, body.round, body.snapshots, body.benchmark_price ?? null);
+
+  if (batch.length > 0) {
+    await db.batch(batch);
+  }
+
+  return c.json({
+    success: true,
+    round: body.round,
+    count: body.snapshots.length,
+  });
+});
+
+export default snapshots;
@@ -5,6 +5,7 @@
 import { Hono } from 'hono';
 import type { Env } from '../types';
 import { authMiddleware } from '../middleware/auth';
+import { jsonETag, etagMatches } from '../etag';
 
 const social = new Hono<{ Bindings: Env }>();
 
@@ -95,11 +96,13 @@ social.get('/messages', async (c) => {
 });
 
 // GET /api/social/messages/:botId - Get messages for a specific bot (including DMs to them)
+// (?since_id= for only messages newer than that id)
 social.get('/messages/:botId', async (c) => {
   const db = c.env.DB;
   const botId = c.req.param('botId');
   const round = c.req.query('round');
   const limit = parseInt(c.req.query('limit') || '50');
+  const sinceId = c.req.query('since_id');
 
   // Get public messages + DMs to this bot
   let query = `
@@ -115,12 +118,20 @@ social.get('/messages/:botId', async (c) => {
     params.push(parseInt(round));
   }
 
+  // Only messages newer than the last one the caller has seen
+  if (sinceId) {
+    query += ' AND m.id > ?';
+    params.push(parseInt(sinceId));
+  }
+
   query += ' ORDER BY m.created_at DESC LIMIT ?';
   params.push(limit);
 
   const result = await db.prepare(query).bind(...params).all();
+  const cursor = Math.max(parseInt(sinceId || '0'), ...result.results.map(m => m.id as number));
 
   return c.json({
+    cursor,
     messages: result.results.map(m => ({
       id: m.id,
       round: m.round,
@@ -411,15 +422,49 @@ social.post('/rejected', authMiddleware, async (c) => {
   return c.json({ success: true, id: result.meta.last_row_id });
 });
 
-// GET /api/social/context/:botId - Get full round context for a bot
-social.get('/context/:botId', async (c) => {
-  const db = c.env.DB;
-  const botId = c.req.param('botId');
+// ==================== ROUND CONTEXT ====================
+// The context splits into a shared part (identical for every bot) and a
+// private part (DMs and memories). The orchestrator fetches the shared part
+// once and hands it to the MCP servers, which then only ask for the private
+// part; /context/:botId still serves both merged.
+
+const CONTEXT_MESSAGE_LIMIT = 30;
+
+interface ContextMessage {
+  id: unknown;
+  from_bot: unknown;
+  from_name: unknown;
+  to_bot: unknown;
+  content: unknown;
+  is_dm: boolean;
+  round: unknown;
+  created_at: unknown;
+}
 
-  // Get game info
+function formatContextMessage(m: Record<string, unknown>): ContextMessage {
+  return {
+    id: m.id,
+    from_bot: m.from_bot,
+    from_name: m.from_name,
+    to_bot: m.to_bot,
+    content: m.content,
+    is_dm: m.to_bot !== null,
+    round: m.round,
+    created_at: m.created_at,
+  };
+}
+
+async function getGameRound(db: D1Database): Promise<{ startingCash: number; currentRound: number }> {
   const game = await db.prepare('SELECT starting_cash, current_round FROM game WHERE id = 1').first();
-  const startingCash = (game?.starting_cash as number) || 100000;
-  const currentRound = (game?.current_round as number) || 0;
+  return {
+    startingCash: (game?.starting_cash as number) || 100000,
+    currentRound: (game?.current_round as number) || 0,
+  };
+}
+
+async function buildSharedContext(db: D1Database) {
+  const { startingCash, currentRound } = await getGameRound(db);
+  const since = Math.max(0, currentRound - 1);
 
   // Get leaderboard (all bots sorted by total_value)
   const botsResult = await db.prepare(`
@@ -446,7 +491,7 @@ social.get('/context/:botId', async (c) => {
     WHERE t.round >= ?
     ORDER BY t.executed_at DESC
     LIMIT 30
-  `).bind(Math.max(0, currentRound - 1)).all();
+  `).bind(since).all();
 
   // Get recent rejected trades
   const rejectedResult = await db.prepare(`
@@ -456,17 +501,17 @@ social.get('/context/:botId', async (c) => {
     WHERE r.round >= ?
     ORDER BY r.attempted_at DESC
     LIMIT 10
-  `).bind(Math.max(0, currentRound - 1)).all();
+  `).bind(since).all();
 
-  // Get messages (public + DMs to this bot)
+  // Get public messages
   const messagesResult = await db.prepare(`
     SELECT m.*, b.name as from_name
     FROM messages m
     JOIN bots b ON m.from_bot = b.id
-    WHERE m.round >= ? AND (m.to_bot IS NULL OR m.to_bot = ?)
+    WHERE m.round >= ? AND m.to_bot IS NULL
     ORDER BY m.created_at DESC
-    LIMIT 30
-  `).bind(Math.max(0, currentRound - 1), botId).all();
+    LIMIT ?
+  `).bind(since, CONTEXT_MESSAGE_LIMIT).all();
 
   // Get all positions grouped by bot
   const positionsResult = await db.prepare(`
@@ -493,6 +538,50 @@ social.get('/context/:botId', async (c) => {
     });
   }
 
+  return {
+    round: currentRound,
+    starting_cash: startingCash,
+    leaderboard,
+    positions_by_bot: positionsByBot,
+    recent_trades: tradesResult.results.map(t => ({
+      id: t.id,
+      bot_id: t.bot_id,
+      bot_name: t.bot_name,
+      symbol: t.symbol,
+      side: t.side,
+      shares: t.shares,
+      price: t.price,
+      commentary: t.commentary,
+      round: t.round,
+      executed_at: t.executed_at,
+    })),
+    rejected_trades: rejectedResult.results.map(r => ({
+      id: r.id,
+      bot_id: r.bot_id,
+      bot_name: r.bot_name,
+      symbol: r.symbol,
+      side: r.side,
+      shares: r.shares,
+      reason: r.reason,
+      round: r.round,
+    })),
+    messages: messagesResult.results.map(formatContextMessage),
+  };
+}
+
+async function buildPrivateContext(db: D1Database, botId: string) {
+  const { currentRound } = await getGameRound(db);
+
+  // DMs to this bot
+  const dmsResult = await db.prepare(`
+    SELECT m.*, b.name as from_name
+    FROM messages m
+    JOIN bots b ON m.from_bot = b.id
+    WHERE m.round >= ? AND m.to_bot = ?
+    ORDER BY m.created_at DESC
+    LIMIT ?
+  `).bind(Math.max(0, currentRound - 1), botId, CONTEXT_MESSAGE_LIMIT).all();
+
   // ==================== BOT MEMORIES ====================
   // Short-term: Last 3 rounds (all memories)
   const shortTermRounds = 3;
@@ -544,40 +633,10 @@ social.get('/context/:botId', async (c) => {
     });
   }
 
-  return c.json({
+  return {
     round: currentRound,
-    starting_cash: startingCash,
     your_bot_id: botId,
-    leaderboard,
-    positions_by_bot: positionsByBot,
-    recent_trades: tradesResult.results.map(t => ({
-      bot_id: t.bot_id,
-      bot_name: t.bot_name,
-      symbol: t.symbol,
-      side: t.side,
-      shares: t.shares,
-      price: t.price,
-      commentary: t.commentary,
-      round: t.round,
-      executed_at: t.executed_at,
-    })),
-    rejected_trades: rejectedResult.results.map(r => ({
-      bot_id: r.bot_id,
-      bot_name: r.bot_name,
-      symbol: r.symbol,
-      side: r.side,
-      shares: r.shares,
-      reason: r.reason,
-      round: r.round,
-    })),
-    messages: messagesResult.results.map(m => ({
-      from_bot: m.from_bot,
-      from_name: m.from_name,
-      to_bot: m.to_bot,
-      content: m.content,
-      is_dm: m.to_bot !== null,
-      round: m.round,
-    })),
+    dms: dmsResult.results.map(formatContextMessage),
     // Your persistent memories across rounds
     your_memories: {
       short_term: shortTermByType,  // Last 3 rounds, grouped by type
@@ -596,6 +655,86 @@ social.get('/context/:botId', async (c) => {
         round: r.round,
       })),
     },
+  };
+}
+
+// Delta requests pass the highest message/trade/rejection id already seen;
+// only newer entries come back. The ETag covers the full context, so a
+// client sending it in If-None-Match gets a 304 when nothing changed at all.
+
+interface ContextCursor {
+  message: number;
+  trade: number;
+  rejected: number;
+}
+
+function parseContextCursor(query: (name: string) => string | undefined): ContextCursor | null {
+  const message = query('since_message');
+  const trade = query('since_trade');
+  const rejected = query('since_rejected');
+  if (message === undefined && trade === undefined && rejected === undefined) {
+    return null;
+  }
+  return {
+    message: parseInt(message || '0'),
+    trade: parseInt(trade || '0'),
+    rejected: parseInt(rejected || '0'),
+  };
+}
+
+// GET /api/social/context - Shared part of the round context (same for every bot)
+social.get('/context', async (c) => {
+  return c.json(await buildSharedContext(c.env.DB));
+});
+
+// GET /api/social/context/:botId/private - DMs and memories for one bot
+social.get('/context/:botId/private', async (c) => {
+  return c.json(await buildPrivateContext(c.env.DB, c.req.param('botId')));
+});
+
+// GET /api/social/context/:botId - Get full round context for a bot
+// (?since_message=&since_trade=&since_rejected= for only newer entries)
+social.get('/context/:botId', async (c) => {
+  const botId = c.req.param('botId');
+  const [shared, priv] = await Promise.all([
+    buildSharedContext(c.env.DB),
+    buildPrivateContext(c.env.DB, botId),
+  ]);
+
+  // Public messages + DMs to this bot, newest first
+  const messages = [...shared.messages, ...priv.dms]
+    .sort((a, b) => String(b.created_at).localeCompare(String(a.created_at)))
+    .slice(0, CONTEXT_MESSAGE_LIMIT)
+    .map(({ created_at, ...m }) => m);
+
+  const context = {
+    round: shared.round,
+    starting_cash: shared.starting_cash,
+    your_bot_id: botId,
+    leaderboard: shared.leaderboard,
+    positions_by_bot: shared.positions_by_bot,
+    recent_trades: shared.recent_trades,
+    rejected_trades: shared.rejected_trades,
+    messages,
+    your_memories: priv.your_memories,
+  };
+
+  const etag = await jsonETag(context);
+  if (etagMatches(c.req.header('If-None-Match'), etag)) {
+    return c.body(null, 304, { ETag: etag });
+  }
+  c.header('ETag', etag);
+
+  const cursor = parseContextCursor(name => c.req.query(name));
+  if (!cursor) {
+    return c.json(context);
+  }
+  return c.json({
+    ...context,
+    delta: true,
+    messages: context.messages.filter(m => (m.id as number) > cursor.message),
+    recent_trades: context.recent_trades.filter(t => (t.id as number) > cursor.trade),
+    rejected_trades: context.rejected_trades.filter(r => (r.id as number) > cursor.rejected),
   });
 });
 
@@ -1,14 +1,17 @@
 /**
- * State routes - GET and POST game state
+ * State routes - GET, POST and PATCH game state
  */
 
 import { Hono } from 'hono';
-import type { Env, Bot, Position, Trade, GameState } from '../types';
+import type { Env, Bot, Position, Trade, GameState, StatePatch } from '../types';
 import { authMiddleware } from '../middleware/auth';
+import { jsonETag, etagMatches } from '../etag';
 
 const state = new Hono<{ Bindings: Env }>();
 
 // GET /api/state - Get full game state (public)
+// Carries an ETag; a client sending it back in If-None-Match gets a bare 304
+// when nothing changed, so it can keep using its cached copy.
 state.get('/', async (c) => {
   const db = c.env.DB;
 
@@ -57,7 +60,7 @@ state.get('/', async (c) => {
 
   // Get recent trades (last 50)
   const tradesResult = await db.prepare(
-    'SELECT * FROM trades ORDER BY executed_at DESC LIMIT 50'
+    'SELECT * FROM trades ORDER BY executed_at DESC, id DESC LIMIT 50'
   ).all();
 
   const recent_trades: Trade[] = tradesResult.results.map(t => ({
@@ -82,6 +85,11 @@ state.get('/', async (c) => {
     updated_at: game.updated_at as string | null,
   };
 
+  const etag = await jsonETag(gameState);
+  if (etagMatches(c.req.header('If-None-Match'), etag)) {
+    return c.body(null, 304, { ETag: etag });
+  }
+  c.header('ETag', etag);
   return c.json(gameState);
 });
 
@@ -162,4 +170,106 @@ state.post('/', authMiddleware, async (c) => {
   return c.json({ success: true });
 });
 
+// Columns a state patch may set
+const BOT_PATCH_FIELDS = ['cash', 'total_value', 'session_id', 'last_commentary', 'enabled'] as const;
+const POSITION_PATCH_FIELDS = ['shares', 'avg_cost', 'current_price'] as const;
+
+// Statements applying a state patch (bot patches must carry an id)
+export function patchStatements(db: D1Database, body: StatePatch): D1PreparedStatement[] {
+  const statements: D1PreparedStatement[] = [];
+
+  if (body.status !== undefined || body.current_round !== undefined) {
+    const updates: string[] = [];
+    const values: unknown[] = [];
+
+    if (body.status !== undefined) {
+      updates.push('status = ?');
+      values.push(body.status);
+    }
+    if (body.current_round !== undefined) {
+      updates.push('current_round = ?');
+      values.push(body.current_round);
+    }
+    updates.push("updated_at = datetime('now')");
+
+    statements.push(
+      db.prepare(`UPDATE game SET ${updates.join(', ')} WHERE id = 1`).bind(...values)
+    );
+  }
+
+  for (const bot of body.bots ?? []) {
+    const updates: string[] = [];
+    const values: unknown[] = [];
+    for (const field of BOT_PATCH_FIELDS) {
+      if (bot[field] !== undefined) {
+        updates.push(`${field} = ?`);
+        values.push(field === 'enabled' ? (bot.enabled ? 1 : 0) : bot[field]);
+      }
+    }
+    if (updates.length) {
+      updates.push("updated_at = datetime('now')");
+      statements.push(
+        db.prepare(`UPDATE bots SET ${updates.join(', ')} WHERE id = ?`).bind(...values, bot.id)
+      );
+    }
+
+    for (const symbol of bot.closed_positions ?? []) {
+      statements.push(
+        db.prepare('DELETE FROM positions WHERE bot_id = ? AND symbol = ?').bind(bot.id, symbol)
+      );
+    }
+
+    for (const pos of bot.opened_positions ?? []) {
+      statements.push(
+        db.prepare(`
+          INSERT INTO positions (bot_id, symbol, shares, avg_cost, current_price)
+          VALUES (?, ?, ?, ?, ?)
+          ON CONFLICT(bot_id, symbol) DO UPDATE SET
+            shares = excluded.shares,
+            avg_cost = excluded.avg_cost,
+            current_price = excluded.current_price
+        `).bind(bot.id, pos.symbol, pos.shares, pos.avg_cost, pos.current_price ?? null)
+      );
+    }
+
+    for (const pos of bot.positions ?? []) {
+      const posUpdates: string[] = [];
+      const posValues: unknown[] = [];
+      for (const field of POSITION_PATCH_FIELDS) {
+        if (pos[field] !== undefined) {
+          posUpdates.push(`${field} = ?`);
+          posValues.push(pos[field]);
+        }
+      }
+      if (posUpdates.length) {
+        statements.push(
+          db.prepare(
+            `UPDATE positions SET ${posUpdates.join(', ')} WHERE bot_id = ? AND symbol = ?`
+          ).bind(...posValues, bot.id, pos.symbol)
+        );
+      }
+    }
+  }
+
+  return statements;
+}
+
+// PATCH /api/state - Apply only what changed since the state was loaded (authenticated)
+state.patch('/', authMiddleware, async (c) => {
+  const db = c.env.DB;
+  const body = await c.req.json<StatePatch>();
+
+  if ((body.bots ?? []).some(bot => !bot.id)) {
+    return c.json({ error: 'Each bot patch needs an id' }, 400);
+  }
+  const statements = patchStatements(db, body);
+
+  // One transaction: the whole patch or none of it
+  if (statements.length) {
+    await db.batch(statements);
+  }
+
+  return c.json({ success: true, statements: statements.length });
+});
+
 export default state;
@@ -9,18 +9,21 @@ import { authMiddleware } from '../middleware/auth';
 const trades = new Hono<{ Bindings: Env }>();
 
 // GET /api/trades - Get recent trades (public)
+//
+// Newest first. Filters: bot_id, round, or a from_round/to_round range.
+// Pages either by offset or, for deep history, by the opaque `cursor`
+// returned as next_cursor (it seeks past the previous page's last trade
+// instead of counting through every trade before it).
 trades.get('/', async (c) => {
   const db = c.env.DB;
   const limit = parseInt(c.req.query('limit') || '50');
   const offset = parseInt(c.req.query('offset') || '0');
   const botId = c.req.query('bot_id');
   const round = c.req.query('round');
+  const fromRound = c.req.query('from_round');
+  const toRound = c.req.query('to_round');
+  const cursor = c.req.query('cursor');
 
-  let query = `
-    SELECT t.*, b.name as bot_name
-    FROM trades t
-    JOIN bots b ON t.bot_id = b.id
-  `;
   const conditions: string[] = [];
   const values: unknown[] = [];
 
@@ -32,35 +35,69 @@ trades.get('/', async (c) => {
     conditions.push('t.round = ?');
     values.push(parseInt(round));
   }
+  if (fromRound) {
+    conditions.push('t.round >= ?');
+    values.push(parseInt(fromRound));
+  }
+  if (toRound) {
+    conditions.push('t.round <= ?');
+    values.push(parseInt(toRound));
+  }
+  const filter = conditions.length > 0 ? ' WHERE ' + conditions.join(' AND ') : '';
 
-  if (conditions.length > 0) {
-    query += ' WHERE ' + conditions.join(' AND ');
+  const pageConditions = [...conditions];
+  const pageValues = [...values];
+  const after = cursor ? parseCursor(cursor) : null;
+  if (cursor && !after) {
+    return c.json({ error: 'Invalid cursor' }, 400);
+  }
+  if (after) {
+    pageConditions.push('(t.executed_at < ? OR (t.executed_at = ? AND t.id < ?))');
+    pageValues.push(after.executedAt, after.executedAt, after.id);
   }
 
-  query += ' ORDER BY t.executed_at DESC LIMIT ? OFFSET ?';
-  values.push(limit, offset);
+  let query = `
+    SELECT t.*, b.name as bot_name
+    FROM trades t
+    JOIN bots b ON t.bot_id = b.id
+  `;
+  if (pageConditions.length > 0) {
+    query += ' WHERE ' + pageConditions.join(' AND ');
+  }
+  query += ' ORDER BY t.executed_at DESC, t.id DESC LIMIT ? OFFSET ?';
+  pageValues.push(limit, offset);
 
-  const result = await db.prepare(query).bind(...values).all();
+  const result = await db.prepare(query).bind(...pageValues).all();
 
   // Get total count for pagination
-  let countQuery = 'SELECT COUNT(*) as count FROM trades t';
-  if (conditions.length > 0) {
-    countQuery += ' WHERE ' + conditions.join(' AND ');
-  }
-  const countResult = await db.prepare(countQuery)
-    .bind(...values.slice(0, conditions.length))
+  const countResult = await db.prepare('SELECT COUNT(*) as count FROM trades t' + filter)
+    .bind(...values)
     .first();
 
+  const rows = result.results as unknown as Trade[];
+  const last = rows.length === limit ? rows[rows.length - 1] : null;
+
   return c.json({
-    trades: result.results,
+    trades: rows,
     pagination: {
       limit,
       offset,
       total: (countResult?.count as number) || 0,
+      next_cursor: last ? `${last.executed_at}|${last.id}` : null,
     },
   });
 });
 
+// A next_cursor value: the executed_at and id of the last trade on a page
+function parseCursor(cursor: string): { executedAt: string; id: number } | null {
+  const split = cursor.lastIndexOf('|');
+  const id = parseInt(cursor.slice(split + 1));
+  if (split < 1 || isNaN(id)) {
+    return null;
+  }
+  return { executedAt: cursor.slice(0, split), id };
+}
+
 // POST /api/trades - Record a new trade (authenticated)
 trades.post('/', authMiddleware, async (c) => {
   const db = c.env.DB;
@@ -53,15 +53,54 @@ export interface GameState {
   updated_at: string | null;
 }
 
+// PATCH /api/state body - only what changed since the orchestrator loaded the state
+export interface BotPatch {
+  id: string;
+  cash?: number;
+  total_value?: number;
+  session_id?: string | null;
+  last_commentary?: string | null;
+  enabled?: boolean;
+  positions?: (Partial<Position> & { symbol: string })[];
+  opened_positions?: Position[];
+  closed_positions?: string[];
+}
+
+export interface StatePatch {
+  status?: 'running' | 'paused';
+  current_round?: number;
+  bots?: BotPatch[];
+}
+
 export interface Snapshot {
   id?: number;
   bot_id: string;
   total_value: number;
   round: number;
+  benchmark_price: number | null;
   captured_at: string | null;
 }
 
 export interface WebSocketMessage {
-  type: 'bot_update' | 'leaderboard' | 'trade' | 'round_start' | 'round_end';
+  type: 'bot_update' | 'bot_activity' | 'leaderboard' | 'trade' | 'round_start' | 'round_end';
   data: unknown;
 }
+
+// POST /api/snapshots/batch body
+export interface SnapshotBatchRequest {
+  round: number;
+  benchmark_price?: number | null;
+  snapshots: Array<{
+    bot_id: string;
+    total_value: number;
+  }>;
+}
+
+// POST /api/round/commit body - a bot turn's or a round's writes in one request
+export interface RoundCommit {
+  round?: number;
+  state?: StatePatch | null;
+  snapshots?: SnapshotBatchRequest['snapshots'] | null;
+  benchmark_price?: number | null;
+  broadcasts?: WebSocketMessage[];
+}
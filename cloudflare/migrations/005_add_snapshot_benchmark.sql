@@ -0,0 +1,4 @@
+-- Migration: Add benchmark price to equity snapshots
+-- Stores the SPY price at capture time so performance analytics can compute beta
+
+ALTER TABLE snapshots ADD COLUMN benchmark_price REAL;
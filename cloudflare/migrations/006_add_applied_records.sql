@@ -0,0 +1,11 @@
+-- Migration: Track records applied from MCP server write-behind queues
+-- A queue may retry a batch whose response was lost; remembering each
+-- record's client-generated id keeps the retry from inserting twice
+
+CREATE TABLE IF NOT EXISTS applied_records (
+    id TEXT PRIMARY KEY,  -- client-generated record id
+    bot_id TEXT NOT NULL REFERENCES bots(id),
+    kind TEXT NOT NULL,  -- 'trade', 'rejected', 'message', 'memory'
+    row_id INTEGER,  -- id of the inserted trade/rejection/message/memory
+    applied_at TEXT DEFAULT (datetime('now'))
+);
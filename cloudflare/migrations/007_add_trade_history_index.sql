@@ -0,0 +1,6 @@
+-- Migration: Index trades in history order
+-- Trade history is paged newest first with an (executed_at, id) cursor;
+-- these indexes let each page seek to the cursor instead of sorting the table
+
+CREATE INDEX IF NOT EXISTS idx_trades_executed ON trades(executed_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_trades_bot_executed ON trades(bot_id, executed_at DESC, id DESC);
@@ -50,6 +50,7 @@ CREATE TABLE snapshots (
     bot_id TEXT NOT NULL REFERENCES bots(id),
     total_value REAL NOT NULL,
     round INTEGER NOT NULL,
+    benchmark_price REAL,  -- SPY price at capture (for beta)
     captured_at TEXT DEFAULT (datetime('now'))
 );
 
@@ -75,8 +76,20 @@ CREATE TABLE rejected_trades (
     attempted_at TEXT DEFAULT (datetime('now'))
 );
 
+-- Records applied from MCP server write-behind queues (keeps a retried
+-- batch from inserting twice)
+CREATE TABLE applied_records (
+    id TEXT PRIMARY KEY,  -- client-generated record id
+    bot_id TEXT NOT NULL REFERENCES bots(id),
+    kind TEXT NOT NULL,  -- 'trade', 'rejected', 'message', 'memory'
+    row_id INTEGER,  -- id of the inserted trade/rejection/message/memory
+    applied_at TEXT DEFAULT (datetime('now'))
+);
+
 CREATE INDEX idx_trades_bot ON trades(bot_id);
 CREATE INDEX idx_trades_round ON trades(round);
+CREATE INDEX idx_trades_executed ON trades(executed_at DESC, id DESC);
+CREATE INDEX idx_trades_bot_executed ON trades(bot_id, executed_at DESC, id DESC);
 CREATE INDEX idx_positions_bot ON positions(bot_id);
 CREATE INDEX idx_snapshots_bot ON snapshots(bot_id);
 CREATE INDEX idx_snapshots_round ON snapshots(round);
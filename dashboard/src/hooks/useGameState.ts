@@ -3,7 +3,7 @@
  */
 
 import { useCallback, useEffect, useState } from 'react';
-import type { GameState, LeaderboardEntry, Trade, WebSocketMessage, Message, RejectedTrade, BotPortfolio } from '../types';
+import type { GameState, LeaderboardEntry, Trade, WebSocketMessage, Message, RejectedTrade, BotPortfolio, BotActivity } from '../types';
 
 const API_URL = import.meta.env.VITE_API_URL || '';
 
@@ -156,6 +156,20 @@ export function useGameState(): UseGameStateReturn {
         break;
       }
 
+      case 'bot_activity': {
+        // Show what a running bot is saying before its turn is stored
+        const activity = message.data as BotActivity;
+        if (activity.kind !== 'text' || typeof activity.text !== 'string') break;
+        setLeaderboard(prev =>
+          prev.map(entry =>
+            entry.id === activity.bot_id
+              ? { ...entry, last_commentary: activity.text! }
+              : entry
+          )
+        );
+        break;
+      }
+
       case 'round_start': {
         const data = message.data as { round: number };
         setState(prev => prev ? { ...prev, current_round: data.round } : null);
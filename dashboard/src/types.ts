@@ -68,10 +68,21 @@ export interface LeaderboardResponse {
 export type WebSocketStatus = 'connecting' | 'connected' | 'disconnected';
 
 export interface WebSocketMessage {
-  type: 'connected' | 'bot_update' | 'leaderboard' | 'trade' | 'round_start' | 'round_end' | 'pong' | 'message' | 'rejected_trade';
+  type: 'connected' | 'bot_update' | 'bot_activity' | 'leaderboard' | 'trade' | 'round_start' | 'round_end' | 'pong' | 'message' | 'rejected_trade';
   data: unknown;
 }
 
+// A bot's text or tool call, broadcast while the bot is still running
+export interface BotActivity {
+  bot_id: string;
+  bot_name: string;
+  kind: 'text' | 'tool_call';
+  text?: string;
+  tool?: string;
+  input?: unknown;
+  elapsed: number;
+}
+
 export interface Message {
   id: number;
   round: number;
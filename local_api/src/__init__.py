@@ -0,0 +1 @@
+"""Local stand-in for the Trading Arena Workers API."""
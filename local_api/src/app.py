@@ -0,0 +1,168 @@
+"""Local stand-in for the Trading Arena Workers API.
+
+Implements the routes the Python side uses on SQLite, with
+cloudflare/schema.sql and the migrations applied, so the orchestrator,
+MCP servers and scripts can run end to end on one machine.
+
+Usage: CF_API_KEY=dev python -m local_api.src.app --db arena.db --port 8787
+Then point CF_API_URL at http://127.0.0.1:8787.
+"""
+
+import argparse
+import os
+from collections import deque
+from typing import Optional
+
+import uvicorn
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from .common import broadcast, get_db, require_auth
+from .db import Database
+from .routes import bot, leaderboard, memory, snapshots, social, state, trades
+
+load_dotenv()
+
+
+async def health(request: Request) -> JSONResponse:
+    """Health check."""
+    return JSONResponse({
+        "name": "Trading Arena API",
+        "version": "0.1.0",
+        "status": "healthy",
+        "backend": "local",
+    })
+
+
+@require_auth
+async def increment_round(request: Request) -> JSONResponse:
+    """POST /api/round/increment - Increment round counter (authenticated)."""
+    db = get_db(request)
+
+    with db.transaction() as conn:
+        conn.execute(
+            "UPDATE game SET current_round = current_round + 1, updated_at = datetime('now') WHERE id = 1"
+        )
+        new_round = conn.execute("SELECT current_round FROM game WHERE id = 1").fetchone()[0] or 0
+
+        # Provisional snapshots for all bots
+        conn.execute(
+            """
+            INSERT INTO snapshots (bot_id, total_value, round, captured_at)
+            SELECT id, total_value, ?, datetime('now')
+            FROM bots
+            WHERE enabled = 1
+            """,
+            (new_round,),
+        )
+
+    broadcast(request, {"type": "round_start", "data": {"round": new_round}})
+    return JSONResponse({"round": new_round})
+
+
+@require_auth
+async def commit_round(request: Request) -> JSONResponse:
+    """POST /api/round/commit - Apply a bot turn's or a round's writes at once (authenticated).
+
+    The state patch and the snapshots commit in one transaction; the
+    broadcasts are sent, in order, only once it has.
+    """
+    body = await request.json()
+    patch = body.get("state") or {}
+    if any(not bot.get("id") for bot in patch.get("bots") or []):
+        return JSONResponse({"error": "Each bot patch needs an id"}, status_code=400)
+    if body.get("snapshots") is not None and body.get("round") is None:
+        return JSONResponse({"error": "round is required with snapshots"}, status_code=400)
+
+    with get_db(request).transaction() as conn:
+        statements = state.apply_patch(conn, patch)
+        if body.get("snapshots") is not None:
+            statements += snapshots.write_snapshots(
+                conn, body["round"], body["snapshots"], body.get("benchmark_price")
+            )
+
+    messages = body.get("broadcasts") or []
+    for message in messages:
+        broadcast(request, message)
+
+    return JSONResponse({"success": True, "statements": statements, "broadcasts": len(messages)})
+
+
+@require_auth
+async def post_broadcast(request: Request) -> JSONResponse:
+    """POST /api/broadcast - Record a broadcast (authenticated)."""
+    broadcast(request, await request.json())
+    return JSONResponse({"success": True})
+
+
+@require_auth
+async def post_broadcast_batch(request: Request) -> JSONResponse:
+    """POST /api/broadcast/batch - Record several broadcasts, in order (authenticated)."""
+    body = await request.json()
+    messages = body.get("messages")
+    if not isinstance(messages, list):
+        return JSONResponse({"error": "messages is required"}, status_code=400)
+    for message in messages:
+        broadcast(request, message)
+    return JSONResponse({"success": True, "count": len(messages)})
+
+
+async def ws_connections(request: Request) -> JSONResponse:
+    """GET /ws/connections - No sockets locally; reports recorded broadcasts."""
+    return JSONResponse({"connections": 0, "broadcasts": len(request.app.state.broadcasts)})
+
+
+def create_app(db_path: str = ":memory:", api_key: Optional[str] = None) -> Starlette:
+    """Create the application.
+
+    Args:
+        db_path: SQLite file (":memory:" for a throwaway database)
+        api_key: Bearer token for authenticated routes (defaults to CF_API_KEY)
+
+    Returns:
+        Starlette app
+    """
+    app = Starlette(
+        routes=[
+            Route("/", health),
+            Route("/api/round/increment", increment_round, methods=["POST"]),
+            Route("/api/round/commit", commit_round, methods=["POST"]),
+            Route("/api/broadcast", post_broadcast, methods=["POST"]),
+            Route("/api/broadcast/batch", post_broadcast_batch, methods=["POST"]),
+            Route("/ws/connections", ws_connections),
+            *state.routes,
+            *leaderboard.routes,
+            *bot.routes,
+            *trades.routes,
+            *social.routes,
+            *memory.routes,
+            *snapshots.routes,
+        ],
+    )
+    app.state.db = Database(db_path)
+    app.state.api_key = api_key or os.environ.get("CF_API_KEY", "")
+    app.state.broadcasts = deque(maxlen=1000)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Trading Arena API (SQLite)")
+    parser.add_argument("--db", default="arena-local.db", help="SQLite file (':memory:' for none)")
+    parser.add_argument("--port", type=int, default=8787, help="Port to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
+    parser.add_argument("--api-key", help="API key (default: CF_API_KEY env var)")
+    args = parser.parse_args()
+
+    app = create_app(args.db, args.api_key)
+    if not app.state.api_key:
+        parser.error("An API key is required (--api-key or CF_API_KEY)")
+
+    print(f"Starting local Trading Arena API on {args.host}:{args.port} (db: {args.db})")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Helpers shared by the route modules."""
+
+import functools
+import hashlib
+import json
+from typing import Awaitable, Callable
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from .db import Database
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+def get_db(request: Request) -> Database:
+    return request.app.state.db
+
+
+def require_auth(handler: Handler) -> Handler:
+    """Reject requests without the API key (mirrors ``authMiddleware``)."""
+
+    @functools.wraps(handler)
+    async def wrapper(request: Request) -> Response:
+        auth_header = request.headers.get("Authorization", "")
+        if not auth_header.startswith("Bearer "):
+            return JSONResponse(
+                {"error": "Unauthorized - Missing or invalid Authorization header"}, status_code=401
+            )
+        if auth_header[7:] != request.app.state.api_key:
+            return JSONResponse({"error": "Unauthorized - Invalid API key"}, status_code=401)
+        return await handler(request)
+
+    return wrapper
+
+
+def query_int(request: Request, name: str, default: int) -> int:
+    """Parse an integer query parameter (like ``parseInt(c.req.query(...))``)."""
+    try:
+        return int(request.query_params.get(name) or default)
+    except ValueError:
+        return default
+
+
+def json_etag(body) -> str:
+    """Content hash of a JSON body, used as its ETag (like ``jsonETag``)."""
+    return '"' + hashlib.sha1(json.dumps(body).encode()).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match names this ETag (weak or strong, like ``etagMatches``)."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    return any(
+        tag.strip() == "*" or tag.strip().removeprefix("W/") == etag for tag in header.split(",")
+    )
+
+
+def broadcast(request: Request, message: dict) -> None:
+    """Record a WebSocket broadcast (there are no sockets locally)."""
+    request.app.state.broadcasts.append(message)
@@ -0,0 +1,113 @@
+"""SQLite database with the D1 schema and migrations applied."""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence
+
+CLOUDFLARE_DIR = Path(__file__).parent.parent.parent / "cloudflare"
+SCHEMA_PATH = CLOUDFLARE_DIR / "schema.sql"
+MIGRATIONS_DIR = CLOUDFLARE_DIR / "migrations"
+
+
+def _statements(sql: str) -> list[str]:
+    """Split a SQL script into complete statements."""
+    statements = []
+    current = ""
+    for line in sql.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ""
+    if current.strip():
+        statements.append(current.strip())
+    return statements
+
+
+class Database:
+    """Thread-safe SQLite connection mirroring the D1 database.
+
+    The schema is applied on first open, then every migration in
+    ``cloudflare/migrations`` that has not been recorded yet. Migrations
+    that re-add columns already present in ``schema.sql`` are tolerated.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Open (and if needed initialize) the database.
+
+        Args:
+            path: SQLite file path, or ":memory:" for a throwaway database
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._conn.close()
+
+    def _migrate(self) -> None:
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'game'"
+            ).fetchone()
+            if not exists:
+                self._conn.executescript(SCHEMA_PATH.read_text())
+
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _migrations (name TEXT PRIMARY KEY, applied_at TEXT DEFAULT (datetime('now')))"
+            )
+            applied = {row["name"] for row in self._conn.execute("SELECT name FROM _migrations")}
+
+            for migration in sorted(MIGRATIONS_DIR.glob("*.sql")):
+                if migration.name in applied:
+                    continue
+                for statement in _statements(migration.read_text()):
+                    try:
+                        self._conn.execute(statement)
+                    except sqlite3.OperationalError as e:
+                        if "duplicate column name" not in str(e):
+                            raise
+                self._conn.execute("INSERT INTO _migrations (name) VALUES (?)", (migration.name,))
+
+    def all(self, sql: str, params: Sequence[Any] = ()) -> list[dict]:
+        """Run a query and return every row as a dict."""
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def first(self, sql: str, params: Sequence[Any] = ()) -> Optional[dict]:
+        """Run a query and return the first row as a dict, or None."""
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return dict(row) if row else None
+
+    def run(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Execute a statement and return the last inserted row ID."""
+        with self._lock:
+            return self._conn.execute(sql, params).lastrowid
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run several statements atomically (like D1's ``db.batch``)."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def current_round(self) -> int:
+        game = self.first("SELECT current_round FROM game WHERE id = 1")
+        return (game or {}).get("current_round") or 0
+
+    def starting_cash(self) -> float:
+        game = self.first("SELECT starting_cash FROM game WHERE id = 1")
+        return (game or {}).get("starting_cash") or 100000
@@ -0,0 +1 @@
+"""Route modules, one per Workers API route file."""
@@ -0,0 +1,308 @@
+"""Bot routes - individual bot details and updates.
+
+The legacy ``POST /api/bot/{id}/order`` route is not ported; bots execute
+on Alpaca and record fills through ``/api/bot/{id}/trade``.
+"""
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from ..common import broadcast, get_db, require_auth
+from .state import _position
+
+
+async def get_bot(request: Request) -> JSONResponse:
+    """GET /api/bot/{id} - Get individual bot details (public)."""
+    db = get_db(request)
+    bot_id = request.path_params["id"]
+
+    row = db.first("SELECT * FROM bots WHERE id = ?", (bot_id,))
+    if not row:
+        return JSONResponse({"error": "Bot not found"}, status_code=404)
+
+    positions = db.all("SELECT * FROM positions WHERE bot_id = ?", (bot_id,))
+    trades = db.all(
+        "SELECT * FROM trades WHERE bot_id = ? ORDER BY executed_at DESC LIMIT 20", (bot_id,)
+    )
+    starting_cash = db.starting_cash()
+
+    return JSONResponse({
+        "id": row["id"],
+        "name": row["name"],
+        "type": row["type"],
+        "cash": row["cash"],
+        "total_value": row["total_value"],
+        "return_pct": (row["total_value"] / starting_cash - 1) * 100,
+        "session_id": row["session_id"],
+        "last_commentary": row["last_commentary"],
+        "enabled": bool(row["enabled"]),
+        "updated_at": row["updated_at"],
+        "positions": [_position(p) for p in positions],
+        "trades": trades,
+    })
+
+
+@require_auth
+async def put_bot(request: Request) -> JSONResponse:
+    """PUT /api/bot/{id} - Update bot (authenticated)."""
+    db = get_db(request)
+    bot_id = request.path_params["id"]
+    body = await request.json()
+
+    updates = []
+    values = []
+    for column in ("cash", "total_value", "session_id", "last_commentary",
+                   "alpaca_api_key", "alpaca_secret_key"):
+        if column in body:
+            updates.append(f"{column} = ?")
+            values.append(body[column])
+    if "enabled" in body:
+        updates.append("enabled = ?")
+        values.append(1 if body["enabled"] else 0)
+
+    updates.append("updated_at = datetime('now')")
+    values.append(bot_id)
+
+    with db.transaction() as conn:
+        conn.execute(f"UPDATE bots SET {', '.join(updates)} WHERE id = ?", values)
+
+        if body.get("positions") is not None:
+            conn.execute("DELETE FROM positions WHERE bot_id = ?", (bot_id,))
+            conn.executemany(
+                """
+                INSERT INTO positions (bot_id, symbol, shares, avg_cost, current_price)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [
+                    (bot_id, p["symbol"], p["shares"], p["avg_cost"], p.get("current_price"))
+                    for p in body["positions"]
+                ],
+            )
+
+    return JSONResponse({"success": True})
+
+
+@require_auth
+async def get_credentials(request: Request) -> JSONResponse:
+    """GET /api/bot/{id}/credentials - Get Alpaca credentials (authenticated)."""
+    db = get_db(request)
+    row = db.first(
+        "SELECT id, name, alpaca_api_key, alpaca_secret_key FROM bots WHERE id = ?",
+        (request.path_params["id"],),
+    )
+
+    if not row:
+        return JSONResponse({"error": "Bot not found"}, status_code=404)
+    if not row["alpaca_api_key"] or not row["alpaca_secret_key"]:
+        return JSONResponse(
+            {"error": "Alpaca credentials not configured for this bot"}, status_code=400
+        )
+
+    return JSONResponse({
+        "name": row["name"],
+        "alpaca_api_key": row["alpaca_api_key"],
+        "alpaca_secret_key": row["alpaca_secret_key"],
+    })
+
+
+@require_auth
+async def record_trade(request: Request) -> JSONResponse:
+    """POST /api/bot/{id}/trade - Record a trade executed via Alpaca (authenticated)."""
+    db = get_db(request)
+    bot_id = request.path_params["id"]
+    trade = await request.json()
+
+    row = db.first("SELECT * FROM bots WHERE id = ?", (bot_id,))
+    if not row:
+        return JSONResponse({"error": "Bot not found"}, status_code=404)
+
+    current_round = db.current_round()
+    symbol = trade["symbol"].upper()
+    side = trade["side"].upper()
+
+    trade_id = db.run(
+        """
+        INSERT INTO trades (bot_id, symbol, side, shares, price, commentary, round, executed_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+        """,
+        (bot_id, symbol, side, trade["shares"], trade.get("price"),
+         trade.get("commentary") or None, current_round),
+    )
+
+    broadcast(request, {
+        "type": "trade",
+        "data": {
+            "id": trade_id,
+            "bot_id": bot_id,
+            "bot_name": row["name"],
+            "symbol": symbol,
+            "side": side,
+            "shares": trade["shares"],
+            "price": trade.get("price"),
+            "round": current_round,
+        },
+    })
+
+    return JSONResponse({"success": True, "trade_id": trade_id})
+
+
+# MCP servers journal trades, rejections, messages and memories locally and
+# post them here in batches. Each record carries a client-generated id that
+# applied_records remembers, so a retried batch doesn't insert twice.
+
+MEMORY_TYPES = ["trade", "rival", "strategy", "reflection", "note"]
+
+
+def _record_statement(bot_id: str, record: dict, round_num: int) -> tuple[str, tuple] | str:
+    """Insert statement for one queued record, or a validation error."""
+    d = record.get("data") or {}
+    at = record.get("at")
+    kind = record.get("kind")
+    if kind == "trade":
+        if not d.get("symbol") or not d.get("side"):
+            return "symbol and side are required"
+        return (
+            """
+            INSERT INTO trades (bot_id, symbol, side, shares, price, commentary, round, executed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+            """,
+            (bot_id, d["symbol"].upper(), d["side"].upper(), d.get("shares"), d.get("price"),
+             d.get("commentary") or None, round_num, at),
+        )
+    if kind == "rejected":
+        if not d.get("symbol") or not d.get("side") or not d.get("reason"):
+            return "symbol, side and reason are required"
+        return (
+            """
+            INSERT INTO rejected_trades (bot_id, symbol, side, shares, reason, round, attempted_at)
+            VALUES (?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+            """,
+            (bot_id, d["symbol"].upper(), d["side"].upper(), d.get("shares"), d["reason"],
+             round_num, at),
+        )
+    if kind == "message":
+        if not d.get("content"):
+            return "content is required"
+        return (
+            """
+            INSERT INTO messages (round, from_bot, to_bot, content, created_at)
+            VALUES (?, ?, ?, ?, COALESCE(?, datetime('now')))
+            """,
+            (round_num, bot_id, d.get("to_bot") or None, d["content"], at),
+        )
+    if kind == "memory":
+        if not d.get("type") or not d.get("content"):
+            return "type and content are required"
+        if d["type"] not in MEMORY_TYPES:
+            return f"Invalid type. Must be one of: {', '.join(MEMORY_TYPES)}"
+        importance = d.get("importance", 5)
+        if importance < 1 or importance > 10:
+            return "Importance must be between 1 and 10"
+        return (
+            """
+            INSERT INTO memories (bot_id, round, type, content, importance, created_at)
+            VALUES (?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+            """,
+            (bot_id, round_num, d["type"], d["content"], importance, at),
+        )
+    return f"Unknown record kind: {kind}"
+
+
+@require_auth
+async def apply_records(request: Request) -> JSONResponse:
+    """POST /api/bot/{id}/records - Apply a batch of queued records in order (authenticated)."""
+    db = get_db(request)
+    bot_id = request.path_params["id"]
+    records = (await request.json()).get("records") or []
+
+    row = db.first("SELECT name FROM bots WHERE id = ?", (bot_id,))
+    if not row:
+        return JSONResponse({"error": "Bot not found"}, status_code=404)
+
+    applied: dict[str, int] = {}
+    if records:
+        placeholders = ", ".join("?" for _ in records)
+        applied = {
+            r["id"]: r["row_id"]
+            for r in db.all(
+                f"SELECT id, row_id FROM applied_records WHERE id IN ({placeholders})",
+                [r["id"] for r in records],
+            )
+        }
+
+    current_round = db.current_round()
+    results = []
+    inserted = []
+    with db.transaction() as conn:
+        for record in records:
+            if record["id"] in applied:
+                results.append({"id": record["id"], "status": "duplicate", "row_id": applied[record["id"]]})
+                continue
+            round_num = record["round"] if record.get("round") is not None else current_round
+            statement = _record_statement(bot_id, record, round_num)
+            if isinstance(statement, str):
+                results.append({"id": record["id"], "status": "error", "error": statement})
+                continue
+            row_id = conn.execute(*statement).lastrowid
+            conn.execute(
+                "INSERT INTO applied_records (id, bot_id, kind, row_id) VALUES (?, ?, ?, ?)",
+                (record["id"], bot_id, record["kind"], row_id),
+            )
+            results.append({"id": record["id"], "status": "ok", "row_id": row_id})
+            inserted.append((record, round_num, row_id))
+
+    for record, round_num, row_id in inserted:
+        d = record["data"]
+        if record["kind"] == "trade":
+            broadcast(request, {
+                "type": "trade",
+                "data": {
+                    "id": row_id,
+                    "bot_id": bot_id,
+                    "bot_name": row["name"],
+                    "symbol": d["symbol"].upper(),
+                    "side": d["side"].upper(),
+                    "shares": d.get("shares"),
+                    "price": d.get("price"),
+                    "round": round_num,
+                },
+            })
+        elif record["kind"] == "rejected":
+            broadcast(request, {
+                "type": "rejected_trade",
+                "data": {
+                    "id": row_id,
+                    "bot_id": bot_id,
+                    "bot_name": row["name"],
+                    "symbol": d["symbol"].upper(),
+                    "side": d["side"].upper(),
+                    "shares": d.get("shares"),
+                    "reason": d["reason"],
+                    "round": round_num,
+                },
+            })
+        elif record["kind"] == "message":
+            broadcast(request, {
+                "type": "message",
+                "data": {
+                    "id": row_id,
+                    "round": round_num,
+                    "from_bot": bot_id,
+                    "from_name": row["name"],
+                    "to_bot": d.get("to_bot") or None,
+                    "content": d["content"],
+                    "is_dm": bool(d.get("to_bot")),
+                },
+            })
+
+    return JSONResponse({"success": True, "results": results})
+
+
+routes = [
+    Route("/api/bot/{id}", get_bot, methods=["GET"]),
+    Route("/api/bot/{id}", put_bot, methods=["PUT"]),
+    Route("/api/bot/{id}/credentials", get_credentials, methods=["GET"]),
+    Route("/api/bot/{id}/trade", record_trade, methods=["POST"]),
+    Route("/api/bot/{id}/records", apply_records, methods=["POST"]),
+]
@@ -0,0 +1,84 @@
+"""Leaderboard routes.
+
+``/api/leaderboard/live`` serves stored values instead of querying Alpaca.
+"""
+
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from ..common import get_db, query_int
+
+
+def _standings(request: Request) -> tuple[int, float, list[dict]]:
+    db = get_db(request)
+    starting_cash = db.starting_cash()
+    rows = db.all(
+        """
+        SELECT id, name, type, cash, total_value, last_commentary, enabled, updated_at
+        FROM bots
+        WHERE enabled = 1
+        ORDER BY total_value DESC
+        """
+    )
+    standings = [
+        {
+            "rank": i + 1,
+            "id": bot["id"],
+            "name": bot["name"],
+            "type": bot["type"],
+            "cash": bot["cash"],
+            "total_value": bot["total_value"],
+            "return_pct": (bot["total_value"] / starting_cash - 1) * 100,
+            "last_commentary": bot["last_commentary"],
+            "updated_at": bot["updated_at"],
+        }
+        for i, bot in enumerate(rows)
+    ]
+    return db.current_round(), starting_cash, standings
+
+
+async def get_leaderboard(request: Request) -> JSONResponse:
+    """GET /api/leaderboard - Get ranked bot list."""
+    current_round, starting_cash, standings = _standings(request)
+    return JSONResponse({
+        "current_round": current_round,
+        "starting_cash": starting_cash,
+        "leaderboard": standings,
+    })
+
+
+async def get_live_leaderboard(request: Request) -> JSONResponse:
+    """GET /api/leaderboard/live - Same as the stored leaderboard locally."""
+    current_round, starting_cash, standings = _standings(request)
+    return JSONResponse({
+        "current_round": current_round,
+        "starting_cash": starting_cash,
+        "leaderboard": standings,
+        "refreshed_at": datetime.now(timezone.utc).isoformat(),
+    })
+
+
+async def get_history(request: Request) -> JSONResponse:
+    """GET /api/leaderboard/history - Get historical snapshots."""
+    limit = query_int(request, "limit", 100)
+    snapshots = get_db(request).all(
+        """
+        SELECT s.bot_id, b.name, s.total_value, s.round, s.captured_at
+        FROM snapshots s
+        JOIN bots b ON s.bot_id = b.id
+        ORDER BY s.round DESC, s.total_value DESC
+        LIMIT ?
+        """,
+        (limit,),
+    )
+    return JSONResponse({"snapshots": snapshots})
+
+
+routes = [
+    Route("/api/leaderboard", get_leaderboard, methods=["GET"]),
+    Route("/api/leaderboard/live", get_live_leaderboard, methods=["GET"]),
+    Route("/api/leaderboard/history", get_history, methods=["GET"]),
+]
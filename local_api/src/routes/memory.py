@@ -0,0 +1,180 @@
+"""Memory routes - persistent bot memories across rounds."""
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from ..common import get_db, query_int, require_auth
+
+VALID_TYPES = ["trade", "rival", "strategy", "reflection", "note"]
+SHORT_TERM_ROUNDS = 3
+
+
+@require_auth
+async def create_memory(request: Request) -> JSONResponse:
+    """POST /api/memory - Create a new memory (authenticated)."""
+    db = get_db(request)
+    body = await request.json()
+
+    if not body.get("bot_id") or not body.get("type") or not body.get("content"):
+        return JSONResponse({"error": "bot_id, type, and content are required"}, status_code=400)
+
+    if body["type"] not in VALID_TYPES:
+        return JSONResponse(
+            {"error": f"Invalid type. Must be one of: {', '.join(VALID_TYPES)}"}, status_code=400
+        )
+
+    importance = body.get("importance", 5)
+    if importance < 1 or importance > 10:
+        return JSONResponse({"error": "Importance must be between 1 and 10"}, status_code=400)
+
+    current_round = db.current_round()
+    memory_id = db.run(
+        "INSERT INTO memories (bot_id, round, type, content, importance) VALUES (?, ?, ?, ?, ?)",
+        (body["bot_id"], current_round, body["type"], body["content"], importance),
+    )
+
+    return JSONResponse({"success": True, "memory_id": memory_id, "round": current_round})
+
+
+async def list_memories(request: Request) -> JSONResponse:
+    """GET /api/memory/{bot_id} - Get memories for a bot (public).
+
+    ``?since_id=`` returns only newer memories, oldest first, for syncing a
+    local copy page by page.
+    """
+    bot_id = request.path_params["bot_id"]
+    memory_type = request.query_params.get("type")
+    count = query_int(request, "count", 20)
+    min_importance = query_int(request, "min_importance", 1)
+    target_bot = request.query_params.get("target_bot")
+    since_id = query_int(request, "since_id", 0)
+
+    query = """
+        SELECT id, bot_id, round, type, content, importance, created_at
+        FROM memories
+        WHERE bot_id = ?
+    """
+    params: list = [bot_id]
+    if memory_type in VALID_TYPES:
+        query += " AND type = ?"
+        params.append(memory_type)
+    if min_importance > 1:
+        query += " AND importance >= ?"
+        params.append(min_importance)
+    if target_bot and memory_type == "rival":
+        query += " AND content LIKE ?"
+        params.append(f"%{target_bot}%")
+    if "since_id" in request.query_params:
+        query += " AND id > ? ORDER BY id ASC LIMIT ?"
+        params.extend([since_id, count])
+    else:
+        query += " ORDER BY round DESC, importance DESC, created_at DESC LIMIT ?"
+        params.append(count)
+
+    memories = get_db(request).all(query, params)
+    return JSONResponse({
+        "bot_id": bot_id,
+        "count": len(memories),
+        "memories": [
+            {
+                "id": m["id"],
+                "round": m["round"],
+                "type": m["type"],
+                "content": m["content"],
+                "importance": m["importance"],
+                "created_at": m["created_at"],
+            }
+            for m in memories
+        ],
+    })
+
+
+async def memory_context(request: Request) -> JSONResponse:
+    """GET /api/memory/{bot_id}/context - Organized memories for context injection."""
+    db = get_db(request)
+    bot_id = request.path_params["bot_id"]
+    current_round = db.current_round()
+    cutoff = max(0, current_round - SHORT_TERM_ROUNDS)
+
+    short_term = db.all(
+        """
+        SELECT id, round, type, content, importance, created_at
+        FROM memories
+        WHERE bot_id = ? AND round > ?
+        ORDER BY round DESC, created_at DESC
+        LIMIT 30
+        """,
+        (bot_id, cutoff),
+    )
+    long_term = db.all(
+        """
+        SELECT id, round, type, content, importance, created_at
+        FROM memories
+        WHERE bot_id = ? AND round <= ? AND importance >= 7
+        ORDER BY importance DESC, round DESC
+        LIMIT 20
+        """,
+        (bot_id, cutoff),
+    )
+    strategy = db.first(
+        """
+        SELECT content, round
+        FROM memories
+        WHERE bot_id = ? AND type = 'strategy'
+        ORDER BY round DESC, created_at DESC
+        LIMIT 1
+        """,
+        (bot_id,),
+    )
+    rivals = db.all(
+        """
+        SELECT content, round, importance
+        FROM memories
+        WHERE bot_id = ? AND type = 'rival'
+        ORDER BY round DESC, importance DESC
+        LIMIT 15
+        """,
+        (bot_id,),
+    )
+
+    short_term_by_type: dict[str, list[dict]] = {}
+    for m in short_term:
+        short_term_by_type.setdefault(m["type"], []).append(
+            {"content": m["content"], "round": m["round"]}
+        )
+
+    return JSONResponse({
+        "current_round": current_round,
+        "short_term": short_term_by_type,
+        "long_term": [
+            {
+                "type": m["type"],
+                "content": m["content"],
+                "round": m["round"],
+                "importance": m["importance"],
+            }
+            for m in long_term
+        ],
+        "active_strategy": {
+            "content": strategy["content"],
+            "since_round": strategy["round"],
+        } if strategy else None,
+        "rival_notes": [{"content": r["content"], "round": r["round"]} for r in rivals],
+    })
+
+
+@require_auth
+async def delete_memory(request: Request) -> JSONResponse:
+    """DELETE /api/memory/{memory_id} - Delete a specific memory (authenticated)."""
+    get_db(request).run("DELETE FROM memories WHERE id = ?", (request.path_params["bot_id"],))
+    return JSONResponse({"success": True})
+
+
+routes = [
+    Route("/api/memory", create_memory, methods=["POST"]),
+    Route("/api/memory/{bot_id}/context", memory_context, methods=["GET"]),
+    Route("/api/memory/{bot_id}", list_memories, methods=["GET"]),
+    # Same path segment as above - it carries a memory ID here
+    Route("/api/memory/{bot_id}", delete_memory, methods=["DELETE"]),
+]
@@ -0,0 +1,147 @@
+"""Snapshot routes - per-round equity curves."""
+
+from typing import Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from ..common import get_db, query_int, require_auth
+
+
+def downsample_indices(xs: list, ys: list, max_points: int) -> list[int]:
+    """Pick point indices with Largest-Triangle-Three-Buckets."""
+    n = len(xs)
+    if max_points >= n or max_points < 3:
+        return list(range(n))
+
+    chosen = [0]
+    bucket_size = (n - 2) / (max_points - 2)
+    a = 0
+    for i in range(max_points - 2):
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_len = max(next_end - next_start, 1)
+        avg_x = sum(xs[next_start:next_end]) / next_len
+        avg_y = sum(ys[next_start:next_end]) / next_len
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        best = start
+        max_area = -1.0
+        for j in range(start, end):
+            area = abs((xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a]))
+            if area > max_area:
+                max_area = area
+                best = j
+        chosen.append(best)
+        a = best
+
+    chosen.append(n - 1)
+    return chosen
+
+
+async def get_snapshots(request: Request) -> JSONResponse:
+    """GET /api/snapshots - Equity curves per bot (public)."""
+    db = get_db(request)
+    bot_id = request.query_params.get("bot_id")
+    since_round = query_int(request, "since_round", 0)
+    max_points = query_int(request, "max_points", 0)
+
+    query = "SELECT bot_id, round, total_value, benchmark_price FROM snapshots WHERE round >= ?"
+    traded_query = """
+        SELECT bot_id, round, SUM(ABS(shares * price)) as traded
+        FROM trades
+        WHERE round >= ?
+    """
+    params: list = [since_round]
+    if bot_id:
+        query += " AND bot_id = ?"
+        traded_query += " AND bot_id = ?"
+        params.append(bot_id)
+    query += " ORDER BY bot_id, round, captured_at"
+    traded_query += " GROUP BY bot_id, round"
+
+    traded_by_key = {
+        (row["bot_id"], row["round"]): row["traded"] or 0
+        for row in db.all(traded_query, params)
+    }
+
+    # Columnar curves, one entry per round (latest capture wins)
+    curves: dict[str, dict] = {}
+    benchmark_by_round: dict[int, float] = {}
+    for row in db.all(query, params):
+        bid = row["bot_id"]
+        round_num = row["round"]
+        if row["benchmark_price"] is not None:
+            benchmark_by_round[round_num] = row["benchmark_price"]
+        curve = curves.setdefault(bid, {"rounds": [], "values": [], "traded": []})
+        if curve["rounds"] and curve["rounds"][-1] == round_num:
+            curve["values"][-1] = row["total_value"]
+        else:
+            curve["rounds"].append(round_num)
+            curve["values"].append(row["total_value"])
+            curve["traded"].append(traded_by_key.get((bid, round_num), 0))
+
+    benchmark_rounds = sorted(benchmark_by_round)
+    benchmark = {
+        "rounds": benchmark_rounds,
+        "values": [benchmark_by_round[r] for r in benchmark_rounds],
+    }
+
+    if max_points > 0:
+        for bid, curve in curves.items():
+            keep = downsample_indices(curve["rounds"], curve["values"], max_points)
+            curves[bid] = {key: [curve[key][i] for i in keep] for key in curve}
+        keep = downsample_indices(benchmark["rounds"], benchmark["values"], max_points)
+        benchmark = {key: [benchmark[key][i] for i in keep] for key in benchmark}
+
+    return JSONResponse({
+        "since_round": since_round,
+        "curves": curves,
+        "benchmark": benchmark,
+    })
+
+
+def write_snapshots(
+    conn, round_num: int, snapshots: list[dict], benchmark_price: Optional[float] = None
+) -> int:
+    """Write one round of snapshots inside a transaction, replacing any for
+    the same bot and round.
+
+    Returns:
+        How many statements were run
+    """
+    for s in snapshots:
+        conn.execute(
+            "DELETE FROM snapshots WHERE bot_id = ? AND round = ?", (s["bot_id"], round_num)
+        )
+        conn.execute(
+            """
+            INSERT INTO snapshots (bot_id, total_value, round, benchmark_price, captured_at)
+            VALUES (?, ?, ?, ?, datetime('now'))
+            """,
+            (s["bot_id"], s["total_value"], round_num, benchmark_price),
+        )
+    return 2 * len(snapshots)
+
+
+@require_auth
+async def post_snapshot_batch(request: Request) -> JSONResponse:
+    """POST /api/snapshots/batch - Write one round of snapshots (authenticated)."""
+    body = await request.json()
+
+    if body.get("round") is None or not isinstance(body.get("snapshots"), list):
+        return JSONResponse({"error": "round and snapshots are required"}, status_code=400)
+
+    round_num = body["round"]
+    with get_db(request).transaction() as conn:
+        write_snapshots(conn, round_num, body["snapshots"], body.get("benchmark_price"))
+
+    return JSONResponse({"success": True, "round": round_num, "count": len(body["snapshots"])})
+
+
+routes = [
+    Route("/api/snapshots", get_snapshots, methods=["GET"]),
+    Route("/api/snapshots/batch", post_snapshot_batch, methods=["POST"]),
+]
@@ -0,0 +1,509 @@
+"""Social routes - messages, all portfolios, round context.
+
+``/api/social/portfolios`` serves stored cash, values and positions
+instead of querying Alpaca.
+"""
+
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from ..common import broadcast, etag_matches, get_db, json_etag, query_int, require_auth
+
+SHORT_TERM_ROUNDS = 3
+
+
+def _message(m: dict) -> dict:
+    return {
+        "id": m["id"],
+        "round": m["round"],
+        "from_bot": m["from_bot"],
+        "from_name": m["from_name"],
+        "to_bot": m["to_bot"],
+        "content": m["content"],
+        "is_dm": m["to_bot"] is not None,
+        "created_at": m["created_at"],
+    }
+
+
+async def list_messages(request: Request) -> JSONResponse:
+    """GET /api/social/messages - Get recent messages (public)."""
+    db = get_db(request)
+    round_num = request.query_params.get("round")
+    bot_id = request.query_params.get("bot_id")
+    limit = query_int(request, "limit", 50)
+    offset = query_int(request, "offset", 0)
+
+    conditions = []
+    params: list = []
+    if round_num:
+        conditions.append("m.round = ?")
+        params.append(int(round_num))
+    if bot_id:
+        # Messages from this bot OR to this bot (DMs)
+        conditions.append("(m.from_bot = ? OR m.to_bot = ?)")
+        params.extend([bot_id, bot_id])
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+    messages = db.all(
+        f"""
+        SELECT m.*, b.name as from_name
+        FROM messages m
+        JOIN bots b ON m.from_bot = b.id
+        {where}
+        ORDER BY m.created_at DESC LIMIT ? OFFSET ?
+        """,
+        (*params, limit, offset),
+    )
+    count = db.first(f"SELECT COUNT(*) as count FROM messages m{where}", params)
+
+    return JSONResponse({
+        "messages": [_message(m) for m in messages],
+        "pagination": {"limit": limit, "offset": offset, "total": count["count"]},
+    })
+
+
+async def bot_messages(request: Request) -> JSONResponse:
+    """GET /api/social/messages/{bot_id} - Public messages plus DMs to a bot.
+
+    ``?since_id=`` returns only messages newer than that id.
+    """
+    bot_id = request.path_params["bot_id"]
+    round_num = request.query_params.get("round")
+    limit = query_int(request, "limit", 50)
+    since_id = query_int(request, "since_id", 0)
+
+    query = """
+        SELECT m.*, b.name as from_name
+        FROM messages m
+        JOIN bots b ON m.from_bot = b.id
+        WHERE (m.to_bot IS NULL OR m.to_bot = ?)
+    """
+    params: list = [bot_id]
+    if round_num:
+        query += " AND m.round = ?"
+        params.append(int(round_num))
+    if since_id:
+        query += " AND m.id > ?"
+        params.append(since_id)
+    query += " ORDER BY m.created_at DESC LIMIT ?"
+    params.append(limit)
+
+    messages = get_db(request).all(query, params)
+    return JSONResponse({
+        "cursor": max([since_id, *(m["id"] for m in messages)]),
+        "messages": [_message(m) for m in messages],
+    })
+
+
+@require_auth
+async def send_message(request: Request) -> JSONResponse:
+    """POST /api/social/messages - Send a message (authenticated)."""
+    db = get_db(request)
+    body = await request.json()
+
+    if not body.get("from_bot") or not body.get("content"):
+        return JSONResponse({"error": "from_bot and content are required"}, status_code=400)
+
+    current_round = db.current_round()
+    to_bot = body.get("to_bot") or None
+    message_id = db.run(
+        "INSERT INTO messages (round, from_bot, to_bot, content) VALUES (?, ?, ?, ?)",
+        (current_round, body["from_bot"], to_bot, body["content"]),
+    )
+
+    sender = db.first("SELECT name FROM bots WHERE id = ?", (body["from_bot"],))
+    broadcast(request, {
+        "type": "message",
+        "data": {
+            "id": message_id,
+            "round": current_round,
+            "from_bot": body["from_bot"],
+            "from_name": sender["name"] if sender else None,
+            "to_bot": to_bot,
+            "content": body["content"],
+            "is_dm": bool(to_bot),
+        },
+    })
+
+    return JSONResponse({"success": True, "message_id": message_id, "round": current_round})
+
+
+async def portfolios(request: Request) -> JSONResponse:
+    """GET /api/social/portfolios - Every enabled bot's portfolio."""
+    db = get_db(request)
+    starting_cash = db.starting_cash()
+
+    bots = db.all(
+        """
+        SELECT id, name, type, cash, total_value, last_commentary
+        FROM bots
+        WHERE enabled = 1
+        ORDER BY total_value DESC
+        """
+    )
+    positions_by_bot: dict[str, list[dict]] = {}
+    for p in db.all("SELECT bot_id, symbol, shares, avg_cost, current_price FROM positions"):
+        price = p["current_price"] or p["avg_cost"]
+        positions_by_bot.setdefault(p["bot_id"], []).append({
+            "symbol": p["symbol"],
+            "shares": p["shares"],
+            "avg_cost": p["avg_cost"],
+            "current_price": price,
+            "market_value": p["shares"] * price,
+            "gain_pct": (price / p["avg_cost"] - 1) * 100 if p["avg_cost"] else 0,
+        })
+
+    return JSONResponse({
+        "round": db.current_round(),
+        "starting_cash": starting_cash,
+        "portfolios": [
+            {
+                "rank": i + 1,
+                "id": bot["id"],
+                "name": bot["name"],
+                "type": bot["type"],
+                "cash": bot["cash"],
+                "total_value": bot["total_value"],
+                "return_pct": round((bot["total_value"] / starting_cash - 1) * 100, 2),
+                "last_commentary": bot["last_commentary"],
+                "positions": positions_by_bot.get(bot["id"], []),
+            }
+            for i, bot in enumerate(bots)
+        ],
+        "refreshed_at": datetime.now(timezone.utc).isoformat(),
+    })
+
+
+async def list_rejected(request: Request) -> JSONResponse:
+    """GET /api/social/rejected - Get rejected trades (public)."""
+    round_num = request.query_params.get("round")
+    limit = query_int(request, "limit", 20)
+
+    query = """
+        SELECT r.*, b.name as bot_name
+        FROM rejected_trades r
+        JOIN bots b ON r.bot_id = b.id
+    """
+    params: list = []
+    if round_num:
+        query += " WHERE r.round = ?"
+        params.append(int(round_num))
+    query += " ORDER BY r.attempted_at DESC LIMIT ?"
+    params.append(limit)
+
+    return JSONResponse({"rejected_trades": get_db(request).all(query, params)})
+
+
+@require_auth
+async def record_rejected(request: Request) -> JSONResponse:
+    """POST /api/social/rejected - Record a rejected trade (authenticated)."""
+    db = get_db(request)
+    body = await request.json()
+    current_round = db.current_round()
+    symbol = body["symbol"].upper()
+    side = body["side"].upper()
+
+    rejected_id = db.run(
+        """
+        INSERT INTO rejected_trades (bot_id, symbol, side, shares, reason, round)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (body["bot_id"], symbol, side, body["shares"], body["reason"], current_round),
+    )
+
+    bot = db.first("SELECT name FROM bots WHERE id = ?", (body["bot_id"],))
+    broadcast(request, {
+        "type": "rejected_trade",
+        "data": {
+            "id": rejected_id,
+            "bot_id": body["bot_id"],
+            "bot_name": bot["name"] if bot else None,
+            "symbol": symbol,
+            "side": side,
+            "shares": body["shares"],
+            "reason": body["reason"],
+            "round": current_round,
+        },
+    })
+
+    return JSONResponse({"success": True, "id": rejected_id})
+
+
+# The round context splits into a shared part (identical for every bot) and
+# a private part (DMs and memories); /context/{bot_id} serves both merged.
+
+CONTEXT_MESSAGE_LIMIT = 30
+
+
+def _context_message(m: dict) -> dict:
+    return {
+        "id": m["id"],
+        "from_bot": m["from_bot"],
+        "from_name": m["from_name"],
+        "to_bot": m["to_bot"],
+        "content": m["content"],
+        "is_dm": m["to_bot"] is not None,
+        "round": m["round"],
+        "created_at": m["created_at"],
+    }
+
+
+def _shared_context(db) -> dict:
+    starting_cash = db.starting_cash()
+    current_round = db.current_round()
+    since = max(0, current_round - 1)
+
+    bots = db.all(
+        "SELECT id, name, type, cash, total_value, last_commentary FROM bots ORDER BY total_value DESC"
+    )
+    trades = db.all(
+        """
+        SELECT t.*, b.name as bot_name
+        FROM trades t
+        JOIN bots b ON t.bot_id = b.id
+        WHERE t.round >= ?
+        ORDER BY t.executed_at DESC
+        LIMIT 30
+        """,
+        (since,),
+    )
+    rejected = db.all(
+        """
+        SELECT r.*, b.name as bot_name
+        FROM rejected_trades r
+        JOIN bots b ON r.bot_id = b.id
+        WHERE r.round >= ?
+        ORDER BY r.attempted_at DESC
+        LIMIT 10
+        """,
+        (since,),
+    )
+    messages = db.all(
+        """
+        SELECT m.*, b.name as from_name
+        FROM messages m
+        JOIN bots b ON m.from_bot = b.id
+        WHERE m.round >= ? AND m.to_bot IS NULL
+        ORDER BY m.created_at DESC
+        LIMIT ?
+        """,
+        (since, CONTEXT_MESSAGE_LIMIT),
+    )
+
+    positions_by_bot: dict[str, list[dict]] = {}
+    for p in db.all("SELECT bot_id, symbol, shares, avg_cost, current_price FROM positions"):
+        price = p["current_price"] or p["avg_cost"]
+        positions_by_bot.setdefault(p["bot_id"], []).append({
+            "symbol": p["symbol"],
+            "shares": p["shares"],
+            "market_value": p["shares"] * price,
+        })
+
+    return {
+        "round": current_round,
+        "starting_cash": starting_cash,
+        "leaderboard": [
+            {
+                "rank": i + 1,
+                "id": bot["id"],
+                "name": bot["name"],
+                "type": bot["type"],
+                "total_value": bot["total_value"],
+                "return_pct": round((bot["total_value"] / starting_cash - 1) * 100, 2),
+                "last_commentary": bot["last_commentary"],
+            }
+            for i, bot in enumerate(bots)
+        ],
+        "positions_by_bot": positions_by_bot,
+        "recent_trades": [
+            {
+                "id": t["id"],
+                "bot_id": t["bot_id"],
+                "bot_name": t["bot_name"],
+                "symbol": t["symbol"],
+                "side": t["side"],
+                "shares": t["shares"],
+                "price": t["price"],
+                "commentary": t["commentary"],
+                "round": t["round"],
+                "executed_at": t["executed_at"],
+            }
+            for t in trades
+        ],
+        "rejected_trades": [
+            {
+                "id": r["id"],
+                "bot_id": r["bot_id"],
+                "bot_name": r["bot_name"],
+                "symbol": r["symbol"],
+                "side": r["side"],
+                "shares": r["shares"],
+                "reason": r["reason"],
+                "round": r["round"],
+            }
+            for r in rejected
+        ],
+        "messages": [_context_message(m) for m in messages],
+    }
+
+
+def _private_context(db, bot_id: str) -> dict:
+    current_round = db.current_round()
+    short_term_cutoff = max(0, current_round - SHORT_TERM_ROUNDS)
+
+    dms = db.all(
+        """
+        SELECT m.*, b.name as from_name
+        FROM messages m
+        JOIN bots b ON m.from_bot = b.id
+        WHERE m.round >= ? AND m.to_bot = ?
+        ORDER BY m.created_at DESC
+        LIMIT ?
+        """,
+        (max(0, current_round - 1), bot_id, CONTEXT_MESSAGE_LIMIT),
+    )
+    short_term = db.all(
+        """
+        SELECT round, type, content, importance
+        FROM memories
+        WHERE bot_id = ? AND round > ?
+        ORDER BY round DESC, created_at DESC
+        LIMIT 25
+        """,
+        (bot_id, short_term_cutoff),
+    )
+    long_term = db.all(
+        """
+        SELECT round, type, content, importance
+        FROM memories
+        WHERE bot_id = ? AND round <= ? AND importance >= 7
+        ORDER BY importance DESC, round DESC
+        LIMIT 15
+        """,
+        (bot_id, short_term_cutoff),
+    )
+    strategy = db.first(
+        """
+        SELECT content, round
+        FROM memories
+        WHERE bot_id = ? AND type = 'strategy'
+        ORDER BY round DESC, created_at DESC
+        LIMIT 1
+        """,
+        (bot_id,),
+    )
+    rival_notes = db.all(
+        """
+        SELECT content, round
+        FROM memories
+        WHERE bot_id = ? AND type = 'rival'
+        ORDER BY round DESC
+        LIMIT 20
+        """,
+        (bot_id,),
+    )
+
+    short_term_by_type: dict[str, list[dict]] = {}
+    for m in short_term:
+        short_term_by_type.setdefault(m["type"], []).append(
+            {"content": m["content"], "round": m["round"]}
+        )
+
+    return {
+        "round": current_round,
+        "your_bot_id": bot_id,
+        "dms": [_context_message(m) for m in dms],
+        "your_memories": {
+            "short_term": short_term_by_type,
+            "long_term": [
+                {
+                    "type": m["type"],
+                    "content": m["content"],
+                    "round": m["round"],
+                    "importance": m["importance"],
+                }
+                for m in long_term
+            ],
+            "active_strategy": {
+                "content": strategy["content"],
+                "since_round": strategy["round"],
+            } if strategy else None,
+            "rival_notes": rival_notes,
+        },
+    }
+
+
+async def shared_context(request: Request) -> JSONResponse:
+    """GET /api/social/context - Shared part of the round context."""
+    return JSONResponse(_shared_context(get_db(request)))
+
+
+async def private_context(request: Request) -> JSONResponse:
+    """GET /api/social/context/{bot_id}/private - DMs and memories for one bot."""
+    return JSONResponse(_private_context(get_db(request), request.path_params["bot_id"]))
+
+
+# Delta requests pass the highest message/trade/rejection id already seen;
+# the ETag covers the full context so an unchanged one is a bare 304.
+CONTEXT_CURSOR = {
+    "since_message": "messages",
+    "since_trade": "recent_trades",
+    "since_rejected": "rejected_trades",
+}
+
+
+async def round_context(request: Request) -> Response:
+    """GET /api/social/context/{bot_id} - Get full round context for a bot.
+
+    ``?since_message=&since_trade=&since_rejected=`` returns only newer entries.
+    """
+    db = get_db(request)
+    bot_id = request.path_params["bot_id"]
+    shared = _shared_context(db)
+    private = _private_context(db, bot_id)
+
+    # Public messages + DMs to this bot, newest first
+    messages = sorted(
+        shared["messages"] + private["dms"], key=lambda m: m["created_at"], reverse=True
+    )[:CONTEXT_MESSAGE_LIMIT]
+
+    context = {
+        "round": shared["round"],
+        "starting_cash": shared["starting_cash"],
+        "your_bot_id": bot_id,
+        "leaderboard": shared["leaderboard"],
+        "positions_by_bot": shared["positions_by_bot"],
+        "recent_trades": shared["recent_trades"],
+        "rejected_trades": shared["rejected_trades"],
+        "messages": [
+            {k: v for k, v in m.items() if k != "created_at"} for m in messages
+        ],
+        "your_memories": private["your_memories"],
+    }
+
+    etag = json_etag(context)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    if any(param in request.query_params for param in CONTEXT_CURSOR):
+        context["delta"] = True
+        for param, field in CONTEXT_CURSOR.items():
+            since = query_int(request, param, 0)
+            context[field] = [item for item in context[field] if item["id"] > since]
+    return JSONResponse(context, headers={"ETag": etag})
+
+
+routes = [
+    Route("/api/social/messages", list_messages, methods=["GET"]),
+    Route("/api/social/messages", send_message, methods=["POST"]),
+    Route("/api/social/messages/{bot_id}", bot_messages, methods=["GET"]),
+    Route("/api/social/portfolios", portfolios, methods=["GET"]),
+    Route("/api/social/rejected", list_rejected, methods=["GET"]),
+    Route("/api/social/rejected", record_rejected, methods=["POST"]),
+    Route("/api/social/context", shared_context, methods=["GET"]),
+    Route("/api/social/context/{bot_id}/private", private_context, methods=["GET"]),
+    Route("/api/social/context/{bot_id}", round_context, methods=["GET"]),
+]
@@ -0,0 +1,226 @@
+"""State routes - GET, POST and PATCH game state."""
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from ..common import etag_matches, get_db, json_etag, require_auth
+
+# Columns a state patch may set
+BOT_PATCH_FIELDS = ("cash", "total_value", "session_id", "last_commentary", "enabled")
+POSITION_PATCH_FIELDS = ("shares", "avg_cost", "current_price")
+
+
+def _position(p: dict) -> dict:
+    return {
+        "id": p["id"],
+        "bot_id": p["bot_id"],
+        "symbol": p["symbol"],
+        "shares": p["shares"],
+        "avg_cost": p["avg_cost"],
+        "current_price": p["current_price"],
+    }
+
+
+def _bot(row: dict, positions: list[dict]) -> dict:
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "type": row["type"],
+        "cash": row["cash"],
+        "total_value": row["total_value"],
+        "session_id": row["session_id"],
+        "last_commentary": row["last_commentary"],
+        "enabled": bool(row["enabled"]),
+        "updated_at": row["updated_at"],
+        "positions": [_position(p) for p in positions],
+    }
+
+
+async def get_state(request: Request) -> Response:
+    """GET /api/state - Get full game state (public, 304 if If-None-Match matches)."""
+    db = get_db(request)
+
+    game = db.first("SELECT * FROM game WHERE id = 1")
+    if not game:
+        return JSONResponse({"error": "Game not initialized"}, status_code=404)
+
+    bot_rows = db.all("SELECT * FROM bots ORDER BY total_value DESC")
+    positions_by_bot: dict[str, list[dict]] = {}
+    for p in db.all("SELECT * FROM positions"):
+        positions_by_bot.setdefault(p["bot_id"], []).append(p)
+
+    trades = db.all("SELECT * FROM trades ORDER BY executed_at DESC, id DESC LIMIT 50")
+
+    state = {
+        "status": game["status"],
+        "starting_cash": game["starting_cash"],
+        "current_round": game["current_round"],
+        "bots": [_bot(row, positions_by_bot.get(row["id"], [])) for row in bot_rows],
+        "recent_trades": [
+            {
+                "id": t["id"],
+                "bot_id": t["bot_id"],
+                "symbol": t["symbol"],
+                "side": t["side"],
+                "shares": t["shares"],
+                "price": t["price"],
+                "commentary": t["commentary"],
+                "round": t["round"],
+                "executed_at": t["executed_at"],
+            }
+            for t in trades
+        ],
+        "created_at": game["created_at"],
+        "updated_at": game["updated_at"],
+    }
+
+    etag = json_etag(state)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse(state, headers={"ETag": etag})
+
+
+@require_auth
+async def post_state(request: Request) -> JSONResponse:
+    """POST /api/state - Update full game state (authenticated)."""
+    db = get_db(request)
+    body = await request.json()
+
+    with db.transaction() as conn:
+        if "status" in body or "current_round" in body:
+            updates = []
+            values = []
+            if "status" in body:
+                updates.append("status = ?")
+                values.append(body["status"])
+            if "current_round" in body:
+                updates.append("current_round = ?")
+                values.append(body["current_round"])
+            updates.append("updated_at = datetime('now')")
+            conn.execute(f"UPDATE game SET {', '.join(updates)} WHERE id = 1", values)
+
+        for bot in body.get("bots") or []:
+            conn.execute(
+                """
+                INSERT INTO bots (id, name, type, cash, total_value, session_id, last_commentary, enabled, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                ON CONFLICT(id) DO UPDATE SET
+                  cash = excluded.cash,
+                  total_value = excluded.total_value,
+                  session_id = excluded.session_id,
+                  last_commentary = excluded.last_commentary,
+                  enabled = excluded.enabled,
+                  updated_at = datetime('now')
+                """,
+                (
+                    bot["id"],
+                    bot["name"],
+                    bot["type"],
+                    bot["cash"],
+                    bot["total_value"],
+                    bot.get("session_id"),
+                    bot.get("last_commentary"),
+                    1 if bot.get("enabled") else 0,
+                ),
+            )
+
+            if bot.get("positions") is not None:
+                conn.execute("DELETE FROM positions WHERE bot_id = ?", (bot["id"],))
+                conn.executemany(
+                    """
+                    INSERT INTO positions (bot_id, symbol, shares, avg_cost, current_price)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (bot["id"], p["symbol"], p["shares"], p["avg_cost"], p.get("current_price"))
+                        for p in bot["positions"]
+                    ],
+                )
+
+    return JSONResponse({"success": True})
+
+
+def apply_patch(conn, body: dict) -> int:
+    """Apply a state patch inside a transaction (bot patches must carry an id).
+
+    Returns:
+        How many statements were run
+    """
+    statements = 0
+    if "status" in body or "current_round" in body:
+        updates = []
+        values = []
+        if "status" in body:
+            updates.append("status = ?")
+            values.append(body["status"])
+        if "current_round" in body:
+            updates.append("current_round = ?")
+            values.append(body["current_round"])
+        updates.append("updated_at = datetime('now')")
+        conn.execute(f"UPDATE game SET {', '.join(updates)} WHERE id = 1", values)
+        statements += 1
+
+    for bot in body.get("bots") or []:
+        updates = []
+        values = []
+        for field in BOT_PATCH_FIELDS:
+            if field in bot:
+                updates.append(f"{field} = ?")
+                values.append((1 if bot[field] else 0) if field == "enabled" else bot[field])
+        if updates:
+            updates.append("updated_at = datetime('now')")
+            conn.execute(f"UPDATE bots SET {', '.join(updates)} WHERE id = ?", [*values, bot["id"]])
+            statements += 1
+
+        for symbol in bot.get("closed_positions") or []:
+            conn.execute(
+                "DELETE FROM positions WHERE bot_id = ? AND symbol = ?", (bot["id"], symbol)
+            )
+            statements += 1
+
+        for p in bot.get("opened_positions") or []:
+            conn.execute(
+                """
+                INSERT INTO positions (bot_id, symbol, shares, avg_cost, current_price)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(bot_id, symbol) DO UPDATE SET
+                  shares = excluded.shares,
+                  avg_cost = excluded.avg_cost,
+                  current_price = excluded.current_price
+                """,
+                (bot["id"], p["symbol"], p["shares"], p["avg_cost"], p.get("current_price")),
+            )
+            statements += 1
+
+        for p in bot.get("positions") or []:
+            fields = [field for field in POSITION_PATCH_FIELDS if field in p]
+            if fields:
+                conn.execute(
+                    f"UPDATE positions SET {', '.join(f'{f} = ?' for f in fields)} "
+                    "WHERE bot_id = ? AND symbol = ?",
+                    [*(p[f] for f in fields), bot["id"], p["symbol"]],
+                )
+                statements += 1
+    return statements
+
+
+@require_auth
+async def patch_state(request: Request) -> JSONResponse:
+    """PATCH /api/state - Apply only what changed since the state was loaded (authenticated)."""
+    db = get_db(request)
+    body = await request.json()
+    if any(not bot.get("id") for bot in body.get("bots") or []):
+        return JSONResponse({"error": "Each bot patch needs an id"}, status_code=400)
+
+    with db.transaction() as conn:
+        statements = apply_patch(conn, body)
+
+    return JSONResponse({"success": True, "statements": statements})
+
+
+routes = [
+    Route("/api/state", get_state, methods=["GET"]),
+    Route("/api/state", post_state, methods=["POST"]),
+    Route("/api/state", patch_state, methods=["PATCH"]),
+]
@@ -0,0 +1,130 @@
+"""Trades routes - trade history and recording."""
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from ..common import broadcast, get_db, query_int, require_auth
+
+INSERT_TRADE = """
+    INSERT INTO trades (bot_id, symbol, side, shares, price, commentary, round, executed_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')))
+"""
+
+
+def _trade_params(trade: dict) -> tuple:
+    return (
+        trade["bot_id"],
+        trade["symbol"],
+        trade["side"],
+        trade["shares"],
+        trade["price"],
+        trade.get("commentary"),
+        trade["round"],
+        trade.get("executed_at"),
+    )
+
+
+async def list_trades(request: Request) -> JSONResponse:
+    """GET /api/trades - Get recent trades (public).
+
+    Newest first, filtered by bot_id, round or a from_round/to_round range,
+    and paged by offset or by the ``next_cursor`` of the previous page.
+    """
+    db = get_db(request)
+    limit = query_int(request, "limit", 50)
+    offset = query_int(request, "offset", 0)
+    bot_id = request.query_params.get("bot_id")
+    round_num = request.query_params.get("round")
+    from_round = request.query_params.get("from_round")
+    to_round = request.query_params.get("to_round")
+    cursor = request.query_params.get("cursor")
+
+    conditions = []
+    values: list = []
+    if bot_id:
+        conditions.append("t.bot_id = ?")
+        values.append(bot_id)
+    if round_num:
+        conditions.append("t.round = ?")
+        values.append(int(round_num))
+    if from_round:
+        conditions.append("t.round >= ?")
+        values.append(int(from_round))
+    if to_round:
+        conditions.append("t.round <= ?")
+        values.append(int(to_round))
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+    page_conditions = list(conditions)
+    page_values = list(values)
+    if cursor:
+        after = _parse_cursor(cursor)
+        if after is None:
+            return JSONResponse({"error": "Invalid cursor"}, status_code=400)
+        executed_at, trade_id = after
+        page_conditions.append("(t.executed_at < ? OR (t.executed_at = ? AND t.id < ?))")
+        page_values.extend((executed_at, executed_at, trade_id))
+    page_where = " WHERE " + " AND ".join(page_conditions) if page_conditions else ""
+
+    trades = db.all(
+        f"""
+        SELECT t.*, b.name as bot_name
+        FROM trades t
+        JOIN bots b ON t.bot_id = b.id
+        {page_where}
+        ORDER BY t.executed_at DESC, t.id DESC LIMIT ? OFFSET ?
+        """,
+        (*page_values, limit, offset),
+    )
+    count = db.first(f"SELECT COUNT(*) as count FROM trades t{where}", values)
+
+    last = trades[-1] if trades and len(trades) == limit else None
+    return JSONResponse({
+        "trades": trades,
+        "pagination": {
+            "limit": limit,
+            "offset": offset,
+            "total": count["count"],
+            "next_cursor": f"{last['executed_at']}|{last['id']}" if last else None,
+        },
+    })
+
+
+def _parse_cursor(cursor: str) -> tuple[str, int] | None:
+    """Split a next_cursor value into the last trade's executed_at and id."""
+    executed_at, _, trade_id = cursor.rpartition("|")
+    if not executed_at or not trade_id.isdigit():
+        return None
+    return executed_at, int(trade_id)
+
+
+@require_auth
+async def create_trade(request: Request) -> JSONResponse:
+    """POST /api/trades - Record a new trade (authenticated)."""
+    trade = await request.json()
+    trade_id = get_db(request).run(INSERT_TRADE, _trade_params(trade))
+    broadcast(request, {"type": "trade", "data": {**trade, "id": trade_id}})
+    return JSONResponse({"success": True, "id": trade_id})
+
+
+@require_auth
+async def create_trades_batch(request: Request) -> JSONResponse:
+    """POST /api/trades/batch - Record multiple trades (authenticated)."""
+    body = await request.json()
+    trades = body.get("trades", [])
+
+    with get_db(request).transaction() as conn:
+        conn.executemany(INSERT_TRADE, [_trade_params(t) for t in trades])
+
+    for trade in trades:
+        broadcast(request, {"type": "trade", "data": trade})
+
+    return JSONResponse({"success": True, "count": len(trades)})
+
+
+routes = [
+    Route("/api/trades", list_trades, methods=["GET"]),
+    Route("/api/trades", create_trade, methods=["POST"]),
+    Route("/api/trades/batch", create_trades_batch, methods=["POST"]),
+]
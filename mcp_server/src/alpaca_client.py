@@ -6,6 +6,8 @@ from typing import Optional
 
 import httpx
 
+from .metrics import InstrumentedTransport
+
 
 @dataclass
 class Position:
@@ -78,6 +80,7 @@ class AlpacaClient:
                 "APCA-API-SECRET-KEY": self.secret_key,
             },
             timeout=30.0,
+            transport=InstrumentedTransport("alpaca"),
         )
 
     def close(self) -> None:
@@ -240,6 +243,7 @@ class AlpacaClient:
                     "APCA-API-SECRET-KEY": self.secret_key,
                 },
                 timeout=10.0,
+                transport=InstrumentedTransport("alpaca_data"),
             )
             # Use query param with original symbol format (BTC/USD)
             response = data_client.get(f"/v1beta3/crypto/us/latest/trades?symbols={symbol}")
@@ -270,6 +274,7 @@ class AlpacaClient:
                     "APCA-API-SECRET-KEY": self.secret_key,
                 },
                 timeout=10.0,
+                transport=InstrumentedTransport("alpaca_data"),
             )
             response = data_client.get(f"/v2/stocks/{symbol.upper()}/trades/latest")
             response.raise_for_status()
@@ -354,6 +359,7 @@ class AlpacaClient:
                     "APCA-API-SECRET-KEY": self.secret_key,
                 },
                 timeout=10.0,
+                transport=InstrumentedTransport("alpaca_data"),
             )
             response = data_client.get(
                 f"/v1beta1/options/quotes/latest",
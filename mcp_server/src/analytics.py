@@ -0,0 +1,156 @@
+"""Vectorized performance and risk analytics over equity snapshots."""
+
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .equity_cache import EquityCurveCache
+
+# Rounds run at 9:30 and hourly 10:00-16:00 ET on trading days
+ROUNDS_PER_YEAR = 8 * 252
+
+
+def _forward_fill(matrix: np.ndarray) -> np.ndarray:
+    """Fill NaN gaps along each row with the last valid value."""
+    valid = ~np.isnan(matrix)
+    idx = np.where(valid, np.arange(matrix.shape[1]), 0)
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    filled = matrix[np.arange(matrix.shape[0])[:, None], idx]
+    # Leading gaps (before the first valid value) stay NaN
+    filled[np.cumsum(valid, axis=1) == 0] = np.nan
+    return filled
+
+
+def _returns(values: np.ndarray) -> np.ndarray:
+    """Per-round simple returns along the last axis (NaN where undefined)."""
+    prev = values[..., :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = values[..., 1:] / prev - 1.0
+    returns[~(prev > 0)] = np.nan
+    return returns
+
+
+def compute_metrics(
+    values: np.ndarray,
+    traded: Optional[np.ndarray] = None,
+    benchmark: Optional[np.ndarray] = None,
+    periods_per_year: int = ROUNDS_PER_YEAR,
+) -> dict[str, np.ndarray]:
+    """Compute performance metrics for every bot in one pass.
+
+    Args:
+        values: (bots x rounds) total value matrix, NaN where missing
+        traded: (bots x rounds) notional traded per round
+        benchmark: (rounds,) benchmark price per round, NaN where missing
+        periods_per_year: Rounds per year for annualization
+
+    Returns:
+        Dict of metric name to (bots,) array: sharpe, sortino,
+        max_drawdown, volatility, beta, win_rate, turnover
+    """
+    values = _forward_fill(np.asarray(values, dtype=float))
+    bots = values.shape[0]
+    returns = _returns(values)
+    valid = ~np.isnan(returns)
+    count = valid.sum(axis=1)
+    annualize = np.sqrt(periods_per_year)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.where(valid, returns, 0.0)
+        mean = r.sum(axis=1) / count
+        dev = np.where(valid, returns - mean[:, None], 0.0)
+        std = np.sqrt((dev ** 2).sum(axis=1) / (count - 1))
+        downside = np.sqrt((np.minimum(r, 0.0) ** 2).sum(axis=1) / count)
+
+        sharpe = mean / std * annualize
+        sortino = mean / downside * annualize
+        volatility = std * annualize
+        win_rate = (r > 0).sum(axis=1) / count
+
+        peaks = np.fmax.accumulate(values, axis=1)
+        drawdowns = 1.0 - values / peaks
+        max_drawdown = np.where(np.isnan(drawdowns), -np.inf, drawdowns).max(axis=1)
+        max_drawdown[~np.isfinite(max_drawdown)] = np.nan
+
+        if traded is not None:
+            turnover = np.nansum(traded, axis=1) / np.nanmean(values, axis=1)
+        else:
+            turnover = np.full(bots, np.nan)
+
+        beta = np.full(bots, np.nan)
+        if benchmark is not None:
+            bench = _forward_fill(np.asarray(benchmark, dtype=float)[None, :])[0]
+            bench_returns = _returns(bench)
+            both = valid & ~np.isnan(bench_returns)[None, :]
+            n = both.sum(axis=1)
+            b = np.where(both, bench_returns[None, :], 0.0)
+            x = np.where(both, returns, 0.0)
+            b_mean = b.sum(axis=1) / n
+            x_mean = x.sum(axis=1) / n
+            cov = (np.where(both, (x - x_mean[:, None]) * (b - b_mean[:, None]), 0.0)).sum(axis=1)
+            var = (np.where(both, (b - b_mean[:, None]) ** 2, 0.0)).sum(axis=1)
+            beta = cov / var
+
+    return {
+        "sharpe": sharpe,
+        "sortino": sortino,
+        "max_drawdown": max_drawdown,
+        "volatility": volatility,
+        "beta": beta,
+        "win_rate": win_rate,
+        "turnover": turnover,
+    }
+
+
+def _finite(value: float, digits: int) -> Optional[float]:
+    """Round a metric for JSON, mapping NaN/inf to None."""
+    return round(float(value), digits) if np.isfinite(value) else None
+
+
+def leaderboard_metrics(cache: "EquityCurveCache") -> dict[str, dict]:
+    """Build the snapshot matrix from the equity cache and score every bot.
+
+    Args:
+        cache: Refreshed equity curve cache
+
+    Returns:
+        Dict mapping bot IDs to JSON-ready metric dicts
+    """
+    bot_ids = cache.bot_ids()
+    if not bot_ids:
+        return {}
+
+    all_rounds = sorted({r for bot_id in bot_ids for r in cache.get_series(bot_id).rounds})
+    column = {r: j for j, r in enumerate(all_rounds)}
+
+    values = np.full((len(bot_ids), len(all_rounds)), np.nan)
+    traded = np.zeros_like(values)
+    for i, bot_id in enumerate(bot_ids):
+        series = cache.get_series(bot_id)
+        cols = [column[r] for r in series.rounds]
+        values[i, cols] = series.values
+        traded[i, cols] = series.traded
+
+    benchmark = np.full(len(all_rounds), np.nan)
+    bench = cache.benchmark
+    bench_cols = [(column[r], v) for r, v in zip(bench.rounds, bench.values) if r in column]
+    if bench_cols:
+        cols, prices = zip(*bench_cols)
+        benchmark[list(cols)] = prices
+
+    metrics = compute_metrics(values, traded, benchmark)
+
+    return {
+        bot_id: {
+            "sharpe": _finite(metrics["sharpe"][i], 2),
+            "sortino": _finite(metrics["sortino"][i], 2),
+            "max_drawdown_pct": _finite(metrics["max_drawdown"][i] * 100, 2),
+            "volatility_pct": _finite(metrics["volatility"][i] * 100, 2),
+            "beta": _finite(metrics["beta"][i], 2),
+            "win_rate_pct": _finite(metrics["win_rate"][i] * 100, 1),
+            "turnover": _finite(metrics["turnover"][i], 2),
+            "rounds": len(cache.get_series(bot_id)),
+        }
+        for i, bot_id in enumerate(bot_ids)
+    }
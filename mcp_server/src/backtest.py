@@ -0,0 +1,712 @@
+"""Offline backtesting against stored candles.
+
+A backtest run lives in one directory shared by the driver script and the
+per-bot MCP servers it spawns:
+
+    <run_dir>/backtest.json        BacktestConfig
+    <run_dir>/clock.json           Current simulated time
+    <run_dir>/ledgers/<bot>.json   Simulated brokerage account per bot
+    <run_dir>/journal/<bot>.jsonl  Recorded and rejected trades per bot
+
+Candles are stored in Finnhub's ``stock/candle`` format, one JSON file per
+symbol under ``data_dir`` (see ``CandleStore``). The simulated clients
+subclass the live ones, so the order pipeline and ``TradingClient``
+constraints run exactly as they do in production.
+"""
+
+import json
+import os
+import tempfile
+import uuid
+from bisect import bisect_right
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from zoneinfo import ZoneInfo
+
+from .alpaca_client import AlpacaClient, OrderResult
+from .finnhub_client import FinnhubClient
+from .trading_client import TradingClient
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = dt_time(9, 30)
+MARKET_CLOSE = dt_time(16, 0)
+
+# Same schedule as the live cron: 9:30 then hourly 10:00-16:00 ET
+ROUND_TIMES = [dt_time(9, 30)] + [dt_time(h, 0) for h in range(10, 17)]
+
+RESOLUTION_SECONDS = {
+    "1": 60,
+    "5": 300,
+    "15": 900,
+    "30": 1800,
+    "60": 3600,
+    "D": 86400,
+    "W": 7 * 86400,
+    "M": 30 * 86400,
+}
+
+
+def _write_json(path: Path, value: dict) -> None:
+    """Atomically write a JSON document (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@dataclass
+class BacktestConfig:
+    """Settings shared by every process in a backtest run."""
+
+    data_dir: str
+    starting_cash: float = 100000.0
+    slippage_bps: float = 5.0  # Applied against the order: buys pay up, sells give up
+    commission_per_share: float = 0.0
+    min_commission: float = 0.0
+
+    def commission(self, qty: float) -> float:
+        """Commission charged for an order of qty shares."""
+        if self.commission_per_share <= 0 and self.min_commission <= 0:
+            return 0.0
+        return max(self.min_commission, self.commission_per_share * abs(qty))
+
+    def save(self, run_dir: Path) -> None:
+        _write_json(Path(run_dir) / "backtest.json", asdict(self))
+
+    @classmethod
+    def load(cls, run_dir: Path) -> "BacktestConfig":
+        with open(Path(run_dir) / "backtest.json") as f:
+            return cls(**json.load(f))
+
+
+@dataclass
+class _Candles:
+    """One symbol's bars, column-wise and sorted by open time."""
+
+    t: list[int]
+    o: list[float]
+    h: list[float]
+    l: list[float]
+    c: list[float]
+    v: list[float]
+    bar_seconds: int
+
+
+class CandleStore:
+    """Historical candles on disk, served without lookahead.
+
+    Files are named ``<SYMBOL>.json`` (``/`` replaced by ``-`` for crypto
+    pairs) and hold a Finnhub candle response plus an optional
+    ``resolution`` key. Bars are stamped with their open time, so at time
+    ``ts`` a bar that has not finished yet only exposes its open price.
+    Optional ``financials/<SYMBOL>.json`` and ``news/<SYMBOL>.json`` files
+    back the fundamentals and news tools.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._candles: dict[str, Optional[_Candles]] = {}
+
+    @staticmethod
+    def _filename(symbol: str) -> str:
+        return symbol.upper().replace("/", "-") + ".json"
+
+    def symbols(self) -> list[str]:
+        """Symbols with stored candles."""
+        return sorted(p.stem.replace("-", "/") for p in self.directory.glob("*.json"))
+
+    def save(self, symbol: str, candles: dict, resolution: str = "D") -> None:
+        """Store a Finnhub candle response for a symbol."""
+        _write_json(self.directory / self._filename(symbol), {**candles, "resolution": resolution})
+        self._candles.pop(symbol.upper(), None)
+
+    def _load(self, symbol: str) -> Optional[_Candles]:
+        symbol = symbol.upper()
+        if symbol in self._candles:
+            return self._candles[symbol]
+
+        candles = None
+        try:
+            with open(self.directory / self._filename(symbol)) as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            raw = None
+
+        if raw and raw.get("s", "ok") == "ok" and raw.get("t"):
+            order = sorted(range(len(raw["t"])), key=raw["t"].__getitem__)
+            columns = {k: [raw[k][i] for i in order] for k in ("t", "o", "h", "l", "c")}
+            volume = raw.get("v") or [0] * len(order)
+            bar_seconds = RESOLUTION_SECONDS.get(str(raw.get("resolution", "")))
+            if bar_seconds is None:
+                gaps = sorted(b - a for a, b in zip(columns["t"], columns["t"][1:]) if b > a)
+                bar_seconds = gaps[len(gaps) // 2] if gaps else 86400
+            candles = _Candles(v=[volume[i] for i in order], bar_seconds=bar_seconds, **columns)
+
+        self._candles[symbol] = candles
+        return candles
+
+    def _index(self, symbol: str, ts: int) -> tuple[Optional[_Candles], int]:
+        candles = self._load(symbol)
+        if candles is None:
+            return None, -1
+        return candles, bisect_right(candles.t, ts) - 1
+
+    def quote(self, symbol: str, ts: int) -> Optional[dict]:
+        """Finnhub-style quote at a point in time, or None without data."""
+        candles, i = self._index(symbol, ts)
+        if i < 0:
+            return None
+
+        if ts >= candles.t[i] + candles.bar_seconds:
+            current, high, low = candles.c[i], candles.h[i], candles.l[i]
+        else:
+            # Bar still forming - only its open is known
+            current = high = low = candles.o[i]
+
+        return {
+            "c": current,
+            "o": candles.o[i],
+            "h": high,
+            "l": low,
+            "pc": candles.c[i - 1] if i > 0 else candles.o[i],
+            "t": ts,
+        }
+
+    def price_at(self, symbol: str, ts: int) -> Optional[float]:
+        """Last known price at a point in time."""
+        quote = self.quote(symbol, ts)
+        return quote["c"] if quote else None
+
+    def candles(self, symbol: str, from_ts: int, to_ts: int, resolution: Optional[str] = None) -> dict:
+        """Completed bars that opened within [from_ts, to_ts], Finnhub format.
+
+        Stored bars are resampled when a coarser resolution is requested
+        (e.g. daily bars built from hourly data, bucketed by exchange date).
+        """
+        candles = self._load(symbol)
+        if candles is None:
+            return {"s": "no_data"}
+
+        start = bisect_right(candles.t, from_ts - 1)
+        end = bisect_right(candles.t, to_ts - candles.bar_seconds)
+        if start >= end:
+            return {"s": "no_data"}
+
+        target = RESOLUTION_SECONDS.get(str(resolution), 0)
+        if target <= candles.bar_seconds:
+            return {
+                "s": "ok",
+                "t": candles.t[start:end],
+                "o": candles.o[start:end],
+                "h": candles.h[start:end],
+                "l": candles.l[start:end],
+                "c": candles.c[start:end],
+                "v": candles.v[start:end],
+            }
+
+        def bucket(ts: int):
+            local = datetime.fromtimestamp(ts, MARKET_TZ)
+            if resolution == "D":
+                return local.date()
+            if resolution == "W":
+                return local.isocalendar()[:2]
+            if resolution == "M":
+                return local.year, local.month
+            return ts // target
+
+        out = {"s": "ok", "t": [], "o": [], "h": [], "l": [], "c": [], "v": []}
+        last_key = None
+        for i in range(start, end):
+            key = bucket(candles.t[i])
+            if key != last_key:
+                out["t"].append(candles.t[i])
+                out["o"].append(candles.o[i])
+                out["h"].append(candles.h[i])
+                out["l"].append(candles.l[i])
+                out["c"].append(candles.c[i])
+                out["v"].append(candles.v[i])
+                last_key = key
+            else:
+                out["h"][-1] = max(out["h"][-1], candles.h[i])
+                out["l"][-1] = min(out["l"][-1], candles.l[i])
+                out["c"][-1] = candles.c[i]
+                out["v"][-1] += candles.v[i]
+        return out
+
+    def _extra(self, kind: str, symbol: str, default):
+        try:
+            with open(self.directory / kind / self._filename(symbol)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return default
+
+    def financials(self, symbol: str) -> dict:
+        """Stored basic financials (Finnhub ``stock/metric`` format)."""
+        return self._extra("financials", symbol, {"metric": {}})
+
+    def news(self, symbol: str) -> list[dict]:
+        """Stored company news (Finnhub ``company-news`` format)."""
+        return self._extra("news", symbol, [])
+
+
+class HistoricalClock:
+    """Simulated wall clock persisted to a file.
+
+    The driver advances it between rounds and every MCP server process
+    reads it, so all bots see the same point in history.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def now(self) -> int:
+        """Current simulated Unix timestamp."""
+        with open(self.path) as f:
+            return int(json.load(f)["timestamp"])
+
+    def set(self, timestamp: int) -> None:
+        _write_json(self.path, {"timestamp": int(timestamp)})
+
+    def is_market_open(self) -> bool:
+        """Whether stock orders fill now.
+
+        The close is included: the schedule's last round runs at 16:00 and
+        trades at the closing price.
+        """
+        local = datetime.fromtimestamp(self.now(), MARKET_TZ)
+        return local.weekday() < 5 and MARKET_OPEN <= local.time() <= MARKET_CLOSE
+
+
+class SimulatedAlpacaClient(AlpacaClient):
+    """Alpaca paper account simulated from stored candles.
+
+    Market orders fill immediately at the clock's price plus slippage and
+    commission. The account is a JSON ledger so the driver can mark it to
+    market between rounds.
+    """
+
+    def __init__(
+        self,
+        store: CandleStore,
+        clock: HistoricalClock,
+        ledger_path: Path,
+        config: BacktestConfig,
+    ):
+        """Initialize the simulated account.
+
+        Args:
+            store: Candle store used for pricing and fills
+            clock: Simulated clock
+            ledger_path: JSON ledger file (created with starting cash if missing)
+            config: Backtest settings (starting cash, slippage, commission)
+        """
+        self.api_key = ""
+        self.secret_key = ""
+        self.store = store
+        self.clock = clock
+        self.ledger_path = Path(ledger_path)
+        self.config = config
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+    def _load_ledger(self) -> dict:
+        try:
+            with open(self.ledger_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"cash": self.config.starting_cash, "positions": {}, "orders": []}
+
+    def _mark(self, symbol: str, position: dict, now: int) -> float:
+        price = self.store.price_at(symbol, now)
+        return price if price is not None else position["avg_entry_price"]
+
+    def get_account(self) -> dict:
+        """Get account information (Alpaca field names)."""
+        ledger = self._load_ledger()
+        now = self.clock.now()
+        positions_value = sum(
+            p["qty"] * self._mark(symbol, p, now) for symbol, p in ledger["positions"].items()
+        )
+        equity = ledger["cash"] + positions_value
+        return {
+            "status": "ACTIVE",
+            "cash": ledger["cash"],
+            "equity": equity,
+            "portfolio_value": equity,
+            "buying_power": ledger["cash"],
+        }
+
+    def get_positions(self) -> list[dict]:
+        """Get all open positions (Alpaca field names)."""
+        ledger = self._load_ledger()
+        now = self.clock.now()
+        positions = []
+        for symbol, p in sorted(ledger["positions"].items()):
+            price = self._mark(symbol, p, now)
+            cost = p["qty"] * p["avg_entry_price"]
+            market_value = p["qty"] * price
+            positions.append({
+                "symbol": symbol,
+                "side": "long",
+                "qty": p["qty"],
+                "market_value": market_value,
+                "avg_entry_price": p["avg_entry_price"],
+                "current_price": price,
+                "unrealized_pl": market_value - cost,
+                "unrealized_plpc": (market_value - cost) / cost if cost else 0.0,
+            })
+        return positions
+
+    def place_order(
+        self,
+        symbol: str,
+        qty: float,
+        side: str,
+        order_type: str = "market",
+        time_in_force: str = "day",
+    ) -> OrderResult:
+        """Fill a market order against the candle at the clock's time."""
+        symbol = symbol.upper()
+        side = side.lower()
+        now = self.clock.now()
+
+        if order_type != "market":
+            return OrderResult(success=False, error=f"Alpaca API error: {order_type} orders are not simulated")
+        if qty <= 0:
+            return OrderResult(success=False, error="Alpaca API error: qty must be > 0")
+        if "/" not in symbol and not self.clock.is_market_open():
+            return OrderResult(success=False, error="Alpaca API error: market is closed")
+
+        price = self.store.price_at(symbol, now)
+        if price is None:
+            return OrderResult(success=False, error=f"Alpaca API error: no price data for {symbol}")
+
+        slippage = price * self.config.slippage_bps / 10000
+        fill_price = price + slippage if side == "buy" else price - slippage
+        commission = self.config.commission(qty)
+
+        ledger = self._load_ledger()
+        position = ledger["positions"].get(symbol, {"qty": 0.0, "avg_entry_price": 0.0})
+
+        if side == "buy":
+            cost = fill_price * qty + commission
+            if cost > ledger["cash"]:
+                return OrderResult(success=False, error="Alpaca API error: insufficient buying power")
+            total_qty = position["qty"] + qty
+            position["avg_entry_price"] = (
+                position["qty"] * position["avg_entry_price"] + qty * fill_price
+            ) / total_qty
+            position["qty"] = total_qty
+            ledger["cash"] -= cost
+        elif side == "sell":
+            if qty > position["qty"] + 1e-9:
+                return OrderResult(
+                    success=False,
+                    error=f"Alpaca API error: insufficient qty available for order (requested: {qty}, available: {position['qty']})",
+                )
+            position["qty"] -= qty
+            ledger["cash"] += fill_price * qty - commission
+        else:
+            return OrderResult(success=False, error=f"Alpaca API error: invalid side {side}")
+
+        if position["qty"] > 1e-9:
+            ledger["positions"][symbol] = position
+        else:
+            ledger["positions"].pop(symbol, None)
+
+        order_id = str(uuid.uuid4())
+        ledger["orders"].append({
+            "id": order_id,
+            "timestamp": now,
+            "symbol": symbol,
+            "side": side,
+            "qty": qty,
+            "price": fill_price,
+            "commission": commission,
+        })
+        _write_json(self.ledger_path, ledger)
+
+        return OrderResult(
+            success=True,
+            order_id=order_id,
+            symbol=symbol,
+            qty=qty,
+            side=side,
+            filled_avg_price=fill_price,
+            status="filled",
+        )
+
+    def get_last_trade(self, symbol: str) -> Optional[float]:
+        return self.store.price_at(symbol, self.clock.now())
+
+    def is_market_open(self) -> bool:
+        return self.clock.is_market_open()
+
+    def get_crypto_price(self, symbol: str) -> Optional[float]:
+        return self.store.price_at(symbol, self.clock.now())
+
+    def get_stock_price(self, symbol: str) -> Optional[float]:
+        return self.store.price_at(symbol, self.clock.now())
+
+    def get_options_chain(self, underlying_symbol: str, **kwargs) -> list[dict]:
+        return [{"error": "Options are not available in backtests"}]
+
+    def get_option_quote(self, option_symbol: str) -> Optional[dict]:
+        return {"error": "Options are not available in backtests"}
+
+    def place_options_order(self, option_symbol: str, qty: int, side: str, **kwargs) -> OrderResult:
+        return OrderResult(success=False, error="Options order failed: not available in backtests")
+
+
+class HistoricalFinnhubClient(FinnhubClient):
+    """Finnhub client answering from stored data at the simulated time."""
+
+    def __init__(self, store: CandleStore, clock: HistoricalClock):
+        self.api_key = ""
+        self.store = store
+        self.clock = clock
+
+    def _request(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        params = params or {}
+        symbol = params.get("symbol", "")
+        now = self.clock.now()
+
+        if endpoint == "quote":
+            return self.store.quote(symbol, now) or {"c": 0, "o": 0, "h": 0, "l": 0, "pc": 0, "t": now}
+        if endpoint == "stock/candle":
+            return self.store.candles(
+                symbol, int(params["from"]), int(params["to"]), params.get("resolution")
+            )
+        if endpoint == "stock/metric":
+            return self.store.financials(symbol)
+        if endpoint == "company-news":
+            return [a for a in self.store.news(symbol) if a.get("datetime", 0) <= now]
+        if endpoint == "news":
+            return []
+        if endpoint == "search":
+            query = params.get("q", "").upper()
+            return {"result": [{"symbol": s} for s in self.store.symbols() if query in s]}
+        return {}
+
+    def get_candles(
+        self,
+        symbol: str,
+        resolution: str = "D",
+        from_ts: Optional[int] = None,
+        to_ts: Optional[int] = None,
+    ) -> dict:
+        """Get candles, treating windows ending after the clock as "last N days"."""
+        now = self.clock.now()
+        if to_ts is None:
+            to_ts = now
+        if from_ts is None:
+            from_ts = to_ts - 30 * 86400
+        if to_ts > now:
+            # Tools build windows from the real wall clock - shift them back
+            from_ts -= to_ts - now
+            to_ts = now
+        return super().get_candles(symbol, resolution, from_ts, to_ts)
+
+    def get_technicals(self, symbol: str, *args, **kwargs) -> dict:
+        return {"error": "Technical indicators are not available in backtests"}
+
+    def close(self):
+        """Nothing to close."""
+
+
+class BacktestTradingClient(TradingClient):
+    """TradingClient that journals trades locally instead of posting them.
+
+    Constraint validation is inherited unchanged. Social and leaderboard
+    calls still go to CF_API_URL when it is configured (point it at a
+    non-production API).
+    """
+
+    def __init__(self, bot_id: str, journal_path: Path, clock: HistoricalClock):
+        try:
+            super().__init__(bot_id=bot_id)
+        except ValueError:
+            self.bot_id = bot_id
+            self.api_url = ""
+            self.api_key = ""
+            self._client = None
+        self.journal_path = Path(journal_path)
+        self.clock = clock
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+
+    def _journal(self, record: dict) -> dict:
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "a") as f:
+            f.write(json.dumps({"timestamp": self.clock.now(), **record}) + "\n")
+        return {"success": True}
+
+    def record_trade(
+        self,
+        symbol: str,
+        side: str,
+        shares: int,
+        price: float,
+        reason: Optional[str] = None,
+    ) -> dict:
+        return self._journal({
+            "status": "filled",
+            "symbol": symbol.upper(),
+            "side": side.upper(),
+            "shares": shares,
+            "price": price,
+            "reason": reason,
+        })
+
+    def record_rejected_trade(
+        self,
+        symbol: str,
+        side: str,
+        shares: int,
+        reason: str,
+    ) -> dict:
+        return self._journal({
+            "status": "rejected",
+            "symbol": symbol.upper(),
+            "side": side.upper(),
+            "shares": shares,
+            "reason": reason,
+        })
+
+
+class BacktestSession:
+    """Entry point to a backtest run directory."""
+
+    def __init__(self, run_dir: str):
+        self.run_dir = Path(run_dir)
+        self.config = BacktestConfig.load(self.run_dir)
+        self.store = CandleStore(self.config.data_dir)
+        self.clock = HistoricalClock(self.run_dir / "clock.json")
+
+    @classmethod
+    def create(cls, run_dir: str, config: BacktestConfig, start: int) -> "BacktestSession":
+        """Initialize a fresh run directory (existing ledgers are removed)."""
+        path = Path(run_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        for stale in list(path.glob("ledgers/*.json")) + list(path.glob("journal/*.jsonl")):
+            stale.unlink()
+        config.save(path)
+        HistoricalClock(path / "clock.json").set(start)
+        return cls(run_dir)
+
+    def ledger_path(self, bot_id: str) -> Path:
+        return self.run_dir / "ledgers" / f"{bot_id}.json"
+
+    def journal_path(self, bot_id: str) -> Path:
+        return self.run_dir / "journal" / f"{bot_id}.jsonl"
+
+    def alpaca_client(self, bot_id: str) -> SimulatedAlpacaClient:
+        return SimulatedAlpacaClient(self.store, self.clock, self.ledger_path(bot_id), self.config)
+
+    def finnhub_client(self) -> HistoricalFinnhubClient:
+        return HistoricalFinnhubClient(self.store, self.clock)
+
+    def trading_client(self, bot_id: str) -> BacktestTradingClient:
+        return BacktestTradingClient(bot_id, self.journal_path(bot_id), self.clock)
+
+    def journal(self, bot_id: str) -> list[dict]:
+        """All journaled trade records for a bot."""
+        try:
+            with open(self.journal_path(bot_id)) as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+
+def round_schedule(start: date, end: date) -> Iterator[int]:
+    """Yield round timestamps for every weekday in [start, end]."""
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            for at in ROUND_TIMES:
+                yield int(datetime.combine(day, at, MARKET_TZ).timestamp())
+        day += timedelta(days=1)
+
+
+@dataclass
+class BacktestResult:
+    """Per-round equity for every bot plus the benchmark."""
+
+    bot_ids: list[str]
+    timestamps: list[int] = field(default_factory=list)
+    equity: dict[str, list[float]] = field(default_factory=dict)
+    benchmark: list[Optional[float]] = field(default_factory=list)
+
+    def summary(self, session: BacktestSession) -> dict[str, dict]:
+        """Return, risk metrics and trade counts per bot."""
+        import numpy as np
+
+        from .analytics import compute_metrics
+
+        values = np.array([self.equity[b] for b in self.bot_ids], dtype=float)
+        benchmark = np.array([np.nan if p is None else p for p in self.benchmark], dtype=float)
+        metrics = compute_metrics(values, benchmark=benchmark)
+        start_cash = session.config.starting_cash
+
+        summary = {}
+        for i, bot_id in enumerate(self.bot_ids):
+            journal = session.journal(bot_id)
+            final = self.equity[bot_id][-1] if self.equity[bot_id] else start_cash
+            summary[bot_id] = {
+                "final_value": round(final, 2),
+                "return_pct": round((final / start_cash - 1) * 100, 2),
+                "sharpe": round(float(metrics["sharpe"][i]), 2) if np.isfinite(metrics["sharpe"][i]) else None,
+                "max_drawdown_pct": round(float(metrics["max_drawdown"][i]) * 100, 2)
+                if np.isfinite(metrics["max_drawdown"][i]) else None,
+                "beta": round(float(metrics["beta"][i]), 2) if np.isfinite(metrics["beta"][i]) else None,
+                "trades": sum(1 for r in journal if r["status"] == "filled"),
+                "rejected": sum(1 for r in journal if r["status"] == "rejected"),
+            }
+        return summary
+
+
+def run_backtest(
+    session: BacktestSession,
+    bot_ids: list[str],
+    timestamps: list[int],
+    play_round: Callable[[int, int], None],
+    benchmark_symbol: str = "SPY",
+) -> BacktestResult:
+    """Replay rounds: advance the clock, let the bots act, then mark to market.
+
+    Args:
+        session: Backtest run
+        bot_ids: Bots taking part
+        timestamps: Round start times (see ``round_schedule``)
+        play_round: Called with (round_num, timestamp) once the clock is set
+        benchmark_symbol: Symbol recorded alongside equity
+
+    Returns:
+        BacktestResult with one equity point per bot per round
+    """
+    result = BacktestResult(bot_ids=list(bot_ids), equity={b: [] for b in bot_ids})
+    accounts = {bot_id: session.alpaca_client(bot_id) for bot_id in bot_ids}
+
+    for round_num, ts in enumerate(timestamps, 1):
+        session.clock.set(ts)
+        play_round(round_num, ts)
+
+        result.timestamps.append(ts)
+        result.benchmark.append(session.store.price_at(benchmark_symbol, ts))
+        for bot_id, account in accounts.items():
+            result.equity[bot_id].append(account.get_account()["equity"])
+
+    return result
@@ -0,0 +1,117 @@
+"""Alpaca credential resolution for the MCP server."""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+# Re-fetch from the Workers API after this long so rotated keys are picked up
+DEFAULT_TTL = 900.0
+
+
+class CredentialStore:
+    """Alpaca credentials for one bot, resolved lazily and cached in memory.
+
+    ALPACA_API_KEY / ALPACA_SECRET_KEY in the environment win (the
+    orchestrator sets them for stdio servers). Otherwise credentials are
+    fetched from the Workers API and re-fetched once the TTL expires, or
+    right away after invalidate() (e.g. Alpaca answered 401). ``version``
+    increments whenever the credentials change, so holders of an
+    AlpacaClient can tell when to rebuild it.
+    """
+
+    def __init__(
+        self,
+        bot_id: str,
+        api_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+    ):
+        """Initialize the store.
+
+        Args:
+            bot_id: Bot whose credentials to load
+            api_url: Workers API URL (defaults to CF_API_URL env var)
+            api_key: Workers API key (defaults to CF_API_KEY env var)
+            ttl: Seconds before API-sourced credentials are re-fetched
+        """
+        self.bot_id = bot_id
+        self.api_url = (api_url or os.environ.get("CF_API_URL", "")).rstrip("/")
+        self.api_key = api_key or os.environ.get("CF_API_KEY", "")
+        self.ttl = ttl
+        self.version = 0
+        self._credentials: Optional[tuple[str, str]] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+        env_key = os.environ.get("ALPACA_API_KEY", "")
+        env_secret = os.environ.get("ALPACA_SECRET_KEY", "")
+        self._from_env = bool(env_key and env_secret)
+        if self._from_env:
+            self._set((env_key, env_secret))
+
+    def _set(self, credentials: Optional[tuple[str, str]]) -> None:
+        if credentials != self._credentials:
+            self._credentials = credentials
+            self.version += 1
+        self._fetched_at = time.monotonic()
+
+    def is_fresh(self) -> bool:
+        """Whether get() would return without a network call."""
+        if self._from_env:
+            return True
+        return self._fetched_at > 0 and time.monotonic() - self._fetched_at < self.ttl
+
+    def _fetch(self) -> Optional[tuple[str, str]]:
+        """Fetch credentials from the Workers API (blocking)."""
+        if not self.bot_id or not self.api_url or not self.api_key:
+            return None
+        try:
+            response = httpx.get(
+                f"{self.api_url}/api/bot/{self.bot_id}/credentials",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=10.0,
+            )
+            if response.status_code == 200:
+                data = response.json()
+                key = data.get("alpaca_api_key", "")
+                secret = data.get("alpaca_secret_key", "")
+                if key and secret:
+                    return key, secret
+        except (httpx.HTTPError, ValueError):
+            pass
+        return None
+
+    def get(self) -> Optional[tuple[str, str]]:
+        """Cached (api_key, secret_key), fetching if stale. None if unavailable.
+
+        Concurrent callers share one in-flight fetch. If a refresh fails,
+        the previous credentials are kept.
+        """
+        if self.is_fresh():
+            return self._credentials
+        with self._lock:
+            if self.is_fresh():
+                return self._credentials
+            fetched = self._fetch()
+            self._set(fetched or self._credentials)
+            return self._credentials
+
+    async def aget(self) -> Optional[tuple[str, str]]:
+        """get() without blocking the event loop."""
+        if self.is_fresh():
+            return self._credentials
+        return await asyncio.to_thread(self.get)
+
+    def prefetch(self) -> None:
+        """Start resolving credentials in a background thread."""
+        if not self.is_fresh():
+            threading.Thread(target=self.get, name="credential-prefetch", daemon=True).start()
+
+    def invalidate(self) -> None:
+        """Force a re-fetch on next use (API-sourced credentials only)."""
+        if not self._from_env:
+            self._fetched_at = 0.0
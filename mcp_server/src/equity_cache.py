@@ -0,0 +1,203 @@
+"""Local columnar cache of per-round equity snapshots."""
+
+import time
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .trading_client import TradingClient
+
+
+class EquitySeries:
+    """Equity curve for one bot, stored column-wise (rounds, values, traded)."""
+
+    def __init__(self):
+        self.rounds = array("i")
+        self.values = array("d")
+        self.traded = array("d")
+
+    def __len__(self) -> int:
+        return len(self.rounds)
+
+    def merge(
+        self,
+        rounds: Sequence[int],
+        values: Sequence[float],
+        traded: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Merge sorted snapshot points, overwriting rounds already cached."""
+        if traded is None:
+            traded = [0.0] * len(rounds)
+
+        for round_num, value, notional in zip(rounds, values, traded):
+            if not self.rounds or round_num > self.rounds[-1]:
+                self.rounds.append(round_num)
+                self.values.append(value)
+                self.traded.append(notional)
+                continue
+
+            i = bisect_left(self.rounds, round_num)
+            if i < len(self.rounds) and self.rounds[i] == round_num:
+                self.values[i] = value
+                self.traded[i] = notional
+            else:
+                self.rounds.insert(i, round_num)
+                self.values.insert(i, value)
+                self.traded.insert(i, notional)
+
+    def since(self, from_round: int = 0) -> tuple[Sequence[int], Sequence[float]]:
+        """Get the slice of the curve at or after a round."""
+        i = bisect_left(self.rounds, from_round)
+        return self.rounds[i:], self.values[i:]
+
+
+def downsample(
+    rounds: Sequence[int],
+    values: Sequence[float],
+    max_points: int,
+) -> tuple[list[int], list[float]]:
+    """Downsample a curve with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points plus the point in each bucket that
+    preserves the most visual shape, so peaks and drawdowns survive.
+
+    Args:
+        rounds: X values (round numbers), ascending
+        values: Y values (total value)
+        max_points: Maximum points to return (values < 3 disable sampling)
+
+    Returns:
+        Tuple of (rounds, values) lists
+    """
+    n = len(rounds)
+    if max_points >= n or max_points < 3:
+        return list(rounds), list(values)
+
+    out_x = [rounds[0]]
+    out_y = [values[0]]
+    bucket_size = (n - 2) / (max_points - 2)
+    a = 0
+
+    for i in range(max_points - 2):
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_len = max(next_end - next_start, 1)
+        avg_x = sum(rounds[next_start:next_end]) / next_len
+        avg_y = sum(values[next_start:next_end]) / next_len
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = rounds[a], values[a]
+        chosen = start
+        max_area = -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - rounds[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                chosen = j
+
+        out_x.append(rounds[chosen])
+        out_y.append(values[chosen])
+        a = chosen
+
+    out_x.append(rounds[-1])
+    out_y.append(values[-1])
+    return out_x, out_y
+
+
+class EquityCurveCache:
+    """Per-bot equity curves, refreshed incrementally from the Workers API.
+
+    Only rounds at or after the newest cached round are re-fetched, so a
+    refresh costs one small request no matter how long the game has run.
+    """
+
+    def __init__(self, client: "TradingClient", refresh_interval: float = 30.0):
+        """Initialize the cache.
+
+        Args:
+            client: Trading client used to fetch snapshots
+            refresh_interval: Minimum seconds between API refreshes
+        """
+        self._client = client
+        self.refresh_interval = refresh_interval
+        self._series: dict[str, EquitySeries] = {}
+        self._benchmark = EquitySeries()
+        self._last_round = 0
+        self._refreshed_at: Optional[float] = None
+
+    @property
+    def last_round(self) -> int:
+        """Newest round held in the cache."""
+        return self._last_round
+
+    def refresh(self, force: bool = False) -> None:
+        """Pull snapshots newer than the cache (re-reading the newest round)."""
+        now = time.monotonic()
+        if (
+            not force
+            and self._refreshed_at is not None
+            and now - self._refreshed_at < self.refresh_interval
+        ):
+            return
+
+        snapshots = self._client.get_snapshots(since_round=self._last_round)
+        for bot_id, curve in snapshots.get("curves", {}).items():
+            rounds = curve.get("rounds", [])
+            series = self._series.setdefault(bot_id, EquitySeries())
+            series.merge(rounds, curve.get("values", []), curve.get("traded"))
+            if rounds:
+                self._last_round = max(self._last_round, rounds[-1])
+
+        benchmark = snapshots.get("benchmark") or {}
+        self._benchmark.merge(benchmark.get("rounds", []), benchmark.get("values", []))
+
+        self._refreshed_at = now
+
+    def bot_ids(self) -> list[str]:
+        """Bots with at least one cached snapshot."""
+        return sorted(bot_id for bot_id, series in self._series.items() if len(series))
+
+    def get_series(self, bot_id: str) -> Optional[EquitySeries]:
+        """Get the raw cached series for a bot."""
+        return self._series.get(bot_id)
+
+    @property
+    def benchmark(self) -> EquitySeries:
+        """Benchmark (SPY) price per round."""
+        return self._benchmark
+
+    def get_curve(
+        self,
+        bot_id: str,
+        from_round: int = 0,
+        max_points: Optional[int] = None,
+    ) -> dict:
+        """Get a bot's equity curve, downsampled if it is long.
+
+        Args:
+            bot_id: Bot to fetch
+            from_round: First round to include
+            max_points: Maximum points to return
+
+        Returns:
+            {"bot_id": ..., "total_points": ..., "curve": [{"round", "value"}, ...]}
+        """
+        self.refresh()
+        series = self._series.get(bot_id)
+        if series is None:
+            return {"bot_id": bot_id, "total_points": 0, "curve": []}
+
+        rounds, values = series.since(from_round)
+        total_points = len(rounds)
+        if max_points:
+            rounds, values = downsample(rounds, values, max_points)
+
+        return {
+            "bot_id": bot_id,
+            "total_points": total_points,
+            "curve": [
+                {"round": r, "value": round(v, 2)} for r, v in zip(rounds, values)
+            ],
+        }
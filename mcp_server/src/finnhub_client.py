@@ -6,6 +6,8 @@ from typing import Optional
 
 import httpx
 
+from .metrics import InstrumentedTransport
+
 
 class FinnhubClient:
     """Client for Finnhub API."""
@@ -16,7 +18,7 @@ class FinnhubClient:
         self.api_key = api_key or os.environ.get("FINNHUB_API_KEY")
         if not self.api_key:
             raise ValueError("FINNHUB_API_KEY is required")
-        self._client = httpx.Client(timeout=30.0)
+        self._client = httpx.Client(timeout=30.0, transport=InstrumentedTransport("finnhub"))
 
     def _request(self, endpoint: str, params: Optional[dict] = None) -> dict:
         """Make a request to Finnhub API."""
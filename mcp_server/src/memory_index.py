@@ -0,0 +1,169 @@
+"""Local full-text index over one bot's memories.
+
+The Workers API can only filter memories by type, importance and target,
+so finding the relevant ones among hundreds meant pulling them all. This
+keeps a BM25 inverted index in memory, updated as memories are saved, and
+ranks matches by text relevance weighted by importance and recency.
+"""
+
+import math
+import re
+from typing import Optional
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+# A memory loses half its recency weight every this many rounds, but never
+# drops below RECENCY_FLOOR - old high-importance lessons should still surface
+HALF_LIFE_ROUNDS = 20
+RECENCY_FLOOR = 0.25
+
+TOKEN = re.compile(r"[a-z0-9]+(?:[.'][a-z0-9]+)*")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from",
+    "has", "have", "he", "i", "if", "in", "is", "it", "its", "me", "my",
+    "of", "on", "or", "so", "that", "the", "their", "they", "this", "to",
+    "was", "we", "were", "will", "with",
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word/ticker tokens without stopwords (BRK.B stays one token)."""
+    return [t for t in TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class MemoryIndex:
+    """BM25 inverted index over memory records.
+
+    Records are the dicts the memory API returns (id, round, type, content,
+    importance). Adding a record with a known id replaces it. Memories not
+    yet written to the API are indexed under their write-queue record id.
+    """
+
+    def __init__(self, memories: Optional[list[dict]] = None, synced_id: int = 0):
+        """Initialize the index.
+
+        Args:
+            memories: Records to index
+            synced_id: Highest API memory id already fetched
+        """
+        self.synced_id = synced_id
+        self.latest_round = 0
+        self._memories: dict[int | str, dict] = {}
+        self._postings: dict[str, dict[int | str, int]] = {}
+        self._lengths: dict[int | str, int] = {}
+        self._total_length = 0
+        for memory in memories or []:
+            self.add(memory)
+
+    def __len__(self) -> int:
+        return len(self._memories)
+
+    def add(self, memory: dict) -> None:
+        """Index one memory record."""
+        memory_id = memory["id"]
+        if memory_id in self._memories:
+            self.remove(memory_id)
+
+        tokens = tokenize(memory.get("content", ""))
+        counts: dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, tf in counts.items():
+            self._postings.setdefault(token, {})[memory_id] = tf
+
+        self._memories[memory_id] = memory
+        self._lengths[memory_id] = len(tokens)
+        self._total_length += len(tokens)
+        self.latest_round = max(self.latest_round, memory.get("round") or 0)
+
+    def remove(self, memory_id: int | str) -> None:
+        """Drop a memory from the index (no-op if unknown)."""
+        memory = self._memories.pop(memory_id, None)
+        if memory is None:
+            return
+        for token in set(tokenize(memory.get("content", ""))):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(memory_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._total_length -= self._lengths.pop(memory_id)
+
+    def _weight(self, memory: dict) -> float:
+        """Importance and recency multiplier for a memory's text score."""
+        importance = 0.5 + (memory.get("importance") or 5) / 10
+        age = max(0, self.latest_round - (memory.get("round") or 0))
+        recency = RECENCY_FLOOR + (1 - RECENCY_FLOOR) * 0.5 ** (age / HALF_LIFE_ROUNDS)
+        return importance * recency
+
+    def search(
+        self,
+        query: str,
+        k: int = 10,
+        memory_type: Optional[str] = None,
+        min_importance: int = 1,
+        target_bot: Optional[str] = None,
+    ) -> list[dict]:
+        """Top-k memories for a free-text query.
+
+        Args:
+            query: Words to look for (symbols, bot names, topics)
+            k: Max memories to return
+            memory_type: Only this type
+            min_importance: Only memories at least this important
+            target_bot: For rival notes, only those mentioning this bot
+
+        Returns:
+            Memory records with a "score" field, best first
+        """
+        if not self._memories:
+            return []
+
+        n = len(self._memories)
+        avg_length = self._total_length / n or 1.0
+        scores: dict[int | str, float] = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for memory_id, tf in postings.items():
+                norm = K1 * (1 - B + B * self._lengths[memory_id] / avg_length)
+                scores[memory_id] = scores.get(memory_id, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        needle = target_bot.lower() if target_bot and memory_type == "rival" else None
+        ranked = []
+        for memory_id, score in scores.items():
+            memory = self._memories[memory_id]
+            if memory_type and memory.get("type") != memory_type:
+                continue
+            if (memory.get("importance") or 0) < min_importance:
+                continue
+            if needle and needle not in memory.get("content", "").lower():
+                continue
+            ranked.append((score * self._weight(memory), memory_id))
+
+        # By score only: ids mix ints (API) and strings (write queue), and
+        # the stable sort leaves ties in insertion order
+        ranked.sort(key=lambda r: r[0], reverse=True)
+        return [
+            {**self._memories[memory_id], "score": round(score, 3)}
+            for score, memory_id in ranked[:k]
+        ]
+
+    def to_dict(self) -> dict:
+        """Serializable form (the records; postings are rebuilt on load).
+
+        Memories still waiting in the write queue (string ids) are left out;
+        the next sync brings them back with their real ids.
+        """
+        return {
+            "synced_id": self.synced_id,
+            "memories": [m for m in self._memories.values() if isinstance(m["id"], int)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MemoryIndex":
+        return cls(data.get("memories", []), synced_id=data.get("synced_id", 0))
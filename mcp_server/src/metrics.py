@@ -0,0 +1,322 @@
+"""In-process metrics for the MCP server, exposed in Prometheus text format.
+
+Recording a sample is a few dict lookups and additions under a lock; the
+text exposition is only built when ``/metrics`` is scraped.
+
+Every tool call is also appended to a JSON-lines call log tagged with the
+orchestrator's run ID and round, for per-round reports. Those stay out of
+the Prometheus labels, which would otherwise grow without bound.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus ``le`` semantics)."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+@dataclass
+class ToolCall:
+    """Upstream usage accumulated while one tool call runs."""
+
+    tool: str
+    started: float
+    run_id: Optional[str] = None
+    round: Optional[int] = None
+    upstream_calls: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    error: bool = False
+    upstreams: dict = field(default_factory=dict)  # upstream -> [requests, seconds]
+
+
+_current_call: ContextVar[Optional[ToolCall]] = ContextVar("mcp_tool_call", default=None)
+
+# (run_id, round) of the orchestrator session driving this connection
+_correlation: ContextVar[tuple[Optional[str], Optional[int]]] = ContextVar(
+    "mcp_correlation", default=(None, None)
+)
+
+
+def set_correlation(run_id: Optional[str], round_num) -> None:
+    """Tag tool calls made from the current context with a run ID and round."""
+    try:
+        round_num = int(round_num) if round_num not in (None, "") else None
+    except (TypeError, ValueError):
+        round_num = None
+    _correlation.set((run_id or None, round_num))
+
+
+def get_correlation() -> tuple[Optional[str], Optional[int]]:
+    """The (run ID, round) tool calls in the current context are tagged with."""
+    return _correlation.get()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs: dict) -> str:
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs.items())
+    return "{" + inner + "}" if inner else ""
+
+
+class MetricsRegistry:
+    """Per-tool and per-upstream counters and histograms."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tool_calls: dict[str, int] = {}
+        self.tool_errors: dict[str, int] = {}
+        self.tool_duration: dict[str, Histogram] = {}
+        self.tool_upstream_calls: dict[str, Histogram] = {}
+        self.tool_bytes_in: dict[str, Histogram] = {}
+        self.tool_bytes_out: dict[str, Histogram] = {}
+        # Keyed by (tool, upstream)
+        self.upstream_requests: dict[tuple[str, str], int] = {}
+        self.upstream_errors: dict[tuple[str, str], int] = {}
+        self.upstream_seconds: dict[tuple[str, str], float] = {}
+        self.upstream_duration: dict[str, Histogram] = {}
+        self.bot_id = ""
+        self.call_log_path: Optional[Path] = None
+        self._call_log = None
+
+    def configure_call_log(self, bot_id: str, path: Optional[str]) -> None:
+        """Append a JSON line per tool call to path (None disables the log)."""
+        self.bot_id = bot_id
+        self.call_log_path = Path(path) if path else None
+
+    # ==================== RECORDING ====================
+
+    def start_tool(self, tool: str) -> ToolCall:
+        """Begin timing a tool call; upstream requests until finish_tool are attributed to it."""
+        run_id, round_num = _correlation.get()
+        call = ToolCall(tool=tool, started=time.perf_counter(), run_id=run_id, round=round_num)
+        _current_call.set(call)
+        return call
+
+    def finish_tool(self, call: ToolCall, error: bool = False) -> None:
+        """Record a finished tool call."""
+        elapsed = time.perf_counter() - call.started
+        _current_call.set(None)
+        tool = call.tool
+        with self._lock:
+            self.tool_calls[tool] = self.tool_calls.get(tool, 0) + 1
+            if error or call.error:
+                self.tool_errors[tool] = self.tool_errors.get(tool, 0) + 1
+            self._histogram(self.tool_duration, tool, DURATION_BUCKETS).observe(elapsed)
+            self._histogram(self.tool_upstream_calls, tool, COUNT_BUCKETS).observe(call.upstream_calls)
+            self._histogram(self.tool_bytes_in, tool, BYTES_BUCKETS).observe(call.bytes_in)
+            self._histogram(self.tool_bytes_out, tool, BYTES_BUCKETS).observe(call.bytes_out)
+            if self.call_log_path is not None:
+                self._log_call(call, elapsed, error or call.error)
+
+    def _log_call(self, call: ToolCall, elapsed: float, error: bool) -> None:
+        """Append one call record (caller holds the lock)."""
+        if self._call_log is None:
+            try:
+                self.call_log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._call_log = open(self.call_log_path, "a", buffering=1)
+            except OSError:
+                self.call_log_path = None
+                return
+
+        self._call_log.write(json.dumps({
+            "ts": time.time(),
+            "bot_id": self.bot_id,
+            "run_id": call.run_id,
+            "round": call.round,
+            "tool": call.tool,
+            "duration": round(elapsed, 4),
+            "error": error,
+            "upstream_calls": call.upstream_calls,
+            "bytes_in": call.bytes_in,
+            "bytes_out": call.bytes_out,
+            "upstreams": {k: [n, round(s, 4)] for k, (n, s) in call.upstreams.items()},
+        }) + "\n")
+
+    def record_upstream(
+        self,
+        upstream: str,
+        seconds: float,
+        bytes_out: int,
+        bytes_in: int,
+        error: bool,
+    ) -> None:
+        """Record one HTTP request to an upstream API."""
+        call = _current_call.get()
+        tool = call.tool if call else "none"
+        if call:
+            call.upstream_calls += 1
+            call.bytes_in += bytes_in
+            call.bytes_out += bytes_out
+            usage = call.upstreams.setdefault(upstream, [0, 0.0])
+            usage[0] += 1
+            usage[1] += seconds
+
+        key = (tool, upstream)
+        with self._lock:
+            self.upstream_requests[key] = self.upstream_requests.get(key, 0) + 1
+            self.upstream_seconds[key] = self.upstream_seconds.get(key, 0.0) + seconds
+            if error:
+                self.upstream_errors[key] = self.upstream_errors.get(key, 0) + 1
+            self._histogram(self.upstream_duration, upstream, DURATION_BUCKETS).observe(seconds)
+
+    @staticmethod
+    def _histogram(table: dict, key, bounds: tuple) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(bounds)
+        return histogram
+
+    # ==================== EXPOSITION ====================
+
+    def render(self, const_labels: Optional[dict] = None) -> str:
+        """Prometheus text exposition of every metric."""
+        const_labels = const_labels or {}
+        lines: list[str] = []
+
+        def counter(name: str, help_text: str, table: dict, label_names: tuple) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(table.items()):
+                key = key if isinstance(key, tuple) else (key,)
+                lines.append(f"{name}{_labels({**const_labels, **dict(zip(label_names, key))})} {value}")
+
+        def histogram(name: str, help_text: str, table: dict, label_name: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, h in sorted(table.items()):
+                labels = {**const_labels, label_name: key}
+                cumulative = 0
+                for bound, count in zip(h.bounds, h.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels({**labels, 'le': bound})} {cumulative}")
+                lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {h.count}")
+                lines.append(f"{name}_sum{_labels(labels)} {h.sum}")
+                lines.append(f"{name}_count{_labels(labels)} {h.count}")
+
+        with self._lock:
+            counter("mcp_tool_calls_total", "Tool calls handled.", self.tool_calls, ("tool",))
+            counter("mcp_tool_errors_total", "Tool calls that returned an error.", self.tool_errors, ("tool",))
+            histogram("mcp_tool_duration_seconds", "Tool call latency.", self.tool_duration, "tool")
+            histogram(
+                "mcp_tool_upstream_requests", "Upstream HTTP requests per tool call.",
+                self.tool_upstream_calls, "tool",
+            )
+            histogram(
+                "mcp_tool_upstream_received_bytes", "Upstream response bytes per tool call.",
+                self.tool_bytes_in, "tool",
+            )
+            histogram(
+                "mcp_tool_upstream_sent_bytes", "Upstream request bytes per tool call.",
+                self.tool_bytes_out, "tool",
+            )
+            counter(
+                "mcp_upstream_requests_total", "Upstream HTTP requests.",
+                self.upstream_requests, ("tool", "upstream"),
+            )
+            counter(
+                "mcp_upstream_errors_total", "Upstream requests that failed or returned >= 400.",
+                self.upstream_errors, ("tool", "upstream"),
+            )
+            counter(
+                "mcp_upstream_seconds_total", "Time spent waiting on upstream requests.",
+                self.upstream_seconds, ("tool", "upstream"),
+            )
+            histogram(
+                "mcp_upstream_duration_seconds", "Upstream request latency.",
+                self.upstream_duration, "upstream",
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+# ==================== HTTP INSTRUMENTATION ====================
+
+
+class _CountingStream(httpx.SyncByteStream):
+    """Response body wrapper that reports once the body has been consumed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._bytes = 0
+
+    def __iter__(self):
+        for chunk in self._stream:
+            self._bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+        self._on_close(self._bytes)
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """httpx transport that records every request against the current tool call.
+
+    Timing covers reading the response body, so slow downloads are
+    attributed to the upstream rather than to our own code.
+    """
+
+    def __init__(self, upstream: str, transport: Optional[httpx.BaseTransport] = None):
+        self.upstream = upstream
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        bytes_out = int(request.headers.get("content-length", 0))
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            metrics.record_upstream(self.upstream, time.perf_counter() - start, bytes_out, 0, True)
+            raise
+
+        def on_close(bytes_in: int) -> None:
+            metrics.record_upstream(
+                self.upstream,
+                time.perf_counter() - start,
+                bytes_out,
+                bytes_in,
+                response.status_code >= 400,
+            )
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, on_close),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
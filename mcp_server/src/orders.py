@@ -0,0 +1,134 @@
+"""Order pipeline shared by the MCP server and the backtester."""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .alpaca_client import AlpacaClient
+    from .finnhub_client import FinnhubClient
+    from .trading_client import TradingClient
+
+
+def execute_order(
+    trading: "TradingClient",
+    alpaca: "AlpacaClient",
+    finnhub: "FinnhubClient",
+    symbol: str,
+    qty: float,
+    side: str,
+    reason: Optional[str] = None,
+) -> dict:
+    """Validate an order against the bot's constraints, execute it and record it.
+
+    Args:
+        trading: Trading client (constraints and trade recording)
+        alpaca: Brokerage client used for portfolio and execution
+        finnhub: Market data client used for pricing
+        symbol: Symbol to trade
+        qty: Number of shares
+        side: "BUY" or "SELL" (any case)
+        reason: Trade commentary (required for Quant)
+
+    Returns:
+        {"status": "filled", ...} or {"status": "rejected", "reason": ...}
+    """
+    symbol = symbol.upper()
+    side = side.upper()
+
+    # 1. Get current portfolio
+    portfolio = alpaca.get_portfolio()
+    positions = [
+        {
+            "symbol": p.symbol,
+            "qty": p.qty,
+            "market_value": p.market_value,
+        }
+        for p in portfolio.positions
+    ]
+
+    # 2. Get current price - try Finnhub first, fall back to Alpaca
+    quote = finnhub.get_quote(symbol)
+    price = quote.get("c", 0)  # Current price
+
+    # Fall back to Alpaca for crypto or if Finnhub fails
+    if price <= 0:
+        if "/" in symbol:  # Crypto (BTC/USD, ETH/USD)
+            price = alpaca.get_crypto_price(symbol) or 0
+        else:
+            price = alpaca.get_stock_price(symbol) or 0
+
+    if price <= 0:
+        return {"status": "rejected", "reason": f"Could not get price for {symbol}"}
+
+    # 3. Get dividend yield if needed (for Boomer)
+    dividend_yield = None
+    if trading.bot_id == "boomer" and side == "BUY":
+        try:
+            financials = finnhub.get_basic_financials(symbol)
+            metrics = financials.get("metric", {})
+            # Dividend yield is returned as percentage
+            div_yield_annual = metrics.get("dividendYieldIndicatedAnnual", 0)
+            dividend_yield = div_yield_annual / 100 if div_yield_annual else 0
+        except Exception:
+            dividend_yield = 0
+
+    # 4. Validate constraints
+    validation = trading.validate_order_full(
+        side=side,
+        shares=int(qty),
+        symbol=symbol,
+        price=price,
+        current_cash=portfolio.cash,
+        current_equity=portfolio.equity,
+        positions=positions,
+        technical_reason=reason,
+        dividend_yield=dividend_yield,
+    )
+
+    if not validation.allowed:
+        # Record rejected trade for entertainment
+        trading.record_rejected_trade(
+            symbol=symbol,
+            side=side,
+            shares=int(qty),
+            reason=validation.reason or "Unknown",
+        )
+        return {
+            "status": "rejected",
+            "reason": validation.reason,
+        }
+
+    # 5. Execute on Alpaca
+    # Crypto requires "gtc" time_in_force, stocks use "day"
+    tif = "gtc" if "/" in symbol else "day"
+    order_result = alpaca.place_order(
+        symbol=symbol,
+        qty=qty,
+        side=side.lower(),
+        order_type="market",
+        time_in_force=tif,
+    )
+
+    if not order_result.success:
+        return {
+            "status": "rejected",
+            "reason": order_result.error,
+        }
+
+    # 6. Record trade for dashboard
+    fill_price = order_result.filled_avg_price or price
+    trading.record_trade(
+        symbol=symbol,
+        side=side,
+        shares=int(qty),
+        price=fill_price,
+        reason=reason,
+    )
+
+    return {
+        "status": "filled",
+        "symbol": symbol,
+        "qty": qty,
+        "side": side.lower(),
+        "price": fill_price,
+        "order_id": order_result.order_id,
+    }
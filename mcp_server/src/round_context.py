@@ -0,0 +1,109 @@
+"""Round context assembled from the orchestrator's shared snapshot.
+
+The leaderboard, positions, recent trades and public chat are the same for
+every bot. The orchestrator fetches them once (at round start and after each
+bot's turn) and writes them to the shared cache; each MCP server then only
+asks the API for its own DMs and memories and merges the two.
+
+Bots that check the context repeatedly can ask for only what is new since
+their last look (RoundContextCursor).
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+ROUND_CONTEXT_KEY = "round-context"
+MESSAGE_LIMIT = 30
+
+# Query parameter -> context list it filters (entries carry increasing ids)
+CURSOR_PARAMS = {
+    "since_message": "messages",
+    "since_trade": "recent_trades",
+    "since_rejected": "rejected_trades",
+}
+
+
+def merge_round_context(shared: dict, private: dict, bot_id: str) -> Optional[dict]:
+    """Combine the shared and private parts into the /context/{bot_id} shape.
+
+    Returns:
+        The merged context, or None if the two parts are from different rounds
+    """
+    if shared.get("round") is None or shared.get("round") != private.get("round"):
+        return None
+
+    # Public messages + DMs to this bot, newest first
+    messages = sorted(
+        shared.get("messages", []) + private.get("dms", []),
+        key=lambda m: m.get("created_at") or "",
+        reverse=True,
+    )[:MESSAGE_LIMIT]
+
+    return {
+        "round": shared["round"],
+        "starting_cash": shared.get("starting_cash"),
+        "your_bot_id": bot_id,
+        "leaderboard": shared.get("leaderboard", []),
+        "positions_by_bot": shared.get("positions_by_bot", {}),
+        "recent_trades": shared.get("recent_trades", []),
+        "rejected_trades": shared.get("rejected_trades", []),
+        "messages": [{k: v for k, v in m.items() if k != "created_at"} for m in messages],
+        "your_memories": private.get("your_memories", {}),
+    }
+
+
+def context_etag(context: dict) -> str:
+    """Content hash of a context, used like an HTTP ETag."""
+    digest = hashlib.sha1(json.dumps(context, sort_keys=True).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+class RoundContextCursor:
+    """What this bot has already seen of the round context.
+
+    Remembering the highest message, trade and rejection id is enough to
+    return only newer entries; the leaderboard, positions and memories are
+    small and always sent whole. The ETag of the last context seen lets an
+    unchanged one be answered with just ``{"unchanged": True}``.
+    """
+
+    def __init__(self):
+        self.since = {param: 0 for param in CURSOR_PARAMS}
+        self.etag: Optional[str] = None
+        self.round: Optional[int] = None
+
+    def params(self) -> dict:
+        """Query parameters asking the API for only newer entries."""
+        return dict(self.since)
+
+    def unchanged(self) -> dict:
+        """Response for a context identical to the last one seen."""
+        return {"round": self.round, "unchanged": True}
+
+    def observe(self, context: dict, etag: Optional[str], new_only: bool = False) -> dict:
+        """Record a context the bot is about to see and return its view of it.
+
+        Args:
+            context: Full context (or an API delta, which filters the same way)
+            etag: ETag of the full context
+            new_only: Only return entries newer than the last context seen
+
+        Returns:
+            The context, the delta since the last one, or unchanged()
+        """
+        if new_only and etag is not None and etag == self.etag:
+            return self.unchanged()
+
+        view = dict(context)
+        for param, field in CURSOR_PARAMS.items():
+            entries = context.get(field, [])
+            if new_only:
+                view[field] = [e for e in entries if (e.get("id") or 0) > self.since[param]]
+            self.since[param] = max([self.since[param], *((e.get("id") or 0) for e in entries)])
+        if new_only:
+            view["delta"] = True
+
+        self.etag = etag
+        self.round = context.get("round")
+        return view
@@ -1,15 +1,25 @@
 """MCP Server for Finnhub market data and Trading Arena integration."""
 
+import asyncio
 import os
+import time
+from pathlib import Path
 from typing import Optional
 
+import httpx
 from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
 from .alpaca_client import AlpacaClient
+from .credentials import CredentialStore
+from .equity_cache import EquityCurveCache
 from .finnhub_client import FinnhubClient
+from .metrics import metrics, set_correlation
+from .orders import execute_order
+from .round_context import ROUND_CONTEXT_KEY, context_etag, merge_round_context
+from .shared_cache import SharedCache
 from .trading_client import TradingClient
 
 load_dotenv()
@@ -18,55 +28,66 @@ server = Server("trading-arena")
 finnhub_client: Optional[FinnhubClient] = None
 trading_client: Optional[TradingClient] = None
 alpaca_client: Optional[AlpacaClient] = None
+equity_cache: Optional[EquityCurveCache] = None
+shared_cache: Optional[SharedCache] = None
 
 # Bot ID from environment (set by orchestrator or start script)
 BOT_ID = os.environ.get("BOT_ID", "")
 
-# Alpaca credentials - fetched from API on startup
-ALPACA_API_KEY = ""
-ALPACA_SECRET_KEY = ""
-
-
-def _fetch_alpaca_credentials() -> tuple[str, str]:
-    """Fetch Alpaca credentials from the Workers API."""
-    global ALPACA_API_KEY, ALPACA_SECRET_KEY
-
-    if not BOT_ID:
-        return "", ""
-
-    api_url = os.environ.get("CF_API_URL", "")
-    api_key = os.environ.get("CF_API_KEY", "")
-
-    if not api_url or not api_key:
-        return "", ""
-
-    try:
-        import httpx
-        response = httpx.get(
-            f"{api_url.rstrip('/')}/api/bot/{BOT_ID}/credentials",
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout=10.0,
-        )
-        if response.status_code == 200:
-            data = response.json()
-            ALPACA_API_KEY = data.get("alpaca_api_key", "")
-            ALPACA_SECRET_KEY = data.get("alpaca_secret_key", "")
-            return ALPACA_API_KEY, ALPACA_SECRET_KEY
-    except Exception as e:
-        print(f"Failed to fetch Alpaca credentials: {e}")
-
-    return "", ""
-
-
-# Fetch credentials on module load
-_fetch_alpaca_credentials()
+# Backtest run directory - when set, brokerage and market data are simulated
+BACKTEST_RUN_DIR = os.environ.get("BACKTEST_RUN_DIR", "")
+backtest_session = None
+
+# Per-call JSON-lines log tagged with the orchestrator's run ID and round
+TOOL_CALL_LOG_DIR = os.environ.get(
+    "TOOL_CALL_LOG_DIR", str(Path(__file__).parent.parent.parent / "logs" / "tool-calls")
+)
+metrics.configure_call_log(
+    BOT_ID,
+    str(Path(TOOL_CALL_LOG_DIR) / f"{BOT_ID or 'unknown'}.jsonl") if TOOL_CALL_LOG_DIR else None,
+)
+
+# Write-behind journal for trades, rejections, messages and memories
+# (empty = post each one before the tool call returns)
+WRITE_QUEUE_DIR = os.environ.get(
+    "WRITE_QUEUE_DIR", str(Path(__file__).parent.parent.parent / "data" / "write-queue")
+)
+
+# Tools that read what the write queue writes - they wait for it to drain
+# so a bot always sees its own trades, messages and memories
+WRITE_QUEUE_READS = {"get_messages", "get_round_context", "recall"}
+
+# Alpaca credentials - resolved lazily, prefetched in the background at startup
+credential_store: Optional[CredentialStore] = None
+alpaca_credentials_version = 0
+
+# Set when this bot trades or chats - its own actions aren't in the
+# orchestrator's shared round context until the next snapshot
+round_context_stale_since: Optional[float] = None
+ROUND_CONTEXT_WRITES = {"place_order", "place_options_order", "send_message"}
+
+# Tools that talk to Alpaca (and so need credentials resolved first)
+ALPACA_TOOLS = {
+    "get_portfolio", "place_order",
+    "get_options_chain", "get_option_quote", "place_options_order",
+}
+
+
+def get_backtest_session():
+    """Get the backtest session if BACKTEST_RUN_DIR is set."""
+    global backtest_session
+    if backtest_session is None and BACKTEST_RUN_DIR:
+        from .backtest import BacktestSession
+        backtest_session = BacktestSession(BACKTEST_RUN_DIR)
+    return backtest_session
 
 
 def get_finnhub_client() -> FinnhubClient:
     """Get or create Finnhub client."""
     global finnhub_client
     if finnhub_client is None:
-        finnhub_client = FinnhubClient()
+        session = get_backtest_session()
+        finnhub_client = session.finnhub_client() if session else FinnhubClient()
     return finnhub_client
 
 
@@ -74,28 +95,154 @@ def get_trading_client() -> Optional[TradingClient]:
     """Get or create Trading client if BOT_ID is set."""
     global trading_client
     if trading_client is None and BOT_ID:
+        session = get_backtest_session()
+        if session is not None:
+            trading_client = session.trading_client(BOT_ID)
+            return trading_client
+        write_queue_path = None
+        if WRITE_QUEUE_DIR:
+            Path(WRITE_QUEUE_DIR).mkdir(parents=True, exist_ok=True)
+            write_queue_path = str(Path(WRITE_QUEUE_DIR) / f"{BOT_ID}.db")
         try:
-            trading_client = TradingClient(bot_id=BOT_ID)
+            trading_client = TradingClient(bot_id=BOT_ID, write_queue_path=write_queue_path)
         except ValueError:
             # Missing API credentials - trading tools won't be available
             pass
     return trading_client
 
 
+def get_credential_store() -> Optional[CredentialStore]:
+    """Get or create the credential store (None in backtests or without BOT_ID)."""
+    global credential_store
+    if credential_store is None and BOT_ID and not BACKTEST_RUN_DIR:
+        credential_store = CredentialStore(BOT_ID)
+    return credential_store
+
+
+def prefetch_credentials() -> None:
+    """Start resolving Alpaca credentials so the first trade doesn't wait on it."""
+    store = get_credential_store()
+    if store is not None:
+        store.prefetch()
+
+
 def get_alpaca_client() -> Optional[AlpacaClient]:
-    """Get or create Alpaca client if credentials are set."""
-    global alpaca_client
-    if alpaca_client is None and ALPACA_API_KEY and ALPACA_SECRET_KEY:
+    """Get or create Alpaca client if credentials are available.
+
+    The client is rebuilt when the credential store picks up rotated keys.
+    """
+    global alpaca_client, alpaca_credentials_version
+    session = get_backtest_session()
+    if session is not None:
+        if alpaca_client is None and BOT_ID:
+            alpaca_client = session.alpaca_client(BOT_ID)
+        return alpaca_client
+
+    store = get_credential_store()
+    credentials = store.get() if store is not None else None
+    if alpaca_client is not None and store.version != alpaca_credentials_version:
+        alpaca_client.close()
+        alpaca_client = None
+    if alpaca_client is None and credentials:
         try:
-            alpaca_client = AlpacaClient(
-                api_key=ALPACA_API_KEY,
-                secret_key=ALPACA_SECRET_KEY,
-            )
+            alpaca_client = AlpacaClient(api_key=credentials[0], secret_key=credentials[1])
+            alpaca_credentials_version = store.version
         except ValueError:
             pass
     return alpaca_client
 
 
+async def aget_alpaca_client() -> Optional[AlpacaClient]:
+    """get_alpaca_client() with any credential fetch run off the event loop."""
+    store = get_credential_store()
+    if store is not None:
+        await store.aget()
+    return get_alpaca_client()
+
+
+def get_equity_cache() -> Optional[EquityCurveCache]:
+    """Get or create the equity curve cache if trading is available."""
+    global equity_cache
+    trading = get_trading_client()
+    if equity_cache is None and trading is not None:
+        equity_cache = EquityCurveCache(trading)
+    return equity_cache
+
+
+def get_shared_cache() -> SharedCache:
+    """Get or create the cross-process shared cache."""
+    global shared_cache
+    if shared_cache is None:
+        shared_cache = SharedCache()
+    return shared_cache
+
+
+def get_round_context(trading: TradingClient, new_only: bool = False) -> dict:
+    """Round context from the orchestrator's shared snapshot plus this bot's DMs and memories.
+
+    Falls back to the full API endpoint when there is no snapshot for the
+    current round, or this bot has acted since the snapshot was taken.
+    Either way ``new_only`` trims it to what the bot hasn't seen yet.
+    """
+    shared = get_shared_cache().get_latest(ROUND_CONTEXT_KEY)
+    if shared is not None and (
+        round_context_stale_since is None
+        or shared.get("published_at", 0) > round_context_stale_since
+    ):
+        private = trading.get_private_round_context()
+        if "error" not in private:
+            merged = merge_round_context(shared, private, trading.bot_id)
+            if merged is not None:
+                return trading.context_cursor.observe(merged, context_etag(merged), new_only)
+    return trading.get_round_context(new_only=new_only)
+
+
+def warm_up() -> dict:
+    """Import tool modules, create clients and resolve credentials ahead of the first call.
+
+    Failures are recorded rather than raised - a missing key only disables
+    the tools that need it, as it would on first use.
+
+    Returns:
+        Seconds per step, plus <step>_error for steps that failed
+    """
+    def import_tools():
+        from . import tools  # noqa: F401
+
+    timings: dict = {}
+    for name, step in (
+        ("tools", import_tools),
+        ("finnhub", get_finnhub_client),
+        ("trading", get_trading_client),
+        ("alpaca", get_alpaca_client),
+        ("shared_cache", get_shared_cache),
+    ):
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            timings[f"{name}_error"] = str(e)
+        timings[name] = round(time.perf_counter() - started, 3)
+    return timings
+
+
+def get_leaderboard_analytics(trading: TradingClient, round_num: int) -> dict[str, dict]:
+    """Get per-bot performance metrics, computed once per round for all servers."""
+    from .analytics import leaderboard_metrics
+
+    def compute() -> dict:
+        cache = get_equity_cache()
+        cache.refresh(force=True)
+        return {"round": round_num, "metrics": leaderboard_metrics(cache)}
+
+    document = get_shared_cache().get_or_compute(
+        "leaderboard-analytics",
+        compute,
+        is_fresh=lambda doc: doc.get("round") == round_num,
+    )
+    return document["metrics"]
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools."""
@@ -260,10 +407,40 @@ async def list_tools() -> list[Tool]:
             ),
             Tool(
                 name="get_leaderboard",
-                description="View the current competition standings to see how you rank against other traders.",
+                description="View the current competition standings to see how you rank against other traders. Set detailed=true for risk metrics: Sharpe, Sortino, max drawdown, volatility, beta to SPY, win rate and turnover.",
                 inputSchema={
                     "type": "object",
-                    "properties": {},
+                    "properties": {
+                        "detailed": {
+                            "type": "boolean",
+                            "description": "Include performance and risk analytics per bot",
+                            "default": False,
+                        },
+                    },
+                    "required": [],
+                },
+            ),
+            Tool(
+                name="get_equity_curve",
+                description="Get a bot's portfolio value over time, one point per round. Long histories are downsampled so peaks and drawdowns are kept.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "bot": {
+                            "type": "string",
+                            "description": "Bot ID to chart, or 'all' for every bot. Defaults to you.",
+                        },
+                        "from_round": {
+                            "type": "integer",
+                            "description": "First round to include",
+                            "default": 0,
+                        },
+                        "max_points": {
+                            "type": "integer",
+                            "description": "Maximum points per curve",
+                            "default": 50,
+                        },
+                    },
                     "required": [],
                 },
             ),
@@ -297,6 +474,11 @@ async def list_tools() -> list[Tool]:
                             "description": "Max messages to return",
                             "default": 30,
                         },
+                        "new_only": {
+                            "type": "boolean",
+                            "description": "Only messages newer than your last get_messages call",
+                            "default": False,
+                        },
                     },
                     "required": [],
                 },
@@ -315,7 +497,13 @@ async def list_tools() -> list[Tool]:
                 description="Get the FULL picture: leaderboard, all recent trades with commentary, rejected trades, chat messages, DMs to you, AND your memories. Call this at the start of each round!",
                 inputSchema={
                     "type": "object",
-                    "properties": {},
+                    "properties": {
+                        "new_only": {
+                            "type": "boolean",
+                            "description": "Only trades, rejections and messages newer than your last get_round_context call (returns unchanged: true if nothing changed)",
+                            "default": False,
+                        },
+                    },
                     "required": [],
                 },
             ),
@@ -346,10 +534,14 @@ async def list_tools() -> list[Tool]:
             ),
             Tool(
                 name="recall",
-                description="Retrieve your memories. Use to review past reasoning, rival behavior, or strategy evolution.",
+                description="Retrieve your memories. Use to review past reasoning, rival behavior, or strategy evolution. Pass a query to search ALL your memories, ranked by relevance, importance and recency.",
                 inputSchema={
                     "type": "object",
                     "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Search words, e.g. 'NVDA earnings' or 'degen' (optional; without it you get the most recent memories)",
+                        },
                         "type": {
                             "type": "string",
                             "enum": ["trade", "rival", "strategy", "reflection", "note"],
@@ -474,6 +666,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         search_news,
     )
 
+    call = metrics.start_tool(name)
     try:
         # Market data tools (use Finnhub client)
         if name in ("get_price", "get_prices", "get_history", "search_news", "get_dividend"):
@@ -504,11 +697,13 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
         # Trading tools (use Trading client + Alpaca client)
         elif name in ("get_constraints", "get_portfolio", "place_order", "get_leaderboard",
-                      "send_message", "get_messages", "get_all_portfolios", "get_round_context",
+                      "get_equity_curve", "send_message", "get_messages", "get_all_portfolios", "get_round_context",
                       "remember", "recall",
                       "get_options_chain", "get_option_quote", "place_options_order"):
             trading = get_trading_client()
-            alpaca = get_alpaca_client()
+            alpaca = await aget_alpaca_client() if name in ALPACA_TOOLS else None
+            if trading is not None and name in WRITE_QUEUE_READS:
+                await asyncio.to_thread(trading.flush_writes)
 
             if trading is None:
                 result = {"error": "Trading not available - BOT_ID not configured"}
@@ -548,121 +743,49 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 if alpaca is None:
                     result = {"error": "Alpaca not configured - missing API credentials"}
                 else:
-                    symbol = arguments["symbol"].upper()
-                    qty = float(arguments["qty"])
-                    side = arguments["side"].upper()
-                    reason = arguments.get("reason")
-
-                    # 1. Get current portfolio
-                    portfolio = alpaca.get_portfolio()
-                    positions = [
-                        {
-                            "symbol": p.symbol,
-                            "qty": p.qty,
-                            "market_value": p.market_value,
-                        }
-                        for p in portfolio.positions
-                    ]
-
-                    # 2. Get current price - try Finnhub first, fall back to Alpaca
-                    finnhub = get_finnhub_client()
-                    quote = finnhub.get_quote(symbol)
-                    price = quote.get("c", 0)  # Current price
-
-                    # Fall back to Alpaca for crypto or if Finnhub fails
-                    if price <= 0:
-                        if "/" in symbol:  # Crypto (BTC/USD, ETH/USD)
-                            price = alpaca.get_crypto_price(symbol) or 0
-                        else:
-                            price = alpaca.get_stock_price(symbol) or 0
-
-                    if price <= 0:
-                        result = {"status": "rejected", "reason": f"Could not get price for {symbol}"}
-                    else:
-                        # 3. Get dividend yield if needed (for Boomer)
-                        dividend_yield = None
-                        if trading.bot_id == "boomer" and side == "BUY":
-                            try:
-                                financials = finnhub.get_basic_financials(symbol)
-                                metrics = financials.get("metric", {})
-                                # Dividend yield is returned as percentage
-                                div_yield_annual = metrics.get("dividendYieldIndicatedAnnual", 0)
-                                dividend_yield = div_yield_annual / 100 if div_yield_annual else 0
-                            except Exception:
-                                dividend_yield = 0
-
-                        # 4. Validate constraints
-                        validation = trading.validate_order_full(
-                            side=side,
-                            shares=int(qty),
-                            symbol=symbol,
-                            price=price,
-                            current_cash=portfolio.cash,
-                            current_equity=portfolio.equity,
-                            positions=positions,
-                            technical_reason=reason,
-                            dividend_yield=dividend_yield,
-                        )
-
-                        if not validation.allowed:
-                            # Record rejected trade for entertainment
-                            trading.record_rejected_trade(
-                                symbol=symbol,
-                                side=side,
-                                shares=int(qty),
-                                reason=validation.reason or "Unknown",
-                            )
-                            result = {
-                                "status": "rejected",
-                                "reason": validation.reason,
-                            }
-                        else:
-                            # 5. Execute on Alpaca
-                            # Crypto requires "gtc" time_in_force, stocks use "day"
-                            tif = "gtc" if "/" in symbol else "day"
-                            order_result = alpaca.place_order(
-                                symbol=symbol,
-                                qty=qty,
-                                side=side.lower(),
-                                order_type="market",
-                                time_in_force=tif,
-                            )
-
-                            if not order_result.success:
-                                result = {
-                                    "status": "rejected",
-                                    "reason": order_result.error,
-                                }
-                            else:
-                                # 6. Record trade for dashboard
-                                fill_price = order_result.filled_avg_price or price
-                                trading.record_trade(
-                                    symbol=symbol,
-                                    side=side,
-                                    shares=int(qty),
-                                    price=fill_price,
-                                    reason=reason,
-                                )
-
-                                result = {
-                                    "status": "filled",
-                                    "symbol": symbol,
-                                    "qty": qty,
-                                    "side": side.lower(),
-                                    "price": fill_price,
-                                    "order_id": order_result.order_id,
-                                }
+                    result = execute_order(
+                        trading,
+                        alpaca,
+                        get_finnhub_client(),
+                        symbol=arguments["symbol"],
+                        qty=float(arguments["qty"]),
+                        side=arguments["side"],
+                        reason=arguments.get("reason"),
+                    )
 
             elif name == "get_leaderboard":
                 state = trading.get_leaderboard()
+                standings = [
+                    {"rank": e.rank, "name": e.name, "return_pct": e.return_pct}
+                    for e in state.standings
+                ]
+                if arguments.get("detailed"):
+                    bot_metrics = get_leaderboard_analytics(trading, state.round)
+                    for entry, standing in zip(state.standings, standings):
+                        standing.update(bot_metrics.get(entry.bot_id, {}))
                 result = {
                     "round": state.round,
-                    "standings": [
-                        {"rank": e.rank, "name": e.name, "return_pct": e.return_pct}
-                        for e in state.standings
-                    ],
+                    "standings": standings,
                 }
 
+            elif name == "get_equity_curve":
+                cache = get_equity_cache()
+                bot = arguments.get("bot") or trading.bot_id
+                from_round = arguments.get("from_round", 0)
+                max_points = arguments.get("max_points", 50)
+
+                if bot == "all":
+                    cache.refresh()
+                    result = {
+                        "round": cache.last_round,
+                        "curves": [
+                            cache.get_curve(bot_id, from_round, max_points)
+                            for bot_id in cache.bot_ids()
+                        ],
+                    }
+                else:
+                    result = cache.get_curve(bot, from_round, max_points)
+
             # Social tools
             elif name == "send_message":
                 result = trading.send_message(
@@ -673,6 +796,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             elif name == "get_messages":
                 messages = trading.get_messages(
                     limit=arguments.get("limit", 30),
+                    new_only=arguments.get("new_only", False),
                 )
                 result = {"messages": messages}
 
@@ -680,7 +804,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                 result = trading.get_all_portfolios()
 
             elif name == "get_round_context":
-                result = trading.get_round_context()
+                result = get_round_context(trading, new_only=arguments.get("new_only", False))
 
             # Memory tools
             elif name == "remember":
@@ -690,6 +814,15 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                     importance=arguments.get("importance", 5),
                 )
 
+            elif name == "recall" and arguments.get("query"):
+                result = trading.search_memories(
+                    arguments["query"],
+                    count=arguments.get("count", 20),
+                    memory_type=arguments.get("type"),
+                    min_importance=arguments.get("min_importance", 1),
+                    target_bot=arguments.get("target_bot"),
+                )
+
             elif name == "recall":
                 result = trading.get_memories(
                     memory_type=arguments.get("type"),
@@ -767,18 +900,40 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         else:
             result = {"error": f"Unknown tool: {name}"}
 
+        if name in ROUND_CONTEXT_WRITES:
+            global round_context_stale_since
+            round_context_stale_since = time.time()
+
+        metrics.finish_tool(call, error=isinstance(result, dict) and "error" in result)
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
     except Exception as e:
+        metrics.finish_tool(call, error=True)
+        # Alpaca rejected the keys - they may have been rotated
+        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in (401, 403):
+            store = get_credential_store()
+            if store is not None and e.request.url.host.endswith("alpaca.markets"):
+                store.invalidate()
         return [TextContent(type="text", text=json.dumps({"error": str(e)}))]
 
 
+def shutdown() -> None:
+    """Flush queued writes before the process exits (blocking)."""
+    if trading_client is not None:
+        trading_client.close()
+
+
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    # Spawned per session, so the orchestrator passes correlation via env
+    set_correlation(os.environ.get("ARENA_RUN_ID"), os.environ.get("ARENA_ROUND"))
+    prefetch_credentials()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await asyncio.to_thread(shutdown)
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -2,69 +2,176 @@
 
 Run as a persistent service instead of spawning per-request.
 Usage: BOT_ID=test python -m mcp_server.src.server_http --port 8081
+
+The port opens as soon as Starlette and uvicorn are loaded. The MCP SDK
+and the tool server (the bulk of startup time) are imported in the
+background, then clients are warmed; /ready reports 200 once that is
+done, and SSE connections that arrive earlier wait for it.
 """
 
 import argparse
+import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
+from typing import Optional
 
-import uvicorn
 from starlette.applications import Starlette
 from starlette.routing import Route, Mount
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+
+BOT_ID = os.environ.get("BOT_ID", "")
+
+# Filled in by _load_runtime once the heavy imports are done
+runtime: dict = {}
+readiness: dict = {"ready": False, "stage": "starting", "error": None, "timings": {}}
+_loading: Optional[asyncio.Task] = None
+_process_started = time.perf_counter()
+
 
-from mcp.server.sse import SseServerTransport
+def _load_runtime(warm: bool) -> None:
+    """Import the MCP SDK and tool server, then optionally warm clients (blocking)."""
+    started = time.perf_counter()
+    from mcp.server.sse import SseServerTransport
 
-# Import everything from the main server
-from .server import server, BOT_ID
+    from . import server as tool_server
+    from .metrics import metrics, set_correlation
 
-# Create SSE transport
-sse = SseServerTransport("/messages/")
+    runtime.update(
+        server=tool_server.server,
+        shutdown=tool_server.shutdown,
+        sse=SseServerTransport("/messages/"),
+        metrics=metrics,
+        set_correlation=set_correlation,
+    )
+    readiness["timings"]["imports"] = round(time.perf_counter() - started, 3)
+
+    tool_server.prefetch_credentials()
+    if warm:
+        readiness["stage"] = "warming"
+        readiness["timings"].update(tool_server.warm_up())
+
+
+async def _runtime() -> dict:
+    """Wait until the runtime is loaded."""
+    if _loading is not None and not _loading.done():
+        await asyncio.shield(_loading)
+    if not runtime:
+        raise RuntimeError(f"MCP server failed to start: {readiness['error']}")
+    return runtime
 
 
 async def handle_sse(request):
     """Handle SSE connection for MCP."""
-    async with sse.connect_sse(
+    rt = await _runtime()
+    server = rt["server"]
+    # Tool calls on this connection inherit the orchestrator's run ID and round
+    rt["set_correlation"](
+        request.headers.get("x-arena-run-id"), request.headers.get("x-arena-round")
+    )
+    async with rt["sse"].connect_sse(
         request.scope, request.receive, request._send
     ) as streams:
         await server.run(
             streams[0], streams[1], server.create_initialization_options()
         )
+    # The transport already sent the response; Starlette still expects one back
+    return Response()
 
 
-async def handle_messages(request):
-    """Handle incoming MCP messages."""
-    await sse.handle_post_message(request.scope, request.receive, request._send)
+async def handle_messages(scope, receive, send):
+    """Handle incoming MCP messages (raw ASGI, owned by the SSE transport)."""
+    rt = await _runtime()
+    await rt["sse"].handle_post_message(scope, receive, send)
 
 
 async def health(request):
-    """Health check endpoint."""
+    """Health check endpoint (liveness - the process is up)."""
     return JSONResponse({
         "status": "ok",
         "bot_id": BOT_ID,
-        "server": "trading-arena-mcp"
+        "server": "trading-arena-mcp",
+        "ready": readiness["ready"],
     })
 
 
-# Create Starlette app
-app = Starlette(
-    debug=True,
-    routes=[
-        Route("/health", health),
-        Route("/sse", handle_sse),
-        Route("/messages/", handle_messages, methods=["POST"]),
-    ],
-)
+async def ready(request):
+    """Readiness endpoint - 200 once imports are done and clients are warm."""
+    return JSONResponse(
+        {"bot_id": BOT_ID, **readiness},
+        status_code=200 if readiness["ready"] else 503,
+    )
+
+
+async def metrics_endpoint(request):
+    """Prometheus scrape endpoint - per-tool latency and upstream usage."""
+    if not runtime:
+        return PlainTextResponse("", media_type="text/plain; version=0.0.4")
+    return PlainTextResponse(
+        runtime["metrics"].render({"bot": BOT_ID}),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+def create_app(warm: bool = True) -> Starlette:
+    """Create the Starlette app.
+
+    Args:
+        warm: Create clients and resolve credentials before reporting ready
+    """
+
+    @asynccontextmanager
+    async def lifespan(app):
+        global _loading
+
+        async def load():
+            try:
+                await asyncio.to_thread(_load_runtime, warm)
+                readiness["timings"]["ready_after"] = round(
+                    time.perf_counter() - _process_started, 3
+                )
+                readiness.update(ready=True, stage="ready")
+            except Exception as e:
+                readiness.update(stage="failed", error=f"{type(e).__name__}: {e}")
+                print(f"MCP server failed to start: {e}")
+
+        _loading = asyncio.create_task(load())
+        yield
+        # Flush the write-behind queue before exiting
+        if runtime:
+            await asyncio.to_thread(runtime["shutdown"])
+
+    return Starlette(
+        debug=True,
+        routes=[
+            Route("/health", health),
+            Route("/ready", ready),
+            Route("/metrics", metrics_endpoint),
+            Route("/sse", handle_sse),
+            Mount("/messages/", app=handle_messages),
+        ],
+        lifespan=lifespan,
+    )
+
+
+app = create_app()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Trading Arena MCP HTTP Server")
     parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
+    parser.add_argument(
+        "--no-warm",
+        action="store_true",
+        help="Report ready after imports, creating clients on first use",
+    )
     args = parser.parse_args()
 
+    import uvicorn
+
     print(f"Starting Trading Arena MCP Server for bot '{BOT_ID}' on {args.host}:{args.port}")
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+    uvicorn.run(create_app(warm=not args.no_warm), host=args.host, port=args.port, log_level="info")
 
 
 if __name__ == "__main__":
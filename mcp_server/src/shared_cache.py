@@ -0,0 +1,142 @@
+"""On-disk JSON cache shared by every MCP server process on the host."""
+
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "trading-arena"
+
+
+class SharedCache:
+    """Small JSON documents shared across the per-bot MCP servers.
+
+    Each bot runs its own server process, so an in-process cache would
+    still cost one computation per bot. Documents are written atomically
+    (temp file + rename) and ``get_or_compute`` holds a file lock so only
+    the first process to ask does the work.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (defaults to ARENA_CACHE_DIR env var
+                or ~/.cache/trading-arena)
+        """
+        self.directory = Path(
+            directory or os.environ.get("ARENA_CACHE_DIR") or DEFAULT_CACHE_DIR
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._memory: dict[str, dict] = {}
+        self._mtimes: dict[str, int] = {}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Get a cached document, or None if missing."""
+        if key in self._memory:
+            return self._memory[key]
+
+        try:
+            with open(self._path(key)) as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        self._memory[key] = value
+        return value
+
+    def _write(self, key: str, content: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def put(self, key: str, value: dict) -> None:
+        """Atomically write a document."""
+        self._write(key, json.dumps(value).encode())
+        self._memory[key] = value
+
+    def put_raw(self, key: str, content: bytes) -> None:
+        """Atomically write a document that is already JSON-encoded."""
+        self._write(key, content)
+        self._memory.pop(key, None)
+
+    def get_latest(self, key: str) -> Optional[dict]:
+        """Get a document, re-reading it if another process replaced it.
+
+        Costs one stat() when unchanged, for documents rewritten in place
+        (unlike get(), which keeps the first value it read).
+        """
+        try:
+            mtime = self._path(key).stat().st_mtime_ns
+        except OSError:
+            self._memory.pop(key, None)
+            return None
+
+        if self._mtimes.get(key) != mtime:
+            self._memory.pop(key, None)
+            self._mtimes[key] = mtime
+        return self.get(key)
+
+    def delete(self, key: str) -> None:
+        """Remove a document."""
+        self._memory.pop(key, None)
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold an exclusive cross-process lock for a key."""
+        with open(self.directory / f".{key}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], dict],
+        is_fresh: Optional[Callable[[dict], bool]] = None,
+    ) -> dict:
+        """Get a document, computing and storing it once if missing or stale.
+
+        Args:
+            key: Document key
+            compute: Builds the document when needed
+            is_fresh: Optional check that a cached document is still valid
+
+        Returns:
+            The cached or freshly computed document
+        """
+        def usable(value: Optional[dict]) -> bool:
+            return value is not None and (is_fresh is None or is_fresh(value))
+
+        value = self.get(key)
+        if usable(value):
+            return value
+
+        with self.lock(key):
+            # Another process may have finished while we waited
+            self._memory.pop(key, None)
+            value = self.get(key)
+            if not usable(value):
+                value = compute()
+                self.put(key, value)
+        return value
@@ -1,11 +1,20 @@
 """HTTP client for Trading Arena API - constraint validation and trade recording."""
 
+import hashlib
 import os
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import Callable, Optional
 
 import httpx
 
+from .memory_index import MemoryIndex
+from .metrics import InstrumentedTransport, get_correlation
+from .round_context import RoundContextCursor
+from .shared_cache import SharedCache
+from .write_queue import WriteQueue
+
 
 @dataclass
 class BotConstraints:
@@ -41,6 +50,7 @@ class LeaderboardEntry:
     rank: int
     name: str
     return_pct: float
+    bot_id: str = ""
 
 
 @dataclass
@@ -155,6 +165,7 @@ class TradingClient:
         bot_id: str,
         api_url: Optional[str] = None,
         api_key: Optional[str] = None,
+        write_queue_path: Optional[str] = None,
     ):
         """Initialize the trading client.
 
@@ -162,11 +173,23 @@ class TradingClient:
             bot_id: The bot making API calls
             api_url: Base URL for the API (defaults to CF_API_URL env var)
             api_key: API key for authentication (defaults to CF_API_KEY env var)
+            write_queue_path: SQLite journal for write-behind recording of
+                trades, rejections, messages and memories (None = post inline)
         """
         self.bot_id = bot_id
         self.api_url = api_url or os.environ.get("CF_API_URL", "")
         self.api_key = api_key or os.environ.get("CF_API_KEY", "")
 
+        # Newest message / context entries this bot has seen (for new_only)
+        self.message_cursor = 0
+        self.context_cursor = RoundContextCursor()
+
+        # Local memory search index, loaded on first recall(query=...)
+        self.memory_index: Optional[MemoryIndex] = None
+        self._memory_synced_at = 0.0
+        self._memory_lock = threading.Lock()  # The write queue applies memories from its thread
+        self.write_queue: Optional[WriteQueue] = None
+
         if not self.api_url:
             raise ValueError("CF_API_URL environment variable is required")
         if not self.api_key:
@@ -179,12 +202,57 @@ class TradingClient:
                 "Content-Type": "application/json",
             },
             timeout=30.0,
+            transport=InstrumentedTransport("workers_api"),
         )
 
+        if write_queue_path:
+            self.write_queue = WriteQueue(
+                write_queue_path,
+                bot_id,
+                self._client,
+                on_applied=self._record_applied,
+                on_rejected=self._record_rejected,
+            )
+
     def close(self) -> None:
-        """Close HTTP client."""
+        """Flush queued writes and close HTTP client."""
+        if self.write_queue is not None:
+            self.write_queue.close()
         self._client.close()
 
+    def flush_writes(self, timeout: float = 10.0) -> bool:
+        """Wait for queued writes to reach the API (so reads see them)."""
+        if self.write_queue is None:
+            return True
+        return self.write_queue.drain(timeout)
+
+    def _enqueue(self, kind: str, data: dict) -> str:
+        _run_id, round_num = get_correlation()
+        return self.write_queue.enqueue(kind, data, round_num)
+
+    def _record_applied(self, record: dict, row_id: Optional[int]) -> None:
+        """Swap a queued memory's placeholder id for the API's once written."""
+        if record["kind"] != "memory" or row_id is None:
+            return
+        with self._memory_lock:
+            if self.memory_index is not None:
+                self.memory_index.remove(record["id"])
+                self.memory_index.add({
+                    "id": row_id,
+                    "round": record["round"] or self.memory_index.latest_round,
+                    **{k: record["data"][k] for k in ("type", "content", "importance")},
+                })
+                self._save_memory_index()
+
+    def _record_rejected(self, record: dict) -> None:
+        """Drop a queued memory the API rejected from the local index."""
+        if record["kind"] != "memory":
+            return
+        with self._memory_lock:
+            if self.memory_index is not None:
+                self.memory_index.remove(record["id"])
+                self._save_memory_index()
+
     def get_bot_constraints(self) -> BotConstraints:
         """Get constraint definition for this bot.
 
@@ -561,6 +629,16 @@ class TradingClient:
         Returns:
             {"success": True} or {"success": False, "error": "..."}
         """
+        if self.write_queue is not None:
+            self._enqueue("trade", {
+                "symbol": symbol.upper(),
+                "side": side.upper(),
+                "shares": shares,
+                "price": price,
+                "commentary": reason,
+            })
+            return {"success": True, "queued": True}
+
         try:
             response = self._client.post(
                 f"/api/bot/{self.bot_id}/trade",
@@ -593,6 +671,7 @@ class TradingClient:
                 rank=entry.get("rank", 0),
                 name=entry.get("name", ""),
                 return_pct=round(entry.get("return_pct", 0), 2),
+                bot_id=entry.get("id", ""),
             ))
 
         return LeaderboardState(
@@ -600,6 +679,33 @@ class TradingClient:
             standings=standings,
         )
 
+    def get_snapshots(
+        self,
+        since_round: int = 0,
+        bot_id: Optional[str] = None,
+        max_points: Optional[int] = None,
+    ) -> dict:
+        """Get per-round equity snapshots as columnar curves.
+
+        Args:
+            since_round: Only include rounds at or after this one
+            bot_id: Restrict to a single bot (default: all bots)
+            max_points: Downsample each curve to at most this many points
+
+        Returns:
+            {"curves": {bot_id: {"rounds", "values", "traded"}},
+             "benchmark": {"rounds", "values"}}
+        """
+        params: dict[str, str | int] = {"since_round": since_round}
+        if bot_id:
+            params["bot_id"] = bot_id
+        if max_points:
+            params["max_points"] = max_points
+
+        response = self._client.get("/api/snapshots", params=params)
+        response.raise_for_status()
+        return response.json()
+
     # ==================== SOCIAL FEATURES ====================
 
     def send_message(self, content: str, to_bot: Optional[str] = None) -> dict:
@@ -612,6 +718,10 @@ class TradingClient:
         Returns:
             {"success": True, "message_id": ...} or {"success": False, "error": ...}
         """
+        if self.write_queue is not None:
+            self._enqueue("message", {"to_bot": to_bot, "content": content})
+            return {"success": True, "queued": True}
+
         try:
             response = self._client.post(
                 "/api/social/messages",
@@ -626,23 +736,31 @@ class TradingClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def get_messages(self, limit: int = 30) -> list[dict]:
+    def get_messages(self, limit: int = 30, new_only: bool = False) -> list[dict]:
         """Get recent messages visible to this bot (public + DMs to me).
 
         Args:
             limit: Max messages to return
+            new_only: Only messages newer than the last get_messages call
 
         Returns:
             List of messages
         """
+        params: dict[str, int] = {"limit": limit}
+        if new_only:
+            params["since_id"] = self.message_cursor
         try:
             response = self._client.get(
                 f"/api/social/messages/{self.bot_id}",
-                params={"limit": limit},
+                params=params,
             )
             response.raise_for_status()
             data = response.json()
-            return data.get("messages", [])
+            messages = data.get("messages", [])
+            self.message_cursor = max(
+                [self.message_cursor, data.get("cursor") or 0, *(m.get("id") or 0 for m in messages)]
+            )
+            return messages
         except Exception:
             return []
 
@@ -659,14 +777,43 @@ class TradingClient:
         except Exception as e:
             return {"error": str(e)}
 
-    def get_round_context(self) -> dict:
+    def get_round_context(self, new_only: bool = False) -> dict:
         """Get full round context including leaderboard, trades, messages, portfolios.
 
+        Args:
+            new_only: Only messages, trades and rejections newer than the last
+                context seen; {"unchanged": True} if nothing changed at all
+
         Returns:
             Full context dict for this bot
         """
+        params: dict[str, int] = {}
+        headers: dict[str, str] = {}
+        if new_only:
+            params = self.context_cursor.params()
+            if self.context_cursor.etag:
+                headers["If-None-Match"] = self.context_cursor.etag
         try:
-            response = self._client.get(f"/api/social/context/{self.bot_id}")
+            response = self._client.get(
+                f"/api/social/context/{self.bot_id}", params=params, headers=headers
+            )
+            if response.status_code == 304:
+                return self.context_cursor.unchanged()
+            response.raise_for_status()
+            return self.context_cursor.observe(
+                response.json(), response.headers.get("ETag"), new_only
+            )
+        except Exception as e:
+            return {"error": str(e)}
+
+    def get_private_round_context(self) -> dict:
+        """Get only this bot's part of the round context (DMs and memories).
+
+        Returns:
+            Dict with round, dms and your_memories
+        """
+        try:
+            response = self._client.get(f"/api/social/context/{self.bot_id}/private")
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -690,6 +837,15 @@ class TradingClient:
         Returns:
             {"success": True} or {"success": False, "error": ...}
         """
+        if self.write_queue is not None:
+            self._enqueue("rejected", {
+                "symbol": symbol.upper(),
+                "side": side.upper(),
+                "shares": shares,
+                "reason": reason,
+            })
+            return {"success": True, "queued": True}
+
         try:
             response = self._client.post(
                 "/api/social/rejected",
@@ -711,6 +867,10 @@ class TradingClient:
     # Valid memory types
     MEMORY_TYPES = ['trade', 'rival', 'strategy', 'reflection', 'note']
 
+    # Re-check the API for memories saved elsewhere at most this often
+    MEMORY_SYNC_INTERVAL = 300.0
+    MEMORY_SYNC_PAGE = 500
+
     def save_memory(
         self,
         memory_type: str,
@@ -736,20 +896,39 @@ class TradingClient:
         if importance < 1 or importance > 10:
             return {"success": False, "error": "Importance must be between 1 and 10"}
 
-        try:
-            response = self._client.post(
-                "/api/memory",
-                json={
-                    "bot_id": self.bot_id,
+        if self.write_queue is not None:
+            memory_id = self._enqueue(
+                "memory", {"type": memory_type, "content": content, "importance": importance}
+            )
+            result = {"success": True, "queued": True}
+        else:
+            try:
+                response = self._client.post(
+                    "/api/memory",
+                    json={
+                        "bot_id": self.bot_id,
+                        "type": memory_type,
+                        "content": content,
+                        "importance": importance,
+                    },
+                )
+                response.raise_for_status()
+                result = response.json()
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+            memory_id = result.get("memory_id")
+
+        with self._memory_lock:
+            if self.memory_index is not None and memory_id is not None:
+                self.memory_index.add({
+                    "id": memory_id,
+                    "round": result.get("round") or self.memory_index.latest_round,
                     "type": memory_type,
                     "content": content,
                     "importance": importance,
-                },
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+                })
+                self._save_memory_index()
+        return result
 
     def get_memories(
         self,
@@ -787,6 +966,89 @@ class TradingClient:
         except Exception as e:
             return {"error": str(e), "memories": []}
 
+    def _memory_cache(self) -> tuple[SharedCache, str]:
+        """Where the index is kept on disk (per bot and per API, since ids are per database)."""
+        api = hashlib.sha1(self.api_url.encode()).hexdigest()[:8]
+        return SharedCache(), f"memories-{self.bot_id}-{api}"
+
+    def _save_memory_index(self) -> None:
+        cache, key = self._memory_cache()
+        try:
+            cache.put(key, self.memory_index.to_dict())
+        except OSError:
+            pass
+
+    def _sync_memory_index(self) -> None:
+        """Load the on-disk index if needed, then fetch memories newer than it."""
+        if self.memory_index is None:
+            cache, key = self._memory_cache()
+            self.memory_index = MemoryIndex.from_dict(cache.get(key) or {})
+
+        fetched = 0
+        while True:
+            response = self._client.get(
+                f"/api/memory/{self.bot_id}",
+                params={"since_id": self.memory_index.synced_id, "count": self.MEMORY_SYNC_PAGE},
+            )
+            response.raise_for_status()
+            page = response.json().get("memories", [])
+            for memory in page:
+                self.memory_index.add(memory)
+                self.memory_index.synced_id = max(self.memory_index.synced_id, memory["id"])
+            fetched += len(page)
+            if len(page) < self.MEMORY_SYNC_PAGE:
+                break
+
+        self._memory_synced_at = time.monotonic()
+        if fetched:
+            self._save_memory_index()
+
+    def search_memories(
+        self,
+        query: str,
+        count: int = 10,
+        memory_type: Optional[str] = None,
+        min_importance: int = 1,
+        target_bot: Optional[str] = None,
+    ) -> dict:
+        """Search all of this bot's memories by relevance.
+
+        Uses the local index (see memory_index), syncing it with the API on
+        first use and every MEMORY_SYNC_INTERVAL after that.
+
+        Args:
+            query: Words to look for (symbols, bot names, topics)
+            count: Max memories to return
+            memory_type: Filter by type
+            min_importance: Minimum importance level (1-10)
+            target_bot: For rival notes, filter by target bot ID
+
+        Returns:
+            {"bot_id": ..., "query": ..., "count": ..., "memories": [...]}
+        """
+        with self._memory_lock:
+            if time.monotonic() - self._memory_synced_at > self.MEMORY_SYNC_INTERVAL:
+                try:
+                    self._sync_memory_index()
+                except Exception as e:
+                    # Search what we have unless there is nothing at all
+                    if not self.memory_index:
+                        return {"error": str(e), "memories": []}
+
+            memories = self.memory_index.search(
+                query,
+                k=count,
+                memory_type=memory_type,
+                min_importance=min_importance,
+                target_bot=target_bot,
+            )
+        return {
+            "bot_id": self.bot_id,
+            "query": query,
+            "count": len(memories),
+            "memories": memories,
+        }
+
     def get_memory_context(self) -> dict:
         """Get organized memories for context (short-term and long-term).
 
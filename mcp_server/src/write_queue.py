@@ -0,0 +1,289 @@
+"""Durable write-behind queue for the records a bot's tool calls produce."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# D1 binds at most 100 parameters per statement (the API's IN (...) lookup)
+BATCH_SIZE = 50
+
+# How long the flusher waits for more records before posting a batch
+LINGER = 0.05
+
+# Backoff between attempts while the API is unreachable
+RETRY_MIN = 0.5
+RETRY_MAX = 30.0
+
+# Client errors the API returns for what a batch contains. Any other
+# failure (a bad or rotated key, a route the API does not have yet,
+# throttling) says nothing about the records, so the batch is retried.
+RECORD_ERROR_STATUSES = frozenset({400, 413, 422})
+
+
+class WriteQueue:
+    """Trades, rejections, messages and memories posted to the Workers API in the background.
+
+    enqueue() commits the record to a local SQLite journal and returns. A
+    flusher thread posts journaled records oldest first to
+    /api/bot/{id}/records, coalescing whatever has queued up into one
+    batch. A batch that fails is retried (with backoff) before anything
+    after it, so the API applies each bot's records in the order they were
+    made. Records leave the journal only once the API has applied them;
+    after a crash the next server for the same bot sends them. Records the
+    API rejects as invalid move to ``dead_records`` instead of blocking
+    the queue. When a batch is refused as malformed, its records are sent
+    one at a time so only the bad ones are set aside; any other error
+    (auth, a missing route, the API being down) is retried.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        bot_id: str,
+        client: httpx.Client,
+        on_applied: Optional[Callable[[dict, Optional[int]], None]] = None,
+        on_rejected: Optional[Callable[[dict], None]] = None,
+        batch_size: int = BATCH_SIZE,
+        linger: float = LINGER,
+    ):
+        """Open the journal and start the flusher.
+
+        Args:
+            path: SQLite journal file
+            bot_id: Bot the records belong to
+            client: Workers API client (base URL and auth already set)
+            on_applied: Called with each applied record and the API row id
+            on_rejected: Called with each record moved to dead_records
+            batch_size: Max records per post
+            linger: Seconds to wait for more records before posting
+        """
+        self.bot_id = bot_id
+        self.batch_size = batch_size
+        self.linger = linger
+        self.last_error: Optional[str] = None
+        self._client = client
+        self._on_applied = on_applied
+        self._on_rejected = on_rejected
+
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # WAL + NORMAL survives a process crash (not power loss) without an fsync per record
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS records (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                round INTEGER,
+                at TEXT NOT NULL,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dead_records (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                round INTEGER,
+                at TEXT NOT NULL,
+                data TEXT NOT NULL,
+                error TEXT
+            )
+            """
+        )
+        self._db_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._pending = self._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-queue", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, kind: str, data: dict, round_num: Optional[int] = None) -> str:
+        """Journal a record for the flusher.
+
+        Args:
+            kind: "trade", "rejected", "message" or "memory"
+            data: Record fields (as the single-record endpoints take them)
+            round_num: Round the tool call ran in (default: the API's current round)
+
+        Returns:
+            The record's id
+        """
+        record_id = uuid.uuid4().hex
+        at = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        with self._db_lock:
+            self._db.execute(
+                "INSERT INTO records (id, kind, round, at, data) VALUES (?, ?, ?, ?, ?)",
+                (record_id, kind, round_num, at, json.dumps(data)),
+            )
+        with self._cond:
+            self._pending += 1
+            self._cond.notify_all()
+        return record_id
+
+    def pending(self) -> int:
+        """Records not yet applied by the API."""
+        return self._pending
+
+    def drain(self, timeout: float = 10.0) -> bool:
+        """Block until every queued record is applied (True) or the timeout passes."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """Flush what can be flushed within the timeout and stop the flusher.
+
+        Anything left stays in the journal for the next server.
+        """
+        drained = self.drain(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+        return drained
+
+    def _read_batch(self) -> list[dict]:
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT seq, id, kind, round, at, data FROM records ORDER BY seq LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+        return [
+            {"seq": seq, "id": rid, "kind": kind, "round": rnd, "at": at, "data": json.loads(data)}
+            for seq, rid, kind, rnd, at, data in rows
+        ]
+
+    def _post(self, batch: list[dict]) -> dict[str, dict]:
+        response = self._client.post(
+            f"/api/bot/{self.bot_id}/records",
+            json={"records": [{k: v for k, v in r.items() if k != "seq"} for r in batch]},
+        )
+        response.raise_for_status()
+        return {r["id"]: r for r in response.json().get("results", [])}
+
+    def _post_rejected(self, batch: list[dict], error: httpx.HTTPStatusError) -> dict[str, dict]:
+        """Results for a batch the API refused as malformed.
+
+        The records are sent again one at a time, so records that are fine
+        still get applied. Those refused on their own are marked as errors.
+        """
+        if len(batch) == 1:
+            return {batch[0]["id"]: _error_result(error)}
+        results: dict[str, dict] = {}
+        for record in batch:
+            try:
+                results.update(self._post([record]))
+            except httpx.HTTPStatusError as e:
+                if not _is_rejection(e):
+                    raise
+                results[record["id"]] = _error_result(e)
+        return results
+
+    def _settle(self, batch: list[dict], results: dict[str, dict]) -> None:
+        """Drop applied records from the journal and set aside rejected ones."""
+        done, rejected = [], []
+        with self._db_lock:
+            self._db.execute("BEGIN")
+            for record in batch:
+                result = results.get(record["id"])
+                if result is None:
+                    continue
+                if result.get("status") == "error":
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO dead_records (id, kind, round, at, data, error) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (record["id"], record["kind"], record["round"], record["at"],
+                         json.dumps(record["data"]), result.get("error")),
+                    )
+                    rejected.append(record)
+                else:
+                    done.append((record, result.get("row_id")))
+                self._db.execute("DELETE FROM records WHERE seq = ?", (record["seq"],))
+            self._db.execute("COMMIT")
+
+        if rejected:
+            logger.warning(
+                f"Set aside {len(rejected)} {self.bot_id} record(s) the API rejected "
+                f"(see dead_records), first: {results[rejected[0]['id']].get('error')}"
+            )
+
+        settled = sum(1 for r in batch if r["id"] in results)
+        with self._cond:
+            self._pending -= settled
+            self._cond.notify_all()
+
+        if self._on_applied is not None:
+            for record, row_id in done:
+                try:
+                    self._on_applied(record, row_id)
+                except Exception:
+                    pass
+        if self._on_rejected is not None:
+            for record in rejected:
+                try:
+                    self._on_rejected(record)
+                except Exception:
+                    pass
+
+    def _run(self) -> None:
+        delay = RETRY_MIN
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            time.sleep(self.linger)
+
+            batch = self._read_batch()
+            if not batch:
+                with self._cond:
+                    self._pending = 0
+                    self._cond.notify_all()
+                continue
+            try:
+                try:
+                    results = self._post(batch)
+                except httpx.HTTPStatusError as e:
+                    if not _is_rejection(e):
+                        raise
+                    self.last_error = str(e)
+                    results = self._post_rejected(batch, e)
+            except (httpx.HTTPError, ValueError) as e:
+                if self.last_error is None:
+                    logger.warning(f"Posting {self.bot_id} records failed, retrying: {e}")
+                self.last_error = str(e)
+                with self._cond:
+                    self._cond.wait(delay)
+                delay = min(delay * 2, RETRY_MAX)
+                continue
+
+            delay = RETRY_MIN
+            self._settle(batch, results)
+            self.last_error = None
+
+
+def _is_rejection(error: httpx.HTTPStatusError) -> bool:
+    """Whether the API refused the request for what it contains."""
+    return error.response.status_code in RECORD_ERROR_STATUSES
+
+
+def _error_result(error: httpx.HTTPStatusError) -> dict:
+    """A per-record error result for a request the API refused."""
+    return {"status": "error", "error": f"HTTP {error.response.status_code}: {error.response.text[:200]}"}
@@ -0,0 +1,349 @@
+"""Async state management - the StateManager API over a pooled HTTP/2 client."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Optional, Sequence
+
+import httpx
+
+from .broadcaster import Broadcaster
+from .config import Config
+from .models import (
+    Bot,
+    GameState,
+    convert_state,
+    decode_state,
+    encode_json,
+    encode_state,
+)
+from .state import CREDENTIALS_TTL
+from .state_cache import StateCache
+
+logger = logging.getLogger(__name__)
+
+# Connections kept to the API; HTTP/2 multiplexes concurrent requests over them
+MAX_CONNECTIONS = 10
+
+# Attempts per request, and the backoff cap before each retry (seconds)
+RETRY_ATTEMPTS = 3
+RETRY_BASE = 0.2
+RETRY_MAX = 5.0
+
+# Responses worth retrying (rate limited, or the Worker/D1 briefly unavailable)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Failures where the request never reached the API, so even writes that are
+# not idempotent can be sent again
+_NOT_SENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class AsyncStateManager:
+    """Manages game state persistence via the Workers API, asynchronously.
+
+    Same methods as StateManager, as coroutines, so a round can run its
+    independent requests (every bot's credentials, the fallback writes of
+    commit_round) concurrently. Requests share one pooled client that
+    negotiates HTTP/2 where the API offers it (Cloudflare does, over TLS)
+    and falls back to HTTP/1.1 keep-alive.
+
+    push_update() buffers events in a Broadcaster, which merges superseded
+    ones and sends them as one batch; commit_round() takes whatever is
+    buffered along in its own request.
+
+    Transient failures are retried with jittered exponential backoff:
+    idempotent requests on any transport error or a 429/5xx, the rest
+    (round increment, trades, snapshots, broadcasts) only when the
+    connection failed before anything was sent.
+    """
+
+    def __init__(self, config: Config, max_connections: int = MAX_CONNECTIONS):
+        self.config = config
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._credentials: dict[str, tuple[tuple[str, str], float]] = {}
+        self._state_cache = StateCache(config.cf_api_url)
+        self._state: Optional[GameState] = None
+        self._broadcaster = Broadcaster(self.push_updates)
+
+    def _headers(self) -> dict:
+        """Get request headers with API key."""
+        return {
+            "Authorization": f"Bearer {self.config.cf_api_key}",
+            "Content-Type": "application/json",
+        }
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        idempotent: bool = True,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request to the API, retrying transient failures.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. "/api/state")
+            idempotent: Whether sending the request twice is harmless
+            headers: Request headers (default: _headers())
+            **kwargs: Passed to httpx (json, content, params)
+
+        Returns:
+            The last response (its status is not checked)
+        """
+        url = f"{self.config.cf_api_url}{path}"
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                response = await self._client.request(
+                    method, url, headers=headers or self._headers(), **kwargs
+                )
+            except httpx.TransportError as e:
+                if attempt == RETRY_ATTEMPTS or not (idempotent or isinstance(e, _NOT_SENT)):
+                    raise
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                if attempt == RETRY_ATTEMPTS or not idempotent or response.status_code not in RETRY_STATUSES:
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            # Full jitter keeps retries from many requests out of lockstep
+            delay = random.uniform(0, min(RETRY_MAX, RETRY_BASE * 2 ** attempt))
+            logger.info(f"{method} {path} failed ({reason}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def load_state(self) -> GameState:
+        """Load full game state from API (revalidated like StateManager.load_state)."""
+        try:
+            response = await self._request(
+                "GET",
+                "/api/state",
+                headers=self._state_cache.request_headers(self._headers()),
+            )
+            changed = self._state_cache.store(response)
+            if not changed and self._state is not None and self._state.diff() == {}:
+                return self._state
+            if self._state_cache.content is not None:
+                state = decode_state(self._state_cache.content)
+            else:
+                state = convert_state(self._state_cache.data)
+            state.mark_clean()
+            self._state = state
+            return state
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to load state: {e}")
+            raise
+
+    async def save_state(self, state: GameState) -> bool:
+        """Save what changed in the game state (see StateManager.save_state)."""
+        patch = state.diff()
+        try:
+            if patch is not None:
+                if not patch:
+                    return True
+                response = await self._request("PATCH", "/api/state", content=encode_json(patch))
+                if response.status_code not in (404, 405):
+                    response.raise_for_status()
+                    state.mark_clean()
+                    return True
+                logger.info("API has no state patch route, saving full state")
+
+            response = await self._request(
+                "POST", "/api/state", content=encode_state(state, include_trades=False)
+            )
+            response.raise_for_status()
+            state.mark_clean()
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to save state: {e}")
+            raise
+
+    async def commit_round(
+        self,
+        state: GameState,
+        broadcasts: Sequence[tuple[str, dict]] = (),
+        snapshot_bots: Optional[list[Bot]] = None,
+        benchmark_price: Optional[float] = None,
+    ) -> bool:
+        """Save the state's changes, snapshots and broadcasts in one request.
+
+        See StateManager.commit_round. The broadcasts are merged with the
+        ones push_update has buffered, and all of them are sent. The
+        fallback (full save, or an API without the route) saves and
+        snapshots concurrently, then broadcasts. If the commit fails, the
+        broadcasts go back in the buffer for the next flush.
+        """
+        for update_type, data in broadcasts:
+            self._broadcaster.publish(update_type, data)
+        events = self._broadcaster.drain()
+        try:
+            committed = await self._commit(state, events, snapshot_bots, benchmark_price)
+        except BaseException:
+            self._broadcaster.requeue(events)
+            raise
+        if not committed and events:
+            await self.push_updates(events)
+        return True
+
+    async def _commit(
+        self,
+        state: GameState,
+        events: list[dict],
+        snapshot_bots: Optional[list[Bot]],
+        benchmark_price: Optional[float],
+    ) -> bool:
+        """Write the round; True if the broadcasts went with it, False if they still need sending."""
+        patch = state.diff()
+        if patch is not None:
+            body: dict = {"round": state.current_round, "state": patch}
+            if snapshot_bots is not None:
+                body["snapshots"] = [
+                    {"bot_id": b.id, "total_value": b.total_value} for b in snapshot_bots
+                ]
+                body["benchmark_price"] = benchmark_price
+            if events:
+                body["broadcasts"] = events
+            try:
+                # Broadcasts are not safe to send twice
+                response = await self._request(
+                    "POST", "/api/round/commit", idempotent=not events, content=encode_json(body)
+                )
+                if response.status_code not in (404, 405):
+                    response.raise_for_status()
+                    state.mark_clean()
+                    return True
+                logger.info("API has no round commit route, writing separately")
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to commit round {state.current_round}: {e}")
+                raise
+
+        writes = [self.save_state(state)]
+        if snapshot_bots is not None:
+            writes.append(self.record_snapshots(state.current_round, snapshot_bots, benchmark_price))
+        await asyncio.gather(*writes)
+        return False
+
+    async def update_bot(self, bot: Bot) -> bool:
+        """Update a single bot's state (a later save_state skips what this wrote)."""
+        try:
+            response = await self._request("PUT", f"/api/bot/{bot.id}", json=bot.to_dict())
+            response.raise_for_status()
+            bot.mark_clean()
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to update bot {bot.id}: {e}")
+            raise
+
+    async def record_snapshots(
+        self,
+        round_num: int,
+        bots: list[Bot],
+        benchmark_price: Optional[float] = None,
+    ) -> bool:
+        """Write one equity snapshot per bot for a round in a single batch."""
+        try:
+            response = await self._request(
+                "POST",
+                "/api/snapshots/batch",
+                idempotent=False,
+                json={
+                    "round": round_num,
+                    "benchmark_price": benchmark_price,
+                    "snapshots": [
+                        {"bot_id": b.id, "total_value": b.total_value} for b in bots
+                    ],
+                },
+            )
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to record snapshots for round {round_num}: {e}")
+            return False
+
+    async def increment_round(self) -> int:
+        """Increment the round counter and return new round number."""
+        try:
+            response = await self._request("POST", "/api/round/increment", idempotent=False)
+            response.raise_for_status()
+            data = response.json()
+            return data.get("round", 0)
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to increment round: {e}")
+            raise
+
+    async def push_update(self, update_type: str, data: dict) -> bool:
+        """Queue a real-time update for WebSocket clients (sent batched, see Broadcaster)."""
+        self._broadcaster.publish(update_type, data)
+        return True
+
+    async def flush_updates(self) -> bool:
+        """Send the queued real-time updates now."""
+        return await self._broadcaster.flush()
+
+    async def push_updates(self, events: list[dict]) -> bool:
+        """Push several {type, data} updates to WebSocket clients in one request."""
+        try:
+            response = await self._request(
+                "POST",
+                "/api/broadcast/batch",
+                idempotent=False,
+                content=encode_json({"messages": events}),
+            )
+            if response.status_code in (404, 405):
+                # API without the batch route: one broadcast per event
+                for event in events:
+                    response = await self._request(
+                        "POST", "/api/broadcast", idempotent=False, content=encode_json(event)
+                    )
+                    response.raise_for_status()
+                return True
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to push {len(events)} updates: {e}")
+            return False
+
+    async def get_shared_context(self) -> Optional[dict]:
+        """Fetch the part of the round context that is the same for every bot."""
+        try:
+            response = await self._request("GET", "/api/social/context")
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Failed to fetch shared round context: {e}")
+            return None
+
+    async def get_bot_credentials(self, bot_id: str) -> tuple[str, str] | None:
+        """Fetch Alpaca credentials for a bot, reusing them for CREDENTIALS_TTL.
+
+        Returns:
+            Tuple of (api_key, secret_key) or None if not available
+        """
+        cached = self._credentials.get(bot_id)
+        if cached and time.monotonic() - cached[1] < CREDENTIALS_TTL:
+            return cached[0]
+
+        try:
+            response = await self._request("GET", f"/api/bot/{bot_id}/credentials")
+            if response.status_code == 200:
+                data = response.json()
+                credentials = data.get("alpaca_api_key"), data.get("alpaca_secret_key")
+                self._credentials[bot_id] = (credentials, time.monotonic())
+                return credentials
+            return None
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to get credentials for bot {bot_id}: {e}")
+            return None
+
+    async def close(self):
+        """Send any queued updates, then close HTTP client."""
+        await self.flush_updates()
+        await self._client.aclose()
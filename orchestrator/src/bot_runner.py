@@ -5,8 +5,12 @@ import logging
 import os
 import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from .models import Bot, GameState
 
@@ -16,6 +20,45 @@ logger = logging.getLogger(__name__)
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 MCP_SERVER_DIR = Path(__file__).parent.parent.parent / "mcp_server"
 
+# Correlation passed to the MCP server so tool calls can be tied to a round
+CORRELATION_HEADERS = {"run_id": "X-Arena-Run-Id", "round": "X-Arena-Round"}
+CORRELATION_ENV = {"run_id": "ARENA_RUN_ID", "round": "ARENA_ROUND"}
+
+# Stream lines kept for the failure log (each cut to STREAM_LINE_LIMIT chars,
+# tool results can be large), and text blocks kept as fallback output
+STREAM_TAIL_LINES = 50
+STREAM_LINE_LIMIT = 2000
+STREAM_TAIL_TEXT = 20
+
+# Seconds the CLI gets to exit after its result event before it is stopped
+RESULT_GRACE = 5.0
+
+# Longest text block forwarded as a live event
+EVENT_TEXT_LIMIT = 500
+
+# Tool whose calls count as trades
+TRADE_TOOL = "place_order"
+
+
+@dataclass(slots=True)
+class BotRun:
+    """Outcome of one streamed bot session.
+
+    Times are seconds since the CLI was started.
+    """
+
+    output: Optional[str] = None  # Final response text, None on failure
+    tool_calls: int = 0
+    trades: int = 0  # place_order calls, accepted or rejected
+    first_action_seconds: Optional[float] = None  # First tool call of any kind
+    last_trade_seconds: Optional[float] = None
+    duration_seconds: float = 0.0
+    timed_out: bool = False
+    returncode: Optional[int] = None
+    session_id: Optional[str] = None  # Session the CLI ran in (resume it next round)
+    resumed: bool = False  # Whether it continued an earlier session
+    input_tokens: Optional[int] = None  # Prompt tokens read over the whole run
+
 
 class BotRunner:
     """Runs bot trading sessions via Claude Code CLI."""
@@ -42,12 +85,14 @@ class BotRunner:
         cf_api_key: Optional[str] = None,
         finnhub_api_key: Optional[str] = None,
         use_sse: bool = True,  # Use SSE transport by default
+        extra_env: Optional[dict[str, str]] = None,  # Extra env for spawned MCP servers
     ):
         self.model = model
         self.cf_api_url = cf_api_url or os.environ.get("CF_API_URL", "")
         self.cf_api_key = cf_api_key or os.environ.get("CF_API_KEY", "")
         self.finnhub_api_key = finnhub_api_key or os.environ.get("FINNHUB_API_KEY", "")
         self.use_sse = use_sse
+        self.extra_env = extra_env or {}
 
     def get_system_prompt(self, bot: Bot) -> str:
         """Load system prompt for a bot."""
@@ -78,6 +123,7 @@ class BotRunner:
             "- `get_portfolio()` — Your cash, positions, P&L",
             "- `get_all_portfolios()` — Everyone's positions and P&L",
             "- `get_leaderboard()` — Rankings and performance",
+            "- `get_equity_curve(bot?)` — Portfolio value by round",
             "- `get_constraints()` — Your trading rules",
             "",
             "**Market Data**",
@@ -98,7 +144,7 @@ class BotRunner:
 
         return "\n".join(lines)
 
-    def _generate_mcp_config(self, bot: Bot) -> dict:
+    def _generate_mcp_config(self, bot: Bot, correlation: Optional[dict] = None) -> dict:
         """Generate MCP config with unified Trading Arena server.
 
         The trading-arena MCP server handles EVERYTHING:
@@ -109,10 +155,13 @@ class BotRunner:
 
         Args:
             bot: The bot to generate config for
+            correlation: Optional run_id/round, sent as headers (SSE) or env (stdio)
 
         Returns:
             MCP config dict
         """
+        correlation = {k: str(v) for k, v in (correlation or {}).items() if v is not None}
+
         if self.use_sse:
             # Use SSE transport - connect to persistent MCP server
             port = self.BOT_PORTS.get(bot.id, 8091)  # Default to test port
@@ -121,6 +170,10 @@ class BotRunner:
                     "trading-arena": {
                         "type": "sse",
                         "url": f"http://localhost:{port}/sse",
+                        "headers": {
+                            CORRELATION_HEADERS[k]: v
+                            for k, v in correlation.items() if k in CORRELATION_HEADERS
+                        },
                     },
                 }
             }
@@ -133,13 +186,15 @@ class BotRunner:
             "CF_API_URL": self.cf_api_url,
             "CF_API_KEY": self.cf_api_key,
             "FINNHUB_API_KEY": self.finnhub_api_key,
+            **{CORRELATION_ENV[k]: v for k, v in correlation.items() if k in CORRELATION_ENV},
+            **self.extra_env,
         }
 
         # Add Alpaca credentials if available
         if bot.alpaca_api_key and bot.alpaca_secret_key:
             env["ALPACA_API_KEY"] = bot.alpaca_api_key
             env["ALPACA_SECRET_KEY"] = bot.alpaca_secret_key
-        else:
+        elif "BACKTEST_RUN_DIR" not in env:
             logger.warning(f"Bot {bot.id} has no Alpaca credentials - trading will be unavailable")
 
         config = {
@@ -216,12 +271,14 @@ class BotRunner:
             logger.error(f"Error running bot {bot.name}: {e}")
             return None
 
+
     def run_bot_with_mcp(
         self,
         bot: Bot,
         state: GameState,
         mcp_config_path: Optional[str] = None,
         timeout: int = 300,
+        correlation: Optional[dict] = None,
     ) -> Optional[str]:
         """Run bot with MCP servers for market data and trading.
 
@@ -230,10 +287,55 @@ class BotRunner:
             state: Current game state
             mcp_config_path: Path to MCP config file (if None, generates per-bot config)
             timeout: Max seconds for bot
+            correlation: Optional run_id/round to tag the bot's tool calls with
 
         Returns:
             Bot's output text or None on failure
         """
+        return self.stream_bot_with_mcp(
+            bot,
+            state,
+            mcp_config_path=mcp_config_path,
+            timeout=timeout,
+            correlation=correlation,
+        ).output
+
+    def stream_bot_with_mcp(
+        self,
+        bot: Bot,
+        state: GameState,
+        on_event: Optional[Callable[[str, dict], None]] = None,
+        mcp_config_path: Optional[str] = None,
+        timeout: int = 300,
+        correlation: Optional[dict] = None,
+        resume: bool = True,
+    ) -> BotRun:
+        """Run bot with MCP servers, reading the CLI's stream-JSON output as it comes.
+
+        Each text block and tool call is passed to ``on_event`` (called from
+        this thread) while the bot is still running. Only a bounded tail of
+        the stream is kept. The run ends at the CLI's result event; a CLI
+        that lingers after it (MCP servers shutting down) is stopped after
+        RESULT_GRACE seconds rather than holding the round.
+
+        The session ID the CLI reports is returned in the BotRun (callers
+        store it as bot.session_id). If resuming bot.session_id fails before
+        the bot did anything (e.g. the session was made on another host),
+        the bot is run again in a new session.
+
+        Args:
+            bot: Bot to run
+            state: Current game state
+            on_event: Optional callback taking ("text", {text}) or
+                ("tool_call", {tool, input}), plus elapsed seconds in the data
+            mcp_config_path: Path to MCP config file (if None, generates per-bot config)
+            timeout: Max seconds for bot
+            correlation: Optional run_id/round to tag the bot's tool calls with
+            resume: Whether to resume bot.session_id (False starts a new session)
+
+        Returns:
+            BotRun with the output text (None on failure), session and action timings
+        """
         system_prompt = self.get_system_prompt(bot)
         context = self.build_context(bot, state)
 
@@ -241,7 +343,7 @@ class BotRunner:
         # Use a fixed path in home directory (temp files in /tmp have issues with MCP loading)
         config_file_path = None
         if mcp_config_path is None:
-            mcp_config = self._generate_mcp_config(bot)
+            mcp_config = self._generate_mcp_config(bot, correlation)
             config_file_path = Path.home() / f"mcp-config-{bot.id}.json"
             with open(config_file_path, 'w') as f:
                 json.dump(mcp_config, f)
@@ -249,65 +351,216 @@ class BotRunner:
             logger.debug(f"Generated MCP config for {bot.id} at {mcp_config_path}")
 
         try:
-            # Build command - order matters! MCP config before --print, prompt at end
-            cmd = ["claude"]
+            session_id = bot.session_id if resume else None
+            run = self._stream(
+                bot, self._mcp_command(bot, system_prompt, context, mcp_config_path, session_id),
+                on_event,
+                timeout,
+                resumed=session_id is not None,
+            )
+            if session_id and run.output is None and not run.tool_calls and not run.timed_out:
+                logger.warning(f"Bot {bot.name} could not resume session {session_id}, starting a new one")
+                run = self._stream(
+                    bot, self._mcp_command(bot, system_prompt, context, mcp_config_path, None),
+                    on_event,
+                    timeout,
+                )
+            return run
 
-            # Add MCP config first
-            if mcp_config_path and os.path.exists(mcp_config_path):
-                cmd.extend(["--mcp-config", mcp_config_path])
+        except Exception as e:
+            logger.error(f"Error running bot {bot.name}: {e}")
+            return BotRun()
+        finally:
+            # Clean up config file
+            if config_file_path is not None:
+                try:
+                    os.unlink(config_file_path)
+                except OSError:
+                    pass
 
-            # Model and print mode, skip permission prompts (requires non-root user)
-            cmd.extend(["--model", self.model, "--print", "--dangerously-skip-permissions"])
+    def _mcp_command(
+        self,
+        bot: Bot,
+        system_prompt: str,
+        context: str,
+        mcp_config_path: Optional[str],
+        session_id: Optional[str],
+    ) -> list[str]:
+        """Build the CLI command for a bot turn (resuming session_id if given)."""
+        # Build command - order matters! MCP config before --print, prompt at end
+        cmd = ["claude"]
 
-            # Resume session if available
-            if bot.session_id:
-                cmd.extend(["--resume", bot.session_id])
+        # Add MCP config first
+        if mcp_config_path and os.path.exists(mcp_config_path):
+            cmd.extend(["--mcp-config", mcp_config_path])
 
-            # System prompt
-            cmd.extend(["--system-prompt", system_prompt])
+        # Model and print mode, skip permission prompts (requires non-root user)
+        cmd.extend(["--model", self.model, "--print", "--dangerously-skip-permissions"])
 
-            # Prompt is positional - must be last
-            cmd.append(context)
+        # One JSON event per line as the session progresses (stream-json needs --verbose)
+        cmd.extend(["--output-format", "stream-json", "--verbose"])
 
-            logger.info(f"Running bot {bot.name} with MCP tools (BOT_ID={bot.id})")
-            logger.info(f"MCP config path: {mcp_config_path}")
-            logger.info(f"Command: {' '.join(cmd)}")
+        # Resume session if requested
+        if session_id:
+            cmd.extend(["--resume", session_id])
 
-            # Log MCP config contents
-            if mcp_config_path:
-                with open(mcp_config_path, 'r') as f:
-                    logger.info(f"MCP config contents: {f.read()}")
+        # System prompt
+        cmd.extend(["--system-prompt", system_prompt])
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=str(Path.home()),  # Run from home directory where MCP config is
-            )
+        # Prompt is positional - must be last
+        cmd.append(context)
 
-            if result.returncode != 0:
-                logger.error(f"Bot {bot.name} failed with code {result.returncode}")
-                logger.error(f"STDERR: {result.stderr}")
-                logger.error(f"STDOUT: {result.stdout}")
-                return None
+        logger.info(f"Running bot {bot.name} with MCP tools (BOT_ID={bot.id})")
+        logger.info(f"MCP config path: {mcp_config_path}")
+        logger.info(f"Command: {' '.join(cmd)}")
 
-            # Log stderr even on success - might show MCP issues
-            if result.stderr:
-                logger.warning(f"Bot {bot.name} stderr: {result.stderr}")
+        # Log MCP config contents
+        if mcp_config_path:
+            with open(mcp_config_path, 'r') as f:
+                logger.info(f"MCP config contents: {f.read()}")
 
-            return result.stdout
+        return cmd
 
-        except subprocess.TimeoutExpired:
+    def _stream(
+        self,
+        bot: Bot,
+        cmd: list[str],
+        on_event: Optional[Callable[[str, dict], None]],
+        timeout: int,
+        resumed: bool = False,
+    ) -> BotRun:
+        """Run the CLI and collect a BotRun from its stream-JSON output."""
+        run = BotRun(resumed=resumed)
+        started = time.monotonic()
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=str(Path.home()),  # Run from home directory where MCP config is
+        )
+
+        # stderr is drained on its own thread so a chatty CLI cannot block on it
+        stderr_tail: deque[str] = deque(maxlen=STREAM_TAIL_LINES)
+        stderr_reader = threading.Thread(
+            target=stderr_tail.extend, args=(proc.stderr,), daemon=True
+        )
+        stderr_reader.start()
+
+        def expire():
+            run.timed_out = True
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+
+        stdout_tail: deque[str] = deque(maxlen=STREAM_TAIL_LINES)
+        texts: deque[str] = deque(maxlen=STREAM_TAIL_TEXT)
+        result: Optional[dict] = None
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                stdout_tail.append(line[:STREAM_LINE_LIMIT])
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(event, dict):
+                    continue
+
+                # Every event carries it; a resumed session may get a new ID
+                if event.get("session_id"):
+                    run.session_id = event["session_id"]
+                if event.get("type") == "result":
+                    result = event
+                    break
+                if event.get("type") == "assistant":
+                    elapsed = time.monotonic() - started
+                    for block in (event.get("message") or {}).get("content") or []:
+                        activity = self._record_block(block, run, texts, elapsed)
+                        if activity and on_event is not None:
+                            try:
+                                on_event(*activity)
+                            except Exception as e:
+                                logger.warning(f"Bot {bot.name} event callback failed: {e}")
+
+            if result is not None:
+                try:
+                    proc.wait(timeout=RESULT_GRACE)
+                except subprocess.TimeoutExpired:
+                    logger.info(f"Bot {bot.name} finished but the CLI did not exit, stopping it")
+                    proc.terminate()
+            run.returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            stderr_reader.join(timeout=1.0)
+            run.duration_seconds = time.monotonic() - started
+
+        if result is not None:
+            usage = result.get("usage") or {}
+            # Everything the model read, cached or not: what grows as a session is resumed
+            run.input_tokens = sum(
+                usage.get(k) or 0
+                for k in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+            )
+
+        if run.timed_out and result is None:
             logger.error(f"Bot {bot.name} timed out after {timeout}s")
+            return run
+
+        failed = result.get("is_error") if result is not None else run.returncode != 0
+        if failed:
+            logger.error(f"Bot {bot.name} failed with code {run.returncode}")
+            logger.error(f"STDERR: {''.join(stderr_tail)}")
+            logger.error(f"STDOUT: {chr(10).join(stdout_tail)}")
+            return run
+
+        # Log stderr even on success - might show MCP issues
+        if stderr_tail:
+            logger.warning(f"Bot {bot.name} stderr: {''.join(stderr_tail)}")
+
+        if result is not None and isinstance(result.get("result"), str):
+            run.output = result["result"]
+        else:
+            run.output = "\n\n".join(texts)
+        return run
+
+    @staticmethod
+    def _record_block(
+        block: dict,
+        run: BotRun,
+        texts: deque,
+        elapsed: float,
+    ) -> Optional[tuple[str, dict]]:
+        """Count one assistant content block and return the event to forward, if any."""
+        if not isinstance(block, dict):
             return None
-        except Exception as e:
-            logger.error(f"Error running bot {bot.name}: {e}")
-            return None
-        finally:
-            # Clean up config file
-            if config_file_path is not None:
-                try:
-                    os.unlink(config_file_path)
-                except OSError:
-                    pass
+        elapsed = round(elapsed, 2)
+
+        if block.get("type") == "text":
+            text = (block.get("text") or "").strip()
+            if not text:
+                return None
+            texts.append(text)
+            return "text", {"text": text[:EVENT_TEXT_LIMIT], "elapsed": elapsed}
+
+        if block.get("type") == "tool_use":
+            # MCP tools arrive as mcp__<server>__<tool>
+            tool = str(block.get("name") or "").rsplit("__", 1)[-1]
+            run.tool_calls += 1
+            if run.first_action_seconds is None:
+                run.first_action_seconds = elapsed
+            if tool == TRADE_TOOL:
+                run.trades += 1
+                run.last_trade_seconds = elapsed
+            return "tool_call", {"tool": tool, "input": block.get("input"), "elapsed": elapsed}
+
+        return None
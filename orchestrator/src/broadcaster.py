@@ -0,0 +1,125 @@
+"""Coalescing broadcaster for live dashboard updates."""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, Optional
+
+# Quiet time after the latest event before the buffer is sent (seconds)
+BROADCAST_WINDOW = 0.25
+
+# Longest any event waits in the buffer, however steadily events arrive
+BROADCAST_MAX_LATENCY = 1.0
+
+# Event types where only the newest one per bot matters (leaderboard has
+# no bot, so only the newest one overall)
+COALESCED_TYPES = frozenset({"bot_update", "leaderboard"})
+
+
+class Broadcaster:
+    """Buffers WebSocket events and sends them as one batched broadcast.
+
+    publish() adds an event to the buffer. A bot_update replaces any
+    pending bot_update for the same bot (a leaderboard, any pending
+    leaderboard) and moves to the end, so events keep the order of their
+    latest update. The buffer is sent once no event has arrived for
+    ``window`` seconds, or ``max_latency`` after its oldest event,
+    whichever comes first. drain() hands the pending events to a caller
+    that sends them itself (commit_round), which requeue()s them if that
+    fails; flush() sends them right away.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[dict]], Awaitable[bool]],
+        window: float = BROADCAST_WINDOW,
+        max_latency: float = BROADCAST_MAX_LATENCY,
+    ):
+        """Initialize the broadcaster.
+
+        Args:
+            send: Coroutine function posting a list of {type, data} events
+            window: Seconds to wait for more events after the latest one
+            max_latency: Seconds after which the oldest event is sent regardless
+        """
+        self.window = window
+        self.max_latency = max_latency
+        self._send = send
+        self._pending: dict[Hashable, dict] = {}
+        self._seq = 0  # Keys events that never coalesce
+        self._first_at = 0.0
+        self._last_at = 0.0
+        self._timer: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered events."""
+        return len(self._pending)
+
+    def publish(self, update_type: str, data: dict) -> None:
+        """Buffer an event (must be called from the event loop)."""
+        # Checked before a superseded event is dropped, so replacing the
+        # only pending event does not restart the max_latency clock
+        was_empty = not self._pending
+        key = self._key(update_type, data)
+        self._pending.pop(key, None)
+        self._pending[key] = {"type": update_type, "data": data}
+        self._schedule(was_empty)
+
+    def requeue(self, events: list[dict]) -> None:
+        """Put drained events that could not be sent back in the buffer.
+
+        They go ahead of anything published since; a newer update for the
+        same bot (or a newer leaderboard) replaces the requeued one.
+        """
+        if not events:
+            return
+        was_empty = not self._pending
+        published = self._pending
+        self._pending = {}
+        for event in events:
+            self._pending[self._key(event["type"], event["data"])] = event
+        for key, event in published.items():
+            self._pending.pop(key, None)
+            self._pending[key] = event
+        self._schedule(was_empty)
+
+    def _key(self, update_type: str, data: dict) -> Hashable:
+        if update_type in COALESCED_TYPES:
+            return (update_type, data.get("bot_id"))
+        self._seq += 1
+        return self._seq
+
+    def _schedule(self, was_empty: bool) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if was_empty:
+            self._first_at = now
+        self._last_at = now
+        if self._timer is None:
+            self._timer = loop.create_task(self._flush_later())
+
+    def drain(self) -> list[dict]:
+        """Take the buffered events, oldest first, without sending them."""
+        events = list(self._pending.values())
+        self._pending.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return events
+
+    async def flush(self) -> bool:
+        """Send the buffered events now as one batch."""
+        events = self.drain()
+        if not events:
+            return True
+        return await self._send(events)
+
+    async def _flush_later(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            delay = min(self._last_at + self.window, self._first_at + self.max_latency) - loop.time()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        # Detach first, so flush() does not cancel the task running it
+        self._timer = None
+        await self.flush()
@@ -27,6 +27,14 @@ class Config:
     # Claude settings
     claude_model: str = "claude-opus-4-5-20251101"
 
+    # Round traces (one JSON-lines file per round)
+    trace_dir: str = "logs/traces"
+
+    # Bot sessions: rounds resumed before a new one (0 = always new), and the
+    # last run's prompt tokens above which a new one starts (0 = no limit)
+    session_max_rounds: int = 10
+    session_max_tokens: int = 400_000
+
     # Bot constraints
     baseline_bots: dict = None
     free_agent_bots: list = None
@@ -81,6 +89,9 @@ def load_config() -> Config:
         starting_cash=float(os.environ.get("STARTING_CASH", "100000")),
         max_trades_per_round=int(os.environ.get("MAX_TRADES_PER_ROUND", "5")),
         claude_model=os.environ.get("CLAUDE_MODEL", "claude-opus-4-5-20251101"),
+        trace_dir=os.environ.get("TRACE_DIR", "logs/traces"),
+        session_max_rounds=int(os.environ.get("SESSION_MAX_ROUNDS", "10")),
+        session_max_tokens=int(os.environ.get("SESSION_MAX_TOKENS", "400000")),
     )
 
 
@@ -7,16 +7,25 @@ Bot-Driven Execution Architecture:
 """
 
 import argparse
+import asyncio
 import logging
 import random
 import sys
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 
+from mcp_server.src.round_context import ROUND_CONTEXT_KEY
+from mcp_server.src.shared_cache import SharedCache
+
+from .async_state import AsyncStateManager
 from .bot_runner import BotRunner
 from .config import Config, load_config
 from .models import Bot, GameState
-from .state import StateManager
+from .price_fetcher import PriceFetcher
+from .sessions import SessionPolicy, SessionStore
+from .tracing import Tracer
+from .valuation import mark_to_market
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +33,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Benchmark priced alongside holdings each round (for beta in analytics)
+BENCHMARK_SYMBOL = "SPY"
+
 
 class TradingArena:
     """Main orchestrator for the trading arena.
@@ -31,34 +43,72 @@ class TradingArena:
     With bot-driven execution, the orchestrator's job is simple:
     1. Check if game is running
     2. Increment round
-    3. Run each bot (they trade via MCP tools directly)
+    3. Run each bot (they trade via MCP tools directly), resuming its
+       last CLI session until the rotation policy starts a new one
     4. Store commentary
-    5. Push real-time updates
+    5. Mark every portfolio to market
+    6. Push real-time updates
+
+    API calls are async on one pooled connection. Each bot turn's writes,
+    and the round's final ones, go out as a single commit_round request.
+    Rounds run on the arena's own event loop so the pool outlives a single
+    round.
     """
 
     def __init__(self, config: Config):
         self.config = config
-        self.state_manager = StateManager(config)
+        self._loop = asyncio.new_event_loop()
+        self.state_manager = AsyncStateManager(config)
         self.bot_runner = BotRunner(
             model=config.claude_model,
             cf_api_url=config.cf_api_url,
             cf_api_key=config.cf_api_key,
             finnhub_api_key=config.finnhub_api_key,
         )
+        self.price_fetcher = PriceFetcher(api_key=config.finnhub_api_key)
+        self.tracer = Tracer(config.trace_dir)
+        self.sessions = SessionStore(
+            SessionPolicy(max_rounds=config.session_max_rounds, max_tokens=config.session_max_tokens)
+        )
+        self.shared_cache = SharedCache()
+        self._current_round: Optional[int] = None  # Set once the round is incremented
 
     def run_round(self, bot_ids: Optional[list[str]] = None) -> dict:
         """Run a single trading round.
 
+        The round is traced as nested spans and written to the trace
+        directory once its round number is known.
+
         Args:
             bot_ids: Optional list of specific bots to run (default: all enabled)
 
         Returns:
             Summary dict with round results
         """
+        self.tracer.reset()
+        self._current_round = None
+        result: dict = {}
+        try:
+            with self.tracer.span("round") as span:
+                result = self._loop.run_until_complete(self._run_round(bot_ids))
+                span.set(round=result.get("round"), bots_run=result.get("bots_run"))
+        finally:
+            # Nothing queued for the dashboard outlives the round
+            self._loop.run_until_complete(self.state_manager.flush_updates())
+            # Rounds that never started (game paused, no bots) leave no trace
+            if self._current_round:
+                path = self.tracer.write(self._current_round)
+                if path:
+                    logger.info(f"Round trace written to {path}")
+        return result
+
+    async def _run_round(self, bot_ids: Optional[list[str]]) -> dict:
+        """Run the round itself (see run_round)."""
         logger.info("Starting trading round...")
 
         # Load current state
-        state = self.state_manager.load_state()
+        with self.tracer.span("load_state"):
+            state = await self.state_manager.load_state()
 
         if state.status != "running":
             logger.warning(f"Game is not running (status: {state.status})")
@@ -74,62 +124,172 @@ class TradingArena:
             return {"error": "No bots to run"}
 
         # Increment round
-        new_round = self.state_manager.increment_round()
+        with self.tracer.span("increment_round"):
+            new_round = await self.state_manager.increment_round()
         state.current_round = new_round
+        self._current_round = new_round
         logger.info(f"Round {new_round}")
 
+        await self._publish_round_context()
+
         # Randomize bot execution order (no information advantage)
         random.shuffle(bots)
 
+        # Spawned (stdio) MCP servers get Alpaca credentials through their env;
+        # persistent SSE servers resolve and cache their own
+        if not self.bot_runner.use_sse:
+            await self._load_credentials(bots)
+
         # Run each bot
         results = {}
 
-        for bot in bots:
-            logger.info(f"Running bot: {bot.name}")
+        for order, bot in enumerate(bots):
+            with self.tracer.span("bot", bot_id=bot.id, order=order) as bot_span:
+                results[bot.id] = await self._run_bot_turn(bot, state)
+                bot_span.set(ok="error" not in results[bot.id])
+            # Later bots should see this bot's trades and messages
+            await self._publish_round_context()
+
+        # Revalue all portfolios before ranking (the price fetch blocks, so
+        # it runs off the event loop like the bot turns)
+        with self.tracer.span("mark_to_market") as span:
+            valuation = await asyncio.to_thread(self._mark_to_market, state)
+            span.set(**{k: v for k, v in valuation.items() if k != "benchmark_price"})
+
+        # Final state save, one equity snapshot per bot for this round and
+        # the leaderboard update, in one request
+        state.updated_at = datetime.utcnow()
+        with self.tracer.span("commit_round", snapshots=True):
+            await self.state_manager.commit_round(
+                state,
+                broadcasts=[("leaderboard", {
+                    "round": new_round,
+                    "leaderboard": [b.to_dict() for b in state.get_leaderboard()],
+                })],
+                snapshot_bots=state.get_enabled_bots(),
+                benchmark_price=valuation.get("benchmark_price"),
+            )
 
-            # Fetch Alpaca credentials for this bot
-            credentials = self.state_manager.get_bot_credentials(bot.id)
+        logger.info(f"Round {new_round} complete.")
+
+        return {
+            "round": new_round,
+            "bots_run": len(bots),
+            "results": results,
+            "mark_to_market": valuation,
+        }
+
+    async def _load_credentials(self, bots: list[Bot]) -> None:
+        """Fetch every bot's Alpaca credentials at once, before the first turn."""
+        with self.tracer.span("credentials", bots=len(bots)) as span:
+            fetched = await asyncio.gather(
+                *(self.state_manager.get_bot_credentials(bot.id) for bot in bots)
+            )
+            span.set(found=sum(1 for credentials in fetched if credentials))
+        for bot, credentials in zip(bots, fetched):
             if credentials:
                 bot.alpaca_api_key, bot.alpaca_secret_key = credentials
-                logger.info(f"Loaded Alpaca credentials for {bot.name}")
             else:
                 logger.warning(f"No Alpaca credentials for {bot.name}")
 
-            result = self._run_single_bot(bot, state)
-            results[bot.id] = result
-
-            # Update bot state (commentary)
-            self.state_manager.update_bot(bot)
+    async def _run_bot_turn(self, bot: Bot, state: GameState) -> dict:
+        """Run the bot, then store and broadcast its commentary.
 
-            # Push real-time update
-            self.state_manager.push_update("bot_update", {
-                "bot_id": bot.id,
-                "bot_name": bot.name,
-                "commentary": result.get("commentary"),
-            })
-
-        # Final state save
-        state.updated_at = datetime.utcnow()
-        self.state_manager.save_state(state)
-
-        # Push leaderboard update
-        self.state_manager.push_update("leaderboard", {
-            "round": new_round,
-            "leaderboard": [b.to_dict() for b in state.get_leaderboard()],
-        })
+        The bot's text and tool calls are broadcast as bot_activity events
+        while it runs.
+        """
+        logger.info(f"Running bot: {bot.name}")
+        loop = asyncio.get_running_loop()
+
+        def forward(kind: str, data: dict) -> None:
+            # Called from the runner's thread; the broadcaster lives on the loop
+            asyncio.run_coroutine_threadsafe(
+                self.state_manager.push_update(
+                    "bot_activity",
+                    {"bot_id": bot.id, "bot_name": bot.name, "kind": kind, **data},
+                ),
+                loop,
+            )
+
+        with self.tracer.span("claude", model=self.config.claude_model) as span:
+            result = await asyncio.to_thread(self._run_single_bot, bot, state, forward)
+            span.set(responded="error" not in result, **result.get("timings", {}))
+
+        # Store the commentary and push it to the dashboard in one request
+        with self.tracer.span("commit_round", snapshots=False):
+            await self.state_manager.commit_round(
+                state,
+                broadcasts=[("bot_update", {
+                    "bot_id": bot.id,
+                    "bot_name": bot.name,
+                    "commentary": result.get("commentary"),
+                })],
+            )
+
+        return result
+
+    async def _publish_round_context(self) -> None:
+        """Write the shared round context where the MCP servers can read it.
+
+        Every bot's get_round_context then only needs its own DMs and
+        memories from the API. If the fetch fails the old snapshot is
+        removed, so servers fall back to the full endpoint instead of
+        serving a stale one.
+        """
+        with self.tracer.span("publish_context") as span:
+            shared = await self.state_manager.get_shared_context()
+            span.set(ok=shared is not None)
+            try:
+                if shared is None:
+                    self.shared_cache.delete(ROUND_CONTEXT_KEY)
+                else:
+                    self.shared_cache.put(
+                        ROUND_CONTEXT_KEY, {**shared, "published_at": time.time()}
+                    )
+            except OSError as e:
+                logger.warning(f"Failed to publish round context: {e}")
+
+    def _mark_to_market(self, state: GameState) -> dict:
+        """Reprice all held positions and recompute every bot's total value.
+
+        Every distinct symbol across all bots (plus the benchmark) is fetched
+        once in a single concurrent pass, then all totals are recomputed in
+        one vectorized step so the leaderboard ranks on fresh values.
 
-        logger.info(f"Round {new_round} complete.")
+        Args:
+            state: Current game state (bots are updated in place)
 
-        return {
-            "round": new_round,
-            "bots_run": len(bots),
-            "results": results,
+        Returns:
+            Dict with symbol counts, benchmark price and stage timings
+        """
+        started = time.perf_counter()
+        symbols = self.price_fetcher.get_all_bot_symbols(state.bots)
+        prices = self.price_fetcher.get_prices(sorted(symbols | {BENCHMARK_SYMBOL}))
+        fetched = time.perf_counter()
+
+        mark_to_market(state.bots, prices)
+        finished = time.perf_counter()
+
+        summary = {
+            "symbols": len(symbols),
+            "priced": len(symbols & prices.keys()),
+            "benchmark_price": prices.get(BENCHMARK_SYMBOL),
+            "fetch_seconds": round(fetched - started, 3),
+            "revalue_seconds": round(finished - fetched, 3),
+            "total_seconds": round(finished - started, 3),
         }
+        logger.info(
+            f"Mark-to-market: {summary['priced']}/{len(symbols)} symbols priced for "
+            f"{len(state.bots)} bots in {summary['total_seconds']:.2f}s "
+            f"(fetch {summary['fetch_seconds']:.2f}s)"
+        )
+        return summary
 
     def _run_single_bot(
         self,
         bot: Bot,
         state: GameState,
+        on_event: Optional[Callable[[str, dict], None]] = None,
     ) -> dict:
         """Run a single bot's trading session.
 
@@ -143,15 +303,34 @@ class TradingArena:
         Args:
             bot: Bot to run
             state: Current game state
+            on_event: Optional callback for the bot's text and tool calls as they happen
 
         Returns:
-            Dict with bot's output and commentary
+            Dict with bot's output, commentary, action timings and session use
         """
-        output = self.bot_runner.run_bot_with_mcp(bot, state)
+        run = self.bot_runner.stream_bot_with_mcp(
+            bot,
+            state,
+            on_event=on_event,
+            correlation={"run_id": self.tracer.trace_id, "round": state.current_round},
+            resume=self.sessions.should_resume(bot),
+        )
+        # The new session ID is saved with the turn's commit
+        self.sessions.record(bot, run, state.current_round)
+        timings = {
+            "tool_calls": run.tool_calls,
+            "trades": run.trades,
+            "first_action_s": run.first_action_seconds,
+            "last_trade_s": run.last_trade_seconds,
+            "resumed": run.resumed,
+            "session_rounds": self.sessions.rounds(bot),
+            "input_tokens": run.input_tokens,
+        }
+        output = run.output
 
         if output is None:
             logger.error(f"Bot {bot.name} failed to respond")
-            return {"error": "Bot failed to respond", "commentary": None}
+            return {"error": "Bot failed to respond", "commentary": None, "timings": timings}
 
         # Extract commentary (everything the bot said)
         # Truncate for storage
@@ -164,11 +343,14 @@ class TradingArena:
         return {
             "output": output[:1000] if output else None,
             "commentary": commentary,
+            "timings": timings,
         }
 
     def close(self):
         """Clean up resources."""
-        self.state_manager.close()
+        self._loop.run_until_complete(self.state_manager.close())
+        self._loop.close()
+        self.price_fetcher.close()
 
 
 def main():
@@ -1,8 +1,21 @@
 """Data models for the trading arena."""
 
 from .bot import Bot
+from .codec import convert_state, decode_state, encode_json, encode_state
 from .game_state import GameState
 from .position import Position
-from .trade import ParsedTrade, Trade
+from .trade import RECENT_TRADES_LIMIT, ParsedTrade, RecentTrades, Trade
 
-__all__ = ["Bot", "Position", "Trade", "ParsedTrade", "GameState"]
+__all__ = [
+    "Bot",
+    "Position",
+    "Trade",
+    "ParsedTrade",
+    "RecentTrades",
+    "RECENT_TRADES_LIMIT",
+    "GameState",
+    "convert_state",
+    "decode_state",
+    "encode_json",
+    "encode_state",
+]
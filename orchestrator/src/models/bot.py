@@ -2,15 +2,22 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import Literal, Optional
 
+from .caching import Cached
 from .position import Position
+from .tracking import Tracked
 
+_symbol = attrgetter("symbol")
 
-@dataclass
-class Bot:
+
+@dataclass(slots=True)
+class Bot(Cached):
     """Represents a trading bot in the arena."""
 
+    TRACKED_FIELDS = ("cash", "total_value", "session_id", "last_commentary", "enabled")
+
     id: str
     name: str
     type: Literal["baseline", "free_agent"]
@@ -31,16 +38,59 @@ class Bot:
 
     def get_position(self, symbol: str) -> Optional[Position]:
         """Get position for a specific symbol."""
-        for pos in self.positions:
-            if pos.symbol == symbol:
-                return pos
-        return None
+        return self._find("positions_by_symbol", self.positions, _symbol, symbol)
 
     def calculate_total_value(self) -> float:
         """Recalculate total portfolio value."""
         self.total_value = self.cash + self.position_value
         return self.total_value
 
+    def mark_clean(self) -> None:
+        """Treat this bot and its positions as persisted."""
+        Tracked.mark_clean(self)
+        for pos in self.positions:
+            pos.mark_clean()
+        self._clean_members = {p.symbol: p for p in self.positions}
+
+    def diff(self) -> dict:
+        """Changes since mark_clean() as a PATCH /api/state bot entry.
+
+        Positions whose fields changed are sent as partial updates, ones
+        opened (or replaced with a new object) in full, and ones no longer
+        held by symbol.
+
+        Returns:
+            The entry, or an empty dict if nothing changed
+        """
+        entry = self.changes()
+        clean = getattr(self, "_clean_members", None) or {}
+
+        updated, opened = [], []
+        kept = 0
+        for pos in self.positions:
+            if clean.get(pos.symbol) is not pos:
+                opened.append(pos.to_dict())
+                continue
+            kept += 1
+            pos_changes = pos.changes()
+            if pos_changes:
+                updated.append({"symbol": pos.symbol, **pos_changes})
+
+        closed = []
+        if kept < len(clean):
+            held = {p.symbol for p in self.positions}
+            closed = [symbol for symbol in clean if symbol not in held]
+
+        if updated:
+            entry["positions"] = updated
+        if opened:
+            entry["opened_positions"] = opened
+        if closed:
+            entry["closed_positions"] = closed
+        if entry:
+            entry = {"id": self.id, **entry}
+        return entry
+
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
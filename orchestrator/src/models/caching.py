@@ -0,0 +1,59 @@
+"""Cached lookups and aggregates for the models."""
+
+from typing import Any, Callable, Hashable, Optional, Sequence
+
+from .tracking import Tracked
+
+
+class Cached(Tracked):
+    """Tracked model that keeps indexes and aggregates over its lists.
+
+    The lists are plain and get mutated freely (appended to, filtered,
+    reassigned, decoded into), so nothing tells a cache its inputs changed.
+    Each cached value is stored with a key computed from its inputs in C
+    (a tuple of the values it depends on) and recomputed when the key
+    differs. Indexes map a key to a list slot and check that slot before
+    trusting it, rebuilding in one pass when it no longer matches. A key
+    missing from the index also rebuilds it before reporting a miss, since
+    an item under that key may have been added or swapped in since.
+    """
+
+    __slots__ = ("_cache",)
+
+    def _cache_dict(self) -> dict:
+        cache = getattr(self, "_cache", None)
+        if cache is None:
+            cache = self._cache = {}
+        return cache
+
+    def _cached(self, name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """A value stored under ``name``, recomputed when ``key`` changes."""
+        cache = self._cache_dict()
+        entry = cache.get(name)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        value = compute()
+        cache[name] = (key, value)
+        return value
+
+    def _find(
+        self,
+        name: str,
+        items: Sequence,
+        get_key: Callable[[Any], Hashable],
+        key: Hashable,
+    ) -> Optional[Any]:
+        """First item in ``items`` whose key equals ``key``, via an index."""
+        cache = self._cache_dict()
+        slots = cache.get(name)
+        if slots is not None:
+            i = slots.get(key)
+            if i is not None and i < len(items) and get_key(items[i]) == key:
+                return items[i]
+
+        slots = {}
+        for i, item_key in enumerate(map(get_key, items)):
+            slots.setdefault(item_key, i)
+        cache[name] = slots
+        i = slots.get(key)
+        return items[i] if i is not None else None
@@ -0,0 +1,81 @@
+"""Fast JSON codec for the game state models.
+
+msgspec reads the dataclass annotations and builds GameState, Bot,
+Position and Trade objects (datetimes included) straight from the
+response bytes in one pass, instead of json.loads followed by a
+from_dict walk. Encoding produces the to_dict() schema the same way.
+
+The typed decoder is stricter than from_dict (a value outside a Literal,
+a string where a number belongs); documents it rejects fall back to the
+lenient from_dict path.
+"""
+
+import json
+from typing import Union
+
+import msgspec
+
+from .bot import Bot
+from .game_state import GameState
+
+# strict=False accepts the loose numbers SQLite hands back (3.0 for an int field)
+_decoder = msgspec.json.Decoder(GameState, strict=False)
+_encoder = msgspec.json.Encoder()
+
+
+def decode_state(raw: Union[bytes, str]) -> GameState:
+    """Parse an /api/state response body into a GameState."""
+    try:
+        return _decoder.decode(raw)
+    except msgspec.ValidationError:
+        return GameState.from_dict(json.loads(raw))
+
+
+def convert_state(data: dict) -> GameState:
+    """Build a GameState from an already parsed state document."""
+    try:
+        return msgspec.convert(data, GameState, strict=False)
+    except msgspec.ValidationError:
+        return GameState.from_dict(data)
+
+
+def encode_json(value) -> bytes:
+    """Serialize any JSON-compatible value (models included) to bytes."""
+    return _encoder.encode(value)
+
+
+def _bot_document(bot: Bot) -> dict:
+    # Bot.to_dict() (no Alpaca credentials), positions left to the encoder
+    return {
+        "id": bot.id,
+        "name": bot.name,
+        "type": bot.type,
+        "cash": bot.cash,
+        "total_value": bot.total_value,
+        "positions": bot.positions,
+        "session_id": bot.session_id,
+        "last_commentary": bot.last_commentary,
+        "enabled": bot.enabled,
+        "updated_at": bot.updated_at,
+    }
+
+
+def encode_state(state: GameState, include_trades: bool = True) -> bytes:
+    """Serialize a GameState to JSON bytes in the to_dict() schema.
+
+    Args:
+        state: The state to encode
+        include_trades: Whether to include recent_trades; POST /api/state
+            ignores them (trades are recorded as they happen)
+    """
+    document = {
+        "status": state.status,
+        "starting_cash": state.starting_cash,
+        "current_round": state.current_round,
+        "bots": [_bot_document(bot) for bot in state.bots],
+        "created_at": state.created_at,
+        "updated_at": state.updated_at,
+    }
+    if include_trades:
+        document["recent_trades"] = list(state.recent_trades)
+    return _encoder.encode(document)
@@ -2,38 +2,89 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal, Optional
+from operator import attrgetter
+from typing import Literal, Optional, Sequence
 
 from .bot import Bot
-from .trade import Trade
+from .caching import Cached
+from .tracking import Tracked
+from .trade import RecentTrades, Trade
 
+_bot_id = attrgetter("id")
+_total_value = attrgetter("total_value")
 
-@dataclass
-class GameState:
+
+@dataclass(slots=True)
+class GameState(Cached):
     """Represents the full game state."""
 
+    TRACKED_FIELDS = ("status", "current_round")
+
     status: Literal["running", "paused"] = "paused"
     starting_cash: float = 100000.0
     current_round: int = 0
     bots: list[Bot] = field(default_factory=list)
-    recent_trades: list[Trade] = field(default_factory=list)
+    recent_trades: Sequence[Trade] = field(default_factory=RecentTrades)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    def __post_init__(self):
+        # Lists (from_dict, the codec, callers) become the bounded buffer
+        if not isinstance(self.recent_trades, RecentTrades):
+            self.recent_trades = RecentTrades(self.recent_trades)
+
     def get_bot(self, bot_id: str) -> Optional[Bot]:
         """Get bot by ID."""
-        for bot in self.bots:
-            if bot.id == bot_id:
-                return bot
-        return None
+        return self._find("bots_by_id", self.bots, _bot_id, bot_id)
 
     def get_enabled_bots(self) -> list[Bot]:
         """Get all enabled bots."""
         return [bot for bot in self.bots if bot.enabled]
 
     def get_leaderboard(self) -> list[Bot]:
-        """Get bots sorted by total value (descending)."""
-        return sorted(self.bots, key=lambda b: b.total_value, reverse=True)
+        """Get bots sorted by total value (descending).
+
+        The ordering is cached until a bot's total value changes.
+        """
+        bots = self.bots
+        values = tuple(map(_total_value, bots))
+        order = self._cached(
+            "leaderboard",
+            values,
+            lambda: sorted(range(len(values)), key=values.__getitem__, reverse=True),
+        )
+        return [bots[i] for i in order]
+
+    def mark_clean(self) -> None:
+        """Treat the game and every bot as persisted (after a load or save)."""
+        Tracked.mark_clean(self)
+        for bot in self.bots:
+            bot.mark_clean()
+
+    def diff(self) -> Optional[dict]:
+        """Changes since mark_clean() as a PATCH /api/state body.
+
+        Only the fields the API stores are compared; ``updated_at`` is set
+        by the API and recent trades are written as they happen.
+
+        Returns:
+            The patch (empty if nothing changed), or None if the state was
+            never marked clean or has bots added since - those need a full save
+        """
+        if not self.is_tracked:
+            return None
+
+        patch = self.changes()
+        bots = []
+        for bot in self.bots:
+            if not bot.is_tracked:
+                return None
+            entry = bot.diff()
+            if entry:
+                bots.append(entry)
+        if bots:
+            patch["bots"] = bots
+        return patch
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -3,11 +3,15 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from .tracking import Tracked
 
-@dataclass
-class Position:
+
+@dataclass(slots=True)
+class Position(Tracked):
     """Represents a stock position held by a bot."""
 
+    TRACKED_FIELDS = ("shares", "avg_cost", "current_price")
+
     symbol: str
     shares: float
     avg_cost: float
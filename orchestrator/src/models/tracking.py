@@ -0,0 +1,48 @@
+"""Change tracking for the persisted models."""
+
+from operator import attrgetter
+
+
+class Tracked:
+    """Mixin reporting which persisted fields changed since mark_clean().
+
+    Subclasses list the fields the API stores in ``TRACKED_FIELDS``.
+    mark_clean() (normally called right after the state is loaded or saved)
+    snapshots their values and changes() compares against that snapshot,
+    so nothing is paid on construction or assignment.
+    """
+
+    # The snapshot, and for models with a child collection its persisted
+    # members (Bot: positions by symbol)
+    __slots__ = ("_clean", "_clean_members")
+
+    TRACKED_FIELDS: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One C call reads every tracked field (as a tuple; needs two or more)
+        if cls.TRACKED_FIELDS:
+            cls._tracked_values = attrgetter(*cls.TRACKED_FIELDS)
+
+    @property
+    def is_tracked(self) -> bool:
+        """Whether mark_clean() has been called."""
+        return getattr(self, "_clean", None) is not None
+
+    def changes(self) -> dict:
+        """Tracked fields that differ from the snapshot, with their current values."""
+        clean = getattr(self, "_clean", None)
+        if clean is None:
+            return {}
+        values = self._tracked_values(self)
+        if values == clean:
+            return {}
+        return {
+            name: value
+            for name, value, old in zip(self.TRACKED_FIELDS, values, clean)
+            if value != old
+        }
+
+    def mark_clean(self) -> None:
+        """Treat the current values as persisted."""
+        self._clean = self._tracked_values(self)
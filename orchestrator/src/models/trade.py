@@ -1,11 +1,17 @@
 """Trade data model."""
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal, Optional
+from itertools import islice
+from typing import Iterable, Literal, Optional
 
+# How many trades GameState keeps (and /api/state returns); older ones are
+# paged from /api/trades (StateManager.get_trade_history)
+RECENT_TRADES_LIMIT = 50
 
-@dataclass
+
+@dataclass(slots=True)
 class Trade:
     """Represents a trade executed by a bot."""
 
@@ -58,7 +64,24 @@ class Trade:
         )
 
 
-@dataclass
+class RecentTrades(deque):
+    """The most recent trades, newest first, holding at most ``capacity``.
+
+    add() puts a trade at the front and drops the oldest once full, so the
+    memory a long-running game keeps (and the state it sends) stays the
+    same size however many rounds are played.
+    """
+
+    def __init__(self, trades: Iterable[Trade] = (), capacity: int = RECENT_TRADES_LIMIT):
+        # Keep the first (newest) ``capacity`` trades, not the last
+        super().__init__(islice(trades, capacity), capacity)
+
+    def add(self, trade: Trade) -> None:
+        """Record a trade as the newest, evicting the oldest if full."""
+        self.appendleft(trade)
+
+
+@dataclass(slots=True)
 class ParsedTrade:
     """Represents a trade parsed from bot output (not yet validated/executed)."""
 
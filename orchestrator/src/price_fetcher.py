@@ -2,23 +2,33 @@
 
 import logging
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
 
+def normalize_symbol(symbol: str) -> str:
+    """Canonical form of a ticker (the keys of every prices dict)."""
+    return symbol.strip().upper()
+
+
 class PriceFetcher:
     """Fetches current market prices from Finnhub API."""
 
     BASE_URL = "https://finnhub.io/api/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_workers: int = 8):
         self.api_key = api_key or os.environ.get("FINNHUB_API_KEY")
         if not self.api_key:
             raise ValueError("FINNHUB_API_KEY is required")
-        self._client = httpx.Client(timeout=30.0)
+        self.max_workers = max_workers
+        self._client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=max_workers),
+        )
 
     def get_price(self, symbol: str) -> Optional[float]:
         """Get current price for a single symbol.
@@ -32,7 +42,7 @@ class PriceFetcher:
         try:
             response = self._client.get(
                 f"{self.BASE_URL}/quote",
-                params={"symbol": symbol.upper(), "token": self.api_key},
+                params={"symbol": normalize_symbol(symbol), "token": self.api_key},
             )
             response.raise_for_status()
             data = response.json()
@@ -49,18 +59,28 @@ class PriceFetcher:
     def get_prices(self, symbols: list[str]) -> dict[str, float]:
         """Get current prices for multiple symbols.
 
+        Each distinct symbol is requested once; lookups run concurrently
+        over the shared connection pool.
+
         Args:
             symbols: List of stock/ETF symbols
 
         Returns:
-            Dict mapping symbols to prices (only includes successful lookups)
+            Dict mapping normalized symbols to prices (only includes successful lookups)
         """
-        prices = {}
-        for symbol in symbols:
-            price = self.get_price(symbol)
-            if price is not None:
-                prices[symbol.upper()] = price
-        return prices
+        unique = sorted({normalize_symbol(s) for s in symbols})
+        if not unique:
+            return {}
+
+        workers = min(self.max_workers, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(self.get_price, unique)
+
+        return {
+            symbol: price
+            for symbol, price in zip(unique, results)
+            if price is not None
+        }
 
     def get_all_bot_symbols(self, bots: list) -> set[str]:
         """Get all unique symbols held by bots.
@@ -69,24 +89,25 @@ class PriceFetcher:
             bots: List of Bot objects
 
         Returns:
-            Set of unique symbols
+            Set of unique normalized symbols
         """
-        symbols = set()
-        for bot in bots:
-            for position in bot.positions:
-                symbols.add(position.symbol)
-        return symbols
+        return {normalize_symbol(p.symbol) for bot in bots for p in bot.positions}
 
-    def update_all_prices(self, bots: list) -> dict[str, float]:
+    def update_all_prices(
+        self,
+        bots: list,
+        extra_symbols: Iterable[str] = (),
+    ) -> dict[str, float]:
         """Fetch prices for all symbols held by bots.
 
         Args:
             bots: List of Bot objects
+            extra_symbols: Additional symbols to price in the same pass
 
         Returns:
             Dict mapping symbols to prices
         """
-        symbols = self.get_all_bot_symbols(bots)
+        symbols = self.get_all_bot_symbols(bots) | set(extra_symbols)
         if not symbols:
             return {}
         return self.get_prices(list(symbols))
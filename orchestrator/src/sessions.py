@@ -0,0 +1,102 @@
+"""Claude CLI session reuse across rounds, with a rotation policy."""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from mcp_server.src.shared_cache import SharedCache
+
+from .bot_runner import BotRun
+from .models import Bot
+
+logger = logging.getLogger(__name__)
+
+# Rounds a session is resumed for before the bot starts a new one
+SESSION_MAX_ROUNDS = 10
+
+# Prompt tokens of the last run above which the session is rotated (a
+# resumed session rereads its whole history every turn)
+SESSION_MAX_TOKENS = 400_000
+
+SESSIONS_KEY = "bot-sessions"
+
+
+@dataclass(slots=True)
+class SessionPolicy:
+    """When a bot resumes its last session and when it starts a new one."""
+
+    max_rounds: int = SESSION_MAX_ROUNDS  # 0 runs every round in a new session
+    max_tokens: int = SESSION_MAX_TOKENS  # 0 for no limit
+
+
+class SessionStore:
+    """Per-bot session bookkeeping for the rotation policy.
+
+    bot.session_id (stored by the API) says which session to resume; this
+    records how many rounds that session has run and how many prompt tokens
+    its last run read. The CLI keeps sessions on the host it runs on, so the
+    bookkeeping lives in the host's shared cache directory, next to them.
+    A session with no record (made before this, or on another host) is
+    resumed and counted from then on.
+    """
+
+    def __init__(self, policy: Optional[SessionPolicy] = None, directory: Optional[str] = None):
+        """Initialize the store.
+
+        Args:
+            policy: Rotation policy (default: SessionPolicy())
+            directory: Cache directory (defaults to the SharedCache one)
+        """
+        self.policy = policy or SessionPolicy()
+        try:
+            self._disk: Optional[SharedCache] = SharedCache(directory)
+        except OSError as e:
+            logger.warning(f"Session cache directory unavailable, tracking in memory only: {e}")
+            self._disk = None
+        self._sessions: dict[str, dict] = (self._disk.get(SESSIONS_KEY) if self._disk else None) or {}
+
+    def rounds(self, bot: Bot) -> int:
+        """Rounds the bot's current session has run (0 if untracked)."""
+        entry = self._sessions.get(bot.id)
+        if not entry or entry.get("session_id") != bot.session_id:
+            return 0
+        return entry.get("rounds", 0)
+
+    def should_resume(self, bot: Bot) -> bool:
+        """Whether the bot's next turn should resume its session."""
+        if not bot.session_id or self.policy.max_rounds <= 0:
+            return False
+
+        entry = self._sessions.get(bot.id)
+        if not entry or entry.get("session_id") != bot.session_id:
+            return True
+
+        if entry.get("rounds", 0) >= self.policy.max_rounds:
+            logger.info(f"Rotating {bot.id}'s session after {entry['rounds']} rounds")
+            return False
+        tokens = entry.get("input_tokens") or 0
+        if self.policy.max_tokens and tokens >= self.policy.max_tokens:
+            logger.info(f"Rotating {bot.id}'s session at {tokens} prompt tokens")
+            return False
+        return True
+
+    def record(self, bot: Bot, run: BotRun, round_num: int) -> None:
+        """Note the session a turn ran in and point bot.session_id at it."""
+        if run.session_id is None:
+            return
+
+        entry = self._sessions.get(bot.id)
+        if run.resumed and entry and entry.get("session_id") == bot.session_id:
+            entry["rounds"] = entry.get("rounds", 0) + 1
+        else:
+            entry = {"started_round": round_num, "rounds": 1}
+        entry["session_id"] = run.session_id
+        entry["input_tokens"] = run.input_tokens
+        self._sessions[bot.id] = entry
+        bot.session_id = run.session_id
+
+        if self._disk is not None:
+            try:
+                self._disk.put(SESSIONS_KEY, self._sessions)
+            except OSError as e:
+                logger.warning(f"Failed to save session bookkeeping: {e}")
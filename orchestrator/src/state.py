@@ -2,15 +2,29 @@
 
 import json
 import logging
-from typing import Optional
+import time
+from typing import Iterator, Optional, Sequence
 
 import httpx
 
 from .config import Config
-from .models import Bot, GameState, Position, Trade
+from .models import (
+    Bot,
+    GameState,
+    Position,
+    Trade,
+    convert_state,
+    decode_state,
+    encode_json,
+    encode_state,
+)
+from .state_cache import StateCache
 
 logger = logging.getLogger(__name__)
 
+# How long fetched Alpaca credentials are reused before asking the API again
+CREDENTIALS_TTL = 900.0
+
 
 class StateManager:
     """Manages game state persistence via Cloudflare Workers API."""
@@ -18,6 +32,9 @@ class StateManager:
     def __init__(self, config: Config):
         self.config = config
         self._client = httpx.Client(timeout=30.0)
+        self._credentials: dict[str, tuple[tuple[str, str], float]] = {}
+        self._state_cache = StateCache(config.cf_api_url)
+        self._state: Optional[GameState] = None
 
     def _headers(self) -> dict:
         """Get request headers with API key."""
@@ -27,35 +44,117 @@ class StateManager:
         }
 
     def load_state(self) -> GameState:
-        """Load full game state from API."""
+        """Load full game state from API.
+
+        The request is conditional on the cached copy's ETag. While the API
+        answers 304 the previous GameState is returned again, unless it was
+        modified since; otherwise it is rebuilt from the cached document.
+        """
         try:
-            response = self._client.get(
-                f"{self.config.cf_api_url}/api/state",
-                headers=self._headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
-            return GameState.from_dict(data)
+            changed = self._state_cache.load(self._client, self._headers())
+            if not changed and self._state is not None and self._state.diff() == {}:
+                return self._state
+            if self._state_cache.content is not None:
+                state = decode_state(self._state_cache.content)
+            else:
+                state = convert_state(self._state_cache.data)
+            state.mark_clean()
+            self._state = state
+            return state
         except httpx.HTTPError as e:
             logger.error(f"Failed to load state: {e}")
             raise
 
     def save_state(self, state: GameState) -> bool:
-        """Save full game state to API."""
+        """Save what changed in the game state since it was loaded.
+
+        Sends only the modified fields and positions (GameState.diff) to
+        PATCH /api/state. States not loaded through load_state, and APIs
+        without the patch route, get the full POST instead.
+        """
+        patch = state.diff()
         try:
+            if patch is not None:
+                if not patch:
+                    return True
+                response = self._client.patch(
+                    f"{self.config.cf_api_url}/api/state",
+                    headers=self._headers(),
+                    content=encode_json(patch),
+                )
+                if response.status_code not in (404, 405):
+                    response.raise_for_status()
+                    state.mark_clean()
+                    return True
+                logger.info("API has no state patch route, saving full state")
+
             response = self._client.post(
                 f"{self.config.cf_api_url}/api/state",
                 headers=self._headers(),
-                json=state.to_dict(),
+                content=encode_state(state, include_trades=False),
             )
             response.raise_for_status()
+            state.mark_clean()
             return True
         except httpx.HTTPError as e:
             logger.error(f"Failed to save state: {e}")
             raise
 
+    def commit_round(
+        self,
+        state: GameState,
+        broadcasts: Sequence[tuple[str, dict]] = (),
+        snapshot_bots: Optional[list[Bot]] = None,
+        benchmark_price: Optional[float] = None,
+    ) -> bool:
+        """Save the state's changes, snapshots and broadcasts in one request.
+
+        POST /api/round/commit applies the diff (as save_state would) and
+        one equity snapshot per ``snapshot_bots`` for the current round in
+        a single transaction, then sends the broadcasts in order. States
+        that need a full save, and APIs without the route, fall back to
+        save_state, record_snapshots and push_update.
+
+        Args:
+            state: Game state to save
+            broadcasts: (update_type, data) pairs, as for push_update
+            snapshot_bots: Bots to snapshot (None records no snapshots)
+            benchmark_price: Benchmark price stored with the snapshots
+        """
+        patch = state.diff()
+        if patch is not None:
+            body: dict = {"round": state.current_round, "state": patch}
+            if snapshot_bots is not None:
+                body["snapshots"] = [
+                    {"bot_id": b.id, "total_value": b.total_value} for b in snapshot_bots
+                ]
+                body["benchmark_price"] = benchmark_price
+            if broadcasts:
+                body["broadcasts"] = [{"type": t, "data": d} for t, d in broadcasts]
+            try:
+                response = self._client.post(
+                    f"{self.config.cf_api_url}/api/round/commit",
+                    headers=self._headers(),
+                    content=encode_json(body),
+                )
+                if response.status_code not in (404, 405):
+                    response.raise_for_status()
+                    state.mark_clean()
+                    return True
+                logger.info("API has no round commit route, writing separately")
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to commit round {state.current_round}: {e}")
+                raise
+
+        self.save_state(state)
+        if snapshot_bots is not None:
+            self.record_snapshots(state.current_round, snapshot_bots, benchmark_price)
+        for update_type, data in broadcasts:
+            self.push_update(update_type, data)
+        return True
+
     def update_bot(self, bot: Bot) -> bool:
-        """Update a single bot's state."""
+        """Update a single bot's state (a later save_state skips what this wrote)."""
         try:
             response = self._client.put(
                 f"{self.config.cf_api_url}/api/bot/{bot.id}",
@@ -63,6 +162,7 @@ class StateManager:
                 json=bot.to_dict(),
             )
             response.raise_for_status()
+            bot.mark_clean()
             return True
         except httpx.HTTPError as e:
             logger.error(f"Failed to update bot {bot.id}: {e}")
@@ -96,6 +196,93 @@ class StateManager:
             logger.error(f"Failed to record trades: {e}")
             raise
 
+    def get_trade_history(
+        self,
+        bot_id: Optional[str] = None,
+        from_round: Optional[int] = None,
+        to_round: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> tuple[list[Trade], Optional[str]]:
+        """Fetch one page of past trades, newest first.
+
+        GameState.recent_trades only holds the latest RECENT_TRADES_LIMIT;
+        this reads further back from the API.
+
+        Args:
+            bot_id: Only this bot's trades
+            from_round: Earliest round to include
+            to_round: Latest round to include
+            cursor: The cursor returned with the previous page
+            limit: Page size
+
+        Returns:
+            The page's trades and the cursor for the next (older) page,
+            or None when this was the last one
+        """
+        params = {"limit": limit}
+        for name, value in (
+            ("bot_id", bot_id),
+            ("from_round", from_round),
+            ("to_round", to_round),
+            ("cursor", cursor),
+        ):
+            if value is not None:
+                params[name] = value
+        try:
+            response = self._client.get(
+                f"{self.config.cf_api_url}/api/trades",
+                headers=self._headers(),
+                params=params,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to fetch trade history: {e}")
+            raise
+        trades = [Trade.from_dict(t) for t in data.get("trades", [])]
+        return trades, data.get("pagination", {}).get("next_cursor")
+
+    def iter_trade_history(
+        self,
+        bot_id: Optional[str] = None,
+        from_round: Optional[int] = None,
+        to_round: Optional[int] = None,
+        page_size: int = 100,
+    ) -> Iterator[Trade]:
+        """Every past trade matching the filters, newest first, a page at a time."""
+        cursor = None
+        while True:
+            trades, cursor = self.get_trade_history(bot_id, from_round, to_round, cursor, page_size)
+            yield from trades
+            if cursor is None:
+                return
+
+    def record_snapshots(
+        self,
+        round_num: int,
+        bots: list[Bot],
+        benchmark_price: Optional[float] = None,
+    ) -> bool:
+        """Write one equity snapshot per bot for a round in a single batch."""
+        try:
+            response = self._client.post(
+                f"{self.config.cf_api_url}/api/snapshots/batch",
+                headers=self._headers(),
+                json={
+                    "round": round_num,
+                    "benchmark_price": benchmark_price,
+                    "snapshots": [
+                        {"bot_id": b.id, "total_value": b.total_value} for b in bots
+                    ],
+                },
+            )
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to record snapshots for round {round_num}: {e}")
+            return False
+
     def increment_round(self) -> int:
         """Increment the round counter and return new round number."""
         try:
@@ -124,12 +311,29 @@ class StateManager:
             logger.warning(f"Failed to push update: {e}")
             return False
 
+    def get_shared_context(self) -> Optional[dict]:
+        """Fetch the part of the round context that is the same for every bot."""
+        try:
+            response = self._client.get(
+                f"{self.config.cf_api_url}/api/social/context",
+                headers=self._headers(),
+            )
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Failed to fetch shared round context: {e}")
+            return None
+
     def get_bot_credentials(self, bot_id: str) -> tuple[str, str] | None:
-        """Fetch Alpaca credentials for a bot.
+        """Fetch Alpaca credentials for a bot, reusing them for CREDENTIALS_TTL.
 
         Returns:
             Tuple of (api_key, secret_key) or None if not available
         """
+        cached = self._credentials.get(bot_id)
+        if cached and time.monotonic() - cached[1] < CREDENTIALS_TTL:
+            return cached[0]
+
         try:
             response = self._client.get(
                 f"{self.config.cf_api_url}/api/bot/{bot_id}/credentials",
@@ -137,7 +341,9 @@ class StateManager:
             )
             if response.status_code == 200:
                 data = response.json()
-                return data.get("alpaca_api_key"), data.get("alpaca_secret_key")
+                credentials = data.get("alpaca_api_key"), data.get("alpaca_secret_key")
+                self._credentials[bot_id] = (credentials, time.monotonic())
+                return credentials
             return None
         except httpx.HTTPError as e:
             logger.warning(f"Failed to get credentials for bot {bot_id}: {e}")
@@ -0,0 +1,105 @@
+"""Last known game state, revalidated against the API with its ETag."""
+
+import hashlib
+import json
+import logging
+from typing import Optional
+
+import httpx
+
+from mcp_server.src.shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+
+class StateCache:
+    """The /api/state document and its ETag, kept in process and on disk.
+
+    load() sends the cached ETag in If-None-Match, so an unchanged state
+    costs a 304 with no body to download or parse. The document is also
+    written to the shared cache directory, so short-lived scripts
+    (view-state, run-single-bot, reset-game) start warm.
+
+    The response body is kept as received (``content``) for callers that
+    decode it themselves; ``data`` parses it on first use. Clients other
+    than a blocking httpx.Client send the request themselves with
+    request_headers() and hand the response to store().
+    """
+
+    def __init__(self, api_url: str, directory: Optional[str] = None):
+        """Initialize the cache, reading any copy left on disk.
+
+        Args:
+            api_url: Workers API base URL (each API gets its own entry)
+            directory: Cache directory (defaults to the SharedCache one)
+        """
+        self.api_url = api_url
+        self.key = f"state-{hashlib.sha1(api_url.encode()).hexdigest()[:8]}"
+        self.etag: Optional[str] = None
+        self.content: Optional[bytes] = None
+        self._data: Optional[dict] = None
+
+        try:
+            self._disk: Optional[SharedCache] = SharedCache(directory)
+        except OSError as e:
+            logger.warning(f"State cache directory unavailable, caching in memory only: {e}")
+            self._disk = None
+            return
+
+        entry = self._disk.get(self.key)
+        if entry and entry.get("etag") and entry.get("state") is not None:
+            self.etag, self._data = entry["etag"], entry["state"]
+
+    @property
+    def data(self) -> Optional[dict]:
+        """The cached state document (None before the first load)."""
+        if self._data is None and self.content is not None:
+            self._data = json.loads(self.content)
+        return self._data
+
+    def load(self, client: httpx.Client, headers: Optional[dict] = None) -> bool:
+        """Fetch the game state, revalidating the cached copy.
+
+        Args:
+            client: HTTP client to send the request with
+            headers: Extra request headers (e.g. Authorization)
+
+        Returns:
+            Whether the state changed since the cached copy (False on a 304)
+        """
+        response = client.get(f"{self.api_url}/api/state", headers=self.request_headers(headers))
+        return self.store(response)
+
+    def request_headers(self, headers: Optional[dict] = None) -> dict:
+        """Headers for a GET /api/state that revalidates the cached copy."""
+        request_headers = dict(headers or {})
+        if self.etag and self._cached:
+            request_headers["If-None-Match"] = self.etag
+        return request_headers
+
+    def store(self, response: httpx.Response) -> bool:
+        """Take in a GET /api/state response sent with request_headers().
+
+        Returns:
+            Whether the state changed since the cached copy (False on a 304)
+        """
+        if response.status_code == 304 and self._cached:
+            return False
+
+        response.raise_for_status()
+        self.content = response.content
+        self._data = None
+        self.etag = response.headers.get("ETag")
+        if self._disk is not None and self.etag:
+            try:
+                self._disk.put_raw(
+                    self.key,
+                    b'{"etag": ' + json.dumps(self.etag).encode() + b', "state": ' + self.content + b"}",
+                )
+            except OSError as e:
+                logger.warning(f"Failed to write state cache: {e}")
+        return True
+
+    @property
+    def _cached(self) -> bool:
+        return self.content is not None or self._data is not None
@@ -0,0 +1,206 @@
+"""Structured span tracing for trading rounds.
+
+Each round produces one JSON-lines file with a line per span. Spans nest
+(round -> bot -> claude, commit_round, ...) via a context variable, so
+callers only wrap the work they want timed:
+
+    with tracer.span("bot", bot_id=bot.id) as span:
+        ...
+        span.set(trades=3)
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("round_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed unit of work within a round."""
+
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    start: float  # Unix time
+    duration: Optional[float] = None  # Seconds
+    status: str = "ok"
+    error: Optional[str] = None
+    attributes: dict = field(default_factory=dict)
+
+    def set(self, **attributes) -> None:
+        """Attach attributes to the span."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": datetime.fromtimestamp(self.start, timezone.utc).isoformat(),
+            "duration": round(self.duration, 4) if self.duration is not None else None,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Span":
+        return cls(
+            name=data["name"],
+            span_id=data["span_id"],
+            parent_id=data.get("parent_id"),
+            start=datetime.fromisoformat(data["start"]).timestamp(),
+            duration=data.get("duration"),
+            status=data.get("status", "ok"),
+            error=data.get("error"),
+            attributes=data.get("attributes", {}),
+        )
+
+
+class Tracer:
+    """Collects spans for one round at a time and writes them to disk."""
+
+    def __init__(self, trace_dir: Optional[str] = None):
+        """Initialize the tracer.
+
+        Args:
+            trace_dir: Directory for round-<n>.jsonl files (None disables writing)
+        """
+        self.trace_dir = Path(trace_dir) if trace_dir else None
+        self.trace_id = uuid.uuid4().hex
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Start a new trace, discarding collected spans."""
+        self.trace_id = uuid.uuid4().hex
+        with self._lock:
+            self.spans = []
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """Time a block as a child of the current span."""
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            attributes=attributes,
+        )
+        with self._lock:
+            self.spans.append(span)
+
+        token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _current_span.reset(token)
+
+    def write(self, round_num: int) -> Optional[Path]:
+        """Write the collected spans as round-<n>.jsonl."""
+        if self.trace_dir is None:
+            return None
+
+        try:
+            self.trace_dir.mkdir(parents=True, exist_ok=True)
+            path = self.trace_dir / f"round-{round_num}.jsonl"
+            with self._lock:
+                lines = [
+                    json.dumps({"trace_id": self.trace_id, "round": round_num, **s.to_dict()})
+                    for s in self.spans
+                ]
+            path.write_text("\n".join(lines) + "\n")
+            return path
+        except OSError as e:
+            logger.warning(f"Failed to write trace for round {round_num}: {e}")
+            return None
+
+
+# ==================== ANALYSIS ====================
+
+
+def load_trace(path: Path) -> list[Span]:
+    """Read the spans of one round."""
+    spans = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                spans.append(Span.from_dict(json.loads(line)))
+    return spans
+
+
+def list_traces(trace_dir: str) -> list[tuple[int, Path]]:
+    """Round trace files in a directory, oldest first."""
+    traces = []
+    for path in Path(trace_dir).glob("round-*.jsonl"):
+        try:
+            traces.append((int(path.stem.split("-", 1)[1]), path))
+        except ValueError:
+            continue
+    return sorted(traces)
+
+
+def bot_timings(spans: list[Span]) -> list[dict]:
+    """Per-bot wall time, phase breakdown, action timings and session use, slowest first."""
+    children: dict[str, list[Span]] = {}
+    for s in spans:
+        if s.parent_id:
+            children.setdefault(s.parent_id, []).append(s)
+
+    bots = []
+    for s in spans:
+        if s.name != "bot":
+            continue
+        phases = children.get(s.span_id, [])
+        claude = next((c.attributes for c in phases if c.name == "claude"), {})
+        bots.append({
+            "bot_id": s.attributes.get("bot_id"),
+            "duration": s.duration or 0.0,
+            "status": s.status,
+            "phases": {c.name: c.duration or 0.0 for c in phases},
+            "first_action": claude.get("first_action_s"),
+            "last_trade": claude.get("last_trade_s"),
+            "tool_calls": claude.get("tool_calls"),
+            "resumed": claude.get("resumed"),
+            "input_tokens": claude.get("input_tokens"),
+        })
+    return sorted(bots, key=lambda b: b["duration"], reverse=True)
+
+
+def phase_totals(spans: list[Span]) -> dict[str, float]:
+    """Total seconds per leaf span name, slowest first.
+
+    Container spans (round, bot) are skipped so time is not counted twice.
+    """
+    parents = {s.parent_id for s in spans}
+    totals: dict[str, float] = {}
+    for s in spans:
+        if s.span_id in parents:
+            continue
+        totals[s.name] = totals.get(s.name, 0.0) + (s.duration or 0.0)
+    return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def round_duration(spans: list[Span]) -> float:
+    """Wall time of the root span."""
+    roots = [s for s in spans if s.parent_id is None]
+    return sum(s.duration or 0.0 for s in roots)
@@ -0,0 +1,49 @@
+"""Portfolio valuation - mark bot positions to market."""
+
+import numpy as np
+
+from .models import Bot
+from .price_fetcher import normalize_symbol
+
+
+def mark_to_market(bots: list[Bot], prices: dict[str, float]) -> np.ndarray:
+    """Reprice every position and recompute every bot's total value.
+
+    Positions are laid out as a (bots x symbols) share matrix so all
+    portfolio values come out of a single vectorized reduction. Symbols
+    missing from ``prices`` keep their last known mark (current price,
+    falling back to average cost).
+
+    Args:
+        bots: Bots to revalue (mutated in place)
+        prices: Dict mapping normalized symbols to latest prices (as
+            PriceFetcher.get_prices returns them)
+
+    Returns:
+        Array of total values, aligned with ``bots``
+    """
+    symbols = sorted({normalize_symbol(p.symbol) for bot in bots for p in bot.positions})
+    column = {symbol: j for j, symbol in enumerate(symbols)}
+
+    shares = np.zeros((len(bots), len(symbols)))
+    last_marks = np.zeros((len(bots), len(symbols)))
+    for i, bot in enumerate(bots):
+        for pos in bot.positions:
+            j = column[normalize_symbol(pos.symbol)]
+            shares[i, j] += pos.shares
+            last_marks[i, j] = pos.current_price if pos.current_price is not None else pos.avg_cost
+
+    latest = np.array([prices.get(symbol, np.nan) for symbol in symbols])
+    marks = np.where(np.isnan(latest), last_marks, latest)
+
+    cash = np.array([bot.cash for bot in bots], dtype=float)
+    totals = cash + (shares * marks).sum(axis=1)
+
+    for bot, total in zip(bots, totals):
+        for pos in bot.positions:
+            price = prices.get(normalize_symbol(pos.symbol))
+            if price is not None:
+                pos.current_price = price
+        bot.total_value = float(total)
+
+    return totals
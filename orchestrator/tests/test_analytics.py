@@ -0,0 +1,62 @@
+"""Tests for the vectorized leaderboard analytics."""
+
+import math
+
+import numpy as np
+import pytest
+
+from mcp_server.src.analytics import compute_metrics
+
+
+def metrics_for(values, **kwargs):
+    return {k: v[0] for k, v in compute_metrics(np.array([values], dtype=float), **kwargs).items()}
+
+
+def test_sharpe_sortino_and_volatility_match_definitions():
+    values = [100.0, 110.0, 99.0, 108.9, 119.79]
+    returns = np.array([0.10, -0.10, 0.10, 0.10])
+
+    m = metrics_for(values, periods_per_year=4)
+
+    mean, std = returns.mean(), returns.std(ddof=1)
+    downside = math.sqrt((np.minimum(returns, 0) ** 2).mean())
+    assert m["sharpe"] == pytest.approx(mean / std * 2)
+    assert m["sortino"] == pytest.approx(mean / downside * 2)
+    assert m["volatility"] == pytest.approx(std * 2)
+    assert m["win_rate"] == pytest.approx(0.75)
+
+
+def test_max_drawdown_is_the_deepest_fall_from_a_peak():
+    m = metrics_for([100.0, 120.0, 90.0, 130.0, 117.0])
+
+    assert m["max_drawdown"] == pytest.approx(0.25)
+
+
+def test_gaps_are_forward_filled():
+    with_gap = metrics_for([100.0, np.nan, 110.0, 121.0])
+    filled = metrics_for([100.0, 100.0, 110.0, 121.0])
+
+    assert with_gap["sharpe"] == pytest.approx(filled["sharpe"])
+    assert with_gap["max_drawdown"] == 0.0
+
+
+def test_beta_against_the_benchmark():
+    bench = np.array([100.0, 102.0, 99.0, 103.0, 101.0])
+    levered = 100.0 * np.cumprod(np.r_[1.0, 1.0 + 2.0 * (bench[1:] / bench[:-1] - 1.0)])
+
+    m = metrics_for(levered, benchmark=bench)
+
+    assert m["beta"] == pytest.approx(2.0)
+
+
+def test_turnover_is_traded_notional_over_mean_value():
+    m = metrics_for([100.0, 100.0], traded=np.array([[50.0, 150.0]]))
+
+    assert m["turnover"] == pytest.approx(2.0)
+
+
+def test_flat_curve_has_undefined_ratios():
+    m = metrics_for([100.0, 100.0, 100.0])
+
+    assert math.isnan(m["sharpe"])
+    assert m["max_drawdown"] == 0.0
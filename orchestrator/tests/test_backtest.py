@@ -0,0 +1,123 @@
+"""Tests for the offline backtester: fills, costs and the round schedule."""
+
+from datetime import date, datetime
+
+import pytest
+
+from mcp_server.src.backtest import (
+    MARKET_TZ,
+    ROUND_TIMES,
+    BacktestConfig,
+    BacktestSession,
+    CandleStore,
+    round_schedule,
+)
+
+
+def ts(day: date, hour: int, minute: int = 0) -> int:
+    return int(datetime(day.year, day.month, day.day, hour, minute, tzinfo=MARKET_TZ).timestamp())
+
+
+MONDAY = date(2024, 3, 4)
+
+
+@pytest.fixture
+def session(tmp_path):
+    store = CandleStore(str(tmp_path / "data"))
+    # Hourly bars from 9:00 to 16:00, each closing 1 above its open
+    times = [ts(MONDAY, h) for h in range(9, 17)]
+    store.save(
+        "AAPL",
+        {
+            "s": "ok",
+            "t": times,
+            "o": [100.0 + i for i in range(len(times))],
+            "h": [101.0 + i for i in range(len(times))],
+            "l": [99.0 + i for i in range(len(times))],
+            "c": [101.0 + i for i in range(len(times))],
+            "v": [1000] * len(times),
+        },
+        resolution="60",
+    )
+    config = BacktestConfig(
+        data_dir=str(tmp_path / "data"),
+        starting_cash=50000.0,
+        slippage_bps=10.0,
+        commission_per_share=0.01,
+        min_commission=1.0,
+    )
+    return BacktestSession.create(str(tmp_path / "run"), config, start=ts(MONDAY, 11))
+
+
+def test_buy_fills_at_price_plus_slippage_and_commission(session):
+    account = session.alpaca_client("a")
+
+    result = account.place_order("aapl", 10, "buy")
+
+    # At 11:00 the 10:00 bar has closed at 102
+    fill = 102.0 * (1 + 10 / 10000)
+    assert result.success and result.symbol == "AAPL"
+    assert result.filled_avg_price == pytest.approx(fill)
+    assert account.get_account()["cash"] == pytest.approx(50000.0 - fill * 10 - 1.0)
+    assert account.get_positions()[0]["avg_entry_price"] == pytest.approx(fill)
+
+
+def test_sell_gives_up_slippage_and_pays_commission(session):
+    account = session.alpaca_client("a")
+    account.place_order("AAPL", 200, "buy")
+    session.clock.set(ts(MONDAY, 13))
+
+    result = account.place_order("AAPL", 200, "sell")
+
+    buy, sell = 102.0 * 1.001, 104.0 * 0.999
+    assert result.success
+    assert result.filled_avg_price == pytest.approx(sell)
+    # 200 shares * $0.01 = $2, above the $1 minimum
+    assert account.get_account()["cash"] == pytest.approx(50000.0 - buy * 200 - 2.0 + sell * 200 - 2.0)
+    assert account.get_positions() == []
+
+
+def test_orders_are_rejected_without_cash_shares_or_data(session):
+    account = session.alpaca_client("a")
+
+    assert "insufficient buying power" in account.place_order("AAPL", 1000, "buy").error
+    assert "insufficient qty" in account.place_order("AAPL", 1, "sell").error
+    assert "no price data" in account.place_order("MSFT", 1, "buy").error
+    assert "not simulated" in account.place_order("AAPL", 1, "buy", order_type="limit").error
+
+
+def test_no_lookahead_into_a_forming_bar(session):
+    quote = session.store.quote("AAPL", ts(MONDAY, 11, 30))
+
+    # The 11:00 bar has not closed, so only its open is known
+    assert quote["c"] == 102.0
+    assert quote["pc"] == 102.0
+
+
+def test_schedule_matches_the_live_cron():
+    friday, monday = date(2024, 3, 8), date(2024, 3, 11)
+
+    rounds = list(round_schedule(friday, monday))
+
+    assert len(ROUND_TIMES) == 8
+    assert len(rounds) == 16  # No weekend rounds
+    first = datetime.fromtimestamp(rounds[0], MARKET_TZ)
+    last = datetime.fromtimestamp(rounds[-1], MARKET_TZ)
+    assert (first.date(), first.hour, first.minute) == (friday, 9, 30)
+    assert (last.date(), last.hour) == (monday, 16)
+
+
+def test_every_scheduled_round_can_trade(session):
+    account = session.alpaca_client("a")
+
+    for round_ts in round_schedule(MONDAY, MONDAY):
+        session.clock.set(round_ts)
+        assert session.clock.is_market_open()
+        assert account.place_order("AAPL", 1, "buy").success
+
+
+def test_market_is_closed_outside_hours(session):
+    for closed in (ts(MONDAY, 9, 29), ts(MONDAY, 16, 1), ts(date(2024, 3, 9), 12)):
+        session.clock.set(closed)
+        assert not session.clock.is_market_open()
+        assert "market is closed" in session.alpaca_client("a").place_order("AAPL", 1, "buy").error
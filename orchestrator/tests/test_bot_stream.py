@@ -0,0 +1,147 @@
+"""Tests for reading the CLI's stream-JSON output (BotRunner._stream)."""
+
+import sys
+import time
+
+import pytest
+
+from orchestrator.src import bot_runner
+from orchestrator.src.bot_runner import BotRunner
+from orchestrator.src.models import Bot
+
+SESSION = "sess-1"
+
+
+def text(value: str) -> dict:
+    return {"type": "assistant", "session_id": SESSION,
+            "message": {"content": [{"type": "text", "text": value}]}}
+
+
+def tool(name: str, **arguments) -> dict:
+    return {"type": "assistant", "session_id": SESSION,
+            "message": {"content": [{"type": "tool_use", "name": f"mcp__trading-arena__{name}",
+                                     "input": arguments}]}}
+
+
+def result(output: str = "done", is_error: bool = False) -> dict:
+    return {"type": "result", "session_id": SESSION, "is_error": is_error, "result": output,
+            "usage": {"input_tokens": 10, "cache_read_input_tokens": 200,
+                      "cache_creation_input_tokens": 30, "output_tokens": 5}}
+
+
+def fake_cli(tmp_path, *steps, after: str = "", exit_code: int = 0) -> list[str]:
+    """Command for a script printing ``steps`` (events, raw lines, or sleeps in seconds)."""
+    script = tmp_path / "cli.py"
+    script.write_text(
+        "import json, sys, time\n"
+        f"for step in {list(steps)!r}:\n"
+        "    if isinstance(step, float):\n"
+        "        time.sleep(step)\n"
+        "    else:\n"
+        "        print(step if isinstance(step, str) else json.dumps(step), flush=True)\n"
+        f"{after}\n"
+        f"sys.exit({exit_code})\n"
+    )
+    return [sys.executable, str(script)]
+
+
+@pytest.fixture
+def bot() -> Bot:
+    return Bot(id="test", name="Test", type="free_agent", cash=0.0, total_value=0.0)
+
+
+@pytest.fixture
+def stream(bot):
+    runner = BotRunner()
+
+    def run(cmd, timeout=10, on_event=None):
+        return runner._stream(bot, cmd, on_event, timeout)
+
+    return run
+
+
+def test_run_collects_actions_timings_and_usage(tmp_path, stream):
+    events = []
+    cmd = fake_cli(
+        tmp_path,
+        {"type": "system", "subtype": "init", "session_id": SESSION},
+        text("Checking the market"),
+        tool("get_round_context"),
+        0.3,
+        tool("place_order", symbol="AAPL", qty=1, side="buy"),
+        result("Bought AAPL"),
+    )
+    run = stream(cmd, on_event=lambda kind, data: events.append((kind, data)))
+
+    assert run.output == "Bought AAPL"
+    assert run.session_id == SESSION
+    assert (run.tool_calls, run.trades) == (2, 1)
+    assert run.input_tokens == 240
+    assert run.returncode == 0
+    assert run.last_trade_seconds - run.first_action_seconds >= 0.25
+    assert run.duration_seconds >= run.last_trade_seconds
+    assert [(kind, data.get("tool")) for kind, data in events] == [
+        ("text", None), ("tool_call", "get_round_context"), ("tool_call", "place_order"),
+    ]
+    assert events[2][1]["input"] == {"symbol": "AAPL", "qty": 1, "side": "buy"}
+
+
+def test_noise_and_failing_callbacks_are_ignored(tmp_path, stream):
+    def explode(kind, data):
+        raise RuntimeError("dashboard down")
+
+    cmd = fake_cli(tmp_path, "not json", "[1, 2]", "", tool("place_order"), result())
+    run = stream(cmd, on_event=explode)
+
+    assert run.output == "done"
+    assert run.trades == 1
+
+
+def test_lingering_cli_is_stopped_after_the_result(tmp_path, stream, monkeypatch):
+    monkeypatch.setattr(bot_runner, "RESULT_GRACE", 0.2)
+    cmd = fake_cli(tmp_path, result("early"), after="time.sleep(30)")
+
+    started = time.monotonic()
+    run = stream(cmd)
+
+    assert run.output == "early"
+    assert time.monotonic() - started < 5
+    assert not run.timed_out
+
+
+def test_error_result_is_a_failure(tmp_path, stream):
+    run = stream(fake_cli(tmp_path, tool("get_round_context"), result("rate limited", is_error=True)))
+
+    assert run.output is None
+    assert run.tool_calls == 1
+    assert run.session_id == SESSION
+
+
+def test_nonzero_exit_without_result_is_a_failure(tmp_path, stream):
+    cmd = fake_cli(tmp_path, after="print('No conversation found', file=sys.stderr)", exit_code=1)
+    run = stream(cmd)
+
+    assert run.output is None
+    assert run.returncode == 1
+    assert run.tool_calls == 0
+
+
+def test_timeout_kills_the_cli(tmp_path, stream):
+    run = stream(fake_cli(tmp_path, tool("get_round_context"), after="time.sleep(30)"), timeout=1)
+
+    assert run.timed_out
+    assert run.output is None
+    assert run.tool_calls == 1
+    assert run.duration_seconds < 5
+
+
+def test_text_fallback_and_event_text_are_bounded(tmp_path, stream):
+    count = bot_runner.STREAM_TAIL_TEXT + 5
+    long_text = "x" * (bot_runner.EVENT_TEXT_LIMIT + 100)
+    events = []
+    cmd = fake_cli(tmp_path, text(long_text), *(text(f"line {i}") for i in range(count)))
+    run = stream(cmd, on_event=lambda kind, data: events.append(data))
+
+    # No result event: the output is the last text blocks kept
+    assert run.output == "\n\n".join(f"line {i}" for i in range(5, count))
+    assert len(events[0]["text"]) == bot_runner.EVENT_TEXT_LIMIT
@@ -0,0 +1,164 @@
+"""Tests for the coalescing broadcaster."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from orchestrator.src.async_state import AsyncStateManager
+from orchestrator.src.broadcaster import Broadcaster
+from orchestrator.src.config import Config
+from orchestrator.src.models import Bot, GameState
+
+WINDOW = 0.05
+MAX_LATENCY = 0.2
+
+
+class Recorder:
+    """send callback recording each batch and when it arrived."""
+
+    def __init__(self):
+        self.batches: list[list[dict]] = []
+        self.times: list[float] = []
+
+    async def __call__(self, events: list[dict]) -> bool:
+        self.batches.append(events)
+        self.times.append(asyncio.get_running_loop().time())
+        return True
+
+
+@pytest.fixture
+def sent() -> Recorder:
+    return Recorder()
+
+
+@pytest.fixture
+def broadcaster(sent: Recorder) -> Broadcaster:
+    return Broadcaster(sent, window=WINDOW, max_latency=MAX_LATENCY)
+
+
+def types(batch: list[dict]) -> list:
+    return [(e["type"], e["data"].get("bot_id")) for e in batch]
+
+
+async def test_events_are_sent_once_quiet(broadcaster, sent):
+    broadcaster.publish("trade", {"bot_id": "a"})
+    broadcaster.publish("trade", {"bot_id": "b"})
+    assert broadcaster.pending == 2
+
+    await asyncio.sleep(WINDOW * 3)
+    assert [types(b) for b in sent.batches] == [[("trade", "a"), ("trade", "b")]]
+    assert broadcaster.pending == 0
+
+
+async def test_newest_update_per_bot_wins_and_moves_last(broadcaster, sent):
+    broadcaster.publish("bot_update", {"bot_id": "a", "cash": 1})
+    broadcaster.publish("bot_update", {"bot_id": "b", "cash": 1})
+    broadcaster.publish("leaderboard", {"rank": 1})
+    broadcaster.publish("bot_update", {"bot_id": "a", "cash": 2})
+    broadcaster.publish("leaderboard", {"rank": 2})
+
+    events = broadcaster.drain()
+    assert types(events) == [("bot_update", "b"), ("bot_update", "a"), ("leaderboard", None)]
+    assert events[1]["data"]["cash"] == 2
+    assert events[2]["data"]["rank"] == 2
+
+
+async def test_steady_events_flush_within_max_latency(broadcaster, sent):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    while loop.time() - start < MAX_LATENCY * 2:
+        broadcaster.publish("trade", {"bot_id": "a"})
+        await asyncio.sleep(WINDOW / 5)
+
+    assert sent.times
+    assert sent.times[0] - start < MAX_LATENCY + WINDOW
+
+
+async def test_repeated_coalesced_publishes_flush_within_max_latency(broadcaster, sent):
+    # Each publish replaces the only pending event; that must not restart
+    # the clock, or the update would never be sent while it keeps changing
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    cash = 0
+    while loop.time() - start < MAX_LATENCY * 2:
+        cash += 1
+        broadcaster.publish("bot_update", {"bot_id": "a", "cash": cash})
+        await asyncio.sleep(WINDOW / 5)
+
+    assert sent.times
+    assert sent.times[0] - start < MAX_LATENCY + WINDOW
+    assert len(sent.batches[0]) == 1
+
+
+async def test_drain_takes_events_and_cancels_the_timer(broadcaster, sent):
+    broadcaster.publish("trade", {"bot_id": "a"})
+
+    assert types(broadcaster.drain()) == [("trade", "a")]
+    await asyncio.sleep(WINDOW * 3)
+    assert sent.batches == []
+
+
+async def test_flush_sends_now(broadcaster, sent):
+    assert await broadcaster.flush() is True
+    assert sent.batches == []
+
+    broadcaster.publish("trade", {"bot_id": "a"})
+    assert await broadcaster.flush() is True
+    assert len(sent.batches) == 1
+
+    await asyncio.sleep(WINDOW * 3)
+    assert len(sent.batches) == 1
+
+
+async def test_requeued_events_go_ahead_of_newer_ones(broadcaster, sent):
+    broadcaster.publish("trade", {"bot_id": "a"})
+    broadcaster.publish("bot_update", {"bot_id": "a", "cash": 1})
+    broadcaster.publish("bot_update", {"bot_id": "b", "cash": 1})
+    events = broadcaster.drain()
+
+    broadcaster.publish("bot_update", {"bot_id": "a", "cash": 2})
+    broadcaster.requeue(events)
+
+    events = broadcaster.drain()
+    assert types(events) == [("trade", "a"), ("bot_update", "b"), ("bot_update", "a")]
+    assert events[2]["data"]["cash"] == 2
+
+
+async def test_requeued_events_are_flushed(broadcaster, sent):
+    broadcaster.publish("trade", {"bot_id": "a"})
+    broadcaster.requeue(broadcaster.drain())
+
+    await asyncio.sleep(WINDOW * 3)
+    assert [types(b) for b in sent.batches] == [[("trade", "a")]]
+
+
+async def test_failed_round_commit_keeps_the_broadcasts(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARENA_CACHE_DIR", str(tmp_path))
+    requests = []
+    fail = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(500 if fail else 200, json={})
+
+    manager = AsyncStateManager(Config(cf_api_url="http://api", cf_api_key="k", finnhub_api_key=""))
+    manager._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    state = GameState(current_round=1, bots=[
+        Bot(id="a", name="A", type="baseline", cash=1.0, total_value=1.0),
+    ])
+    state.mark_clean()
+    state.bots[0].cash = 2.0
+
+    await manager.push_update("bot_update", {"bot_id": "a", "cash": 2.0})
+    with pytest.raises(httpx.HTTPStatusError):
+        await manager.commit_round(state, broadcasts=[("leaderboard", {"round": 1})])
+    assert requests[0][0] == "/api/round/commit"
+
+    fail = False
+    assert await manager.flush_updates()
+    path, body = requests[-1]
+    assert path == "/api/broadcast/batch"
+    assert [e["type"] for e in body["messages"]] == ["bot_update", "leaderboard"]
+    await manager._client.aclose()
@@ -0,0 +1,143 @@
+"""Tests for the cached model indexes and the leaderboard cache."""
+
+from orchestrator.src.models import Bot, GameState, Position
+
+
+class CountingKey:
+    """Symbol getter that counts how many items it reads."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, position: Position) -> str:
+        self.calls += 1
+        return position.symbol
+
+
+def make_bot(*symbols: str) -> Bot:
+    return Bot(
+        id="bot-1",
+        name="Bot One",
+        type="free_agent",
+        cash=1000.0,
+        total_value=1000.0,
+        positions=[Position(symbol=s, shares=1, avg_cost=10.0) for s in symbols],
+    )
+
+
+def make_bots(*values: float) -> list[Bot]:
+    return [
+        Bot(id=f"bot-{i}", name=f"Bot {i}", type="baseline", cash=v, total_value=v)
+        for i, v in enumerate(values)
+    ]
+
+
+def test_lookup_finds_first_match():
+    bot = make_bot("AAPL", "MSFT")
+    bot.positions.append(Position(symbol="AAPL", shares=9, avg_cost=1.0))
+
+    assert bot.get_position("MSFT") is bot.positions[1]
+    assert bot.get_position("AAPL") is bot.positions[0]
+    assert bot.get_position("NVDA") is None
+
+
+def test_hit_on_a_current_index_does_not_rebuild():
+    bot = make_bot("AAPL", "MSFT", "NVDA")
+    get_key = CountingKey()
+    bot._find("by_symbol", bot.positions, get_key, "MSFT")
+    built = get_key.calls
+
+    assert bot._find("by_symbol", bot.positions, get_key, "NVDA") is bot.positions[2]
+    assert get_key.calls == built + 1  # only the slot check
+
+
+def test_miss_rebuilds_before_reporting_none():
+    bot = make_bot("AAPL", "MSFT")
+    get_key = CountingKey()
+    bot._find("by_symbol", bot.positions, get_key, "AAPL")
+    built = get_key.calls
+
+    assert bot._find("by_symbol", bot.positions, get_key, "TSLA") is None
+    assert get_key.calls == built + len(bot.positions)
+
+
+def test_appended_item_is_found():
+    bot = make_bot("AAPL")
+    assert bot.get_position("MSFT") is None
+
+    bot.positions.append(Position(symbol="MSFT", shares=1, avg_cost=10.0))
+    assert bot.get_position("MSFT") is bot.positions[1]
+
+
+def test_removed_item_is_not_found():
+    bot = make_bot("AAPL", "MSFT")
+    assert bot.get_position("AAPL") is not None
+
+    del bot.positions[0]
+    assert bot.get_position("AAPL") is None
+    assert bot.get_position("MSFT") is bot.positions[0]
+
+
+def test_reassigned_list_of_the_same_length_is_reindexed():
+    bot = make_bot("AAPL", "MSFT")
+    assert bot.get_position("NVDA") is None
+
+    bot.positions = [p for p in bot.positions if p.symbol != "MSFT"]
+    bot.positions.append(Position(symbol="NVDA", shares=1, avg_cost=10.0))
+    assert bot.get_position("NVDA") is bot.positions[1]
+    assert bot.get_position("MSFT") is None
+
+
+def test_reordered_items_fail_validation_and_are_reindexed():
+    bot = make_bot("AAPL", "MSFT")
+    assert bot.get_position("AAPL") is bot.positions[0]
+
+    bot.positions.reverse()
+    assert bot.get_position("AAPL") is bot.positions[1]
+    assert bot.get_position("MSFT") is bot.positions[0]
+
+
+def test_swapped_item_in_the_same_list_is_found():
+    bot = make_bot("AAPL", "TSLA")
+    positions = bot.positions
+    assert bot.get_position("TSLA") is positions[1]
+
+    positions.remove(positions[1])
+    positions.append(Position(symbol="MSFT", shares=1, avg_cost=10.0))
+    assert bot.positions is positions
+    assert bot.get_position("MSFT") is positions[1]
+    assert bot.get_position("TSLA") is None
+
+    positions[0] = Position(symbol="NVDA", shares=1, avg_cost=10.0)
+    assert bot.get_position("NVDA") is positions[0]
+    assert bot.get_position("AAPL") is None
+
+
+def test_get_bot_uses_its_own_index():
+    state = GameState(bots=make_bots(1.0, 2.0))
+
+    assert state.get_bot("bot-1") is state.bots[1]
+    state.bots.append(Bot(id="bot-9", name="Late", type="baseline", cash=0.0, total_value=0.0))
+    assert state.get_bot("bot-9") is state.bots[2]
+    assert state.get_bot("missing") is None
+
+    state.bots[0] = Bot(id="bot-5", name="Swapped", type="baseline", cash=0.0, total_value=0.0)
+    assert state.get_bot("bot-5") is state.bots[0]
+    assert state.get_bot("bot-0") is None
+
+
+def test_leaderboard_follows_total_value_changes():
+    state = GameState(bots=make_bots(100.0, 300.0, 200.0))
+    assert [b.id for b in state.get_leaderboard()] == ["bot-1", "bot-2", "bot-0"]
+
+    state.bots[0].total_value = 400.0
+    assert [b.id for b in state.get_leaderboard()] == ["bot-0", "bot-1", "bot-2"]
+
+
+def test_leaderboard_returns_current_bot_objects():
+    state = GameState(bots=make_bots(100.0, 200.0))
+    state.get_leaderboard()
+
+    replacement = Bot(id="bot-1", name="New", type="baseline", cash=200.0, total_value=200.0)
+    state.bots[1] = replacement
+    assert state.get_leaderboard()[0] is replacement
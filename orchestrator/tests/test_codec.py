@@ -0,0 +1,120 @@
+"""Tests for the msgspec game state codec."""
+
+import json
+from datetime import datetime, timezone
+
+from orchestrator.src.models import (
+    Bot,
+    GameState,
+    Position,
+    RecentTrades,
+    Trade,
+    convert_state,
+    decode_state,
+    encode_json,
+    encode_state,
+)
+
+EXECUTED_AT = datetime(2024, 3, 4, 14, 30, tzinfo=timezone.utc)
+
+
+def make_state() -> GameState:
+    bot = Bot(
+        id="bot-1",
+        name="Bot One",
+        type="free_agent",
+        cash=1000.5,
+        total_value=2000.0,
+        positions=[Position(symbol="AAPL", shares=5, avg_cost=100.0, current_price=101.25)],
+        session_id="sess-1",
+        last_commentary="Holding",
+        updated_at=EXECUTED_AT,
+        alpaca_api_key="key",
+        alpaca_secret_key="secret",
+    )
+    trade = Trade(
+        bot_id="bot-1", symbol="AAPL", side="BUY", shares=5, price=100.0,
+        round=2, commentary="Entry", executed_at=EXECUTED_AT, id=7,
+    )
+    return GameState(
+        status="running",
+        current_round=2,
+        bots=[bot],
+        recent_trades=[trade],
+        created_at=EXECUTED_AT,
+    )
+
+
+def test_encoding_matches_to_dict():
+    state = make_state()
+    document = state.to_dict()
+    # msgspec writes UTC as "Z" rather than isoformat()'s "+00:00"
+    stamp = "2024-03-04T14:30:00Z"
+    document["created_at"] = document["bots"][0]["updated_at"] = stamp
+    document["recent_trades"][0]["executed_at"] = stamp
+
+    assert json.loads(encode_state(state)) == document
+
+
+def test_encoding_leaves_out_credentials_and_optionally_trades():
+    encoded = json.loads(encode_state(make_state(), include_trades=False))
+
+    assert "recent_trades" not in encoded
+    assert "alpaca_api_key" not in encoded["bots"][0]
+    assert "alpaca_secret_key" not in encoded["bots"][0]
+
+
+def test_round_trip():
+    state = make_state()
+    decoded = decode_state(encode_state(state))
+
+    assert decoded.to_dict() == state.to_dict()
+    assert isinstance(decoded.bots[0].positions[0], Position)
+    assert decoded.bots[0].updated_at == EXECUTED_AT
+    assert isinstance(decoded.recent_trades, RecentTrades)
+    assert decoded.recent_trades[0].executed_at == EXECUTED_AT
+
+
+def test_decode_accepts_str_and_sqlite_numbers():
+    raw = json.dumps({
+        "status": "paused",
+        "current_round": 3.0,
+        "bots": [{"id": "b", "name": "B", "type": "baseline", "cash": 10, "total_value": 10}],
+    })
+    state = decode_state(raw)
+
+    assert state.current_round == 3
+    assert state.bots[0].cash == 10
+    assert len(state.recent_trades) == 0
+
+
+def test_rejected_documents_fall_back_to_from_dict():
+    document = {
+        "status": "stopped",
+        "bots": [{"id": "b", "name": "B", "type": "baseline", "cash": 10, "total_value": 10}],
+    }
+
+    for state in (decode_state(json.dumps(document)), convert_state(document)):
+        assert state.status == "stopped"
+        assert state.bots[0].id == "b"
+
+
+def test_convert_matches_decode():
+    document = json.loads(encode_state(make_state()))
+
+    assert convert_state(document).to_dict() == decode_state(encode_state(make_state())).to_dict()
+
+
+def test_decoded_state_is_untracked_until_marked_clean():
+    state = decode_state(encode_state(make_state()))
+    assert state.diff() is None
+
+    state.mark_clean()
+    state.bots[0].cash = 0.0
+    assert state.diff() == {"bots": [{"id": "bot-1", "cash": 0.0}]}
+
+
+def test_encode_json_handles_models():
+    trade = make_state().recent_trades[0]
+
+    assert json.loads(encode_json({"trade": trade}))["trade"]["id"] == 7
@@ -0,0 +1,72 @@
+"""Tests for the equity curve cache and LTTB downsampling."""
+
+from mcp_server.src.equity_cache import EquityCurveCache, EquitySeries, downsample
+
+
+def test_series_merge_appends_inserts_and_overwrites():
+    series = EquitySeries()
+    series.merge([1, 2, 4], [100.0, 101.0, 104.0])
+    series.merge([3, 4, 5], [103.0, 99.0, 105.0], [10.0, 0.0, 5.0])
+
+    assert list(series.rounds) == [1, 2, 3, 4, 5]
+    assert list(series.values) == [100.0, 101.0, 103.0, 99.0, 105.0]
+    assert list(series.traded) == [0.0, 0.0, 10.0, 0.0, 5.0]
+    assert list(series.since(3)[0]) == [3, 4, 5]
+
+
+def test_downsample_keeps_short_curves_and_endpoints():
+    rounds, values = list(range(10)), [float(v) for v in range(10)]
+
+    assert downsample(rounds, values, 20) == (rounds, values)
+    assert downsample(rounds, values, 2) == (rounds, values)
+
+    out_x, out_y = downsample(rounds, values, 5)
+    assert len(out_x) == 5
+    assert (out_x[0], out_x[-1]) == (0, 9)
+    assert out_x == sorted(out_x)
+    assert out_y == [float(x) for x in out_x]
+
+
+def test_downsample_preserves_extremes():
+    rounds = list(range(100))
+    values = [100.0] * 100
+    values[37] = 150.0  # Spike
+    values[71] = 40.0  # Crash
+
+    out_x, out_y = downsample(rounds, values, 10)
+
+    assert 37 in out_x and 71 in out_x
+    assert max(out_y) == 150.0 and min(out_y) == 40.0
+
+
+class FakeClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.since = []
+
+    def get_snapshots(self, since_round=0):
+        self.since.append(since_round)
+        return self.responses.pop(0)
+
+
+def test_cache_refreshes_incrementally_and_downsamples():
+    client = FakeClient([
+        {"curves": {"a": {"rounds": [1, 2, 3], "values": [100.0, 110.0, 105.0]}}},
+        {"curves": {"a": {"rounds": [3, 4], "values": [106.0, 120.0]}}},
+        {"curves": {}},
+        {"curves": {}},
+    ])
+    cache = EquityCurveCache(client, refresh_interval=0)
+
+    cache.refresh()
+    cache.refresh()
+
+    assert client.since == [0, 3]
+    assert cache.last_round == 4
+    assert list(cache.get_series("a").values) == [100.0, 110.0, 106.0, 120.0]
+
+    curve = cache.get_curve("a", max_points=3)
+    assert client.since == [0, 3, 4]
+    assert curve["total_points"] == 4
+    assert [p["round"] for p in curve["curve"]] == [1, 3, 4]
+    assert cache.get_curve("missing") == {"bot_id": "missing", "total_points": 0, "curve": []}
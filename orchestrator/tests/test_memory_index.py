@@ -0,0 +1,81 @@
+"""Tests for the BM25 memory index behind recall(query=...)."""
+
+from mcp_server.src.memory_index import MemoryIndex, tokenize
+
+
+def memory(memory_id, content, round_num=10, importance=5, memory_type="note"):
+    return {"id": memory_id, "round": round_num, "type": memory_type, "content": content, "importance": importance}
+
+
+def test_tokenize_drops_stopwords_and_keeps_tickers_whole():
+    assert tokenize("The BRK.B and NVDA trade was it") == ["brk.b", "nvda", "trade"]
+
+
+def test_bm25_ranks_rarer_and_denser_matches_higher():
+    index = MemoryIndex([
+        memory(1, "nvda nvda earnings beat, held nvda"),
+        memory(2, "nvda dipped on the open"),
+        memory(3, "rotated into utilities, sold everything else"),
+        memory(4, "earnings season is noisy"),
+    ])
+
+    results = index.search("nvda")
+    assert [r["id"] for r in results] == [1, 2]
+    assert results[0]["score"] > results[1]["score"]
+
+    # "utilities" appears once in the corpus, "earnings" twice
+    assert index.search("utilities earnings")[0]["id"] == 3
+
+
+def test_importance_and_recency_weight_the_text_score():
+    index = MemoryIndex([
+        memory(1, "short tsla", round_num=100, importance=2),
+        memory(2, "short tsla", round_num=100, importance=9),
+        memory(3, "short tsla", round_num=80, importance=9),
+    ])
+
+    assert [r["id"] for r in index.search("tsla")] == [2, 3, 1]
+
+
+def test_filters():
+    index = MemoryIndex([
+        memory(1, "degen is all in on gme", memory_type="rival", importance=8),
+        memory(2, "turtle never sells gme", memory_type="rival", importance=8),
+        memory(3, "gme squeeze lesson", memory_type="trade", importance=3),
+    ])
+
+    assert [r["id"] for r in index.search("gme", memory_type="rival", target_bot="Degen")] == [1]
+    assert {r["id"] for r in index.search("gme", min_importance=5)} == {1, 2}
+    assert len(index.search("gme", k=1)) == 1
+
+
+def test_ties_between_api_and_queued_ids_do_not_crash():
+    index = MemoryIndex([memory(1, "buy NVDA")])
+    index.add(memory("q-abc", "buy NVDA"))
+
+    results = index.search("nvda")
+
+    assert [r["id"] for r in results] == [1, "q-abc"]
+    assert results[0]["score"] == results[1]["score"]
+
+
+def test_replacing_and_removing_memories_updates_postings():
+    index = MemoryIndex([memory(1, "hold aapl")])
+    index.add(memory(1, "sold msft"))
+
+    assert index.search("aapl") == []
+    assert [r["id"] for r in index.search("msft")] == [1]
+
+    index.remove(1)
+    assert len(index) == 0
+    assert index.search("msft") == []
+
+
+def test_round_trip_leaves_out_queued_memories():
+    index = MemoryIndex([memory(1, "buy amd")], synced_id=1)
+    index.add(memory("q-1", "buy amd again"))
+
+    restored = MemoryIndex.from_dict(index.to_dict())
+
+    assert restored.synced_id == 1
+    assert [r["id"] for r in restored.search("amd")] == [1]
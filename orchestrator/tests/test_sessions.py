@@ -0,0 +1,142 @@
+"""Tests for session rotation and the fallback when a resume fails."""
+
+import sys
+
+import pytest
+
+from orchestrator.src.bot_runner import BotRun, BotRunner
+from orchestrator.src.models import Bot, GameState
+from orchestrator.src.sessions import SessionPolicy, SessionStore
+
+
+@pytest.fixture
+def bot() -> Bot:
+    return Bot(id="test", name="Test", type="free_agent", cash=0.0, total_value=0.0)
+
+
+def store(tmp_path, **policy) -> SessionStore:
+    return SessionStore(SessionPolicy(**policy), directory=str(tmp_path))
+
+
+def play(sessions: SessionStore, bot: Bot, round_num: int, session_id: str, tokens: int = 1000) -> None:
+    """Record a turn the way the round loop does."""
+    resumed = sessions.should_resume(bot)
+    sessions.record(bot, BotRun(session_id=session_id, resumed=resumed, input_tokens=tokens), round_num)
+
+
+def test_new_bot_starts_cold_and_is_then_resumed(tmp_path, bot):
+    sessions = store(tmp_path)
+    assert not sessions.should_resume(bot)
+
+    play(sessions, bot, 1, "s1")
+    assert bot.session_id == "s1"
+    assert sessions.rounds(bot) == 1
+    assert sessions.should_resume(bot)
+
+
+def test_rotates_after_max_rounds(tmp_path, bot):
+    sessions = store(tmp_path, max_rounds=3)
+    for round_num in range(1, 4):
+        play(sessions, bot, round_num, "s1")
+    assert sessions.rounds(bot) == 3
+    assert not sessions.should_resume(bot)
+
+    play(sessions, bot, 4, "s2")
+    assert sessions.rounds(bot) == 1
+    assert sessions.should_resume(bot)
+
+
+def test_rotates_at_max_tokens(tmp_path, bot):
+    sessions = store(tmp_path, max_tokens=5000)
+    play(sessions, bot, 1, "s1", tokens=4999)
+    assert sessions.should_resume(bot)
+
+    play(sessions, bot, 2, "s1", tokens=5000)
+    assert not sessions.should_resume(bot)
+
+
+def test_zero_max_tokens_means_no_limit(tmp_path, bot):
+    sessions = store(tmp_path, max_tokens=0)
+    play(sessions, bot, 1, "s1", tokens=10_000_000)
+
+    assert sessions.should_resume(bot)
+
+
+def test_zero_max_rounds_never_resumes(tmp_path, bot):
+    sessions = store(tmp_path, max_rounds=0)
+    play(sessions, bot, 1, "s1")
+    play(sessions, bot, 2, "s2")
+
+    assert not sessions.should_resume(bot)
+    assert sessions.rounds(bot) == 1
+
+
+def test_untracked_session_is_resumed_and_counted_from_then(tmp_path, bot):
+    sessions = store(tmp_path, max_rounds=2)
+    bot.session_id = "from-another-host"
+    assert sessions.rounds(bot) == 0
+    assert sessions.should_resume(bot)
+
+    play(sessions, bot, 5, "from-another-host")
+    assert sessions.rounds(bot) == 1
+
+
+def test_cold_run_resets_the_count(tmp_path, bot):
+    sessions = store(tmp_path)
+    play(sessions, bot, 1, "s1")
+    play(sessions, bot, 2, "s1")
+
+    # The resume failed and the runner fell back to a new session
+    sessions.record(bot, BotRun(session_id="s2", resumed=False, input_tokens=10), 3)
+    assert bot.session_id == "s2"
+    assert sessions.rounds(bot) == 1
+
+
+def test_run_without_a_session_changes_nothing(tmp_path, bot):
+    sessions = store(tmp_path)
+    play(sessions, bot, 1, "s1")
+    sessions.record(bot, BotRun(session_id=None), 2)
+
+    assert bot.session_id == "s1"
+    assert sessions.rounds(bot) == 1
+
+
+def test_bookkeeping_survives_a_restart(tmp_path, bot):
+    sessions = store(tmp_path, max_rounds=2)
+    play(sessions, bot, 1, "s1")
+    play(sessions, bot, 2, "s1")
+
+    reloaded = store(tmp_path, max_rounds=2)
+    assert reloaded.rounds(bot) == 2
+    assert not reloaded.should_resume(bot)
+
+
+def test_failed_resume_falls_back_to_a_new_session(tmp_path, bot, monkeypatch):
+    script = tmp_path / "cli.py"
+    script.write_text(
+        "import json, sys\n"
+        "if sys.argv[1:]:\n"
+        "    print('No conversation found with session ID: ' + sys.argv[1], file=sys.stderr)\n"
+        "    sys.exit(1)\n"
+        "print(json.dumps({'type': 'result', 'session_id': 'fresh', 'result': 'ok'}))\n"
+    )
+    commands = []
+
+    def command(bot, system_prompt, context, mcp_config_path, session_id):
+        commands.append(session_id)
+        return [sys.executable, str(script)] + ([session_id] if session_id else [])
+
+    runner = BotRunner()
+    monkeypatch.setattr(runner, "_mcp_command", command)
+    monkeypatch.setattr(runner, "get_system_prompt", lambda bot: "")
+    monkeypatch.setattr(runner, "build_context", lambda bot, state: "")
+    bot.session_id = "stale"
+
+    run = runner.stream_bot_with_mcp(bot, GameState(bots=[bot]), mcp_config_path="unused")
+
+    assert commands == ["stale", None]
+    assert (run.output, run.session_id, run.resumed) == ("ok", "fresh", False)
+
+    commands.clear()
+    runner.stream_bot_with_mcp(bot, GameState(bots=[bot]), mcp_config_path="unused", resume=False)
+    assert commands == [None]
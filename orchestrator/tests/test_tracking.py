@@ -0,0 +1,133 @@
+"""Tests for change tracking and the PATCH /api/state diffs."""
+
+from orchestrator.src.models import Bot, GameState, Position
+
+
+def make_state() -> GameState:
+    bot = Bot(
+        id="bot-1",
+        name="Bot One",
+        type="free_agent",
+        cash=1000.0,
+        total_value=2000.0,
+        positions=[
+            Position(symbol="AAPL", shares=5, avg_cost=100.0, current_price=100.0),
+            Position(symbol="MSFT", shares=2, avg_cost=250.0, current_price=250.0),
+        ],
+    )
+    state = GameState(status="running", current_round=3, bots=[bot])
+    state.mark_clean()
+    return state
+
+
+def test_untracked_model_reports_no_changes():
+    pos = Position(symbol="AAPL", shares=1, avg_cost=10.0)
+    pos.shares = 2
+
+    assert not pos.is_tracked
+    assert pos.changes() == {}
+
+
+def test_changes_lists_only_modified_fields():
+    pos = Position(symbol="AAPL", shares=1, avg_cost=10.0)
+    pos.mark_clean()
+    assert pos.changes() == {}
+
+    pos.current_price = 12.0
+    assert pos.changes() == {"current_price": 12.0}
+
+
+def test_reverting_a_field_clears_the_change():
+    pos = Position(symbol="AAPL", shares=1, avg_cost=10.0)
+    pos.mark_clean()
+
+    pos.shares = 3
+    pos.shares = 1
+    assert pos.changes() == {}
+
+
+def test_mark_clean_takes_a_new_snapshot():
+    pos = Position(symbol="AAPL", shares=1, avg_cost=10.0)
+    pos.mark_clean()
+    pos.shares = 3
+    pos.mark_clean()
+
+    assert pos.changes() == {}
+
+
+def test_untouched_state_diffs_empty():
+    assert make_state().diff() == {}
+
+
+def test_never_marked_clean_state_needs_a_full_save():
+    state = GameState(bots=[Bot(id="b", name="B", type="baseline", cash=1.0, total_value=1.0)])
+    assert state.diff() is None
+
+
+def test_added_bot_needs_a_full_save():
+    state = make_state()
+    state.bots.append(Bot(id="bot-2", name="Bot Two", type="baseline", cash=1.0, total_value=1.0))
+
+    assert state.diff() is None
+
+
+def test_game_and_bot_field_changes():
+    state = make_state()
+    state.current_round = 4
+    bot = state.bots[0]
+    bot.cash = 900.0
+    bot.last_commentary = "Bought the dip"
+
+    assert state.diff() == {
+        "current_round": 4,
+        "bots": [{"id": "bot-1", "cash": 900.0, "last_commentary": "Bought the dip"}],
+    }
+
+
+def test_position_updates_are_partial():
+    state = make_state()
+    state.bots[0].get_position("AAPL").current_price = 110.0
+
+    assert state.diff() == {
+        "bots": [{"id": "bot-1", "positions": [{"symbol": "AAPL", "current_price": 110.0}]}],
+    }
+
+
+def test_opened_and_closed_positions():
+    state = make_state()
+    bot = state.bots[0]
+    bot.positions = [p for p in bot.positions if p.symbol != "MSFT"]
+    bot.positions.append(Position(symbol="NVDA", shares=1, avg_cost=900.0))
+
+    assert bot.diff() == {
+        "id": "bot-1",
+        "opened_positions": [
+            {"symbol": "NVDA", "shares": 1, "avg_cost": 900.0, "current_price": None}
+        ],
+        "closed_positions": ["MSFT"],
+    }
+
+
+def test_replaced_position_is_sent_in_full():
+    state = make_state()
+    bot = state.bots[0]
+    bot.positions[0] = Position(symbol="AAPL", shares=5, avg_cost=100.0, current_price=100.0)
+
+    assert bot.diff() == {
+        "id": "bot-1",
+        "opened_positions": [
+            {"symbol": "AAPL", "shares": 5, "avg_cost": 100.0, "current_price": 100.0}
+        ],
+    }
+
+
+def test_mark_clean_after_save_clears_the_diff():
+    state = make_state()
+    bot = state.bots[0]
+    bot.cash = 500.0
+    bot.positions.pop()
+    bot.positions.append(Position(symbol="TSLA", shares=1, avg_cost=200.0))
+    assert state.diff()
+
+    state.mark_clean()
+    assert state.diff() == {}
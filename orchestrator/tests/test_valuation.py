@@ -0,0 +1,80 @@
+"""Tests for mark-to-market valuation and batched price fetching."""
+
+import httpx
+import pytest
+
+from orchestrator.src.models import Bot, Position
+from orchestrator.src.price_fetcher import PriceFetcher, normalize_symbol
+from orchestrator.src.valuation import mark_to_market
+
+
+def make_bot(bot_id: str, cash: float, positions: list[Position]) -> Bot:
+    return Bot(id=bot_id, name=bot_id, type="free_agent", cash=cash, total_value=0.0, positions=positions)
+
+
+def test_mark_to_market_reprices_positions_and_totals():
+    bots = [
+        make_bot("a", 1000.0, [Position("AAPL", 10, 100.0), Position("MSFT", 2, 300.0)]),
+        make_bot("b", 500.0, [Position("AAPL", 1, 90.0)]),
+    ]
+
+    totals = mark_to_market(bots, {"AAPL": 150.0, "MSFT": 400.0})
+
+    assert list(totals) == [1000 + 10 * 150 + 2 * 400, 500 + 150]
+    assert bots[0].total_value == 3300.0
+    assert bots[0].get_position("AAPL").current_price == 150.0
+    assert bots[1].get_position("AAPL").current_price == 150.0
+
+
+def test_mark_to_market_keeps_last_mark_for_unpriced_symbols():
+    bots = [make_bot("a", 0.0, [Position("XYZ", 4, 10.0, current_price=12.0), Position("ABC", 2, 5.0)])]
+
+    mark_to_market(bots, {})
+
+    assert bots[0].total_value == 4 * 12.0 + 2 * 5.0
+    assert bots[0].get_position("XYZ").current_price == 12.0
+    assert bots[0].get_position("ABC").current_price is None
+
+
+def test_mark_to_market_matches_symbols_case_insensitively():
+    bots = [make_bot("a", 0.0, [Position("aapl", 3, 100.0)])]
+
+    mark_to_market(bots, {"AAPL": 200.0})
+
+    assert bots[0].total_value == 600.0
+    assert bots[0].positions[0].current_price == 200.0
+
+
+def test_normalize_symbol():
+    assert normalize_symbol(" brk.b ") == "BRK.B"
+
+
+@pytest.fixture
+def fetcher():
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        symbol = request.url.params["symbol"]
+        requested.append(symbol)
+        if symbol == "BAD":
+            return httpx.Response(200, json={"c": 0})
+        return httpx.Response(200, json={"c": 10.0 + len(symbol)})
+
+    fetcher = PriceFetcher(api_key="test")
+    fetcher._client = httpx.Client(transport=httpx.MockTransport(handler))
+    fetcher.requested = requested
+    yield fetcher
+    fetcher.close()
+
+
+def test_get_prices_requests_each_symbol_once_and_skips_failures(fetcher):
+    prices = fetcher.get_prices(["aapl", "AAPL", "SPY", "BAD"])
+
+    assert prices == {"AAPL": 14.0, "SPY": 13.0}
+    assert sorted(fetcher.requested) == ["AAPL", "BAD", "SPY"]
+
+
+def test_get_all_bot_symbols_is_normalized(fetcher):
+    bots = [make_bot("a", 0.0, [Position("aapl", 1, 1.0)]), make_bot("b", 0.0, [Position("AAPL", 1, 1.0)])]
+
+    assert fetcher.get_all_bot_symbols(bots) == {"AAPL"}
@@ -0,0 +1,250 @@
+"""Tests for the MCP servers' write-behind record queue."""
+
+import json
+import sqlite3
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from local_api.src.app import create_app
+from mcp_server.src import write_queue
+from mcp_server.src.memory_index import MemoryIndex
+from mcp_server.src.trading_client import TradingClient
+from mcp_server.src.write_queue import WriteQueue
+
+API_KEY = "test"
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(write_queue, "RETRY_MIN", 0.01)
+    monkeypatch.setattr(write_queue, "RETRY_MAX", 0.05)
+
+
+class ApiTransport(httpx.BaseTransport):
+    """Sends requests to the local API stand-in, optionally losing responses."""
+
+    def __init__(self, api: TestClient):
+        self.api = api
+        self.lose_responses = 0  # Apply the request, then fail as if the connection dropped
+        self.refuse = False  # Fail before anything reaches the API
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.refuse:
+            raise httpx.ConnectError("connection refused", request=request)
+        response = self.api.request(
+            request.method, request.url.path, content=request.read(), headers=dict(request.headers)
+        )
+        if self.lose_responses:
+            self.lose_responses -= 1
+            raise httpx.ReadError("connection reset", request=request)
+        return httpx.Response(response.status_code, headers=response.headers, content=response.content)
+
+
+@pytest.fixture
+def api(tmp_path):
+    with TestClient(create_app(str(tmp_path / "api.db"), api_key=API_KEY)) as client:
+        client.post(
+            "/api/state",
+            json={"status": "running", "current_round": 7, "bots": [
+                {"id": "degen", "name": "Degen", "type": "baseline", "cash": 1e5, "total_value": 1e5},
+            ]},
+            headers={"Authorization": f"Bearer {API_KEY}"},
+        ).raise_for_status()
+        yield client
+
+
+@pytest.fixture
+def transport(api):
+    return ApiTransport(api)
+
+
+def api_client(transport: httpx.BaseTransport) -> httpx.Client:
+    return httpx.Client(
+        base_url="http://api", transport=transport, headers={"Authorization": f"Bearer {API_KEY}"}
+    )
+
+
+def trades(api: TestClient) -> list[dict]:
+    return sorted(api.get("/api/trades", params={"limit": 500}).json()["trades"], key=lambda t: t["id"])
+
+
+def trade(i: int) -> dict:
+    return {"symbol": "GME", "side": "buy", "shares": i + 1, "price": 20.0}
+
+
+def test_records_are_applied_in_order_across_batches(tmp_path, api, transport):
+    applied = []
+    queue = WriteQueue(
+        str(tmp_path / "q.db"), "degen", api_client(transport),
+        on_applied=lambda record, row_id: applied.append(record["data"]["shares"]), batch_size=7,
+    )
+    for i in range(30):
+        queue.enqueue("trade", trade(i))
+
+    assert queue.drain(5.0)
+    queue.close()
+
+    assert [t["shares"] for t in trades(api)] == list(range(1, 31))
+    assert applied == list(range(1, 31))
+    assert all(t["round"] == 7 for t in trades(api))
+
+
+def test_retried_batch_is_deduplicated_by_applied_records(tmp_path, api, transport):
+    transport.lose_responses = 1
+    queue = WriteQueue(str(tmp_path / "q.db"), "degen", api_client(transport))
+    for i in range(5):
+        queue.enqueue("trade", trade(i))
+
+    assert queue.drain(5.0)
+    queue.close()
+
+    assert transport.lose_responses == 0
+    assert [t["shares"] for t in trades(api)] == [1, 2, 3, 4, 5]
+
+
+def test_journal_is_replayed_after_a_crash(tmp_path, api, transport):
+    path = str(tmp_path / "q.db")
+    transport.refuse = True
+    queue = WriteQueue(path, "degen", api_client(transport))
+    for i in range(3):
+        queue.enqueue("trade", trade(i), round_num=5)
+    assert not queue.close(timeout=0.2)
+    assert trades(api) == []
+
+    transport.refuse = False
+    replayed = WriteQueue(path, "degen", api_client(transport))
+    assert replayed.pending() == 3
+    assert replayed.drain(5.0)
+    replayed.close()
+
+    assert [(t["shares"], t["round"]) for t in trades(api)] == [(1, 5), (2, 5), (3, 5)]
+
+
+def test_invalid_records_are_set_aside_without_blocking(tmp_path, api, transport):
+    queue = WriteQueue(str(tmp_path / "q.db"), "degen", api_client(transport))
+    queue.enqueue("trade", trade(0))
+    queue.enqueue("memory", {"type": "gossip", "content": "x"})
+    queue.enqueue("trade", trade(1))
+
+    assert queue.drain(5.0)
+    queue.close()
+
+    assert [t["shares"] for t in trades(api)] == [1, 2]
+    dead = sqlite3.connect(tmp_path / "q.db").execute("SELECT kind, error FROM dead_records").fetchall()
+    assert dead == [("memory", "Invalid type. Must be one of: trade, rival, strategy, reflection, note")]
+
+
+@pytest.mark.parametrize("status", [401, 403, 404, 405])
+def test_auth_and_route_errors_are_retried(tmp_path, status):
+    # e.g. a rotated CF_API_KEY, or an API without the records route yet
+    failures = [status] * 3
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if failures:
+            return httpx.Response(failures.pop(), json={"error": "nope"})
+        records = json.loads(request.content)["records"]
+        return httpx.Response(200, json={"results": [{"id": r["id"], "status": "ok", "row_id": 1} for r in records]})
+
+    rejected = []
+    queue = WriteQueue(
+        str(tmp_path / "q.db"), "degen", api_client(httpx.MockTransport(handler)),
+        on_rejected=rejected.append,
+    )
+    queue.enqueue("trade", trade(0))
+    queue.enqueue("trade", trade(1))
+
+    assert queue.drain(2.0)
+    queue.close()
+
+    assert failures == [] and rejected == []
+    db = sqlite3.connect(tmp_path / "q.db")
+    assert db.execute("SELECT COUNT(*) FROM dead_records").fetchone()[0] == 0
+
+
+def test_records_stay_journaled_while_the_api_refuses_the_key(tmp_path):
+    transport = httpx.MockTransport(lambda request: httpx.Response(401, json={"error": "Unauthorized"}))
+    queue = WriteQueue(str(tmp_path / "q.db"), "degen", api_client(transport))
+    for i in range(3):
+        queue.enqueue("trade", trade(i))
+
+    assert not queue.drain(0.3)
+    assert queue.last_error.startswith("Client error '401")
+    queue.close(timeout=0.1)
+
+    db = sqlite3.connect(tmp_path / "q.db")
+    assert db.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 3
+    assert db.execute("SELECT COUNT(*) FROM dead_records").fetchone()[0] == 0
+
+
+def test_malformed_batch_is_retried_record_by_record(tmp_path):
+    posted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        records = json.loads(request.content)["records"]
+        posted.append(len(records))
+        if any(r["data"].get("bad") for r in records):
+            return httpx.Response(400, json={"error": "malformed"})
+        return httpx.Response(200, json={"results": [{"id": r["id"], "status": "ok", "row_id": 1} for r in records]})
+
+    applied, rejected = [], []
+    queue = WriteQueue(
+        str(tmp_path / "q.db"), "degen", api_client(httpx.MockTransport(handler)),
+        on_applied=lambda record, row_id: applied.append(record["data"]["shares"]),
+        on_rejected=lambda record: rejected.append(record["data"]["shares"]),
+    )
+    queue.enqueue("trade", trade(0))
+    queue.enqueue("trade", {**trade(1), "bad": True})
+    queue.enqueue("trade", trade(2))
+
+    assert queue.drain(2.0)
+    queue.close()
+
+    assert posted == [3, 1, 1, 1]
+    assert applied == [1, 3]
+    assert rejected == [2]
+    dead = sqlite3.connect(tmp_path / "q.db").execute("SELECT data FROM dead_records").fetchall()
+    assert [json.loads(d)["shares"] for (d,) in dead] == [2]
+
+
+def test_server_errors_are_retried(tmp_path):
+    statuses = [503, 429]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if statuses:
+            return httpx.Response(statuses.pop(0))
+        records = json.loads(request.content)["records"]
+        return httpx.Response(200, json={"results": [{"id": r["id"], "status": "ok", "row_id": 1} for r in records]})
+
+    queue = WriteQueue(str(tmp_path / "q.db"), "degen", api_client(httpx.MockTransport(handler)))
+    queue.enqueue("trade", trade(0))
+
+    assert queue.drain(2.0)
+    queue.close()
+
+    assert statuses == []
+    db = sqlite3.connect(tmp_path / "q.db")
+    assert db.execute("SELECT COUNT(*) FROM dead_records").fetchone()[0] == 0
+
+
+def test_rejected_memory_leaves_the_search_index(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARENA_CACHE_DIR", str(tmp_path / "cache"))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        records = json.loads(request.content)["records"]
+        if any("rejected" in r["data"].get("content", "") for r in records):
+            return httpx.Response(422, json={"error": "invalid memory"})
+        return httpx.Response(200, json={"results": [{"id": r["id"], "status": "ok", "row_id": 41} for r in records]})
+
+    client = TradingClient("degen", api_url="http://api", api_key=API_KEY, write_queue_path=str(tmp_path / "q.db"))
+    client.write_queue._client = api_client(httpx.MockTransport(handler))
+    client.memory_index = MemoryIndex()
+    try:
+        client.save_memory("note", "GME squeeze rejected by the API")
+        client.save_memory("note", "GME squeeze kept")
+        assert client.flush_writes(2.0)
+    finally:
+        client.close()
+
+    assert [m["id"] for m in client.memory_index.search("GME squeeze")] == [41]
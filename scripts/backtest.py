@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Replay trading rounds offline against stored candles.
+
+Fetch candles once:
+    python scripts/backtest.py fetch SPY AAPL NVDA --from 2025-01-01 --to 2025-02-01
+
+Replay a month with the real bot prompts (claude CLI, simulated brokerage):
+    python scripts/backtest.py run --start 2025-01-02 --end 2025-01-31 --bots turtle,degen
+
+Replay recorded orders instead of running the bots (checks constraint changes):
+    python scripts/backtest.py run --start 2025-01-02 --end 2025-01-31 --replay orders.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from mcp_server.src.backtest import (
+    BacktestConfig,
+    BacktestSession,
+    CandleStore,
+    round_schedule,
+    run_backtest,
+)
+from mcp_server.src.orders import execute_order
+
+DEFAULT_DATA_DIR = os.path.join("data", "candles")
+DEFAULT_RUN_DIR = os.path.join("data", "backtest")
+
+
+def _timestamp(value) -> int:
+    """Parse a Unix timestamp or ISO date/datetime."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(datetime.fromisoformat(value).timestamp())
+
+
+def fetch(args):
+    """Download candles (and financials) from Finnhub into the data dir."""
+    from mcp_server.src.finnhub_client import FinnhubClient
+
+    client = FinnhubClient()
+    store = CandleStore(args.data_dir)
+    from_ts = _timestamp(args.from_date)
+    to_ts = _timestamp(args.to_date)
+
+    for symbol in args.symbols:
+        candles = client.get_candles(symbol, args.resolution, from_ts, to_ts)
+        if candles.get("s") != "ok":
+            print(f"  {symbol}: no data")
+            continue
+        store.save(symbol, candles, args.resolution)
+
+        financials = client.get_basic_financials(symbol)
+        path = os.path.join(args.data_dir, "financials", CandleStore._filename(symbol))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(financials, f)
+
+        print(f"  {symbol}: {len(candles['t'])} bars")
+
+    client.close()
+
+
+def replay_orders(session: BacktestSession, path: str, bot_ids: list[str]):
+    """Build a round callback that re-submits recorded orders.
+
+    Each line of the file is {"timestamp", "bot_id", "symbol", "side", "qty",
+    "reason"}. Orders are submitted in the first round at or after their
+    timestamp.
+    """
+    pending = defaultdict(list)
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                order = json.loads(line)
+                if order["bot_id"] in bot_ids:
+                    pending[order["bot_id"]].append(order)
+    for orders in pending.values():
+        orders.sort(key=lambda o: _timestamp(o["timestamp"]))
+
+    clients = {
+        bot_id: (
+            session.trading_client(bot_id),
+            session.alpaca_client(bot_id),
+        )
+        for bot_id in bot_ids
+    }
+    finnhub = session.finnhub_client()
+
+    def play_round(round_num: int, ts: int) -> None:
+        for bot_id, orders in pending.items():
+            trading, alpaca = clients[bot_id]
+            while orders and _timestamp(orders[0]["timestamp"]) <= ts:
+                order = orders.pop(0)
+                execute_order(
+                    trading,
+                    alpaca,
+                    finnhub,
+                    symbol=order["symbol"],
+                    qty=float(order["qty"]),
+                    side=order["side"],
+                    reason=order.get("reason"),
+                )
+
+    return play_round
+
+
+def run_bots(session: BacktestSession, bot_ids: list[str], args):
+    """Build a round callback that runs the real bot prompts via the claude CLI."""
+    from orchestrator.src.bot_runner import BotRunner
+    from orchestrator.src.models import Bot, GameState
+
+    runner = BotRunner(
+        **({"model": args.model} if args.model else {}),
+        use_sse=False,
+        extra_env={"BACKTEST_RUN_DIR": str(session.run_dir.resolve())},
+    )
+    cash = session.config.starting_cash
+    bots = [
+        Bot(id=bot_id, name=bot_id.title(), type="baseline", cash=cash, total_value=cash)
+        for bot_id in bot_ids
+    ]
+
+    def play_round(round_num: int, ts: int) -> None:
+        state = GameState(status="running", starting_cash=cash, current_round=round_num - 1, bots=bots)
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            list(pool.map(lambda bot: runner.run_bot_with_mcp(bot, state, timeout=args.timeout), bots))
+        print(f"  Round {round_num} ({datetime.fromtimestamp(ts):%Y-%m-%d %H:%M}) done")
+
+    return play_round
+
+
+def run(args):
+    """Replay rounds between two dates and print the results."""
+    bot_ids = [b.strip() for b in args.bots.split(",") if b.strip()]
+    timestamps = list(round_schedule(date.fromisoformat(args.start), date.fromisoformat(args.end)))
+    if not timestamps:
+        print("No trading days in range")
+        sys.exit(1)
+
+    config = BacktestConfig(
+        data_dir=os.path.abspath(args.data_dir),
+        starting_cash=args.starting_cash,
+        slippage_bps=args.slippage_bps,
+        commission_per_share=args.commission_per_share,
+        min_commission=args.min_commission,
+    )
+    session = BacktestSession.create(args.run_dir, config, timestamps[0])
+
+    if args.replay:
+        play_round = replay_orders(session, args.replay, bot_ids)
+    else:
+        play_round = run_bots(session, bot_ids, args)
+
+    print(f"Backtesting {len(bot_ids)} bots over {len(timestamps)} rounds...")
+    result = run_backtest(session, bot_ids, timestamps, play_round, args.benchmark)
+    summary = result.summary(session)
+
+    with open(session.run_dir / "results.json", "w") as f:
+        json.dump(
+            {
+                "config": vars(args) | {"func": None},
+                "timestamps": result.timestamps,
+                "equity": result.equity,
+                "benchmark": result.benchmark,
+                "summary": summary,
+            },
+            f,
+            indent=2,
+        )
+
+    print("\n" + "=" * 72)
+    print(f"{'Bot':<10} {'Final':>14} {'Return':>9} {'Sharpe':>8} {'MaxDD':>8} {'Trades':>7} {'Rejected':>9}")
+    print("-" * 72)
+    for bot_id, s in sorted(summary.items(), key=lambda kv: kv[1]["return_pct"], reverse=True):
+        sharpe = f"{s['sharpe']:.2f}" if s["sharpe"] is not None else "-"
+        drawdown = f"{s['max_drawdown_pct']:.1f}%" if s["max_drawdown_pct"] is not None else "-"
+        print(
+            f"{bot_id:<10} ${s['final_value']:>13,.2f} {s['return_pct']:>8.2f}% "
+            f"{sharpe:>8} {drawdown:>8} {s['trades']:>7} {s['rejected']:>9}"
+        )
+    print("=" * 72)
+    print(f"Results written to {session.run_dir / 'results.json'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline backtests against stored candles")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    fetch_parser = subparsers.add_parser("fetch", help="Download candles from Finnhub")
+    fetch_parser.add_argument("symbols", nargs="+", help="Symbols to download")
+    fetch_parser.add_argument("--from", dest="from_date", required=True, help="Start date (YYYY-MM-DD)")
+    fetch_parser.add_argument("--to", dest="to_date", required=True, help="End date (YYYY-MM-DD)")
+    fetch_parser.add_argument("--resolution", default="60", help="Candle resolution (default: 60)")
+    fetch_parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Candle directory")
+    fetch_parser.set_defaults(func=fetch)
+
+    run_parser = subparsers.add_parser("run", help="Replay rounds")
+    run_parser.add_argument("--start", required=True, help="First trading day (YYYY-MM-DD)")
+    run_parser.add_argument("--end", required=True, help="Last trading day (YYYY-MM-DD)")
+    run_parser.add_argument(
+        "--bots",
+        default="turtle,degen,boomer,quant,doomer,gary,diana,mel,vince,rei",
+        help="Comma-separated bot IDs",
+    )
+    run_parser.add_argument("--replay", help="Replay recorded orders (JSON lines) instead of running bots")
+    run_parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Candle directory")
+    run_parser.add_argument("--run-dir", default=DEFAULT_RUN_DIR, help="Ledger/journal directory")
+    run_parser.add_argument("--starting-cash", type=float, default=100000.0)
+    run_parser.add_argument("--slippage-bps", type=float, default=5.0)
+    run_parser.add_argument("--commission-per-share", type=float, default=0.0)
+    run_parser.add_argument("--min-commission", type=float, default=0.0)
+    run_parser.add_argument("--benchmark", default="SPY", help="Benchmark symbol")
+    run_parser.add_argument("--model", help="Model for bot sessions (default: BotRunner's)")
+    run_parser.add_argument("--workers", type=int, default=10, help="Bots run concurrently per round")
+    run_parser.add_argument("--timeout", type=int, default=300, help="Seconds per bot session")
+    run_parser.set_defaults(func=run)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
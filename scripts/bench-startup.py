@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark MCP server startup: module import time and first tool call latency.
+
+A stub Workers API answers on localhost with a configurable delay, so the
+cost of network calls made during import or the first tool call shows up
+without touching the real services.
+
+Usage:
+    python scripts/bench-startup.py --runs 5 --api-delay 0.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Runs in a fresh interpreter so import cost is measured cold
+PROBE = """
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+import mcp_server.src.server as server
+t1 = time.perf_counter()
+asyncio.run(server.call_tool("get_round_context", {}))
+t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "first_tool": t2 - t1}))
+"""
+
+
+def start_stub_api(delay: float) -> ThreadingHTTPServer:
+    """Serve minimal Workers API responses after a fixed delay."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            if "/credentials" in self.path:
+                body = {"alpaca_api_key": "bench-key", "alpaca_secret_key": "bench-secret"}
+            else:
+                body = {"leaderboard": [], "recent_trades": [], "messages": []}
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCP server import and first tool call")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--api-delay", type=float, default=0.5, help="Seconds the stub API waits per request")
+    args = parser.parse_args()
+
+    httpd = start_stub_api(args.api_delay)
+    env = {
+        **os.environ,
+        "BOT_ID": "turtle",
+        "CF_API_URL": f"http://127.0.0.1:{httpd.server_address[1]}",
+        "CF_API_KEY": "bench",
+        "FINNHUB_API_KEY": "bench",
+        "TOOL_CALL_LOG_DIR": "",
+        "WRITE_QUEUE_DIR": "",
+    }
+    env.pop("ALPACA_API_KEY", None)
+    env.pop("ALPACA_SECRET_KEY", None)
+
+    samples = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    httpd.shutdown()
+
+    print(f"API delay {args.api_delay * 1000:.0f} ms, {args.runs} runs (median / max)")
+    for key in ("import", "first_tool"):
+        values = [s[key] * 1000 for s in samples]
+        print(f"  {key:<12} {statistics.median(values):>8.1f} ms  {max(values):>8.1f} ms")
+    total = [(s["import"] + s["first_tool"]) * 1000 for s in samples]
+    print(f"  {'total':<12} {statistics.median(total):>8.1f} ms  {max(total):>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
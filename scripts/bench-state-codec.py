@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark decoding and encoding the game state: dict path vs. codec.
+
+The dict path is what load_state/save_state used to do (json.loads +
+GameState.from_dict, GameState.to_dict + json.dumps); the codec path
+decodes response bytes straight into the models (decode_state) and
+encodes them back (encode_state). Scale 1 is today's arena: 10 bots,
+10 positions each and the API's 50 recent trades.
+
+Usage:
+    python scripts/bench-state-codec.py
+    python scripts/bench-state-codec.py --scales 1,10,100 --runs 20
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestrator.src.models import GameState, decode_state, encode_state
+
+BASE_BOTS = 10
+POSITIONS_PER_BOT = 10
+BASE_TRADES = 50
+
+
+def state_document(scale: int, rng: random.Random) -> bytes:
+    """An /api/state response body (D1 timestamps, position ids and all)."""
+    bots = []
+    for i in range(BASE_BOTS * scale):
+        bots.append({
+            "id": f"bot-{i}",
+            "name": f"Bot {i}",
+            "type": "free_agent" if i % 2 else "baseline",
+            "cash": round(rng.uniform(0, 100000), 2),
+            "total_value": round(rng.uniform(80000, 120000), 2),
+            "session_id": None,
+            "last_commentary": "Rotating out of tech into energy. " * 40,
+            "enabled": True,
+            "updated_at": "2026-10-19 14:30:00",
+            "positions": [
+                {
+                    "id": i * POSITIONS_PER_BOT + j,
+                    "bot_id": f"bot-{i}",
+                    "symbol": f"SYM{j}",
+                    "shares": float(rng.randint(1, 500)),
+                    "avg_cost": round(rng.uniform(10, 500), 2),
+                    "current_price": round(rng.uniform(10, 500), 2),
+                }
+                for j in range(POSITIONS_PER_BOT)
+            ],
+        })
+    trades = [
+        {
+            "id": k,
+            "bot_id": f"bot-{rng.randrange(BASE_BOTS * scale)}",
+            "symbol": f"SYM{rng.randrange(POSITIONS_PER_BOT)}",
+            "side": rng.choice(["BUY", "SELL"]),
+            "shares": float(rng.randint(1, 100)),
+            "price": round(rng.uniform(10, 500), 2),
+            "commentary": "Momentum breakout on volume.",
+            "round": rng.randint(1, 200),
+            "executed_at": "2026-10-19 14:29:12",
+        }
+        for k in range(BASE_TRADES * scale)
+    ]
+    return json.dumps({
+        "status": "running",
+        "starting_cash": 100000.0,
+        "current_round": 200,
+        "bots": bots,
+        "recent_trades": trades,
+        "created_at": "2026-09-01 00:00:00",
+        "updated_at": "2026-10-19 14:30:00",
+    }).encode()
+
+
+def median_ms(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark game state decode/encode")
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated data size multipliers")
+    parser.add_argument("--runs", type=int, default=20, help="Timing runs per case (median reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Scale':>5} {'Size KB':>8} | {'Decode dict':>11} {'codec':>7} {'x':>5} | "
+          f"{'Encode dict':>11} {'codec':>7} {'x':>5}")
+    print("-" * 72)
+    for scale in (int(s) for s in args.scales.split(",")):
+        raw = state_document(scale, random.Random(args.seed))
+        state = decode_state(raw)
+
+        # Both paths must produce the same objects and the same document
+        legacy = GameState.from_dict(json.loads(raw))
+        assert state == legacy, "decode_state differs from from_dict"
+        assert json.loads(encode_state(state)) == json.loads(json.dumps(legacy.to_dict())), \
+            "encode_state differs from to_dict"
+
+        decode_dict = median_ms(lambda: GameState.from_dict(json.loads(raw)), args.runs)
+        decode_codec = median_ms(lambda: decode_state(raw), args.runs)
+        encode_dict = median_ms(lambda: json.dumps(state.to_dict()).encode(), args.runs)
+        encode_codec = median_ms(lambda: encode_state(state), args.runs)
+        print(f"{scale:>5} {len(raw) / 1024:>8.0f} | {decode_dict:>9.2f}ms {decode_codec:>5.2f}ms "
+              f"{decode_dict / decode_codec:>5.1f} | {encode_dict:>9.2f}ms {encode_codec:>5.2f}ms "
+              f"{encode_dict / encode_codec:>5.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark the end-of-round state save: full POST body vs. PATCH diff.
+
+Builds a synthetic game state, simulates one round (every bot's
+commentary written by update_bot, then every position marked to market)
+and compares the payload size and serialize time of the full-state body
+with the patch save_state now sends. recent_trades is a bounded buffer
+that neither body carries, so both stay flat as the trade count grows.
+
+Usage:
+    python scripts/bench-state-save.py
+    python scripts/bench-state-save.py --bots 5,50,500 --trades 50,1000,10000 --positions 10
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from orchestrator.src.models import Bot, GameState, Position, Trade, encode_json, encode_state
+from orchestrator.src.valuation import mark_to_market
+
+SYMBOLS = [f"SYM{i:03d}" for i in range(200)]
+
+
+def build_state(n_bots: int, n_positions: int, n_trades: int, rng: random.Random) -> GameState:
+    """A loaded-looking game state (already marked clean)."""
+    bots = []
+    for i in range(n_bots):
+        positions = [
+            Position(symbol, rng.randint(1, 500), rng.uniform(10, 500), rng.uniform(10, 500))
+            for symbol in rng.sample(SYMBOLS, n_positions)
+        ]
+        bots.append(Bot(
+            id=f"bot-{i}",
+            name=f"Bot {i}",
+            type="free_agent",
+            cash=rng.uniform(0, 100000),
+            total_value=100000.0,
+            positions=positions,
+            last_commentary="x" * 500,
+            updated_at=datetime.utcnow(),
+        ))
+    trades = [
+        Trade(
+            bot_id=f"bot-{rng.randrange(n_bots)}",
+            symbol=rng.choice(SYMBOLS),
+            side=rng.choice(["BUY", "SELL"]),
+            shares=rng.randint(1, 100),
+            price=rng.uniform(10, 500),
+            round=rng.randint(1, 100),
+            commentary="y" * 200,
+            executed_at=datetime.utcnow(),
+            id=i,
+        )
+        for i in range(n_trades)
+    ]
+    state = GameState(status="running", current_round=100, bots=bots, recent_trades=trades)
+    state.mark_clean()
+    return state
+
+
+def play_round(state: GameState, rng: random.Random) -> None:
+    """What a round changes: commentary (saved per bot), then fresh marks."""
+    state.current_round += 1
+    for bot in state.bots:
+        bot.last_commentary = f"round {state.current_round}: " + "z" * 500
+        bot.updated_at = datetime.utcnow()
+        bot.mark_clean()  # update_bot already wrote it
+    prices = {symbol: rng.uniform(10, 500) for symbol in SYMBOLS}
+    mark_to_market(state.bots, prices)
+    state.updated_at = datetime.utcnow()
+
+
+def measure(fn, runs: int) -> tuple[float, int]:
+    """Median seconds to build an encoded body, and its size in bytes."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        body = fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times), len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full vs. diff state saves")
+    parser.add_argument("--bots", default="5,50,500", help="Comma-separated bot counts")
+    parser.add_argument("--trades", default="50,1000,10000", help="Comma-separated trade counts (buffer keeps the newest)")
+    parser.add_argument("--positions", type=int, default=10, help="Positions per bot")
+    parser.add_argument("--runs", type=int, default=20, help="Timing runs per case (median reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Bots':>5} {'Trades':>7} {'Full KB':>9} {'Patch KB':>9} "
+          f"{'Full ms':>9} {'Patch ms':>9} {'Size x':>7} {'Time x':>7}")
+    print("-" * 70)
+    for n_bots in (int(n) for n in args.bots.split(",")):
+        for n_trades in (int(n) for n in args.trades.split(",")):
+            rng = random.Random(args.seed)
+            state = build_state(n_bots, args.positions, n_trades, rng)
+            play_round(state, rng)
+
+            full_s, full_bytes = measure(lambda: encode_state(state, include_trades=False), args.runs)
+            patch_s, patch_bytes = measure(lambda: encode_json(state.diff()), args.runs)
+            print(f"{n_bots:>5} {n_trades:>7} {full_bytes / 1024:>9.1f} {patch_bytes / 1024:>9.1f} "
+                  f"{full_s * 1000:>9.2f} {patch_s * 1000:>9.2f} "
+                  f"{full_bytes / patch_bytes:>7.1f} {full_s / patch_s:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
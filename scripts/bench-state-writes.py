@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Benchmark a round's API traffic: separate blocking calls vs. async round commits.
+
+Spawns the local API stand-in (local_api) with N bots and replays the
+calls TradingArena makes in a round, minus Claude and price fetching:
+load the state, increment the round, fetch credentials, then per bot
+store the commentary, broadcast it and republish the round context, and
+finally record snapshots, save the marked-to-market state and broadcast
+the leaderboard. The blocking path sends each of those as its own call,
+one after another, as the orchestrator used to. The async path does what
+TradingArena now does: it fetches credentials together and sends each bot
+turn's writes, and the round's final ones, as one commit_round request.
+
+Loopback has next to no latency, so --rtt-ms adds a simulated network
+round trip to every request (the Workers API is tens of ms away).
+
+Usage:
+    python scripts/bench-state-writes.py
+    python scripts/bench-state-writes.py --bots 10,50,200 --rtt-ms 0,30 --runs 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from orchestrator.src.async_state import MAX_CONNECTIONS, AsyncStateManager
+from orchestrator.src.config import Config
+from orchestrator.src.state import StateManager
+
+PROJECT_ROOT = Path(__file__).parent.parent
+API_KEY = "bench"
+SYMBOLS = [f"SYM{i:02d}" for i in range(40)]
+
+
+class _DelayedTransport(httpx.HTTPTransport):
+    def __init__(self, rtt: float, **kwargs):
+        super().__init__(**kwargs)
+        self.rtt = rtt
+
+    def handle_request(self, request):
+        time.sleep(self.rtt)
+        return super().handle_request(request)
+
+
+class _AsyncDelayedTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, rtt: float, **kwargs):
+        super().__init__(**kwargs)
+        self.rtt = rtt
+
+    async def handle_async_request(self, request):
+        await asyncio.sleep(self.rtt)
+        return await super().handle_async_request(request)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_api(workdir: Path) -> tuple[subprocess.Popen, str]:
+    """Run local_api on a free port and wait until it answers."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}"
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "local_api.src.app", "--db", str(workdir / "api.db"),
+         "--port", str(port), "--api-key", API_KEY],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    end = time.monotonic() + 30
+    while time.monotonic() < end:
+        try:
+            if httpx.get(f"{url}/", timeout=1.0).status_code == 200:
+                return proc, url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("local_api did not start")
+
+
+def seed(url: str, n_bots: int, rng: random.Random) -> None:
+    """Replace the game with N running bots holding a few positions each."""
+    bots = [
+        {
+            "id": f"bot-{i}",
+            "name": f"Bot {i}",
+            "type": "free_agent",
+            "cash": 50000,
+            "total_value": 100000,
+            "enabled": True,
+            "positions": [
+                {"symbol": symbol, "shares": rng.randint(1, 100),
+                 "avg_cost": rng.uniform(10, 500), "current_price": rng.uniform(10, 500)}
+                for symbol in rng.sample(SYMBOLS, 5)
+            ],
+        }
+        for i in range(n_bots)
+    ]
+    httpx.post(
+        f"{url}/api/state",
+        json={"status": "running", "current_round": 1, "bots": bots},
+        headers={"Authorization": f"Bearer {API_KEY}"},
+        timeout=60.0,
+    ).raise_for_status()
+
+
+def _mark(state, rng: random.Random) -> None:
+    for bot in state.bots:
+        for position in bot.positions:
+            position.current_price = rng.uniform(10, 500)
+        bot.total_value = bot.cash + sum(p.shares * p.current_price for p in bot.positions)
+
+
+def blocking_round(manager: StateManager, rng: random.Random) -> None:
+    state = manager.load_state()
+    state.current_round = manager.increment_round()
+    manager.get_shared_context()
+    for bot in state.bots:
+        manager.get_bot_credentials(bot.id)
+        bot.last_commentary = f"Round {state.current_round}: " + "x" * 500
+        manager.update_bot(bot)
+        manager.push_update("bot_update", {"bot_id": bot.id, "commentary": bot.last_commentary})
+        manager.get_shared_context()
+    _mark(state, rng)
+    manager.record_snapshots(state.current_round, state.bots)
+    manager.save_state(state)
+    manager.push_update("leaderboard", {"round": state.current_round})
+
+
+async def async_round(manager: AsyncStateManager, rng: random.Random) -> None:
+    state = await manager.load_state()
+    state.current_round = await manager.increment_round()
+    await manager.get_shared_context()
+    await asyncio.gather(*(manager.get_bot_credentials(bot.id) for bot in state.bots))
+    for bot in state.bots:
+        bot.last_commentary = f"Round {state.current_round}: " + "x" * 500
+        await manager.commit_round(
+            state, broadcasts=[("bot_update", {"bot_id": bot.id, "commentary": bot.last_commentary})]
+        )
+        await manager.get_shared_context()
+    _mark(state, rng)
+    await manager.commit_round(
+        state,
+        broadcasts=[("leaderboard", {"round": state.current_round})],
+        snapshot_bots=state.bots,
+    )
+
+
+def time_blocking(config: Config, rtt: float, runs: int, rng: random.Random) -> float:
+    times = []
+    for _ in range(runs):
+        manager = StateManager(config)
+        if rtt:
+            manager._client = httpx.Client(timeout=30.0, transport=_DelayedTransport(rtt))
+        started = time.perf_counter()
+        blocking_round(manager, rng)
+        times.append(time.perf_counter() - started)
+        manager.close()
+    return statistics.median(times)
+
+
+def time_async(config: Config, rtt: float, runs: int, rng: random.Random) -> float:
+    async def one() -> float:
+        manager = AsyncStateManager(config)
+        if rtt:
+            limits = httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS)
+            manager._client = httpx.AsyncClient(
+                timeout=30.0,
+                transport=_AsyncDelayedTransport(rtt, http2=True, limits=limits),
+            )
+        try:
+            started = time.perf_counter()
+            await async_round(manager, rng)
+            return time.perf_counter() - started
+        finally:
+            await manager.close()
+
+    return statistics.median(asyncio.run(one()) for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark blocking vs. async round API traffic")
+    parser.add_argument("--bots", default="10,50,200", help="Comma-separated bot counts")
+    parser.add_argument("--rtt-ms", default="0,30", help="Comma-separated simulated round trips (ms)")
+    parser.add_argument("--runs", type=int, default=3, help="Rounds timed per case (median reported)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="arena-bench-writes-"))
+    # Keep the state cache out of the real one
+    os.environ["ARENA_CACHE_DIR"] = str(workdir / "cache")
+    proc, url = start_api(workdir)
+    config = Config(cf_api_url=url, cf_api_key=API_KEY, finnhub_api_key="unused")
+    try:
+        print(f"{'Bots':>5} {'RTT ms':>7} {'Requests':>9} {'Blocking s':>11} "
+              f"{'Requests':>9} {'Async s':>8} {'x':>6}")
+        print("-" * 62)
+        for n_bots in (int(n) for n in args.bots.split(",")):
+            rng = random.Random(args.seed)
+            seed(url, n_bots, rng)
+            requests = 6 + 4 * n_bots
+            commits = 4 + 3 * n_bots
+            for rtt_ms in (float(r) for r in args.rtt_ms.split(",")):
+                blocking = time_blocking(config, rtt_ms / 1000, args.runs, rng)
+                concurrent = time_async(config, rtt_ms / 1000, args.runs, rng)
+                print(f"{n_bots:>5} {rtt_ms:>7.0f} {requests:>9} {blocking:>11.2f} "
+                      f"{commits:>9} {concurrent:>8.2f} {blocking / concurrent:>6.1f}")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""Load-test the MCP servers with synthetic bot sessions over SSE.
+
+Against servers that are already running:
+    python scripts/loadtest.py --target http://localhost:8081 --target http://localhost:8082
+
+Against freshly spawned servers with every upstream stubbed locally
+(simulated Alpaca/Finnhub from the backtester, local_api for the Workers API):
+    python scripts/loadtest.py --spawn 10 --sessions 50 --duration 60
+
+Results are written as JSON; pass --compare to diff against an earlier run.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import anyio
+import httpx
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BOT_IDS = ["turtle", "degen", "boomer", "quant", "doomer", "gary", "diana", "mel", "vince", "rei"]
+SYMBOLS = ["SPY", "AAPL", "MSFT", "NVDA", "KO", "JNJ", "TSLA", "AMD", "SQQQ", "TQQQ"]
+API_KEY = "loadtest"
+
+# Relative call frequencies, roughly what a bot does in one round
+DEFAULT_MIX = {
+    "get_round_context": 10,
+    "get_portfolio": 15,
+    "get_price": 15,
+    "get_prices": 15,
+    "get_history": 8,
+    "get_leaderboard": 6,
+    "place_order": 10,
+    "recall": 6,
+    "remember": 4,
+    "send_message": 4,
+    "get_messages": 4,
+    "get_all_portfolios": 3,
+}
+
+
+def tool_arguments(tool: str, rng: random.Random) -> dict:
+    """Plausible arguments for a tool call."""
+    if tool == "get_price":
+        return {"symbol": rng.choice(SYMBOLS)}
+    if tool == "get_prices":
+        return {"symbols": rng.sample(SYMBOLS, 4)}
+    if tool == "get_history":
+        return {"symbol": rng.choice(SYMBOLS), "days": 30}
+    if tool == "place_order":
+        return {
+            "symbol": rng.choice(SYMBOLS[:6]),
+            "qty": rng.randint(1, 5),
+            "side": rng.choice(["buy", "buy", "sell"]),
+            "reason": "RSI oversold, MACD crossing up",
+        }
+    if tool == "recall":
+        return {"count": 20}
+    if tool == "remember":
+        return {"type": "note", "content": f"Load test note {rng.random():.6f}", "importance": rng.randint(1, 10)}
+    if tool == "send_message":
+        return {"content": "Load test message"}
+    if tool == "get_messages":
+        return {"limit": 30}
+    return {}
+
+
+def percentile(sorted_values: list[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    k = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+def summarize(samples: list[float]) -> dict:
+    """Latency summary in milliseconds."""
+    values = sorted(s * 1000 for s in samples)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 2),
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+        "max_ms": round(values[-1], 2),
+    }
+
+
+class Recorder:
+    """Collects per-tool latencies and errors."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.error_samples: dict[str, str] = {}
+        self.session_failures = 0
+
+    def record(self, tool: str, seconds: float, error: Optional[str] = None) -> None:
+        self.latencies[tool].append(seconds)
+        if error:
+            self.errors[tool] += 1
+            self.error_samples.setdefault(tool, error[:200])
+
+
+def _result_error(result) -> Optional[str]:
+    """Error text from a tool result, or None if it succeeded."""
+    text = "".join(getattr(c, "text", "") for c in result.content)
+    if result.isError:
+        return text or "isError"
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(payload, dict) and payload.get("error"):
+        return str(payload["error"])
+    return None
+
+
+async def run_session(
+    url: str,
+    mix: dict[str, int],
+    recorder: Recorder,
+    deadline: float,
+    think_time: float,
+    seed: int,
+) -> None:
+    """One synthetic bot: connect over SSE and call tools until the deadline."""
+    rng = random.Random(seed)
+    tools = list(mix)
+    weights = [mix[t] for t in tools]
+
+    try:
+        async with sse_client(f"{url.rstrip('/')}/sse", timeout=30) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                while time.monotonic() < deadline:
+                    tool = rng.choices(tools, weights)[0]
+                    start = time.perf_counter()
+                    try:
+                        result = await session.call_tool(tool, tool_arguments(tool, rng))
+                        error = _result_error(result)
+                    except (anyio.ClosedResourceError, anyio.EndOfStream):
+                        raise
+                    except Exception as e:
+                        error = f"{type(e).__name__}: {e}"
+                    recorder.record(tool, time.perf_counter() - start, error)
+                    if think_time:
+                        await asyncio.sleep(rng.uniform(0, 2 * think_time))
+    except BaseException as e:
+        if isinstance(e, (asyncio.CancelledError, KeyboardInterrupt)):
+            raise
+        recorder.session_failures += 1
+        recorder.error_samples.setdefault("session", f"{type(e).__name__}: {e}"[:200])
+
+
+async def monitor_loop_lag(deadline: float, interval: float, samples: list[float]) -> None:
+    """Measure how late this process's event loop wakes up."""
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.perf_counter() - start - interval))
+
+
+async def probe_servers(urls: list[str], deadline: float, interval: float, samples: list[float]) -> None:
+    """Time /health on each server - a proxy for the server's event-loop lag."""
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        while time.monotonic() < deadline:
+            for url in urls:
+                start = time.perf_counter()
+                try:
+                    await client.get(f"{url.rstrip('/')}/health")
+                    samples.append(time.perf_counter() - start)
+                except httpx.HTTPError:
+                    pass
+            await asyncio.sleep(interval)
+
+
+async def run_load(args, urls: list[str], mix: dict[str, int]) -> dict:
+    """Run every session concurrently and build the results document."""
+    recorder = Recorder()
+    loop_lag: list[float] = []
+    server_lag: list[float] = []
+
+    started = time.monotonic()
+    deadline = started + args.ramp_up + args.duration
+
+    async def delayed_session(i: int) -> None:
+        await asyncio.sleep(args.ramp_up * i / max(args.sessions, 1))
+        await run_session(urls[i % len(urls)], mix, recorder, deadline, args.think_time, args.seed + i)
+
+    await asyncio.gather(
+        monitor_loop_lag(deadline, 0.05, loop_lag),
+        probe_servers(urls, deadline, 0.5, server_lag),
+        *(delayed_session(i) for i in range(args.sessions)),
+    )
+    elapsed = time.monotonic() - started
+
+    total_calls = sum(len(v) for v in recorder.latencies.values())
+    total_errors = sum(recorder.errors.values())
+    all_latencies = [s for v in recorder.latencies.values() for s in v]
+
+    return {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "targets": urls,
+            "sessions": args.sessions,
+            "duration_s": args.duration,
+            "ramp_up_s": args.ramp_up,
+            "think_time_s": args.think_time,
+            "spawned": args.spawn,
+            "mix": mix,
+        },
+        "elapsed_s": round(elapsed, 2),
+        "totals": {
+            "calls": total_calls,
+            "errors": total_errors,
+            "session_failures": recorder.session_failures,
+            "throughput_rps": round(total_calls / elapsed, 2) if elapsed else 0,
+            **summarize(all_latencies),
+        },
+        "tools": {
+            tool: {**summarize(samples), "errors": recorder.errors.get(tool, 0)}
+            for tool, samples in sorted(recorder.latencies.items())
+        },
+        "client_loop_lag": summarize(loop_lag),
+        "server_health_latency": summarize(server_lag),
+        "error_samples": recorder.error_samples,
+    }
+
+
+# ==================== STUBBED ENVIRONMENT ====================
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for(url: str, timeout: float = 30.0) -> None:
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Timed out waiting for {url}")
+
+
+class StubEnvironment:
+    """Local API + N MCP servers with simulated brokerage and market data."""
+
+    def __init__(self, servers: int):
+        self.servers = servers
+        self.workdir = Path(tempfile.mkdtemp(prefix="arena-loadtest-"))
+        self.processes: list[subprocess.Popen] = []
+        self.urls: list[str] = []
+
+    def _spawn(self, args: list[str], env: dict) -> None:
+        log = open(self.workdir / f"proc-{len(self.processes)}.log", "w")
+        self.processes.append(subprocess.Popen(
+            [sys.executable, *args],
+            cwd=PROJECT_ROOT,
+            env={**os.environ, **env},
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        ))
+
+    def _write_candles(self, now: datetime) -> int:
+        """Hourly random-walk candles for the last 60 days, ending at now."""
+        from mcp_server.src.backtest import CandleStore
+
+        store = CandleStore(str(self.workdir / "candles"))
+        rng = random.Random(42)
+        end = int(now.timestamp())
+        start = end - 60 * 86400
+        for symbol in SYMBOLS:
+            price = rng.uniform(20, 500)
+            candles = {"s": "ok", "t": [], "o": [], "h": [], "l": [], "c": [], "v": []}
+            for ts in range(start, end, 3600):
+                close = price * (1 + rng.gauss(0, 0.004))
+                candles["t"].append(ts)
+                candles["o"].append(price)
+                candles["h"].append(max(price, close) * 1.001)
+                candles["l"].append(min(price, close) * 0.999)
+                candles["c"].append(close)
+                candles["v"].append(rng.randint(1000, 100000))
+                price = close
+            store.save(symbol, candles, "60")
+        return end
+
+    def start(self) -> list[str]:
+        from mcp_server.src.backtest import MARKET_TZ, BacktestConfig, BacktestSession
+
+        # Most recent weekday at 11:00 ET, so the simulated market is open
+        now = datetime.now(MARKET_TZ).replace(hour=11, minute=0, second=0, microsecond=0)
+        while now.weekday() >= 5:
+            now -= timedelta(days=1)
+        clock_ts = self._write_candles(now)
+
+        run_dir = self.workdir / "run"
+        BacktestSession.create(
+            str(run_dir),
+            BacktestConfig(data_dir=str(self.workdir / "candles"), starting_cash=10_000_000),
+            clock_ts,
+        )
+
+        api_port = _free_port()
+        api_url = f"http://127.0.0.1:{api_port}"
+        self._spawn(
+            ["-m", "local_api.src.app", "--db", str(self.workdir / "api.db"),
+             "--port", str(api_port), "--api-key", API_KEY],
+            {},
+        )
+        _wait_for(f"{api_url}/")
+
+        bots = BOT_IDS[: max(self.servers, 1)]
+        httpx.post(
+            f"{api_url}/api/state",
+            json={
+                "status": "running",
+                "current_round": 1,
+                "bots": [
+                    {"id": b, "name": b.title(), "type": "baseline", "cash": 100000,
+                     "total_value": 100000, "enabled": True, "positions": []}
+                    for b in BOT_IDS
+                ],
+            },
+            headers={"Authorization": f"Bearer {API_KEY}"},
+            timeout=10.0,
+        ).raise_for_status()
+
+        for i in range(self.servers):
+            port = _free_port()
+            self._spawn(
+                ["-m", "mcp_server.src.server_http", "--port", str(port)],
+                {
+                    "BOT_ID": bots[i % len(bots)],
+                    "BACKTEST_RUN_DIR": str(run_dir),
+                    "CF_API_URL": api_url,
+                    "CF_API_KEY": API_KEY,
+                    "ARENA_CACHE_DIR": str(self.workdir / "cache"),
+                    "TOOL_CALL_LOG_DIR": str(self.workdir / "tool-calls"),
+                    "WRITE_QUEUE_DIR": str(self.workdir / "write-queue"),
+                },
+            )
+            self.urls.append(f"http://127.0.0.1:{port}")
+
+        for url in self.urls:
+            _wait_for(f"{url}/ready")
+        return self.urls
+
+    def stop(self) -> None:
+        for proc in self.processes:
+            proc.terminate()
+        for proc in self.processes:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+# ==================== REPORTING ====================
+
+
+def print_report(results: dict, baseline: Optional[dict] = None) -> None:
+    """Print per-tool latency, optionally with deltas against a baseline run."""
+
+    def delta(current, previous) -> str:
+        if current is None or previous in (None, 0):
+            return ""
+        return f" ({(current / previous - 1) * 100:+.0f}%)"
+
+    base_tools = (baseline or {}).get("tools", {})
+    totals = results["totals"]
+    base_totals = (baseline or {}).get("totals", {})
+
+    print("\n" + "=" * 84)
+    print(f"{'Tool':<20} {'Calls':>7} {'Err':>5} {'p50 ms':>16} {'p95 ms':>16} {'p99 ms':>16}")
+    print("-" * 84)
+    for tool, s in results["tools"].items():
+        b = base_tools.get(tool, {})
+        print(
+            f"{tool:<20} {s['count']:>7} {s['errors']:>5} "
+            f"{str(s.get('p50_ms')) + delta(s.get('p50_ms'), b.get('p50_ms')):>16} "
+            f"{str(s.get('p95_ms')) + delta(s.get('p95_ms'), b.get('p95_ms')):>16} "
+            f"{str(s.get('p99_ms')) + delta(s.get('p99_ms'), b.get('p99_ms')):>16}"
+        )
+    print("-" * 84)
+    print(
+        f"Throughput: {totals['throughput_rps']} calls/s{delta(totals['throughput_rps'], base_totals.get('throughput_rps'))}"
+        f"   Calls: {totals['calls']}   Errors: {totals['errors']}   Failed sessions: {totals['session_failures']}"
+    )
+    lag = results["client_loop_lag"]
+    health = results["server_health_latency"]
+    print(f"Client loop lag p99: {lag.get('p99_ms')} ms   Server /health p99: {health.get('p99_ms')} ms")
+    print("=" * 84)
+    for tool, sample in results["error_samples"].items():
+        print(f"  {tool}: {sample}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test MCP servers with synthetic SSE sessions")
+    parser.add_argument("--target", action="append", default=[], help="MCP server base URL (repeatable)")
+    parser.add_argument("--spawn", type=int, default=0, help="Spawn N servers with stubbed upstreams")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent SSE sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of steady load")
+    parser.add_argument("--ramp-up", type=float, default=2.0, help="Seconds to open all sessions")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between calls per session")
+    parser.add_argument("--mix", help='Tool weights as JSON, e.g. \'{"get_price": 5, "place_order": 1}\'')
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Results JSON path (default: loadtest-<timestamp>.json)")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    if not args.target and not args.spawn:
+        parser.error("Give --target URLs or --spawn N")
+
+    mix = json.loads(args.mix) if args.mix else DEFAULT_MIX
+
+    env = None
+    urls = list(args.target)
+    if args.spawn:
+        print(f"Spawning local API and {args.spawn} MCP servers with stubbed upstreams...")
+        env = StubEnvironment(args.spawn)
+        urls += env.start()
+
+    try:
+        print(f"Running {args.sessions} sessions against {len(urls)} servers for {args.duration}s...")
+        results = asyncio.run(run_load(args, urls, mix))
+    finally:
+        if env is not None:
+            env.stop()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_report(results, baseline)
+
+    output = args.output or f"loadtest-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Profile MCP server startup: slowest imports and time to listen / ready.
+
+Usage:
+    python scripts/profile-imports.py                       # import profile + startup timing
+    python scripts/profile-imports.py --module mcp_server.src.server --top 30
+    python scripts/profile-imports.py --no-startup
+"""
+
+import argparse
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parent.parent
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def import_profile(module: str, env: dict) -> list[tuple[str, int, int, int]]:
+    """(name, self_us, cumulative_us, depth) for every module imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def startup_timing(env: dict, timeout: float = 60.0) -> dict:
+    """Seconds from spawning server_http until /health and /ready answer 200."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "mcp_server.src.server_http", "--port", str(port)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    timings: dict = {}
+    try:
+        with httpx.Client(timeout=1.0) as client:
+            while time.perf_counter() - started < timeout and "ready" not in timings:
+                for name in ("health", "ready"):
+                    if name in timings:
+                        continue
+                    try:
+                        response = client.get(f"http://127.0.0.1:{port}/{name}")
+                    except httpx.HTTPError:
+                        break
+                    if response.status_code == 200:
+                        timings[name] = time.perf_counter() - started
+                        if name == "ready":
+                            timings["server"] = response.json().get("timings", {})
+                time.sleep(0.02)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=5)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile MCP server imports and startup")
+    parser.add_argument("--module", default="mcp_server.src.server_http", help="Module to import")
+    parser.add_argument("--top", type=int, default=20, help="Slowest top-level packages to show")
+    parser.add_argument("--no-startup", action="store_true", help="Skip the server startup timing")
+    args = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "BOT_ID": os.environ.get("BOT_ID", "profile"),
+        "TOOL_CALL_LOG_DIR": "",
+        "WRITE_QUEUE_DIR": "",
+    }
+
+    rows = import_profile(args.module, env)
+    total = next((cum for name, _s, cum, _d in rows if name == args.module), 0)
+    packages: dict[str, int] = {}
+    for name, self_us, _cum, _depth in rows:
+        top = name.split(".")[0]
+        packages[top] = packages.get(top, 0) + self_us
+
+    print(f"import {args.module}: {total / 1000:.1f} ms")
+    print(f"\n{'Package':<28} {'Self ms':>9} {'Share':>7}")
+    print("-" * 46)
+    for name, us in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[: args.top]:
+        print(f"{name:<28} {us / 1000:>9.1f} {us / total * 100 if total else 0:>6.1f}%")
+
+    if not args.no_startup:
+        timings = startup_timing(env)
+        print("\nserver_http startup")
+        print("-" * 46)
+        for name in ("health", "ready"):
+            value = timings.get(name)
+            print(f"{'listening' if name == 'health' else 'ready':<28} "
+                  f"{f'{value * 1000:.0f} ms' if value is not None else 'timed out':>9}")
+        for name, value in timings.get("server", {}).items():
+            print(f"  {name:<26} {value}")
+
+
+if __name__ == "__main__":
+    main()
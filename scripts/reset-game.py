@@ -8,8 +8,13 @@ import sys
 import httpx
 from dotenv import load_dotenv
 
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 load_dotenv()
 
+from orchestrator.src.state_cache import StateCache
+
 
 def reset_game(api_url: str, api_key: str, starting_cash: float = 100000.0):
     """Reset the game to initial state."""
@@ -21,14 +26,11 @@ def reset_game(api_url: str, api_key: str, starting_cash: float = 100000.0):
     print("Fetching current state...")
 
     try:
-        # Get current bots
-        response = httpx.get(
-            f"{api_url}/api/state",
-            headers=headers,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        current_state = response.json()
+        # Get current bots (a 304 if the locally cached state is current)
+        cache = StateCache(api_url)
+        with httpx.Client(timeout=30.0) as client:
+            cache.load(client, headers)
+        current_state = cache.data
 
         # Reset each bot
         bots = []
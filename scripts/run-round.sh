@@ -44,8 +44,8 @@ LOG_FILE="$LOG_DIR/round-$(date +%Y%m%d-%H%M%S).log"
     RUNNING_SERVERS=$(lsof -i :8081-8090 2>/dev/null | grep LISTEN | wc -l || echo "0")
     if [ "$RUNNING_SERVERS" -lt 5 ]; then
         echo "Starting MCP servers..."
-        "$SCRIPT_DIR/start_mcp_servers.sh" --all
-        sleep 5  # Give servers time to start
+        # Returns once every server reports /ready
+        "$SCRIPT_DIR/start_mcp_servers.sh" --all || echo "WARNING: Not all MCP servers are ready"
     else
         echo "MCP servers already running ($RUNNING_SERVERS ports)"
     fi
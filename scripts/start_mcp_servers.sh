@@ -62,6 +62,24 @@ start_bot_server() {
     echo "  Started with PID $!"
 }
 
+# Wait until each given port answers /ready (imports done, clients warm)
+wait_ready() {
+    local timeout="${MCP_READY_TIMEOUT:-60}"
+    local deadline=$((SECONDS + timeout))
+    local port
+
+    for port in "$@"; do
+        until curl -sf "http://127.0.0.1:$port/ready" > /dev/null 2>&1; do
+            if [ "$SECONDS" -ge "$deadline" ]; then
+                echo "  Server on port $port not ready after ${timeout}s (see /tmp/mcp-*.log)"
+                return 1
+            fi
+            sleep 0.2
+        done
+    done
+    echo "  Ready: ports $*"
+}
+
 # Parse command line args
 if [ "$1" == "--bot" ] && [ -n "$2" ]; then
     # Start single bot
@@ -72,12 +90,13 @@ if [ "$1" == "--bot" ] && [ -n "$2" ]; then
         exit 1
     fi
     start_bot_server "$bot_id" "$port"
+    wait_ready "$port"
 elif [ "$1" == "--all" ]; then
-    # Start all bots
+    # Start all bots (in parallel - each waits on its own imports)
     for bot_id in "${!BOT_PORTS[@]}"; do
         start_bot_server "$bot_id" "${BOT_PORTS[$bot_id]}"
-        sleep 0.5  # Brief delay between starts
     done
+    wait_ready "${BOT_PORTS[@]}"
     echo "All MCP servers started. Check logs in /tmp/mcp-*.log"
 else
     echo "Usage: $0 [--bot <bot_id>] [--all]"
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Per-round report of MCP tool calls, from the servers' call logs.
+
+Each MCP server appends one JSON line per tool call to
+<TOOL_CALL_LOG_DIR>/<bot>.jsonl, tagged with the orchestrator's run ID and
+round. This groups them by bot so the heaviest upstream users stand out.
+
+Usage:
+    python scripts/tool-call-report.py                # latest round
+    python scripts/tool-call-report.py --round 412
+    python scripts/tool-call-report.py --round 412 --by-tool
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_LOG_DIR = Path(__file__).parent.parent / "logs" / "tool-calls"
+
+
+def load_calls(log_dir: Path) -> list[dict]:
+    """Read every call record in the log directory."""
+    calls = []
+    for path in sorted(log_dir.glob("*.jsonl")):
+        with open(path) as f:
+            for line in f:
+                try:
+                    calls.append(json.loads(line))
+                except ValueError:
+                    continue  # Partially written line
+    return calls
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def aggregate(calls: list[dict], key: str) -> list[dict]:
+    """Counts, latency and upstream usage grouped by a record field."""
+    groups: dict[str, list[dict]] = {}
+    for c in calls:
+        groups.setdefault(c.get(key) or "?", []).append(c)
+
+    rows = []
+    for name, group in groups.items():
+        durations = [c["duration"] for c in group]
+        upstreams: dict[str, int] = {}
+        for c in group:
+            for upstream, (count, _seconds) in c.get("upstreams", {}).items():
+                upstreams[upstream] = upstreams.get(upstream, 0) + count
+        rows.append({
+            key: name,
+            "calls": len(group),
+            "errors": sum(1 for c in group if c.get("error")),
+            "p50_ms": percentile(durations, 50) * 1000,
+            "p95_ms": percentile(durations, 95) * 1000,
+            "total_s": sum(durations),
+            "upstream_calls": sum(c.get("upstream_calls", 0) for c in group),
+            "kb_in": sum(c.get("bytes_in", 0) for c in group) / 1024,
+            "upstreams": upstreams,
+        })
+    return sorted(rows, key=lambda r: r["upstream_calls"], reverse=True)
+
+
+def print_table(rows: list[dict], key: str) -> None:
+    upstream_names = sorted({u for r in rows for u in r["upstreams"]})
+    header = (
+        f"{key.replace('_', ' ').title():<20} {'Calls':>6} {'Err':>4} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'Total s':>8} {'Upstream':>9} {'KB in':>8}  "
+        + " ".join(f"{u:>12}" for u in upstream_names)
+    )
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(
+            f"{r[key]:<20} {r['calls']:>6} {r['errors']:>4} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+            f"{r['total_s']:>8.1f} {r['upstream_calls']:>9} {r['kb_in']:>8.1f}  "
+            + " ".join(f"{r['upstreams'].get(u, 0):>12}" for u in upstream_names)
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-round MCP tool call report")
+    parser.add_argument(
+        "--dir",
+        default=os.environ.get("TOOL_CALL_LOG_DIR") or str(DEFAULT_LOG_DIR),
+        help="Call log directory (default: TOOL_CALL_LOG_DIR or logs/tool-calls)",
+    )
+    parser.add_argument("--round", type=int, help="Round to report (default: latest)")
+    parser.add_argument("--run-id", help="Restrict to one orchestrator run ID")
+    parser.add_argument("--by-tool", action="store_true", help="Also break down by tool")
+    args = parser.parse_args()
+
+    calls = [c for c in load_calls(Path(args.dir)) if c.get("round") is not None]
+    if not calls:
+        print(f"No correlated tool calls found in {args.dir}")
+        sys.exit(1)
+
+    round_num = args.round if args.round is not None else max(c["round"] for c in calls)
+    calls = [c for c in calls if c["round"] == round_num]
+    if args.run_id:
+        calls = [c for c in calls if c.get("run_id") == args.run_id]
+    if not calls:
+        print(f"No tool calls for round {round_num}")
+        sys.exit(1)
+
+    run_ids = sorted({c.get("run_id") or "?" for c in calls})
+    print("=" * 80)
+    print(f"ROUND {round_num} - {len(calls)} tool calls (run {', '.join(run_ids)})")
+    print("=" * 80)
+    print()
+    print_table(aggregate(calls, "bot_id"), "bot_id")
+
+    if args.by_tool:
+        print()
+        print_table(aggregate(calls, "tool"), "tool")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Summarize round traces written by the orchestrator.
+
+Usage:
+    python scripts/trace-summary.py                 # latest round, trend and sessions over last 10
+    python scripts/trace-summary.py --round 412     # one specific round
+    python scripts/trace-summary.py --last 30 --top 5
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+from orchestrator.src.tracing import (
+    bot_timings,
+    list_traces,
+    load_trace,
+    phase_totals,
+    round_duration,
+)
+
+load_dotenv()
+
+BOT_PHASES = ["claude", "commit_round"]
+
+
+def print_round(round_num: int, spans: list, top: int) -> None:
+    """Slowest phases and bots for one round."""
+    total = round_duration(spans)
+
+    print("=" * 72)
+    print(f"ROUND {round_num} - {total:.1f}s")
+    print("=" * 72)
+
+    print("\nSlowest phases (summed across bots)")
+    print("-" * 72)
+    for name, seconds in list(phase_totals(spans).items())[:top]:
+        share = seconds / total * 100 if total else 0
+        print(f"  {name:<20} {seconds:>9.2f}s  {share:>5.1f}%")
+
+    print("\nSlowest bots")
+    print("-" * 72)
+    print(f"  {'Bot':<10} {'Total':>8} " + " ".join(f"{p:>12}" for p in BOT_PHASES)
+          + f" {'1st action':>11} {'Last trade':>11}  Status")
+    for bot in bot_timings(spans)[:top]:
+        phases = " ".join(f"{bot['phases'].get(p, 0):>11.2f}s" for p in BOT_PHASES)
+        marks = " ".join(
+            f"{bot[k]:>10.1f}s" if bot[k] is not None else f"{'-':>11}"
+            for k in ("first_action", "last_trade")
+        )
+        print(f"  {bot['bot_id'] or '?':<10} {bot['duration']:>7.1f}s {phases} {marks}  {bot['status']}")
+
+    errors = [s for s in spans if s.status == "error"]
+    if errors:
+        print("\nErrors")
+        print("-" * 72)
+        for s in errors:
+            print(f"  {s.name} {s.attributes.get('bot_id', '')}: {s.error}")
+
+
+def print_trend(traces: list, last: int) -> None:
+    """Round duration and where it went, over the last N rounds."""
+    print("\n" + "=" * 72)
+    print(f"TREND - last {min(last, len(traces))} rounds")
+    print("=" * 72)
+    print(f"  {'Round':>6} {'Total':>8} {'Bots':>5} {'Claude':>9} {'Other':>8}  Slowest bot")
+    for round_num, path in traces[-last:]:
+        spans = load_trace(path)
+        total = round_duration(spans)
+        bots = bot_timings(spans)
+        claude = sum(b["phases"].get("claude", 0) for b in bots)
+        slowest = f"{bots[0]['bot_id']} ({bots[0]['duration']:.0f}s)" if bots else "-"
+        print(f"  {round_num:>6} {total:>7.1f}s {len(bots):>5} {claude:>8.1f}s {total - claude:>7.1f}s  {slowest}")
+
+
+def print_sessions(traces: list, last: int) -> None:
+    """Bot turns in a new CLI session vs. a resumed one, over the last N rounds."""
+    groups: dict[str, list[dict]] = {"cold": [], "resumed": []}
+    for _, path in traces[-last:]:
+        for bot in bot_timings(load_trace(path)):
+            if bot["resumed"] is not None:
+                groups["resumed" if bot["resumed"] else "cold"].append(bot)
+    if not any(groups.values()):
+        return
+
+    def mean(bots: list[dict], key) -> str:
+        values = [key(b) for b in bots if key(b) is not None]
+        return f"{sum(values) / len(values):.1f}" if values else "-"
+
+    print("\n" + "=" * 72)
+    print(f"SESSIONS - last {min(last, len(traces))} rounds")
+    print("=" * 72)
+    print(f"  {'Mode':<8} {'Turns':>6} {'Claude s':>9} {'Tool calls':>11} {'1st action s':>13} {'Prompt ktok':>12}")
+    for mode, bots in groups.items():
+        tokens = mean(bots, lambda b: b["input_tokens"] / 1000 if b["input_tokens"] is not None else None)
+        print(f"  {mode:<8} {len(bots):>6} {mean(bots, lambda b: b['phases'].get('claude')):>9} "
+              f"{mean(bots, lambda b: b['tool_calls']):>11} {mean(bots, lambda b: b['first_action']):>13} "
+              f"{tokens:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize orchestrator round traces")
+    parser.add_argument(
+        "--dir",
+        default=os.environ.get("TRACE_DIR", "logs/traces"),
+        help="Trace directory (default: TRACE_DIR or logs/traces)",
+    )
+    parser.add_argument("--round", type=int, help="Round to detail (default: latest)")
+    parser.add_argument("--last", type=int, default=10, help="Rounds in the trend table")
+    parser.add_argument("--top", type=int, default=10, help="Rows in the slowest lists")
+    args = parser.parse_args()
+
+    traces = list_traces(args.dir)
+    if not traces:
+        print(f"No traces found in {args.dir}")
+        sys.exit(1)
+
+    by_round = dict(traces)
+    round_num = args.round if args.round is not None else traces[-1][0]
+    if round_num not in by_round:
+        print(f"No trace for round {round_num}")
+        sys.exit(1)
+
+    print_round(round_num, load_trace(by_round[round_num]), args.top)
+    print_trend(traces, args.last)
+    print_sessions(traces, args.last)
+
+
+if __name__ == "__main__":
+    main()
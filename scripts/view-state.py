@@ -1,77 +1,120 @@
 #!/usr/bin/env python3
-"""View current game state."""
+"""View current game state.
+
+Usage:
+    python scripts/view-state.py -v
+    python scripts/view-state.py --watch --interval 5    # redraw when the state changes
+"""
 
 import argparse
 import json
 import os
 import sys
+import time
 
 import httpx
 from dotenv import load_dotenv
 
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 load_dotenv()
 
+from orchestrator.src.state_cache import StateCache
 
-def view_state(api_url: str, verbose: bool = False):
-    """Fetch and display current game state."""
-    try:
-        response = httpx.get(
-            f"{api_url}/api/state",
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        state = response.json()
 
-        print("=" * 60)
-        print("TRADING ARENA - CURRENT STATE")
-        print("=" * 60)
+def print_state(state: dict, verbose: bool = False):
+    """Display a game state document."""
+    print("=" * 60)
+    print("TRADING ARENA - CURRENT STATE")
+    print("=" * 60)
 
-        print(f"\nStatus: {state['status'].upper()}")
-        print(f"Round: {state['current_round']}")
-        print(f"Starting Cash: ${state['starting_cash']:,.2f}")
+    print(f"\nStatus: {state['status'].upper()}")
+    print(f"Round: {state['current_round']}")
+    print(f"Starting Cash: ${state['starting_cash']:,.2f}")
 
-        print("\n" + "-" * 60)
-        print("LEADERBOARD")
-        print("-" * 60)
+    print("\n" + "-" * 60)
+    print("LEADERBOARD")
+    print("-" * 60)
 
-        # Sort bots by total value
-        bots = sorted(state.get("bots", []), key=lambda b: b["total_value"], reverse=True)
+    # Sort bots by total value
+    bots = sorted(state.get("bots", []), key=lambda b: b["total_value"], reverse=True)
 
-        for i, bot in enumerate(bots, 1):
-            return_pct = ((bot["total_value"] / state["starting_cash"]) - 1) * 100
-            sign = "+" if return_pct >= 0 else ""
-            enabled = "" if bot.get("enabled", True) else " [DISABLED]"
-            print(f"{i:2}. {bot['name']:10} ({bot['type']:10}) ${bot['total_value']:>12,.2f} ({sign}{return_pct:>6.2f}%){enabled}")
+    for i, bot in enumerate(bots, 1):
+        return_pct = ((bot["total_value"] / state["starting_cash"]) - 1) * 100
+        sign = "+" if return_pct >= 0 else ""
+        enabled = "" if bot.get("enabled", True) else " [DISABLED]"
+        print(f"{i:2}. {bot['name']:10} ({bot['type']:10}) ${bot['total_value']:>12,.2f} ({sign}{return_pct:>6.2f}%){enabled}")
 
-        if verbose:
-            print("\n" + "-" * 60)
-            print("POSITIONS")
-            print("-" * 60)
+    if verbose:
+        print("\n" + "-" * 60)
+        print("POSITIONS")
+        print("-" * 60)
 
-            for bot in bots:
-                positions = bot.get("positions", [])
-                if positions:
-                    print(f"\n{bot['name']}:")
-                    for pos in positions:
-                        price = pos.get("current_price") or pos.get("avg_cost")
-                        value = pos["shares"] * price
-                        print(f"  {pos['symbol']:6} {pos['shares']:>8.2f} shares @ ${pos['avg_cost']:>8.2f} (value: ${value:>10,.2f})")
+        for bot in bots:
+            positions = bot.get("positions", [])
+            if positions:
+                print(f"\n{bot['name']}:")
+                for pos in positions:
+                    price = pos.get("current_price") or pos.get("avg_cost")
+                    value = pos["shares"] * price
+                    print(f"  {pos['symbol']:6} {pos['shares']:>8.2f} shares @ ${pos['avg_cost']:>8.2f} (value: ${value:>10,.2f})")
+
+        print("\n" + "-" * 60)
+        print("RECENT TRADES")
+        print("-" * 60)
 
-            print("\n" + "-" * 60)
-            print("RECENT TRADES")
-            print("-" * 60)
+        trades = state.get("recent_trades", [])[:20]
+        for trade in trades:
+            time_str = trade.get("executed_at", "")[:16] if trade.get("executed_at") else ""
+            print(f"{time_str} | {trade['bot_id']:8} {trade['side']:4} {trade['shares']:>6} {trade['symbol']:6} @ ${trade['price']:>8.2f}")
 
-            trades = state.get("recent_trades", [])[:20]
-            for trade in trades:
-                time_str = trade.get("executed_at", "")[:16] if trade.get("executed_at") else ""
-                print(f"{time_str} | {trade['bot_id']:8} {trade['side']:4} {trade['shares']:>6} {trade['symbol']:6} @ ${trade['price']:>8.2f}")
+    print("\n" + "=" * 60)
 
-        print("\n" + "=" * 60)
 
+def view_state(api_url: str, verbose: bool = False, as_json: bool = False):
+    """Fetch and display current game state (revalidating the local copy)."""
+    try:
+        cache = StateCache(api_url)
+        with httpx.Client(timeout=30.0) as client:
+            cache.load(client)
+        state = cache.data
     except httpx.HTTPError as e:
         print(f"Error: {e}")
         sys.exit(1)
 
+    if as_json:
+        print(json.dumps(state, indent=2))
+    else:
+        print_state(state, verbose)
+
+
+def watch_state(api_url: str, interval: float, verbose: bool = False, as_json: bool = False):
+    """Poll the state and redraw whenever it changes.
+
+    Each poll is a conditional request, so an unchanged state costs a 304
+    and nothing is re-parsed or redrawn.
+    """
+    cache = StateCache(api_url)
+    drawn = False
+    with httpx.Client(timeout=30.0) as client:
+        while True:
+            try:
+                changed = cache.load(client)
+            except httpx.HTTPError as e:
+                print(f"Error: {e} (retrying in {interval:g}s)")
+            else:
+                if changed or not drawn:
+                    state = cache.data
+                    print("\033[2J\033[H", end="")
+                    if as_json:
+                        print(json.dumps(state, indent=2))
+                    else:
+                        print_state(state, verbose)
+                    print(f"Updated {time.strftime('%H:%M:%S')} - checking every {interval:g}s (Ctrl-C to stop)")
+                    drawn = True
+            time.sleep(interval)
+
 
 def main():
     parser = argparse.ArgumentParser(description="View Trading Arena game state")
@@ -90,17 +133,30 @@ def main():
         action="store_true",
         help="Output raw JSON",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep polling and redraw when the state changes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=5.0,
+        help="Seconds between polls in --watch mode (default: 5)",
+    )
     args = parser.parse_args()
 
     if not args.api_url:
         print("Error: CF_API_URL not set")
         sys.exit(1)
 
-    if args.json:
-        response = httpx.get(f"{args.api_url}/api/state", timeout=30.0)
-        print(json.dumps(response.json(), indent=2))
+    if args.watch:
+        try:
+            watch_state(args.api_url, args.interval, args.verbose, args.json)
+        except KeyboardInterrupt:
+            pass
     else:
-        view_state(args.api_url, args.verbose)
+        view_state(args.api_url, args.verbose, args.json)
 
 
 if __name__ == "__main__":